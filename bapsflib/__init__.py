@@ -16,14 +16,23 @@ data collected at BaPSF.
 """
 __all__ = ["lapd"]
 
-import pkg_resources
+from bapsflib.utils.lazyimport import lazy_import
 
-from bapsflib import _hdf, lapd, plasma, utils
+# sub-packages are imported on first access
+__getattr__, __dir__ = lazy_import(
+    __name__, submodules=["_hdf", "lapd", "plasma", "utils"]
+)
 
 # --- Define version -----------------------------------------------------------
 try:
-    # this places a runtime dependency on setuptools
-    #
+    from importlib.metadata import PackageNotFoundError
+    from importlib.metadata import version as _version
+except ImportError:  # pragma: no cover
+    # python < 3.8
+    from importlib_metadata import PackageNotFoundError
+    from importlib_metadata import version as _version
+
+try:
     # note: if there's any distribution metadata in your source files, then this
     #       will find a version based on those files.  Keep distribution metadata
     #       out of your repository unless you've intentionally installed the package
@@ -32,8 +41,8 @@ try:
     #       frozen to the version at time of install.
     #
     #: `bapsflib` version string
-    __version__ = pkg_resources.get_distribution("bapsflib").version
-except pkg_resources.DistributionNotFound:
+    __version__ = _version("bapsflib")
+except PackageNotFoundError:
     # package is not installed
     fallback_version = "unknown"
     try:
@@ -64,4 +73,4 @@ except pkg_resources.DistributionNotFound:
     del fallback_version, warn_add
 
 
-del pkg_resources
+del PackageNotFoundError, _version
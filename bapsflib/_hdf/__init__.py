@@ -14,6 +14,15 @@ mapping the HDF5 files generated at BaPSF.
 """
 __all__ = ["ConType", "File", "HDFMap"]
 
-from bapsflib._hdf import maps, utils
-from bapsflib._hdf.maps import ConType, HDFMap
-from bapsflib._hdf.utils.file import File
+from bapsflib.utils.lazyimport import lazy_import
+
+# sub-packages and classes are imported on first access
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    submodules=["maps", "utils"],
+    attributes={
+        "ConType": "bapsflib._hdf.maps.controls.types",
+        "File": "bapsflib._hdf.utils.file",
+        "HDFMap": "bapsflib._hdf.maps.core",
+    },
+)
@@ -28,8 +28,18 @@ __all__ = [
     "HDFMapMSI",
 ]
 
-from bapsflib._hdf.maps.controls import ConType, HDFMapControls
-from bapsflib._hdf.maps.core import HDFMap
-from bapsflib._hdf.maps.digitizers import HDFMapDigitizers
-from bapsflib._hdf.maps.msi import HDFMapMSI
-from bapsflib._hdf.maps.tests.fauxhdfbuilder import FauxHDFBuilder
+from bapsflib.utils.lazyimport import lazy_import
+
+# sub-packages and mapping classes are imported on first access
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    submodules=["controls", "core", "digitizers", "msi", "templates", "tests"],
+    attributes={
+        "ConType": "bapsflib._hdf.maps.controls.types",
+        "FauxHDFBuilder": "bapsflib._hdf.maps.tests.fauxhdfbuilder",
+        "HDFMap": "bapsflib._hdf.maps.core",
+        "HDFMapControls": "bapsflib._hdf.maps.controls.map_controls",
+        "HDFMapDigitizers": "bapsflib._hdf.maps.digitizers.map_digis",
+        "HDFMapMSI": "bapsflib._hdf.maps.msi.map_msi",
+    },
+)
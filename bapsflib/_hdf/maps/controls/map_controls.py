@@ -13,7 +13,7 @@ __all__ = ["HDFMapControls"]
 
 import h5py
 
-from typing import Dict, Tuple, Union
+from typing import Tuple, Union
 
 from bapsflib._hdf.maps.controls.n5700ps import HDFMapControlN5700PS
 from bapsflib._hdf.maps.controls.nixyz import HDFMapControlNIXYZ
@@ -24,13 +24,13 @@ from bapsflib._hdf.maps.controls.templates import (
     HDFMapControlTemplate,
 )
 from bapsflib._hdf.maps.controls.waveform import HDFMapControlWaveform
-from bapsflib.utils.exceptions import HDFMappingError
+from bapsflib._hdf.maps.templates import HDFMapDevicesTemplate
 
 # define type aliases
 ControlMap = Union[HDFMapControlTemplate, HDFMapControlCLTemplate]
 
 
-class HDFMapControls(dict):
+class HDFMapControls(HDFMapDevicesTemplate):
     """
     A dictionary that contains mapping objects for all the discovered
     control devices in the HDF5 data group.  The dictionary keys are
@@ -68,9 +68,6 @@ class HDFMapControls(dict):
         if not isinstance(data_group, h5py.Group):
             raise TypeError("data_group is not of type h5py.Group")
 
-        # store HDF5 data group
-        self.__data_group = data_group
-
         # Gather data_group subgroups
         # - each of these subgroups can fall into one of four 'LaPD
         #   data types'
@@ -84,8 +81,8 @@ class HDFMapControls(dict):
             if isinstance(data_group[gname], h5py.Group):
                 self.data_group_subgnames.append(gname)
 
-        # Build the self dictionary
-        dict.__init__(self, self.__build_dict)
+        # build the (lazily mapped) self dictionary
+        HDFMapDevicesTemplate.__init__(self, data_group)
 
     @property
     def mappable_devices(self) -> Tuple[str, ...]:
@@ -94,27 +91,3 @@ class HDFMapControls(dict):
         names)
         """
         return tuple(self._defined_mapping_classes.keys())
-
-    @property
-    def __build_dict(self) -> Dict[str, ControlMap]:
-        """
-        Discovers the HDF5 control devices and builds the dictionary
-        containing the control device mapping objects.  This is the
-        dictionary used to initialize :code:`self`.
-
-        :return: control device mapping dictionary
-        :rtype: dict
-        """
-        control_dict = {}
-        for name in self.data_group_subgnames:
-            if name in self._defined_mapping_classes:
-                # only add mapping that succeeded
-                try:
-                    _map = self._defined_mapping_classes[name](self.__data_group[name])
-                    control_dict[name] = _map
-                except HDFMappingError:
-                    # mapping failed
-                    pass
-
-        # return dictionary
-        return control_dict
@@ -247,6 +247,20 @@ class HDFMapControlTemplate(ABC):
         ]
         return dnames
 
+    def __getstate__(self):
+        # h5py objects can not be pickled, keep the HDF5 path instead
+        # (see :meth:`_bind`)
+        state = self.__dict__.copy()
+        state["_control_group"] = self._control_group.name
+        return state
+
+    def _bind(self, hdf_obj: h5py.File):
+        """
+        Re-attach the HDF5 group of an unpickled mapping to the opened
+        HDF5 file **hdf_obj**.
+        """
+        self._control_group = hdf_obj[self._control_group]
+
     @property
     def group(self) -> h5py.Group:
         """Instance of the HDF5 Control Device group"""
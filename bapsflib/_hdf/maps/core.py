@@ -82,10 +82,13 @@ class HDFMap(object):
                 self.DEVICE_PATHS[device] = "/"
 
         # attach the mapping dictionaries
+        # - devices are mapped the first time they are accessed (see
+        #   HDFMapDevicesTemplate) and unknowns are gathered the first
+        #   time :attr:`unknowns` is accessed
         self.__attach_msi()
         self.__attach_digitizers()
         self.__attach_controls()
-        self.__attach_unknowns()
+        self.__unknowns = None
 
     def __repr__(self):
         filename = self._hdf_obj.filename
@@ -95,6 +98,30 @@ class HDFMap(object):
         rstr = f"<{self.__class__.__name__} of HDF5 file '{filename}'>"
         return rstr
 
+    def __getstate__(self):
+        # h5py objects can not be pickled, an unpickled map needs to
+        # be re-attached to the HDF5 file with :meth:`_bind`
+        self.unknowns  # gather unknowns while the file is attached
+        state = self.__dict__.copy()
+        state["_hdf_obj"] = None
+        return state
+
+    def _bind(self, hdf_obj: h5py.File):
+        """
+        Re-attach an unpickled map (and all its device mappings) to the
+        opened HDF5 file **hdf_obj**.
+
+        :param hdf_obj: the HDF5 file object
+        :type hdf_obj: :class:`h5py.File`
+        """
+        if not isinstance(hdf_obj, h5py.File):
+            raise TypeError("arg `hdf_file` not an h5py.File object")
+
+        self._hdf_obj = hdf_obj
+        for dmaps in (self.controls, self.digitizers, self.msi):
+            if hasattr(dmaps, "_bind"):
+                dmaps._bind(hdf_obj)
+
     def __attach_controls(self):
         """
         Attaches the :attr:`__controls` dictionary, which contains all
@@ -278,4 +305,6 @@ class HDFMap(object):
         control device group, digitizer group, and MSI group that were
         not mapped.
         """
+        if self.__unknowns is None:
+            self.__attach_unknowns()
         return self.__unknowns
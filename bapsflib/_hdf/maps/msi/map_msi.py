@@ -13,18 +13,15 @@ __all__ = ["HDFMapMSI"]
 
 import h5py
 
-from typing import Dict
-
 from bapsflib._hdf.maps.msi.discharge import HDFMapMSIDischarge
 from bapsflib._hdf.maps.msi.gaspressure import HDFMapMSIGasPressure
 from bapsflib._hdf.maps.msi.heater import HDFMapMSIHeater
 from bapsflib._hdf.maps.msi.interferometerarray import HDFMapMSIInterferometerArray
 from bapsflib._hdf.maps.msi.magneticfield import HDFMapMSIMagneticField
-from bapsflib._hdf.maps.msi.templates import HDFMapMSITemplate
-from bapsflib.utils.exceptions import HDFMappingError
+from bapsflib._hdf.maps.templates import HDFMapDevicesTemplate
 
 
-class HDFMapMSI(dict):
+class HDFMapMSI(HDFMapDevicesTemplate):
     """
     A dictionary containing mapping objects for all the discovered
     MSI diagnostic HDF5 groups.  The dictionary keys are the MSI
@@ -60,9 +57,6 @@ class HDFMapMSI(dict):
         if not isinstance(msi_group, h5py.Group):
             raise TypeError("msi_group is not of type h5py.Group")
 
-        # store HDF5 MSI group
-        self.__msi_group = msi_group
-
         # Determine Diagnostics in msi
         # - it is assumed that any subgroup of 'MSI/' is a diagnostic
         # - any dataset directly under 'MSI/' is ignored
@@ -71,8 +65,8 @@ class HDFMapMSI(dict):
             if isinstance(msi_group[diag], h5py.Group):
                 self.msi_group_subgnames.append(diag)
 
-        # Build the self dictionary
-        dict.__init__(self, self.__build_dict)
+        # build the (lazily mapped) self dictionary
+        HDFMapDevicesTemplate.__init__(self, msi_group)
 
     @property
     def mappable_devices(self) -> tuple:
@@ -81,28 +75,3 @@ class HDFMapMSI(dict):
         names)
         """
         return tuple(self._defined_mapping_classes.keys())
-
-    @property
-    def __build_dict(self) -> Dict[str, HDFMapMSITemplate]:
-        """
-        Discovers the HDF5 MSI diagnostics and builds the dictionary
-        containing the diagnostic mapping objects.  This is the
-        dictionary used to initialize :code:`self`.
-
-        :return: MSI diagnostic mapping dictionary
-        :rtype: dict
-        """
-        # do not attach item if mapping is not known
-        msi_dict = {}
-        for name in self.msi_group_subgnames:
-            if name in self._defined_mapping_classes:
-                # only add mapping that succeeded
-                try:
-                    diag_map = self._defined_mapping_classes[name](self.__msi_group[name])
-                    msi_dict[name] = diag_map
-                except HDFMappingError:
-                    # mapping failed
-                    pass
-
-        # return dictionary
-        return msi_dict
@@ -183,6 +183,20 @@ class HDFMapMSITemplate(ABC):
         """Name of MSI diagnostic (device)"""
         return self._info["group name"]
 
+    def __getstate__(self):
+        # h5py objects can not be pickled, keep the HDF5 path instead
+        # (see :meth:`_bind`)
+        state = self.__dict__.copy()
+        state["_diag_group"] = self._diag_group.name
+        return state
+
+    def _bind(self, hdf_obj: h5py.File):
+        """
+        Re-attach the HDF5 group of an unpickled mapping to the opened
+        HDF5 file **hdf_obj**.
+        """
+        self._diag_group = hdf_obj[self._diag_group]
+
     @property
     def group(self) -> h5py.Group:
         """Instance of MSI diagnostic group"""
@@ -0,0 +1,178 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module for the template dictionary of the device family mappings
+(control devices, digitizers, and MSI diagnostics).
+"""
+__all__ = ["HDFMapDevicesTemplate"]
+
+import h5py
+import warnings
+
+from typing import Any, Dict, List
+
+from bapsflib.utils.exceptions import HDFMappingError
+
+
+class HDFMapDevicesTemplate(dict):
+    """
+    Template dictionary for the mapping objects of a device family
+    (e.g. :class:`~.controls.map_controls.HDFMapControls`).  The
+    dictionary keys are the names of the discovered devices.
+
+    Devices are mapped lazily.  Looking up a device (e.g.
+    :code:`fmap['SIS 3301']`, :code:`'SIS 3301' in fmap`) only maps that
+    device, and any operation that needs all devices (e.g. iterating,
+    :func:`len`, :meth:`items`) maps the remaining devices.  A device
+    whose mapping fails (raises
+    :exc:`~bapsflib.utils.exceptions.HDFMappingError`) is not added,
+    and warnings issued while mapping are filtered as they would have
+    been when the dictionary was created.
+    """
+
+    _defined_mapping_classes = NotImplemented  # type: Dict[str, type]
+    """
+    Dictionary containing references to the defined (known) device
+    mapping classes.
+    """
+
+    def __init__(self, group: h5py.Group):
+        """
+        :param group: HDF5 group containing the devices
+        """
+        self._group = group
+
+        # known devices that are yet to be mapped
+        self._candidates = [
+            name
+            for name in group
+            if name in self._defined_mapping_classes
+            and isinstance(group[name], h5py.Group)
+        ]  # type: List[str]
+        self._unmapped = list(self._candidates)  # type: List[str]
+
+        # warning filters to be used while mapping
+        self._warn_filters = list(warnings.filters)
+
+        dict.__init__(self)
+
+    def _map_device(self, name: Any) -> bool:
+        """
+        Map device **name** if it has not been mapped yet.
+
+        :return: :code:`True` if device **name** is mapped
+        """
+        if name in self._unmapped:
+            self._unmapped.remove(name)
+            with warnings.catch_warnings():
+                warnings.filters[:] = self._warn_filters
+                try:
+                    _map = self._defined_mapping_classes[name](self._group[name])
+                    dict.__setitem__(self, name, _map)
+                except HDFMappingError:
+                    # mapping failed
+                    pass
+
+        return dict.__contains__(self, name)
+
+    def _map_all(self):
+        """Map all devices not mapped yet."""
+        if not self._unmapped:
+            return
+
+        for name in list(self._unmapped):
+            self._map_device(name)
+
+        # order devices as they are in the HDF5 group
+        mapped = [
+            (name, dict.__getitem__(self, name))
+            for name in self._candidates
+            if dict.__contains__(self, name)
+        ]
+        dict.clear(self)
+        dict.update(self, mapped)
+
+    def __getitem__(self, name):
+        self._map_device(name)
+        return dict.__getitem__(self, name)
+
+    def __contains__(self, name):
+        return self._map_device(name)
+
+    def get(self, name, default=None):
+        return self[name] if name in self else default
+
+    def __bool__(self):
+        return any(self._map_device(name) for name in self._candidates)
+
+    def __len__(self):
+        self._map_all()
+        return dict.__len__(self)
+
+    def __iter__(self):
+        self._map_all()
+        return dict.__iter__(self)
+
+    def keys(self):
+        self._map_all()
+        return dict.keys(self)
+
+    def values(self):
+        self._map_all()
+        return dict.values(self)
+
+    def items(self):
+        self._map_all()
+        return dict.items(self)
+
+    def copy(self) -> dict:
+        self._map_all()
+        return dict.copy(self)
+
+    def __eq__(self, other):
+        self._map_all()
+        if isinstance(other, HDFMapDevicesTemplate):
+            other._map_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        self._map_all()
+        return dict.__repr__(self)
+
+    def __getstate__(self):
+        # h5py objects can not be pickled, keep the HDF5 path instead
+        # (see :meth:`_bind`)
+        self._map_all()
+        state = self.__dict__.copy()
+        state["_group"] = self._group.name
+        state["_warn_filters"] = []
+        return state
+
+    def _bind(self, hdf_obj: h5py.File):
+        """
+        Re-attach the HDF5 groups of an unpickled mapping (and its
+        device mappings) to the opened HDF5 file **hdf_obj**.
+        """
+        self._group = hdf_obj[self._group]
+        for _map in self.values():
+            _map._bind(hdf_obj)
+
+    @property
+    def mappable_devices(self) -> tuple:
+        """
+        tuple of the mappable devices (i.e. their HDF5 group names)
+        """
+        return tuple(self._defined_mapping_classes.keys())
@@ -11,6 +11,7 @@
 # License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
 #   license terms and contributor agreement.
 #
+import pickle
 import unittest as ut
 
 from bapsflib._hdf.maps.controls import HDFMapControls
@@ -365,6 +366,38 @@ class TestHDFMap(ut.TestCase):
         with self.assertRaises(TypeError):
             self.map_file(None, "", "", "")
 
+    def test_pickle(self):
+        """Test pickling a map and re-attaching it to the HDF5 file."""
+        self.f.add_module("Waveform")
+        self.f.add_module("SIS 3301")
+        self.f.add_module("Discharge")
+        _map = self.map
+
+        # h5py objects are not pickled
+        _map2 = pickle.loads(pickle.dumps(_map))
+        self.assertIsInstance(_map2, self.MAP_CLASS)
+        self.assertIsNone(_map2._hdf_obj)
+        self.assertEqual(_map2.controls["Waveform"].group, "/Raw data + config/Waveform")
+
+        # re-attach
+        _map2._bind(self.f)
+        self.assertHDFMapBasics(_map2, self.f)
+        self.assertEqual(_map2.unknowns, _map.unknowns)
+        for dmaps, dmaps2 in (
+            (_map.controls, _map2.controls),
+            (_map.digitizers, _map2.digitizers),
+            (_map.msi, _map2.msi),
+        ):
+            self.assertEqual(list(dmaps2), list(dmaps))
+            for name, dmap in dmaps.items():
+                self.assertIsInstance(dmaps2[name], type(dmap))
+                self.assertEqual(dmaps2[name].group, dmap.group)
+                self.assertEqual(dmaps2[name].info, dmap.info)
+                self.assertEqual(list(dmaps2[name].configs), list(dmap.configs))
+
+        with self.assertRaises(TypeError):
+            _map2._bind(None)
+
     def assertHDFMapBasics(self, _map, _file):
         # check instance
         self.assertIsInstance(_map, HDFMap)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import h5py
+import os
+import tempfile
+import unittest as ut
+import warnings
+
+from unittest import mock
+
+from bapsflib._hdf.maps.templates import HDFMapDevicesTemplate
+from bapsflib.utils.exceptions import HDFMappingError
+
+
+class FauxDeviceMap(object):
+    """Faux device mapping class."""
+
+    def __init__(self, group: h5py.Group):
+        if "fail" in group.attrs:
+            raise HDFMappingError(group.name)
+        if "warn" in group.attrs:
+            warnings.warn(f"mapping {group.name}")
+        self.group = group
+
+
+class TestHDFMapDevicesTemplate(ut.TestCase):
+    """
+    Test case for
+    :class:`~bapsflib._hdf.maps.templates.HDFMapDevicesTemplate`.
+    """
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory(prefix="hdf-test_")
+        self.f = h5py.File(os.path.join(self.tempdir.name, "test.hdf5"), "w")
+        for name in ("Alpha", "Beta", "Delta", "Gamma", "Unknown"):
+            self.f.create_group(name)
+        self.f["Gamma"].attrs["fail"] = True
+        self.f["Delta"].attrs["warn"] = True
+        self.f.create_dataset("Epsilon", data=[1, 2])
+
+        self.mock_map = mock.Mock(side_effect=FauxDeviceMap)
+
+        class DevicesMap(HDFMapDevicesTemplate):
+            _defined_mapping_classes = {
+                name: self.mock_map
+                for name in ("Epsilon", "Gamma", "Delta", "Beta", "Alpha")
+            }
+
+        self.map_class = DevicesMap
+
+    def tearDown(self):
+        self.f.close()
+        self.tempdir.cleanup()
+
+    def test_lazy_mapping(self):
+        _map = self.map_class(self.f)
+        self.assertIsInstance(_map, dict)
+        self.assertFalse(self.mock_map.called)
+        self.assertEqual(
+            _map.mappable_devices, ("Epsilon", "Gamma", "Delta", "Beta", "Alpha")
+        )
+
+        # only the requested device is mapped
+        self.assertIsInstance(_map["Beta"], FauxDeviceMap)
+        self.assertEqual(self.mock_map.call_count, 1)
+        self.assertIn("Beta", _map)
+        self.assertIs(_map.get("Beta"), _map["Beta"])
+        self.assertEqual(self.mock_map.call_count, 1)
+
+        # failed, unknown, and dataset members are not mapped
+        self.assertNotIn("Gamma", _map)
+        self.assertNotIn("Unknown", _map)
+        self.assertNotIn("Epsilon", _map)
+        self.assertIsNone(_map.get("Gamma"))
+        with self.assertRaises(KeyError):
+            _map["Gamma"]
+        self.assertEqual(self.mock_map.call_count, 2)
+
+        # `bool` maps devices until one succeeds (i.e. 'Alpha')
+        self.assertTrue(_map)
+        self.assertEqual(self.mock_map.call_count, 3)
+
+        # all devices are mapped when listed (in HDF5 group order)
+        self.assertEqual(list(_map), ["Alpha", "Beta", "Delta"])
+        self.assertEqual(self.mock_map.call_count, 4)
+        self.assertEqual(len(_map), 3)
+        self.assertEqual(list(_map.keys()), ["Alpha", "Beta", "Delta"])
+        self.assertEqual(
+            [v.group.name for v in _map.values()], ["/Alpha", "/Beta", "/Delta"]
+        )
+        self.assertEqual(dict(_map), _map.copy())
+        self.assertEqual(self.mock_map.call_count, 4)
+
+        # comparison
+        _map2 = self.map_class(self.f)
+        self.assertEqual(set(_map2.keys()), set(_map.keys()))
+        self.assertNotEqual(_map, {})
+
+    def test_empty(self):
+        for name in ("Alpha", "Beta", "Delta"):
+            del self.f[name]
+        _map = self.map_class(self.f)
+        self.assertFalse(_map)
+        self.assertEqual(_map, {})
+        self.assertEqual(len(_map), 0)
+
+    def test_warnings(self):
+        # warnings are filtered as they were when the map was created
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            _map = self.map_class(self.f)
+        with warnings.catch_warnings(record=True) as rec:
+            warnings.simplefilter("always")
+            _map["Delta"]
+        self.assertEqual(len(rec), 0)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("always")
+            _map = self.map_class(self.f)
+        with self.assertWarns(UserWarning):
+            _map["Delta"]
+
+
+if __name__ == "__main__":
+    ut.main()
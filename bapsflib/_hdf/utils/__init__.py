@@ -14,11 +14,29 @@ access and interface with the HDF5 files generated at BaPSF.
 """
 __all__ = []
 
-from bapsflib._hdf.utils import (
-    file,
-    hdfoverview,
-    hdfreadcontrols,
-    hdfreaddata,
-    hdfreadmsi,
-    helpers,
+from bapsflib.utils.lazyimport import lazy_import
+
+# modules are imported on first access
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    submodules=[
+        "bufferpool",
+        "export",
+        "file",
+        "hdflazysignal",
+        "hdfmaskedsignal",
+        "hdfoverview",
+        "hdfpositionstats",
+        "hdfreadcontrols",
+        "hdfreaddata",
+        "hdfreadmsi",
+        "helpers",
+        "instrument",
+        "mapcache",
+        "reductioncache",
+        "shotnumindex",
+        "shotnumresolver",
+        "shotset",
+        "sidecar",
+    ],
 )
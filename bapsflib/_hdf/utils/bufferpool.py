@@ -0,0 +1,96 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module containing the `~bapsflib._hdf.utils.bufferpool.BufferPool`
+class.
+"""
+__all__ = ["BufferPool"]
+
+import numpy as np
+
+from typing import Dict, List, Tuple
+
+
+class BufferPool(object):
+    """
+    A pool of reusable :mod:`numpy` arrays for reading data in a loop.
+    Passing the pool as the :data:`out` argument of
+    :meth:`~bapsflib._hdf.utils.file.File.read_data` (or
+    :meth:`~bapsflib._hdf.utils.file.File.iter_data`) makes repeated
+    reads of the same shape and dtype reuse the same memory instead of
+    allocating a new array for every read.
+
+    For each shape and dtype the pool keeps up to :attr:`size` arrays
+    and hands them out round-robin, i.e. the array returned by one read
+    is overwritten :attr:`size` reads later.  Copy any data that needs
+    to be kept longer.
+
+    :Example:
+
+        >>> pool = BufferPool(size=2)
+        >>> for sn in shot_blocks:
+        ...     data = f.read_data(1, 1, shotnum=sn, out=pool)
+        ...     process(data)
+    """
+
+    def __init__(self, size=2):
+        """
+        :param int size: number of arrays kept for each shape and
+            dtype (DEFAULT :code:`2`)
+        """
+        if not isinstance(size, int) or isinstance(size, bool):
+            raise TypeError("Argument `size` must be an int.")
+        elif size < 1:
+            raise ValueError("Argument `size` must be >= 1.")
+
+        self._size = size
+        self._buffers = {}  # type: Dict[Tuple[Tuple[int, ...], np.dtype], List]
+        self._next = {}  # type: Dict[Tuple[Tuple[int, ...], np.dtype], int]
+
+    @property
+    def size(self) -> int:
+        """Number of arrays kept for each shape and dtype."""
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes held by the pool."""
+        return sum(buf.nbytes for bufs in self._buffers.values() for buf in bufs)
+
+    def __len__(self):
+        return sum(len(bufs) for bufs in self._buffers.values())
+
+    def get(self, shape, dtype) -> np.ndarray:
+        """
+        Return an array of the given shape and dtype.  A new array is
+        allocated until the pool holds :attr:`size` arrays of that
+        shape and dtype, after which those arrays are reused
+        round-robin.  The array contents are undefined.
+
+        :param shape: shape of the array
+        :param dtype: :mod:`numpy` dtype (or dtype specification) of the
+            array
+        """
+        key = (tuple(np.atleast_1d(shape).tolist()), np.dtype(dtype))
+        bufs = self._buffers.setdefault(key, [])
+        if len(bufs) < self._size:
+            buf = np.empty(key[0], dtype=key[1])
+            bufs.append(buf)
+            return buf
+
+        ii = self._next.get(key, 0)
+        self._next[key] = (ii + 1) % self._size
+        return bufs[ii]
+
+    def clear(self):
+        """Release all arrays held by the pool."""
+        self._buffers.clear()
+        self._next.clear()
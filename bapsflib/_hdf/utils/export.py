@@ -0,0 +1,348 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module for exporting the structured arrays returned by the read
+classes (e.g. :class:`~.hdfreaddata.HDFReadData`) to :mod:`pandas`,
+:mod:`xarray`, and :mod:`pyarrow`.
+
+The exports are built from views of the array fields wherever the
+memory layout allows, and a :class:`CopyWarning` names the fields that
+had to be copied.  :mod:`pandas`, :mod:`xarray`, and :mod:`pyarrow`
+are optional dependencies, only imported when an export is made.
+"""
+__all__ = ["CopyWarning", "ExportMixin", "export_columns"]
+
+import importlib
+import numpy as np
+
+from typing import Any, Dict, Iterable, List, Tuple, Union
+from warnings import warn
+
+_position_names = ("x", "y", "z")
+"""Column names of the elements of the :code:`'xyz'` field."""
+
+
+class CopyWarning(UserWarning):
+    """
+    Warning issued when exporting a read result had to copy (or read)
+    data instead of viewing the array buffer.
+    """
+
+
+def export_columns(arr: np.ndarray, exclude: Iterable[str] = ()) -> Dict[str, np.ndarray]:
+    """
+    Split the structured array **arr** into 1D per-shot column views.
+
+    * Scalar fields become a column of the same name.
+    * Sub-array fields get a column per element, named like
+      :code:`'field[i]'` (or :code:`'field[i,j]'`), except for the
+      :code:`'xyz'` field whose elements are named :code:`'x'`,
+      :code:`'y'`, and :code:`'z'`.
+    * Nested structured fields are flattened, with the sub-field names
+      joined by a :code:`'.'`, e.g. :code:`'meta.peak current'`.
+
+    No data is copied, every column is a (strided) view of **arr**.
+
+    :param arr: 1D structured array
+    :param exclude: (dotted) names of the fields to leave out, e.g.
+        the trace fields
+    :return: dictionary of column name to column view
+
+    :Example:
+
+        >>> data = f.read_data(1, 1, add_controls=[('6K Compumotor', 3)])
+        >>> list(export_columns(data, exclude=['signal']))
+        ['shotnum', 'x', 'y', 'z', 'ptip_rot_theta', 'ptip_rot_phi']
+        >>> np.shares_memory(export_columns(data)['x'], data)
+        True
+    """
+    if arr.dtype.names is None:
+        raise TypeError("Argument `arr` must be a structured array.")
+
+    columns = {}  # type: Dict[str, np.ndarray]
+    _add_columns(columns, arr.view(np.ndarray).reshape(-1), "", "", set(exclude))
+    return columns
+
+
+def _add_columns(
+    columns: Dict[str, np.ndarray], arr: np.ndarray, prefix: str, fprefix: str, exclude
+):
+    """
+    Add the column views of the fields of **arr** to **columns**, with
+    the column names prefixed by **prefix**.  **fprefix** is the dotted
+    field name of **arr** (without element indices), which is matched
+    against **exclude**.
+    """
+    for name in arr.dtype.names:
+        path = name if prefix == "" else f"{prefix}.{name}"
+        fpath = name if fprefix == "" else f"{fprefix}.{name}"
+        if fpath in exclude:
+            continue
+
+        field = arr[name]
+        for idx in np.ndindex(field.shape[1:]):
+            col = field[(slice(None),) + idx]
+            if col.dtype.names is not None:
+                _add_columns(columns, col, path + _index_suffix(idx), fpath, exclude)
+            elif path == "xyz" and len(idx) == 1 and field.shape[1:] == (3,):
+                columns[_position_names[idx[0]]] = col
+            else:
+                columns[path + _index_suffix(idx)] = col
+
+
+def _index_suffix(idx: Tuple[int, ...]) -> str:
+    """Column name suffix of the sub-array element **idx**."""
+    if len(idx) == 0:
+        return ""
+
+    return f"[{','.join(str(ii) for ii in idx)}]"
+
+
+def _import_backend(name: str):
+    """Import the optional export backend **name**."""
+    try:
+        return importlib.import_module(name)
+    except ImportError as err:
+        raise ImportError(
+            f"Exporting to {name} requires the optional dependency '{name}', "
+            f"install it with `pip install {name}`."
+        ) from err
+
+
+def _report_copies(target: str, names: List[str]):
+    """Issue a :class:`CopyWarning` for the fields **names**."""
+    if len(names) == 0:
+        return
+
+    warn(
+        f"Exporting to {target} copied the fields: {', '.join(names)}.",
+        CopyWarning,
+        stacklevel=3,
+    )
+
+
+def _get_field(arr: np.ndarray, path: str) -> np.ndarray:
+    """View of the (dotted) field **path** of structured array **arr**."""
+    for name in path.split("."):
+        arr = arr[name]
+    return arr
+
+
+def _msi_time(info: Dict[str, Any], nt: int, window: Union[slice, None] = None):
+    """
+    Times (in seconds) of the **nt** samples of an MSI diagnostic data
+    array, from the :code:`'dt'` and :code:`'t0'` items of the
+    diagnostic **info**.  :code:`None` if the diagnostic datasets do
+    not share a recorded time step.
+
+    :param info: the :attr:`~.hdfreadmsi.HDFReadMSI.info` of the
+        diagnostic
+    :param nt: number of samples
+    :param window: sample window the samples were read with
+    """
+    dts = set(info.get("dt", []))
+    if len(dts) != 1 or None in dts:
+        return
+
+    t0s = set(info.get("t0", []))
+    t0 = float(t0s.pop()) if len(t0s) == 1 and None not in t0s else 0.0
+    start, step = (0, 1) if window is None else (window.start, window.step)
+    return t0 + (start + step * np.arange(nt)) * float(dts.pop())
+
+
+class ExportMixin(object):
+    """
+    Mixin adding the :meth:`to_pandas`, :meth:`to_xarray`, and
+    :meth:`to_arrow` exports to the structured read classes.
+
+    Per-shot fields are exported as column views (see
+    :func:`export_columns`).  Trace fields (e.g. :code:`'signal'`)
+    keep their shot number axis first and are exported as 2D (or
+    higher) views, with their time coordinates only generated when
+    an export asks for them.
+    """
+
+    def _trace_fields(self) -> List[str]:
+        """(Dotted) names of the trace fields."""
+        return []
+
+    def _trace_values(self, name: str) -> Any:
+        """Array-like values of trace field **name**."""
+        return _get_field(self, name)
+
+    def _trace_dims(self, name: str, shape: Tuple[int, ...]) -> Tuple[str, ...]:
+        """Dimension names of trace field **name** of shape **shape**."""
+        dims = tuple(f"{name}_dim{ii}" for ii in range(1, len(shape) - 1))
+        return ("shotnum",) + dims + (f"{name}_time",)
+
+    def _trace_time(self, name: str, nt: int) -> Union[np.ndarray, None]:
+        """
+        Times (in seconds) of the **nt** samples of trace field **name**,
+        :code:`None` if not known.
+        """
+        return
+
+    def _trace_array(self, name: str) -> Tuple[np.ndarray, bool]:
+        """
+        Values of trace field **name** as a :class:`numpy.ndarray`, and
+        whether they had to be copied (or read) to get them.
+        """
+        values = self._trace_values(name)
+        if isinstance(values, np.ndarray):
+            return values.view(np.ndarray), False
+
+        return np.asarray(values), True
+
+    def _position_coords(self) -> Dict[str, np.ndarray]:
+        """Shot number and position coordinate views."""
+        arr = self.view(np.ndarray)
+        coords = {"shotnum": arr["shotnum"]}
+        if "xyz" in arr.dtype.names and arr.dtype["xyz"].shape == (3,):
+            for ii, name in enumerate(_position_names):
+                coords[name] = arr["xyz"][:, ii]
+        return coords
+
+    def export_columns(self) -> Dict[str, np.ndarray]:
+        """
+        The per-shot column views of the array, leaving out the trace
+        fields (see :func:`export_columns`).
+        """
+        return export_columns(self, exclude=self._trace_fields())
+
+    def to_pandas(self, trace: str = None):
+        """
+        Export to a :class:`pandas.DataFrame`.
+
+        With :code:`trace=None` (DEFAULT) the frame has a column per
+        per-shot field (see :func:`export_columns`).  Otherwise, the
+        frame holds trace field **trace** (e.g. :code:`'signal'`) with
+        a row per shot number and a column per sample, labeled by
+        sample time (in seconds) if known.  Only 2D traces can be
+        exported this way.
+
+        A :class:`CopyWarning` is issued if any data had to be copied.
+
+        :param trace: name of the trace field to export
+        """
+        pd = _import_backend("pandas")
+
+        if trace is None:
+            columns = self.export_columns()
+            df = pd.DataFrame(columns, copy=False)
+            copied = [
+                name
+                for name, col in columns.items()
+                if not np.shares_memory(df[name].to_numpy(), col)
+            ]
+            _report_copies("pandas", copied)
+            return df
+
+        if trace not in self._trace_fields():
+            raise ValueError(
+                f"'{trace}' is not a trace field, expected one of {self._trace_fields()}."
+            )
+        values, copied = self._trace_array(trace)
+        if values.ndim != 2:
+            raise ValueError(
+                f"Trace '{trace}' has shape {values.shape}, only 2D traces can be "
+                f"exported to pandas (use to_xarray)."
+            )
+
+        time = self._trace_time(trace, values.shape[-1])
+        df = pd.DataFrame(
+            values,
+            index=pd.Index(self["shotnum"].view(np.ndarray), name="shotnum"),
+            columns=None if time is None else pd.Index(time, name="time"),
+            copy=False,
+        )
+        if copied or not np.shares_memory(df.to_numpy(), values):
+            _report_copies("pandas", [trace])
+        return df
+
+    def to_xarray(self):
+        """
+        Export to a :class:`xarray.Dataset` along the :code:`'shotnum'`
+        dimension.
+
+        Per-shot fields (see :func:`export_columns`) become data
+        variables, except for the :code:`'x'`, :code:`'y'`, and
+        :code:`'z'` positions which become coordinates.  Trace fields
+        keep their shape, with a time coordinate (in seconds) along
+        their last dimension if the sample times are known.
+
+        A :class:`CopyWarning` is issued if any data had to be copied.
+        """
+        xr = _import_backend("xarray")
+
+        coords = {name: ("shotnum", col) for name, col in self._position_coords().items()}
+        sources = {
+            name: col for name, col in self.export_columns().items() if name not in coords
+        }
+        data_vars = {name: ("shotnum", col) for name, col in sources.items()}
+
+        copied = []
+        for name in self._trace_fields():
+            values, was_copied = self._trace_array(name)
+            if was_copied:
+                copied.append(name)
+            dims = self._trace_dims(name, values.shape)
+            data_vars[name] = (dims, values)
+            sources[name] = values
+
+            time = self._trace_time(name, values.shape[-1])
+            if time is not None:
+                coords[dims[-1]] = (dims[-1], time, {"units": "s"})
+
+        ds = xr.Dataset(data_vars, coords=coords)
+        for name, values in sources.items():
+            if name not in copied and not np.shares_memory(ds[name].values, values):
+                copied.append(name)
+        _report_copies("xarray", copied)
+        return ds
+
+    def to_arrow(self, traces: bool = True):
+        """
+        Export to a :class:`pyarrow.Table` with a row per shot number.
+
+        Per-shot fields (see :func:`export_columns`) become columns and,
+        if **traces** is :code:`True`, trace fields become fixed size
+        list columns.
+
+        Arrow needs contiguous buffers, so the column views of a
+        structured array (and boolean columns) are copied, which is
+        reported by a :class:`CopyWarning`.  A trace is only viewed if
+        it is a contiguous (i.e. single field) array.
+
+        :param traces: include the trace fields
+        """
+        pa = _import_backend("pyarrow")
+
+        names = []
+        arrays = []
+        copied = []
+        for name, col in self.export_columns().items():
+            if not col.flags.c_contiguous or col.dtype == np.bool_:
+                copied.append(name)
+            names.append(name)
+            arrays.append(pa.array(col))
+
+        for name in self._trace_fields() if traces else []:
+            values, was_copied = self._trace_array(name)
+            if was_copied or not values.flags.c_contiguous:
+                copied.append(name)
+            arr = pa.array(np.ascontiguousarray(values).reshape(-1))
+            for size in reversed(values.shape[1:]):
+                arr = pa.FixedSizeListArray.from_arrays(arr, size)
+            names.append(name)
+            arrays.append(arr)
+
+        _report_copies("pyarrow", copied)
+        return pa.Table.from_arrays(arrays, names=names)
@@ -15,9 +15,12 @@ import h5py
 import os
 import warnings
 
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, Iterator, List, Tuple, Union
 
 from bapsflib._hdf.maps import HDFMap, HDFMapControls, HDFMapDigitizers, HDFMapMSI
+from bapsflib._hdf.utils.mapcache import HDFMapCache
+from bapsflib._hdf.utils.reductioncache import ReductionCache
+from bapsflib._hdf.utils.shotnumindex import ShotNumIndex
 
 
 class File(h5py.File):
@@ -36,7 +39,11 @@ class File(h5py.File):
         digitizer_path="/",
         msi_path="/",
         silent=False,
-        **kwargs
+        shotnum_index=False,
+        map_cache=False,
+        remap=False,
+        cache_validate="stat",
+        **kwargs,
     ):
         """
         :param name: name (and path) of file on disk
@@ -50,6 +57,30 @@ class File(h5py.File):
             devices
         :param silent: set :code:`True` to suppress warnings
             (:code:`False` DEFAULT)
+        :param shotnum_index: :code:`True` to keep a persistent
+            sidecar index of the dataset shot numbers next to the HDF5
+            file, a directory path to keep it in that (cache) directory,
+            or :code:`False` (DEFAULT) to not use an index.  Only
+            available for readonly files.
+            (see :class:`~.shotnumindex.ShotNumIndex`)
+        :type shotnum_index: Union[bool, str]
+        :param map_cache: :code:`True` to cache the file mapping
+            (:attr:`file_map`) next to the HDF5 file, a directory path
+            to cache it in that directory, or :code:`False` (DEFAULT)
+            to always map the file
+            (see :class:`~.mapcache.HDFMapCache`).  The cache is a
+            pickle file, which can execute code when loaded, so a
+            cache file not owned by the current user (or writable by
+            others) is ignored.  Only cache in directories whose
+            writers are trusted.
+        :type map_cache: Union[bool, str]
+        :param bool remap: set :code:`True` to re-map the file even if
+            a valid cached mapping exists, the cache is then rewritten
+            (:code:`False` DEFAULT)
+        :param str cache_validate: how the saved :data:`shotnum_index`
+            and :data:`map_cache` are validated against the HDF5 file,
+            :code:`'stat'` (DEFAULT, file size and modification time)
+            or :code:`'hash'` (file size and content hash)
         :param kwargs:  additional keywords passed on to
             :class:`h5py.File`
 
@@ -68,9 +99,34 @@ class File(h5py.File):
             raise ValueError(
                 "Only `mode` readonly 'r' and read/write 'r+' are supported."
             )
+        if shotnum_index and mode != "r":
+            raise ValueError("A `shotnum_index` is only supported for readonly files.")
         kwargs["mode"] = mode
         h5py.File.__init__(self, name, **kwargs)
 
+        # -- shot number index --
+        if not shotnum_index:
+            self._shotnum_index = None
+        else:
+            self._shotnum_index = ShotNumIndex(
+                self.filename,
+                cache_dir=None if shotnum_index is True else shotnum_index,
+                validate=cache_validate,
+            )
+
+        # -- file map cache --
+        if not map_cache:
+            self._map_cache = None
+        else:
+            self._map_cache = HDFMapCache(
+                self.filename,
+                cache_dir=None if map_cache is True else map_cache,
+                validate=cache_validate,
+            )
+
+        # -- per-shot reductions of MSI signals --
+        self._reduction_cache = ReductionCache()
+
         # -- define device paths --
         #: Internal HDF5 path for control devices. (DEFAULT :code:`'/'`)
         self.CONTROL_PATH = control_path
@@ -88,11 +144,24 @@ class File(h5py.File):
             warnings.simplefilter(warn_filter)
 
             # create map
-            self._map_file()
+            self._file_map = None
+            if self._map_cache is not None and not remap:
+                self._file_map = self._map_cache.load(self, self._map_cache_key)
+            if self._file_map is None:
+                self._map_file()
+                if self._map_cache is not None:
+                    self._map_cache.save(self._file_map, self._map_cache_key)
 
             # build `_info` attribute
             self._build_info()
 
+    def close(self):
+        """Close the file, saving the :attr:`shotnum_index` if used."""
+        sn_index = getattr(self, "_shotnum_index", None)
+        if sn_index is not None:
+            sn_index.save()
+        super().close()
+
     def _build_info(self):
         """Builds the general :attr:`info` dictionary for the file."""
         # define file keys
@@ -101,8 +170,20 @@ class File(h5py.File):
             "absolute file path": os.path.abspath(self.filename),
         }
 
+    @property
+    def _map_cache_key(self) -> Dict[str, Any]:
+        """
+        Description of how :attr:`file_map` is built, which a cached
+        map must match (see :class:`~.mapcache.HDFMapCache`).
+        """
+        return {
+            "file class": f"{type(self).__module__}.{type(self).__qualname__}",
+            "paths": [self.CONTROL_PATH, self.DIGITIZER_PATH, self.MSI_PATH],
+        }
+
     def _map_file(self):
         """Map/re-map the HDF5 file. (Builds :attr:`file_map`)"""
+        self._reduction_cache.clear()
         self._file_map = HDFMap(
             self,
             control_path=self.CONTROL_PATH,
@@ -148,13 +229,34 @@ class File(h5py.File):
 
         return HDFOverview(self)
 
+    @property
+    def reduction_cache(self) -> ReductionCache:
+        """
+        Cache of the per-shot reductions of MSI signals
+        (:class:`~.reductioncache.ReductionCache`), filled by
+        :meth:`read_msi` with a named :data:`reduce`.  Only filled
+        if the file is opened read-only.
+        """
+        return self._reduction_cache
+
+    @property
+    def shotnum_index(self) -> Union[ShotNumIndex, None]:
+        """
+        Persistent index of the dataset shot numbers
+        (:class:`~.shotnumindex.ShotNumIndex`), :code:`None` if the file
+        was opened without :data:`shotnum_index`.
+        """
+        return self._shotnum_index
+
     def read_controls(
         self,
         controls: List[Union[str, Tuple[str, Any]]],
         shotnum=slice(None),
         intersection_set=True,
+        categorical=False,
+        masked=False,
         silent=False,
-        **kwargs
+        **kwargs,
     ):
         """
         Reads data from control device datasets.  See
@@ -177,7 +279,7 @@ class File(h5py.File):
             HDF5 file shot number(s) indicating data entries to be
             extracted
 
-        :type shotnum: Union[int, list(int), slice(), numpy.array]
+        :type shotnum: Union[int, list(int), slice(), numpy.array, ShotSet]
         :param bool intersection_set:
 
             :code:`True` (DEFAULT) will force the returned shot numbers
@@ -188,6 +290,22 @@ class File(h5py.File):
             :class:`~.hdfreadcontrols.HDFReadControls`
             for details)
 
+        :param bool categorical:
+
+            :code:`False` (DEFAULT).  Set :code:`True` to return the
+            fields of command list controls (e.g. :code:`'Waveform'`) as
+            command indices, with the command tables stored in
+            :code:`info['controls'][control]['command tables']`. (see
+            :class:`~.hdfreadcontrols.HDFReadControls` for details)
+
+        :param bool masked:
+
+            :code:`False` (DEFAULT).  Set :code:`True` to add a
+            :code:`'valid'` field flagging the shot numbers recorded by
+            each control device, instead of NULL filling the entries of
+            unrecorded shot numbers. (see
+            :class:`~.hdfreadcontrols.HDFReadControls` for details)
+
         :param bool silent:
 
             :code:`False` (DEFAULT).  Set :code:`True` to ignore any
@@ -240,7 +358,9 @@ class File(h5py.File):
                 controls,
                 shotnum=shotnum,
                 intersection_set=intersection_set,
-                **kwargs
+                categorical=categorical,
+                masked=masked,
+                **kwargs,
             )
 
         return data
@@ -256,9 +376,15 @@ class File(h5py.File):
         config_name=None,
         keep_bits=False,
         add_controls=None,
+        add_msi=None,
         intersection_set=True,
+        samples=None,
+        average=None,
+        lazy=False,
+        masked=False,
+        out=None,
         silent=False,
-        **kwargs
+        **kwargs,
     ):
         """
         Reads data from digitizer datasets and attaches control device
@@ -270,7 +396,7 @@ class File(h5py.File):
         :param index: dataset row index
         :type index: Union[int, list(int), slice(), numpy.array]
         :param shotnum: HDF5 global shot number
-        :type shotnum: Union[int, list(int), slice(), numpy.array]
+        :type shotnum: Union[int, list(int), slice(), numpy.array, ShotSet]
         :param str digitizer: name of digitizer
         :param str adc: name of the digitizer's analog-digital converter
         :param str config_name: name of digitizer configuration
@@ -292,16 +418,75 @@ class File(h5py.File):
             (see :func:`~.helpers.condition_controls` for details)
 
         :type add_controls: List[Union[str, Tuple[str, Any]]]
+        :param add_msi:
+
+            A list of strings and/or 2-element tuples indicating the
+            MSI diagnostic(s) to join by shot number.  A tuple
+            :code:`('Discharge', 'max')` also reduces the diagnostic
+            signals to one value per shot.  Each diagnostic is added
+            as a nested field named after the diagnostic. (see
+            :func:`~.helpers.condition_msi` for details)
+
+        :type add_msi: List[Union[str, Tuple[str, Any]]]
         :param bool intersection_set:
 
             :code:`True` (DEFAULT) will force the returned shot numbers
             to be the intersection of :data:`shotnum`, the digitizer
             dataset shot numbers, and, if requested, the shot numbers
-            contained in  each control device dataset. :code:`False`
+            contained in  each control device and MSI diagnostic
+            dataset. :code:`False`
             will return the union instead of the intersection, minus
             :math:`shotnum \le 0`. (see
             :class:`~.hdfreaddata.HDFReadData` for details)
 
+        :param samples:
+
+            :code:`None` (DEFAULT).  A slice selecting the window of the
+            time axis to be read.  :code:`start` and :code:`stop` are
+            sample indices or times (:class:`astropy.units.Quantity`)
+            measured from the first sample, and :code:`step` is a
+            sample stride, e.g. :code:`slice(1 * u.ms, 1.002 * u.ms, 2)`.
+            Only the selected samples are read from disk. (see
+            :class:`~.hdfreaddata.HDFReadData` for details)
+
+        :type samples: slice
+        :param int average:
+
+            :code:`None` (DEFAULT).  Number of consecutive samples to
+            average together (boxcar average) while the data is read,
+            so the full-rate signal is never held in memory.
+            :code:`info['sample average']` and :attr:`dt` of the
+            returned data include the averaging. (see
+            :class:`~.hdfreaddata.HDFReadData` for details)
+
+        :param bool lazy:
+
+            :code:`False` (DEFAULT).  Set :code:`True` to resolve the
+            shot numbers and control device data now, but defer reading
+            the digitizer signal until it is indexed through
+            :attr:`~.hdfreaddata.HDFReadData.signal`.  The returned
+            array has no :code:`'signal'` field.
+
+        :param bool masked:
+
+            :code:`False` (DEFAULT).  Set :code:`True`, with
+            :code:`intersection_set=False`, to only store the digitizer
+            signal of the shot numbers that were recorded.
+            :attr:`~.hdfreaddata.HDFReadData.signal` is then a
+            :class:`~.hdfmaskedsignal.HDFMaskedSignal` (indexing gives a
+            :class:`numpy.ma.MaskedArray`) and a :code:`'valid'` field
+            flags the shot numbers recorded by each control device.
+            (see :class:`~.hdfreaddata.HDFReadData` for details)
+
+        :param out:
+
+            :code:`None` (DEFAULT).  A preallocated array or a
+            :class:`~.bufferpool.BufferPool` to read the data into, so
+            that repeated reads in a loop reuse memory instead of
+            allocating new arrays. (see
+            :class:`~.hdfreaddata.HDFReadData` for details)
+
+        :type out: Union[numpy.ndarray, BufferPool]
         :param bool silent:
 
             :code:`False` (DEFAULT).  Set :code:`True` to ignore any
@@ -367,18 +552,299 @@ class File(h5py.File):
                 config_name=config_name,
                 keep_bits=keep_bits,
                 add_controls=add_controls,
+                add_msi=add_msi,
+                intersection_set=intersection_set,
+                samples=samples,
+                average=average,
+                lazy=lazy,
+                masked=masked,
+                out=out,
+                **kwargs,
+            )
+
+        return data
+
+    def read_channels(
+        self,
+        channels: List[Union[Tuple[int, int], Tuple[int, int, str]]],
+        index=slice(None),
+        shotnum=slice(None),
+        digitizer=None,
+        config_name=None,
+        keep_bits=False,
+        add_controls=None,
+        add_msi=None,
+        intersection_set=True,
+        samples=None,
+        average=None,
+        lazy=False,
+        masked=False,
+        out=None,
+        silent=False,
+        **kwargs,
+    ):
+        """
+        Reads several channels of a digitizer configuration in one
+        pass.  Shot numbers and control device data are resolved once
+        for all channels, and the signals are stacked along a channel
+        axis of the :code:`'signal'` field.
+        (see :meth:`.hdfreaddata.HDFReadData.from_channels` for details)
+
+        :param channels: list of :code:`(board, channel)` or
+            :code:`(board, channel, adc)` tuples
+        :type channels: List[Union[Tuple[int, int], Tuple[int, int, str]]]
+
+        All remaining arguments are the same as :meth:`read_data`.
+
+        :rtype: :class:`~.hdfreaddata.HDFReadData`
+
+        :Example:
+
+            >>> # open HDF5 file
+            >>> f = File('sample.hdf5')
+            >>>
+            >>> # read channels 1 and 2 of board 1
+            >>> data = f.read_channels([(1, 1), (1, 2)],
+            ...                        digitizer='SIS crate',
+            ...                        config_name='config01')
+            >>> data['signal'].shape
+            (1000, 2, 8192)
+            >>> data.info['channel']
+            (1, 2)
+        """
+        # to avoid cyclical imports
+        from bapsflib._hdf.utils.hdfreaddata import HDFReadData
+
+        warn_filter = "ignore" if silent else "default"
+        with warnings.catch_warnings():
+            warnings.simplefilter(warn_filter)
+            data = HDFReadData.from_channels(
+                self,
+                channels,
+                index=index,
+                shotnum=shotnum,
+                digitizer=digitizer,
+                config_name=config_name,
+                keep_bits=keep_bits,
+                add_controls=add_controls,
+                add_msi=add_msi,
                 intersection_set=intersection_set,
-                **kwargs
+                samples=samples,
+                average=average,
+                lazy=lazy,
+                masked=masked,
+                out=out,
+                **kwargs,
+            )
+
+        return data
+
+    def iter_data(
+        self,
+        board: int,
+        channel: int,
+        *,
+        chunk_shots=1000,
+        index=slice(None),
+        shotnum=slice(None),
+        digitizer=None,
+        adc=None,
+        config_name=None,
+        keep_bits=False,
+        add_controls=None,
+        add_msi=None,
+        intersection_set=True,
+        samples=None,
+        average=None,
+        masked=False,
+        out=None,
+        silent=False,
+        **kwargs,
+    ) -> Iterator:
+        """
+        Iterates over the digitizer data in blocks of at most
+        :data:`chunk_shots` shot numbers, attaching control device
+        data when requested.  Shot numbers and control device data are
+        resolved once, and only the digitizer data for the current
+        block is held in memory.  Each block is the same as the
+        corresponding rows returned by :meth:`read_data`. (see
+        :meth:`.hdfreaddata.HDFReadData.iter_chunks` for details)
+
+        :param board: digitizer board number
+        :param channel: digitizer channel number
+        :param int chunk_shots: maximum number of shot numbers per
+            yielded block (DEFAULT :code:`1000`)
+        :param out: a :class:`~.bufferpool.BufferPool` providing the
+            memory of the yielded blocks, :code:`None` (DEFAULT) to
+            allocate each block
+
+        All remaining arguments are the same as :meth:`read_data`, but
+        are keyword-only.
+
+        :rtype: Iterator[:class:`~.hdfreaddata.HDFReadData`]
+
+        :Example:
+
+            >>> # open HDF5 file
+            >>> f = File('sample.hdf5')
+            >>>
+            >>> # stream the data for board 1, channel 1 in blocks of
+            >>> # 500 shots
+            >>> for data in f.iter_data(1, 1, chunk_shots=500,
+            ...                         digitizer='SIS crate',
+            ...                         adc='SIS 3302',
+            ...                         config_name='config01'):
+            ...     print(data.shape)
+            (500,)
+            (500,)
+            (120,)
+        """
+        # to avoid cyclical imports
+        from bapsflib._hdf.utils.hdfreaddata import HDFReadData
+
+        chunks = HDFReadData.iter_chunks(
+            self,
+            board,
+            channel,
+            chunk_shots=chunk_shots,
+            index=index,
+            shotnum=shotnum,
+            digitizer=digitizer,
+            adc=adc,
+            config_name=config_name,
+            keep_bits=keep_bits,
+            add_controls=add_controls,
+            add_msi=add_msi,
+            intersection_set=intersection_set,
+            samples=samples,
+            average=average,
+            masked=masked,
+            out=out,
+            **kwargs,
+        )
+
+        # only filter warnings while a block is being read, not while
+        # the caller is processing it
+        warn_filter = "ignore" if silent else "default"
+        while True:
+            with warnings.catch_warnings():
+                warnings.simplefilter(warn_filter)
+                try:
+                    data = next(chunks)
+                except StopIteration:
+                    return
+            yield data
+
+    def read_position_stats(
+        self,
+        board: int,
+        channel: int,
+        add_controls=None,
+        chunk_shots=1000,
+        ddof=0,
+        silent=False,
+        **kwargs,
+    ):
+        """
+        Computes the count, mean, and variance of the digitizer signal
+        at each unique :code:`'xyz'` probe position.  The digitizer data
+        is streamed in blocks of :data:`chunk_shots` shots and the
+        statistics are accumulated in :code:`float64`, so memory scales
+        with the number of positions instead of the number of shots.
+        (see :class:`~.hdfpositionstats.HDFPositionStats` for details)
+
+        :param board: digitizer board number
+        :param channel: digitizer channel number
+        :param add_controls: control device(s) providing the probe
+            positions, same as in :meth:`read_data`
+        :type add_controls: List[Union[str, Tuple[str, Any]]]
+        :param int chunk_shots: maximum number of shot numbers read per
+            block (DEFAULT :code:`1000`)
+        :param int ddof: delta degrees of freedom of the variance
+            (DEFAULT :code:`0`)
+        :param bool silent:
+
+            :code:`False` (DEFAULT).  Set :code:`True` to ignore any
+            UserWarnings (soft-warnings)
+
+        The keywords :data:`index`, :data:`shotnum`, :data:`digitizer`,
+        :data:`adc`, :data:`config_name`, :data:`keep_bits`,
+        :data:`samples`, and :data:`average` behave as in
+        :meth:`read_data`.
+
+        :rtype: :class:`~.hdfpositionstats.HDFPositionStats`
+
+        :Example:
+
+            >>> # open HDF5 file
+            >>> f = File('sample.hdf5')
+            >>>
+            >>> # mean waveform at each probe position
+            >>> stats = f.read_position_stats(
+            ...     1, 1, add_controls=[('6K Compumotor', 3)])
+            >>> stats['xyz'].shape, stats['mean'].shape
+            ((25, 3), (25, 8192))
+        """
+        # to avoid cyclical imports
+        from bapsflib._hdf.utils.hdfpositionstats import HDFPositionStats
+
+        warn_filter = "ignore" if silent else "default"
+        with warnings.catch_warnings():
+            warnings.simplefilter(warn_filter)
+            data = HDFPositionStats(
+                self,
+                board,
+                channel,
+                add_controls=add_controls,
+                chunk_shots=chunk_shots,
+                ddof=ddof,
+                **kwargs,
             )
 
         return data
 
-    def read_msi(self, msi_diag: str, silent=False, **kwargs):
+    def read_msi(
+        self,
+        msi_diag: str,
+        index=slice(None),
+        shotnum=slice(None),
+        reduce=None,
+        samples=None,
+        silent=False,
+        **kwargs,
+    ):
         """
         Reads data from MSI Diagnostic datasets.  See
         :class:`~.hdfreadmsi.HDFReadMSI` for more detail.
 
         :param msi_diag: name of MSI diagnostic
+        :param index: dataset row index
+        :type index: Union[int, list(int), slice(), numpy.array]
+        :param shotnum:
+
+            HDF5 global shot number(s), only the entries of the shot
+            numbers recorded by the diagnostic are returned.  As in
+            :meth:`read_data`, :data:`shotnum` is only used if
+            :data:`index` is not given, and only the selected rows are
+            read from the diagnostic datasets.
+
+        :type shotnum: Union[int, list(int), slice(), numpy.array, ShotSet]
+        :param reduce:
+
+            :code:`None` (DEFAULT).  A reduction of each data array to
+            one value per shot number (e.g. :code:`'max'`,
+            :code:`'mean'`, or :code:`'integral'`), computed
+            block-by-block without holding the full traces in memory.
+            Named reductions are cached in :attr:`reduction_cache`.
+
+        :type reduce: Union[str, Callable]
+        :param samples:
+
+            :code:`None` (DEFAULT).  A slice selecting the window of the
+            time axis of the data arrays to be read (or reduced), as
+            sample indices or times (:class:`astropy.units.Quantity`).
+
+        :type samples: slice
         :param bool silent:
 
             :code:`False` (DEFAULT).  Set :code:`True` to ignore any
@@ -399,12 +865,29 @@ class File(h5py.File):
             >>> mdata = f.read_msi('Interferometer array')
             >>> type(mdata)
             bapsflib._hdf.utils.hdfreadmsi.HDFReadMSI
+            >>>
+            >>> # only read shot numbers 100 to 199
+            >>> mdata = f.read_msi('Interferometer array',
+            ...                    shotnum=slice(100, 200))
+            >>>
+            >>> # peak discharge current of each shot number
+            >>> mdata = f.read_msi('Discharge', reduce='max')
+            >>> mdata['current'].shape == mdata['shotnum'].shape
+            True
         """
         from bapsflib._hdf.utils.hdfreadmsi import HDFReadMSI
 
         warn_filter = "ignore" if silent else "default"
         with warnings.catch_warnings():
             warnings.simplefilter(warn_filter)
-            data = HDFReadMSI(self, msi_diag, **kwargs)
+            data = HDFReadMSI(
+                self,
+                msi_diag,
+                index=index,
+                shotnum=shotnum,
+                reduce=reduce,
+                samples=samples,
+                **kwargs,
+            )
 
         return data
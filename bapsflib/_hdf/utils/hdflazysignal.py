@@ -0,0 +1,303 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+#
+"""
+Module containing the `~bapsflib._hdf.utils.hdflazysignal.HDFLazySignal`
+class.
+"""
+__all__ = ["HDFLazySignal"]
+
+import h5py
+import numpy as np
+
+from typing import List, Tuple, Union
+
+from bapsflib._hdf.utils.helpers import read_dset_rows
+
+
+class HDFLazySignal(object):
+    """
+    Array-like stand-in for the :code:`'signal'` field of a lazily read
+    :class:`~.hdfreaddata.HDFReadData` array.  Nothing is read from the
+    HDF5 file until the object is indexed, and then only the selected
+    rows and samples are read from the digitizer dataset(s).
+
+    The first axis is the shot number axis, aligned with the shot
+    numbers the object was created with.  Multi-channel reads have a
+    channel axis second.  The last axis is the sample (time) axis.
+    Indexing is orthogonal (like :mod:`h5py`), i.e. each index is
+    applied to its own axis independently.
+
+    :Example:
+
+        >>> data = f.read_data(1, 1, lazy=True)
+        >>> sig = data.signal
+        >>> sig.shape
+        (1000, 8192)
+        >>>
+        >>> # only shots 10 to 19 and the first 100 samples are read
+        >>> sig[10:20, :100].shape
+        (10, 100)
+        >>>
+        >>> # read everything
+        >>> arr = sig.read()
+    """
+
+    def __init__(
+        self,
+        datasets: List[h5py.Dataset],
+        shotnum: np.ndarray,
+        rows: List[np.ndarray],
+        dtype,
+        conversions: Union[List[Tuple[float, float]], None] = None,
+        channel_axis=False,
+        samples: slice = None,
+        average: int = 1,
+    ):
+        """
+        :param datasets: digitizer dataset for each channel
+        :param shotnum: shot numbers aligned with the first axis
+        :param rows: for each channel, the dataset row of each shot
+            number in :data:`shotnum` (:code:`-1` if the shot number
+            was not recorded)
+        :param dtype: :mod:`numpy` dtype of the returned data
+        :param conversions: for each channel, the voltage step size and
+            offset :code:`(dv, offset)` used to convert bits to volts,
+            :code:`None` to keep bits
+        :param bool channel_axis: :code:`True` if the data has a channel
+            axis (multi-channel read)
+        :param samples: slice of the dataset samples making up the last
+            axis (step must be positive), :code:`None` (DEFAULT) for all
+            samples
+        :type samples: slice
+        :param int average: number of consecutive samples averaged into
+            each element of the last axis (DEFAULT :code:`1`), requires
+            a unit step :data:`samples` and a floating point
+            :data:`dtype`
+        """
+        if len(datasets) > 1 and not channel_axis:
+            raise ValueError("Multiple datasets require `channel_axis=True`.")
+        if samples is None:
+            samples = slice(None)
+        samples = slice(*samples.indices(datasets[0].shape[1]))
+        if samples.step < 1:
+            raise ValueError("Argument `samples` must have a positive step.")
+        if average != 1 and (
+            samples.step != 1 or not np.issubdtype(np.dtype(dtype), np.floating)
+        ):
+            raise ValueError(
+                "Argument `average` requires a unit step `samples` and a floating "
+                "point `dtype`."
+            )
+
+        self._datasets = list(datasets)
+        self._shotnum = np.asarray(shotnum, dtype=np.uint32)
+        self._rows = [np.asarray(row, dtype=np.int64) for row in rows]
+        self._dtype = np.dtype(dtype)
+        self._conversions = conversions
+        self._channel_axis = channel_axis
+        self._samples = samples
+        self._average = average
+
+    @property
+    def dtype(self) -> np.dtype:
+        """:mod:`numpy` dtype of the data returned when indexed"""
+        return self._dtype
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions."""
+        return len(self.shape)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Shape of the (unread) data."""
+        shape = (self._shotnum.size,)
+        if self._channel_axis:
+            shape += (len(self._datasets),)
+        return shape + (len(self._sample_range),)
+
+    @property
+    def _sample_range(self) -> range:
+        """
+        Dataset sample positions of the last axis (the first sample of
+        each average).
+        """
+        start, stop, step = self._samples.start, self._samples.stop, self._samples.step
+        n_avg = len(range(start, stop, step)) // self._average
+        return range(start, start + n_avg * step * self._average, step * self._average)
+
+    @property
+    def shotnum(self) -> np.ndarray:
+        """Shot numbers aligned with the first axis."""
+        return self._shotnum
+
+    def __len__(self):
+        return self._shotnum.size
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} shape={self.shape} " f"dtype={self.dtype.name}>"
+        )
+
+    def __array__(self, dtype=None):
+        arr = self.read()
+        return arr if dtype is None else arr.astype(dtype, copy=False)
+
+    def __getitem__(self, item):
+        # expand `item` to one index per axis
+        if not isinstance(item, tuple):
+            item = (item,)
+        is_ellipsis = [key is Ellipsis for key in item]
+        if sum(is_ellipsis) > 1:
+            raise IndexError("an index can only have a single ellipsis ('...')")
+        elif sum(is_ellipsis) == 1:
+            ii = is_ellipsis.index(True)
+            n_fill = self.ndim - len(item) + 1
+            item = item[:ii] + (slice(None),) * n_fill + item[ii + 1 :]
+        if len(item) > self.ndim:
+            raise IndexError(
+                f"too many indices for {self.__class__.__name__}: "
+                f"{self.ndim}-dimensional, but {len(item)} were indexed"
+            )
+        item = item + (slice(None),) * (self.ndim - len(item))
+        shot_key = item[0]
+        chan_key = item[1] if self._channel_axis else 0
+        sample_key = item[-1]
+
+        # resolve shot and channel positions
+        shots = np.arange(self._shotnum.size)[shot_key]
+        chans = np.arange(len(self._datasets))[chan_key]
+
+        # only read simple (positive step) sample slices
+        # - selections are mapped to dataset samples through
+        #   `self._samples`
+        #
+        sample_range = self._sample_range
+        if self._average != 1:
+            # read the span of averages covering the selection
+            pos = np.arange(len(sample_range))[sample_key]
+            lo = int(pos.min()) if pos.size else 0
+            hi = int(pos.max()) + 1 if pos.size else 0
+            h5_key = slice(
+                sample_range.start + lo * self._average,
+                sample_range.start + hi * self._average,
+            )
+            post_key = pos - lo
+        elif isinstance(sample_key, (int, np.integer)):
+            try:
+                sample = sample_range[sample_key]
+            except IndexError:
+                raise IndexError(
+                    f"index {sample_key} is out of bounds for axis {self.ndim - 1} "
+                    f"with size {len(sample_range)}"
+                )
+            h5_key = slice(sample, sample + 1)
+            post_key = 0
+        elif isinstance(sample_key, slice) and (sample_key.step or 1) > 0:
+            sub_range = sample_range[sample_key]
+            h5_key = slice(sub_range.start, sub_range.stop, sub_range.step)
+            post_key = None
+        else:
+            h5_key = self._samples
+            post_key = sample_key
+
+        arrs = [
+            self._read_channel(chan, np.atleast_1d(shots), h5_key)
+            for chan in np.atleast_1d(chans)
+        ]
+        arr = arrs[0] if np.ndim(chans) == 0 else np.stack(arrs, axis=1)
+        if post_key is not None:
+            arr = arr[..., post_key]
+        if np.ndim(shots) == 0:
+            arr = arr[0]
+
+        return arr
+
+    def _read_channel(self, chan: int, shots: np.ndarray, h5_key: slice) -> np.ndarray:
+        """
+        Read the dataset rows of channel :data:`chan` for the shot
+        number positions :data:`shots`, filling the shot numbers not
+        recorded by the channel with :code:`numpy.nan` (or :code:`0`
+        for integer dtypes).
+        """
+        dset = self._datasets[chan]
+        rows = self._rows[chan][shots]
+        valid = rows >= 0
+
+        # read each row once
+        # - averages are accumulated in float64 (like the eager read)
+        #   and then cast to `self._dtype`
+        #
+        urows, inverse = np.unique(rows[valid], return_inverse=True)
+        inverse = inverse.reshape(-1)
+        sample_shape = (len(range(*h5_key.indices(dset.shape[1]))) // self._average,)
+        if self._average != 1:
+            block = read_dset_rows(
+                dset, urows, samples=h5_key, average=self._average
+            ).astype(self._dtype, copy=False)
+        else:
+            block = read_dset_rows(
+                dset,
+                urows,
+                out=np.empty((urows.size,) + sample_shape, dtype=self._dtype),
+                samples=h5_key,
+            )
+        if self._conversions is not None:
+            dv, offset = self._conversions[chan]
+            np.multiply(block, dv, out=block)
+            np.subtract(block, offset, out=block)
+
+        arr = np.empty((shots.size,) + sample_shape, dtype=self._dtype)
+        arr[valid] = block[inverse]
+        if np.issubdtype(self._dtype, np.integer):
+            arr[np.logical_not(valid)] = 0
+        else:
+            arr[np.logical_not(valid)] = np.nan
+
+        return arr
+
+    def read(self) -> np.ndarray:
+        """Read and return all the data."""
+        return self[...]
+
+    def for_shotnum(self, shotnum: np.ndarray) -> "HDFLazySignal":
+        """
+        Return a new :class:`HDFLazySignal` whose first axis is aligned
+        with :data:`shotnum`.  All of :data:`shotnum` must be contained
+        in :attr:`shotnum`.
+
+        :param shotnum: shot numbers for the new first axis
+        """
+        shotnum = np.asarray(shotnum, dtype=np.uint32).reshape(-1)
+
+        # locate `shotnum` in `self._shotnum`
+        # - `self._shotnum` follows the dataset rows, so it is not
+        #   necessarily sorted
+        #
+        sorter = np.argsort(self._shotnum, kind="stable")
+        pos = np.searchsorted(self._shotnum, shotnum, sorter=sorter)
+        if np.any(pos == self._shotnum.size) or not np.array_equal(
+            self._shotnum[sorter[pos]], shotnum
+        ):
+            raise ValueError("`shotnum` contains shot numbers not in `self.shotnum`.")
+        pos = sorter[pos]
+
+        return self.__class__(
+            self._datasets,
+            shotnum,
+            [row[pos] for row in self._rows],
+            self._dtype,
+            conversions=self._conversions,
+            channel_axis=self._channel_axis,
+            samples=self._samples,
+            average=self._average,
+        )
@@ -0,0 +1,208 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module containing the
+`~bapsflib._hdf.utils.hdfmaskedsignal.HDFMaskedSignal` class.
+"""
+__all__ = ["HDFMaskedSignal"]
+
+import numpy as np
+
+from typing import Tuple
+
+
+class HDFMaskedSignal(object):
+    """
+    Array-like stand-in for the :code:`'signal'` field of a masked
+    union read (:code:`intersection_set=False, masked=True`) of
+    :class:`~.hdfreaddata.HDFReadData`.
+
+    Only the shot numbers recorded by at least one digitizer channel
+    are stored (the compact :attr:`data` payload), together with a
+    validity mask (:attr:`valid`) of the shot numbers each channel
+    recorded.  Memory is proportional to the recorded data, not to
+    the union of the requested shot numbers.
+
+    The first axis is the shot number axis, aligned with the shot
+    numbers the object was created with.  Multi-channel reads have a
+    channel axis second.  The last axis is the sample (time) axis.
+    Indexing returns a :class:`numpy.ma.MaskedArray` that masks the
+    shot numbers not recorded by a channel, and only the indexed shot
+    numbers are expanded.
+
+    :Example:
+
+        >>> data = f.read_data(1, 1, intersection_set=False, masked=True)
+        >>> sig = data.signal
+        >>> sig.shape, sig.data.shape
+        ((1000, 8192), (200, 8192))
+        >>>
+        >>> # masked array of the first 10 shot numbers
+        >>> sig[:10].mask.shape
+        (10, 8192)
+        >>>
+        >>> # the recorded shot numbers
+        >>> data['shotnum'][sig.valid]
+    """
+
+    def __init__(self, shotnum: np.ndarray, valid: np.ndarray, data: np.ndarray):
+        """
+        :param shotnum: shot numbers aligned with the first axis
+        :param valid: boolean mask of the shot numbers recorded by each
+            channel, of shape :code:`(shotnum.size,)` or, for a
+            multi-channel read, :code:`(shotnum.size, nchan)`
+        :param data: the signal of the shot numbers recorded by at
+            least one channel (in the order of :data:`shotnum`), with
+            the channel axis (if any) second
+        """
+        self._shotnum = np.asarray(shotnum, dtype=np.uint32).reshape(-1)
+        self._valid = np.asarray(valid, dtype=bool)
+        self._data = data
+        if self._valid.shape[0] != self._shotnum.size:
+            raise ValueError("Arguments `shotnum` and `valid` must be the same length.")
+
+        # payload row of each shot number (-1 if not recorded)
+        any_valid = self._any_valid
+        if data.shape[0] != np.count_nonzero(any_valid):
+            raise ValueError(
+                "The first axis of argument `data` must match the number of shot "
+                "numbers recorded by at least one channel."
+            )
+        self._pos = np.cumsum(any_valid, dtype=np.int64) - 1
+        self._pos[np.logical_not(any_valid)] = -1
+
+    @property
+    def _any_valid(self) -> np.ndarray:
+        """Mask of the shot numbers recorded by at least one channel."""
+        return self._valid if self._valid.ndim == 1 else self._valid.any(axis=1)
+
+    @property
+    def data(self) -> np.ndarray:
+        """The compact signal payload."""
+        return self._data
+
+    @property
+    def dtype(self) -> np.dtype:
+        """:mod:`numpy` dtype of the signal"""
+        return self._data.dtype
+
+    @property
+    def fill_value(self):
+        """
+        Value given to the shot numbers not recorded by a channel when
+        the signal is expanded (:code:`numpy.nan`, or :code:`0` for
+        integer dtypes).
+        """
+        return 0 if np.issubdtype(self.dtype, np.integer) else np.nan
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the payload and the validity mask."""
+        return self._data.nbytes + self._valid.nbytes
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions."""
+        return len(self.shape)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Shape of the (expanded) signal."""
+        return (self._shotnum.size,) + self._data.shape[1:]
+
+    @property
+    def shotnum(self) -> np.ndarray:
+        """Shot numbers aligned with the first axis."""
+        return self._shotnum
+
+    @property
+    def valid(self) -> np.ndarray:
+        """
+        Boolean mask of the shot numbers recorded by each channel, with
+        the channel axis (if any) second.
+        """
+        return self._valid
+
+    def __len__(self):
+        return self._shotnum.size
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} shape={self.shape} "
+            f"stored={self._data.shape[0]} dtype={self.dtype.name}>"
+        )
+
+    def __array__(self, dtype=None):
+        arr = self.filled()
+        return arr if dtype is None else arr.astype(dtype, copy=False)
+
+    def __getitem__(self, item) -> np.ma.MaskedArray:
+        if not isinstance(item, tuple):
+            item = (item,)
+        if len(item) == 0 or item[0] is Ellipsis:
+            # the shot number axis is covered by the ellipsis
+            return self._expand(np.arange(self._shotnum.size))[item]
+
+        # only expand the selected shot numbers
+        shot_key, rest = item[0], item[1:]
+        shots = np.arange(self._shotnum.size)[shot_key]
+        arr = self._expand(np.atleast_1d(shots))
+        if np.ndim(shots) == 0:
+            return arr[(0,) + rest]
+
+        return arr[(slice(None),) + rest]
+
+    def _expand(self, shots: np.ndarray) -> np.ma.MaskedArray:
+        """Masked signal of the shot number positions **shots**."""
+        pos = self._pos[shots]
+        has_data = pos >= 0
+        arr = np.empty((shots.size,) + self._data.shape[1:], dtype=self.dtype)
+        arr[has_data] = self._data[pos[has_data]]
+        arr[np.logical_not(has_data)] = self.fill_value
+
+        # broadcast the shot/channel mask along the sample axis
+        mask = np.logical_not(self._valid[shots])
+        mask = np.broadcast_to(mask[..., np.newaxis], arr.shape).copy()
+        return np.ma.MaskedArray(arr, mask=mask, fill_value=self.fill_value)
+
+    def filled(self, fill_value=None) -> np.ndarray:
+        """
+        Expand the signal to all shot numbers, filling the shot numbers
+        not recorded by a channel with **fill_value** (DEFAULT
+        :attr:`fill_value`).
+        """
+        arr = self[...]
+        return arr.filled(self.fill_value if fill_value is None else fill_value)
+
+    def read(self) -> np.ma.MaskedArray:
+        """Expand the signal to all shot numbers as a masked array."""
+        return self[...]
+
+    def for_shotnum(self, shotnum: np.ndarray) -> "HDFMaskedSignal":
+        """
+        Return a new :class:`HDFMaskedSignal` whose first axis is
+        aligned with :data:`shotnum`.  All of :data:`shotnum` must be
+        contained in :attr:`shotnum`.
+
+        :param shotnum: shot numbers for the new first axis
+        """
+        shotnum = np.asarray(shotnum, dtype=np.uint32).reshape(-1)
+        if np.array_equal(shotnum, self._shotnum):
+            return self
+
+        pos = np.searchsorted(self._shotnum, shotnum)
+        if np.any(pos == self._shotnum.size) or not np.array_equal(
+            self._shotnum[pos], shotnum
+        ):
+            raise ValueError("`shotnum` contains shot numbers not in `self.shotnum`.")
+
+        rows = self._pos[pos]
+        return self.__class__(shotnum, self._valid[pos], self._data[rows[rows >= 0]])
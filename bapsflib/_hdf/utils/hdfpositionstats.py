@@ -0,0 +1,242 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module containing the
+`~bapsflib._hdf.utils.hdfpositionstats.HDFPositionStats` class.
+"""
+__all__ = ["HDFPositionStats"]
+
+import copy
+import numpy as np
+
+from typing import Dict, List
+
+from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.hdfreaddata import HDFReadData
+
+
+class HDFPositionStats(np.ndarray):
+    """
+    Computes the ensemble statistics of a digitizer signal for each
+    probe position.
+
+    The digitizer data is streamed in blocks (see
+    :meth:`~bapsflib._hdf.utils.hdfreaddata.HDFReadData.iter_chunks`)
+    and the shots of each block are grouped by their :code:`'xyz'`
+    position.  The count, mean, and sum of squared deviations of each
+    position are accumulated in :code:`float64` and merged block by
+    block with the pairwise update of Chan et al., so memory scales
+    with the number of positions instead of the number of shots.
+
+    The constructed structured numpy array has one entry per unique
+    position, sorted by position, with the fields:
+
+    .. csv-table::
+        :header: "Field", "Description"
+        :widths: 10, 40
+
+        :code:`'xyz'`, "probe position"
+        :code:`'count'`, "number of shots taken at the position"
+        :code:`'mean'`, "mean signal of the shots"
+        :code:`'var'`, "variance of the signal, :code:`numpy.nan` if
+        :code:`'count'` is not larger than :data:`ddof`"
+
+    :Example:
+
+        >>> # mean waveform at each '6K Compumotor' position
+        >>> stats = HDFPositionStats(f, 1, 1,
+        ...                          add_controls=[('6K Compumotor', 3)])
+        >>> stats.dtype
+        dtype([('xyz', '<f4', (3,)), ('count', '<u4'),
+               ('mean', '<f8', (8192,)), ('var', '<f8', (8192,))])
+    """
+
+    def __new__(
+        cls,
+        hdf_file: File,
+        board: int,
+        channel: int,
+        add_controls=None,
+        chunk_shots=1000,
+        ddof=0,
+        **kwargs,
+    ):
+        """
+        :param hdf_file: HDF5 file object
+        :param board: analog-digital-converter board number
+        :param channel: analog-digital-converter channel number
+        :param add_controls: control devices providing the
+            :code:`'xyz'` positions (see
+            :class:`~bapsflib._hdf.utils.hdfreaddata.HDFReadData`).
+            Without a positional control device all shots are grouped
+            together.
+        :param int chunk_shots: maximum number of shots read per block
+            (DEFAULT :code:`1000`)
+        :param int ddof: delta degrees of freedom of the variance
+            (DEFAULT :code:`0`)
+
+        The keywords :data:`index`, :data:`shotnum`, :data:`digitizer`,
+        :data:`config_name`, :data:`adc`, :data:`keep_bits`,
+        :data:`samples` and :data:`average` are passed on to
+        :meth:`~bapsflib._hdf.utils.hdfreaddata.HDFReadData.iter_chunks`.
+        Only shots recorded by the digitizer and all control devices
+        are used (i.e. :data:`intersection_set=True`), and the signal
+        is always read (:data:`lazy` and :data:`masked` are not
+        supported).
+        """
+        if not isinstance(ddof, (int, np.integer)) or isinstance(ddof, bool):
+            raise TypeError(f"Argument `ddof` must be an int, got type {type(ddof)}.")
+        elif ddof < 0:
+            raise ValueError(f"Argument `ddof` must be >= 0, got {ddof}.")
+        if "intersection_set" in kwargs:
+            raise TypeError(
+                "Argument `intersection_set` is not supported, only shots recorded "
+                "by all devices are used."
+            )
+        for name in ("lazy", "masked"):
+            if name in kwargs:
+                raise TypeError(
+                    f"Argument `{name}` is not supported, the statistics need the "
+                    f"'signal' field of each block."
+                )
+
+        # accumulate
+        # - `keys` maps the bytes of a position to its accumulator
+        #   index
+        #
+        keys = {}  # type: Dict[bytes, int]
+        xyz = []  # type: List[np.ndarray]
+        count = []  # type: List[int]
+        mean = []  # type: List[np.ndarray]
+        m2 = []  # type: List[np.ndarray]
+        info = None
+        sigshape = None
+        for data in HDFReadData.iter_chunks(
+            hdf_file,
+            board,
+            channel,
+            chunk_shots=chunk_shots,
+            add_controls=add_controls,
+            **kwargs,
+        ):
+            if info is None:
+                info = data.info
+                sigshape = data.dtype["signal"].shape
+            if data.size == 0:  # pragma: no cover
+                continue
+
+            # statistics of each position in the block
+            bxyz, bcount, bmean, bm2 = cls._block_stats(data["xyz"], data["signal"])
+
+            # merge into the accumulators
+            for ii, key in enumerate(
+                np.ascontiguousarray(bxyz).view(np.dtype((np.void, 12))).ravel()
+            ):
+                key = key.tobytes()
+                nb = int(bcount[ii])
+                if key not in keys:
+                    keys[key] = len(count)
+                    xyz.append(bxyz[ii])
+                    count.append(nb)
+                    mean.append(bmean[ii])
+                    m2.append(bm2[ii])
+                    continue
+
+                jj = keys[key]
+                na = count[jj]
+                n = na + nb
+                delta = bmean[ii] - mean[jj]
+                mean[jj] += delta * (nb / n)
+                m2[jj] += bm2[ii] + np.square(delta) * (na * nb / n)
+                count[jj] = n
+
+        # ---- Build `obj`                                          ----
+        if sigshape is None:
+            # no blocks were read
+            sigshape = (0,)
+        dtype = [
+            ("xyz", np.float32, (3,)),
+            ("count", np.uint32),
+            ("mean", np.float64, sigshape),
+            ("var", np.float64, sigshape),
+        ]
+        data = np.empty(len(count), dtype=dtype)
+        if len(count) != 0:
+            xyz = np.stack(xyz)
+            order = np.lexsort(xyz.T[::-1])
+            data["xyz"] = xyz[order]
+            data["count"] = np.asarray(count)[order]
+            for ii, jj in enumerate(order):
+                data["mean"][ii] = mean[jj]
+                if count[jj] > ddof:
+                    data["var"][ii] = m2[jj] / (count[jj] - ddof)
+                else:
+                    data["var"][ii] = np.nan
+
+        obj = data.view(cls)
+        obj._info = {} if info is None else copy.deepcopy(info)
+        obj._info["ddof"] = ddof
+
+        return obj
+
+    @staticmethod
+    def _block_stats(xyz: np.ndarray, signal: np.ndarray):
+        """
+        Groups a block of shots by position and returns the unique
+        positions with their shot count, mean signal, and sum of
+        squared deviations from the mean.
+        """
+        # normalize the position bytes
+        # - -0.0 becomes 0.0 and all NaN payloads become numpy.nan, so
+        #   equal positions are grouped together
+        #
+        xyz = np.ascontiguousarray(xyz, dtype=np.float32) + np.float32(0.0)
+        xyz[np.isnan(xyz)] = np.nan
+        bxyz, first, inverse, counts = np.unique(
+            xyz.view(np.dtype((np.void, 12))).ravel(),
+            return_index=True,
+            return_inverse=True,
+            return_counts=True,
+        )
+        bxyz = xyz[first]
+
+        # group the shots of each position together
+        order = np.argsort(inverse, kind="stable")
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        sig = signal[order].astype(np.float64)
+
+        # mean and squared deviations in float64
+        bshape = (counts.size,) + (1,) * (sig.ndim - 1)
+        bmean = np.add.reduceat(sig, starts, axis=0) / counts.reshape(bshape)
+        sig -= np.repeat(bmean, counts, axis=0)
+        np.square(sig, out=sig)
+        bm2 = np.add.reduceat(sig, starts, axis=0)
+
+        return bxyz, counts, bmean, bm2
+
+    def __array_finalize__(self, obj):
+        # This should only be True during explicit construction
+        # if obj is None:
+        if obj is None or obj.__class__ is np.ndarray:
+            return
+
+        # Define _info attribute
+        self._info = getattr(obj, "_info", {"ddof": None})
+
+    @property
+    def info(self) -> dict:
+        """
+        A dictionary of meta-info for the statistics.  These are the
+        :attr:`~bapsflib._hdf.utils.hdfreaddata.HDFReadData.info`
+        items of the read digitizer data plus the :code:`'ddof'` used
+        for the variance.
+        """
+        return self._info
@@ -18,7 +18,6 @@ import copy
 import h5py
 import numpy as np
 import os
-import time
 
 from functools import reduce
 from typing import Any, Dict, Iterable, List, Tuple, Union
@@ -28,13 +27,16 @@ from bapsflib._hdf.maps.controls.templates import (
     HDFMapControlCLTemplate,
     HDFMapControlTemplate,
 )
+from bapsflib._hdf.utils.export import ExportMixin
 from bapsflib._hdf.utils.file import File
 from bapsflib._hdf.utils.helpers import (
-    build_shotnum_dset_relation,
     condition_controls,
     condition_shotnum,
-    do_shotnum_intersection,
+    get_shotnum_resolver,
+    intersect_shotnum,
+    read_dset_rows,
 )
+from bapsflib._hdf.utils.instrument import stage_timer
 
 # define type aliases
 ControlMap = Union[HDFMapControlTemplate, HDFMapControlCLTemplate]
@@ -42,7 +44,7 @@ ControlsType = Union[str, Iterable[Union[str, Tuple[str, Any]]]]
 IndexDict = Dict[str, np.ndarray]
 
 
-class HDFReadControls(np.ndarray):
+class HDFReadControls(ExportMixin, np.ndarray):
     """
     Reads control device data from the HDF5 file.
 
@@ -105,6 +107,8 @@ class HDFReadControls(np.ndarray):
         controls: ControlsType,
         shotnum=slice(None),
         intersection_set=True,
+        categorical=False,
+        masked=False,
         **kwargs,
     ):
         """
@@ -115,12 +119,20 @@ class HDFReadControls(np.ndarray):
         :type controls: Union[str, Iterable[str, Tuple[str, Any]]]
         :param shotnum: HDF5 file shot number(s) indicating data
             entries to be extracted
-        :type shotnum: Union[int, List[int], slice, numpy.ndarray]
+        :type shotnum: Union[int, List[int], slice, numpy.ndarray, ShotSet]
         :param bool intersection_set: :code:`True` (DEFAULT) will force
             the returned shot numbers to be the intersection of
             :data:`shotnum` and the shot numbers contained in each
             control device dataset. :code:`False` will return the union
             instead of the intersection
+        :param bool categorical: :code:`True` to return the fields of
+            command list controls (e.g. :code:`'Waveform'`) as the
+            command indices instead of the command values (DEFAULT
+            :code:`False`)
+        :param bool masked: :code:`True` to flag the shot numbers
+            recorded by each control device in a :code:`'valid'` field
+            instead of giving the missing entries NULL values (DEFAULT
+            :code:`False`)
 
         Behavior of :data:`shotnum` and :data:`intersection_set`:
             * :data:`shotnum` indexing starts at 1
@@ -136,17 +148,46 @@ class HDFReadControls(np.ndarray):
               be given a NULL value of :code:`-99999`, :code:`0`,
               :code:`numpy.nan`, or :code:`''`, depending on the
               :code:`numpy.dtype`.
+
+        Behavior of :data:`categorical`:
+            * The command list fields hold the index of the command
+              into its command table, using the smallest unsigned
+              integer dtype that fits the table size.
+            * The command tables are stored in
+              :code:`info['controls'][control]['command tables']`,
+              a dictionary mapping the field name to a
+              :class:`numpy.ndarray` of the command values, i.e. the
+              command values are
+              :code:`table[data[field]]`.
+            * Shot numbers without a command (see
+              :data:`intersection_set`) are given the index
+              :code:`len(table)`.
+
+        Behavior of :data:`masked`:
+            * A boolean :code:`'valid'` field is added with one column
+              per control device, in the order of
+              :code:`info['controls']`, i.e.
+              :code:`data['valid'][:, ii]` is :code:`True` for the shot
+              numbers recorded by the :code:`ii`-th control device.
+            * The entries of shot numbers that are not recorded are
+              left zeroed instead of being NULL filled (see
+              :data:`intersection_set`), so checks like
+              :code:`numpy.isnan(data['xyz'])` do not find them, use
+              the :code:`'valid'` field instead.
+            * The control device fields are not compacted, they still
+              hold an entry for every shot number in
+              :code:`'shotnum'`.
         """
-        # initialize timing
-        tt = []
-        if "timeit" in kwargs:  # pragma: no cover
-            timeit = kwargs["timeit"]
-            if timeit:
-                tt.append(time.time())
-            else:
-                timeit = False
-        else:
-            timeit = False
+        # initialize the stage timer (see `instrument`)
+        # - `timeit` is the deprecated way of reporting stage durations
+        timeit = bool(kwargs.get("timeit", False))
+        if timeit:
+            warn(
+                "The `timeit` keyword is deprecated, use "
+                "bapsflib._hdf.utils.instrument.instrument() instead.",
+                DeprecationWarning,
+            )
+        timer = stage_timer("HDFReadControls", timeit=timeit)
 
         # ---- Condition `hdf_file`                                 ----
         # - `hdf_file` is a lapd.File object
@@ -156,11 +197,6 @@ class HDFReadControls(np.ndarray):
                 f"`hdf_file` is NOT type `{File.__module__}.{File.__qualname__}`"
             )
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - hdf_file conditioning: {(tt[-1] - tt[-2]) * 1.0e3} ms")
-
         # ---- Examine file map object                              ----
         # grab instance of _fmap
         _fmap = hdf_file.file_map
@@ -182,10 +218,8 @@ class HDFReadControls(np.ndarray):
         except KeyError:
             controls = condition_controls(hdf_file, controls)
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - condition controls: {(tt[-1] - tt[-2]) * 1.0e3} ms")
+        if timer is not None:
+            timer.mark("conditioning")
 
         # ---- Condition shotnum                                    ----
         # shotnum -- global HDF5 file shot number
@@ -245,9 +279,13 @@ class HDFReadControls(np.ndarray):
             shotnumkey = cmap.configs[cconfn]["shotnum"]["dset field"][0]
             shotnumkey_dict[cname] = shotnumkey
 
+        if timer is not None:
+            timer.mark("dataset lookup")
+
         # perform `shotnum` conditioning
-        # - `shotnum` is returned as a numpy array
-        shotnum = condition_shotnum(shotnum, cdset_dict, shotnumkey_dict)
+        # - `shotnum` is returned as a ShotSet, and only expanded into
+        #   a numpy array once the intersection (if any) is done
+        shotset = condition_shotnum(shotnum, cdset_dict, shotnumkey_dict, as_shotset=True)
 
         # ---- Build `index` and `sni` arrays for each dataset      ----
         #
@@ -260,85 +298,125 @@ class HDFReadControls(np.ndarray):
         #    array
         # 2. all entries in `index_dict` and `sni_dict` are build with
         #    respect to shotnum
+        # 3. for intersection_set, the shot number ranges of the
+        #    datasets are intersected before any rows are resolved
         #
-        index_dict = {}  # type: IndexDict
-        sni_dict = {}  # type: IndexDict
+        resolver_dict = {}
         for control in controls:
             # control name (cname) and configuration name (cconfn)
             cname = control[0]
             cconfn = control[1]
-            cmap = _fmap.controls[cname]
 
-            # build `index` and `sni` for each dataset
-            index_dict[cname], sni_dict[cname] = build_shotnum_dset_relation(
-                shotnum, cdset_dict[cname], shotnumkey_dict[cname], cmap, cconfn
+            resolver_dict[cname] = get_shotnum_resolver(
+                cdset_dict[cname],
+                shotnumkey_dict[cname],
+                cmap=_fmap.controls[cname],
+                cconfn=cconfn,
+                sn_index=hdf_file.shotnum_index,
             )
 
-        # re-filter `index`, `shotnum`, and `sni` if intersection_set
-        # requested
         if intersection_set:
-            shotnum, sni_dict, index_dict = do_shotnum_intersection(
-                shotnum, sni_dict, index_dict
-            )
+            shotnum, sni_dict, index_dict = intersect_shotnum(shotset, resolver_dict)
+        else:
+            shotnum = shotset.to_array()
+            index_dict = {}  # type: IndexDict
+            sni_dict = {}  # type: IndexDict
+            for cname, resolver in resolver_dict.items():
+                index_dict[cname], sni_dict[cname] = resolver.resolve(shotnum)
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - condition shotnum: {(tt[-1] - tt[-2]) * 1.0e3} ms")
+        if timer is not None:
+            timer.mark("index build", shotnum.size)
 
         # ---- Build obj                                            ----
         # Define dtype and shape for numpy array
         shape = shotnum.shape
-        dtype = [("shotnum", np.uint32, 1)]
+        dtype = [("shotnum", np.uint32)]
         for control in controls:
             # control name (cname) and configuration name (cconfn)
             cname = control[0]
             cconfn = control[1]
 
             # add fields
-            cconfig = _fmap.controls[cname].configs[cconfn]
+            cmap = _fmap.controls[cname]
+            cconfig = cmap.configs[cconfn]
             for field_name, fconfig in cconfig["state values"].items():
+                if categorical and cmap.has_command_list:
+                    # command indices, len(command list) flags a
+                    # missing command
+                    fdtype = np.min_scalar_type(len(fconfig["command list"]))
+                else:
+                    fdtype = fconfig["dtype"]
                 dtype.append(
                     (
                         field_name,
-                        fconfig["dtype"],
+                        fdtype,
                         fconfig["shape"],
                     )
                 )
+        if masked:
+            dtype.append(("valid", bool, (len(controls),)))
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - define dtype: {(tt[-1] - tt[-2]) * 1.0e3} ms")
+        # Read Control Data
+        # - all the needed dataset fields of a control are read in one
+        #   pass, fields missing from the dataset are handled below
+        #
+        cdset_rows_dict = {}
+        read_fields_dict = {}
+        for control in controls:
+            # control name (cname) and configuration name (cconfn)
+            cname = control[0]
+            cconfn = control[1]
+
+            cconfig = _fmap.controls[cname].configs[cconfn]
+            cdset = cdset_dict[cname]
+            dset_fields = cdset.dtype.names or ()
+            read_fields = []  # type: List[str]
+            for fconfig in cconfig["state values"].values():
+                for df_name in fconfig["dset field"]:
+                    if df_name in dset_fields and df_name not in read_fields:
+                        read_fields.append(df_name)
+            read_fields_dict[cname] = read_fields
+            if read_fields:
+                cdset_rows_dict[cname] = read_dset_rows(
+                    cdset, index_dict[cname], read_fields
+                )
+            else:
+                # no dataset fields are mapped (e.g. every field is
+                # zero filled), so there is nothing to read
+                cdset_rows_dict[cname] = None
+
+        if timer is not None:
+            timer.mark("control read", shotnum.size)
 
         # Initialize Control Data
-        data = np.empty(shape, dtype=dtype)
+        # - a masked read zeroes the entries of unrecorded shot numbers
+        #   instead of NULL filling them field-by-field
+        #
+        data = np.zeros(shape, dtype=dtype) if masked else np.empty(shape, dtype=dtype)
         data["shotnum"] = shotnum
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - initialize data np.ndarray: {(tt[-1] - tt[-2]) * 1.0e3} ms")
-
         # Assign Control Data to Numpy array
-        for control in controls:
+        for cii, control in enumerate(controls):
             # control name (cname) and configuration name (cconfn)
             cname = control[0]
             cconfn = control[1]
 
-            # get control dataset
+            # get control mapping and the read rows
             cmap = _fmap.controls[cname]
             cconfig = cmap.configs[cconfn]
-            cdset = cdset_dict[cname]
             sni = sni_dict[cname]
-            index = index_dict[cname].tolist()  # type: List
+            index = index_dict[cname]  # type: np.ndarray
+            read_fields = read_fields_dict[cname]
+            cdset_rows = cdset_rows_dict[cname]
+            if masked:
+                data["valid"][:, cii] = sni
 
             # populate control data array
             # 1. scan over numpy fields
             # 2. scan over the dset fields that will fill the numpy
             #    fields
             # 3. split between a command list fill or a direct fill
-            # 4. NaN fill if intersection_set = False
+            # 4. NaN fill if intersection_set = False (and not masked)
             #
             for nf_name, fconfig in cconfig["state values"].items():
                 # nf_name = the numpy field name
@@ -359,30 +437,31 @@ class HDFReadControls(np.ndarray):
                         cl = fconfig["command list"]
 
                         # retrieve the array of command indices
-                        ci_arr = cdset[index, df_name]
+                        if df_name not in read_fields:
+                            raise ValueError(
+                                f"Field '{df_name}' does not appear in the "
+                                f"dataset type."
+                            )
+                        ci_arr = cdset_rows[df_name]
 
                         # assign command values to data
-                        for ci, command in enumerate(cl):
-                            # Order of operations
-                            # 1. find where command index (ci) is in the
-                            #    command index array (ci_arr)
-                            # 2. construct a new sni for ci
-                            # 3. fill data
-                            #
-                            # find where ci is in ci_arr
-                            ii = np.where(ci_arr == ci, True, False)
-
-                            # construct new sni
-                            sni_for_ci = np.zeros(sni.shape, dtype=bool)
-                            sni_for_ci[np.where(sni)[0][ii]] = True
-
-                            # assign values
-                            data[nf_name][sni_for_ci] = command
+                        # - command indices outside the command list
+                        #   have no command
+                        # - the command values are gathered from the
+                        #   command list (i.e. a lookup table)
+                        #
+                        valid = np.logical_and(ci_arr >= 0, ci_arr < len(cl))
+                        data_rows = np.flatnonzero(sni)
+                        if categorical:
+                            data[nf_name][data_rows] = np.where(valid, ci_arr, len(cl))
+                        else:
+                            table = np.asarray(cl, dtype=data.dtype[nf_name].base)
+                            data[nf_name][data_rows[valid]] = table[ci_arr[valid]]
                     else:
                         # direct fill (NO command list)
-                        try:
-                            arr = cdset[index, df_name]
-                        except ValueError as err:
+                        if df_name in read_fields:
+                            arr = cdset_rows[df_name]
+                        else:
                             mlist = [1] + list(data.dtype[nf_name].shape)
                             size = reduce(lambda x, y: x * y, mlist)
                             dtype = data.dtype[nf_name].base
@@ -427,21 +506,24 @@ class HDFReadControls(np.ndarray):
                                     )
                             else:
                                 # expected field df_name is missing
-                                raise err
+                                raise ValueError(
+                                    f"Field '{df_name}' does not appear in the "
+                                    f"dataset type."
+                                )
 
                         if data.dtype[nf_name].shape != ():
                             # field contains an array (e.g. 'xyz')
                             # data[nf_name][sni, npi] = \
-                            #     cdset[index, df_name]
+                            #     read_dset_rows(cdset, index, df_name)
                             data[nf_name][sni, npi] = arr
                         else:
                             # field is a constant
                             # data[nf_name][sni] = \
-                            #     cdset[index, df_name]
+                            #     read_dset_rows(cdset, index, df_name)
                             data[nf_name][sni] = arr
 
                     # handle NaN fill
-                    if not intersection_set:
+                    if not intersection_set and not masked:
                         # overhead
                         sni_not = np.logical_not(sni)
                         dtype = data.dtype[nf_name].base
@@ -453,7 +535,10 @@ class HDFReadControls(np.ndarray):
                             ii = np.s_[sni_not]
 
                         # NaN fill
-                        if np.issubdtype(dtype, np.signedinteger):
+                        if categorical and cmap.has_command_list:
+                            # no command index
+                            data[nf_name][ii] = len(fconfig["command list"])
+                        elif np.issubdtype(dtype, np.signedinteger):
                             data[nf_name][ii] = -99999
                         elif np.issubdtype(dtype, np.unsignedinteger):
                             data[nf_name][ii] = 0
@@ -471,19 +556,8 @@ class HDFReadControls(np.ndarray):
                                 f"...no NaN fill done"
                             )
 
-            # print execution timing
-            if timeit:  # pragma: no cover
-                tt.append(time.time())
-                print(f"tt - fill data - {cname}: {(tt[-1] - tt[-2]) * 1.0e3} ms")
-
-        # print execution timing
-        if timeit:  # pragma: no cover
-            n_controls = len(controls)
-            tt.append(time.time())
-            print(
-                f"tt - fill data array: {(tt[-1] - tt[-n_controls - 2]) * 1.0e3} ms "
-                f"(intersection_set={intersection_set})"
-            )
+        if timer is not None:
+            timer.mark("array fill", shotnum.size)
 
         # -- Define `obj`                                           ----
         obj = data.view(cls)
@@ -517,11 +591,11 @@ class HDFReadControls(np.ndarray):
             for key, val in cconfig.items():
                 if key not in ["dset paths", "shotnum", "state values"]:
                     obj._info["controls"][cname][key] = copy.deepcopy(val)
-
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - total execution time: {(tt[-1] - tt[0]) * 1.0e3} ms")
+            if categorical and cmap.has_command_list:
+                obj._info["controls"][cname]["command tables"] = {
+                    nf_name: np.asarray(fconfig["command list"], dtype=fconfig["dtype"])
+                    for nf_name, fconfig in cconfig["state values"].items()
+                }
 
         # return obj
         return obj
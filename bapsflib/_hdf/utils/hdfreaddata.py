@@ -18,24 +18,35 @@ import astropy.units as u
 import copy
 import numpy as np
 import os
-import time
 
-from typing import Union
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
 from warnings import warn
 
+from bapsflib._hdf.utils.bufferpool import BufferPool
+from bapsflib._hdf.utils.export import _msi_time, ExportMixin
 from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.hdflazysignal import HDFLazySignal
+from bapsflib._hdf.utils.hdfmaskedsignal import HDFMaskedSignal
 from bapsflib._hdf.utils.hdfreadcontrols import HDFReadControls
+from bapsflib._hdf.utils.hdfreadmsi import HDFReadMSI
 from bapsflib._hdf.utils.helpers import (
     build_sndr_for_simple_dset,
     condition_controls,
+    condition_msi,
     condition_shotnum,
     do_shotnum_intersection,
+    get_shotnum_resolver,
+    intersect_shotnum,
+    read_dset_rows,
 )
+from bapsflib._hdf.utils.instrument import stage_timer
+from bapsflib._hdf.utils.shotnumresolver import ShotNumResolvers
+from bapsflib._hdf.utils.shotset import ShotSet
 from bapsflib.plasma import core
 
 
 # noinspection PyInitNewSignature
-class HDFReadData(np.ndarray):
+class HDFReadData(ExportMixin, np.ndarray):
     """
     Reads digitizer and control device data from the HDF5 file. Control
     device data is extracted using
@@ -120,7 +131,13 @@ class HDFReadData(np.ndarray):
         adc=None,
         keep_bits=False,
         add_controls=None,
+        add_msi=None,
         intersection_set=True,
+        samples=None,
+        average=None,
+        lazy=False,
+        masked=False,
+        out=None,
         **kwargs,
     ):
         """
@@ -132,7 +149,7 @@ class HDFReadData(np.ndarray):
         :type index: Union[int, List[int], slice, numpy.ndarray]
         :param shotnum: HDF5 file shot number(s) indicating data
             entries to be extracted (overrides :code:`index`)
-        :type shotnum: Union[int, List[int], slice, numpy.ndarray]
+        :type shotnum: Union[int, List[int], slice, numpy.ndarray, ShotSet]
         :param str digitizer: digitizer name
         :param str adc: name of analog-digital-converter
         :param str config_name: name of the digitizer configuration
@@ -142,11 +159,46 @@ class HDFReadData(np.ndarray):
             device names and their configuration name (if more than one
             configuration exists)
         :type controls: Union[str, Iterable[str, Tuple[str, Any]]]
+        :param add_msi: a list indicating the desired MSI diagnostic
+            names and, optionally, the reduction of their signals to
+            one value per shot (see
+            :func:`~.helpers.condition_msi`)
+        :type add_msi: Union[str, Iterable[str, Tuple[str, Any]]]
         :param bool intersection_set: :code:`True` (DEFAULT) will force
             the returned shot numbers to be the intersection of
             :data:`shotnum` and the shot numbers contained in each
-            control device and digitizer dataset. :code:`False` will
-            return the union of shot numbers.
+            control device, MSI diagnostic, and digitizer dataset.
+            :code:`False` will return the union of shot numbers.
+        :param samples: window of the time axis to be read, as a slice
+            of sample indices.  The slice :code:`start` and
+            :code:`stop` may also be given as times (an
+            :class:`astropy.units.Quantity`) measured from the first
+            sample, in which case the samples with
+            :code:`start <= t < stop` are read.  The slice
+            :code:`step` is a positive integer sample stride.
+            :code:`None` (DEFAULT) reads all samples.  Only the selected
+            samples are read from disk.
+        :type samples: slice
+        :param int average: number of consecutive samples to be
+            averaged together while reading (boxcar averaging),
+            :code:`None` (DEFAULT) for no averaging.  Trailing samples
+            that do not fill a whole average are dropped.  The data is
+            averaged block-by-block as it is read, so the full-rate
+            signal is never held in memory.
+        :param bool lazy: :code:`True` to defer reading the digitizer
+            signal until it is accessed through :attr:`signal`,
+            :code:`False` (DEFAULT) to read it immediately
+        :param bool masked: :code:`True` to only store the digitizer
+            signal of recorded shot numbers, with validity masks in
+            place of NULL fills, :code:`False` (DEFAULT) to store the
+            signal of all shot numbers (cannot be combined with
+            :data:`lazy`)
+        :param out: a preallocated structured array (with the shape and
+            dtype of the returned array) or a
+            :class:`~.bufferpool.BufferPool` to read into, so repeated
+            reads do not allocate new memory. The returned array is a
+            view of that memory.
+        :type out: Union[numpy.ndarray, BufferPool]
 
         Behavior of :data:`index`, :data:`shotnum` and
         :data:`intersection_set`:
@@ -158,17 +210,298 @@ class HDFReadData(np.ndarray):
               required for identifying shot number locations in the
               digitizer dataset, the :data:`index` keyword will always
               execute quicker than the :data:`shotnum` keyword.
+
+        Behavior of :data:`add_msi`:
+
+        .. note::
+
+            Each MSI diagnostic gets a nested structured field named
+            after the diagnostic, containing the fields of
+            :class:`~.hdfreadmsi.HDFReadMSI` (minus
+            :code:`'shotnum'`), e.g.
+            :code:`data['Discharge']['current']`.  Only the MSI dataset
+            rows of the returned shot numbers are read.  With a
+            reduction, e.g. :code:`add_msi=[('Discharge', 'max')]`,
+            each signal field holds one :code:`float64` value per shot
+            instead of the full trace.
+
+            With :code:`intersection_set=False`, the entries of shot
+            numbers not recorded by the diagnostic are NULL filled
+            (:code:`numpy.nan` for floats, :code:`-99999` for signed
+            integers, and :code:`0` otherwise), also for a
+            :data:`masked` read.  The MSI diagnostic info is stored in
+            :code:`info['msi']`.
+
+        Behavior of :data:`masked`:
+
+        .. note::
+
+            With :code:`intersection_set=False`, shot numbers missing
+            from the digitizer dataset normally cost a full
+            :code:`'signal'` row of NULL values.  A masked read leaves
+            out the :code:`'signal'` field and :attr:`signal` is a
+            :class:`~.hdfmaskedsignal.HDFMaskedSignal` that only holds
+            the recorded shot numbers, plus a validity mask.  Indexing
+            it gives a :class:`numpy.ma.MaskedArray`.
+
+            Only the :code:`'signal'` is compact.  The control device
+            fields are still allocated for every shot number in
+            :code:`'shotnum'` (they are one value per shot number), but
+            the entries of unrecorded shot numbers are zeroed instead
+            of NULL filled and the :code:`'valid'` field flags the
+            shot numbers recorded by each control device (see
+            :class:`~.hdfreadcontrols.HDFReadControls`).  Since the
+            :code:`'valid'` field replaces the NULL fill, checks like
+            :code:`numpy.isnan(data['xyz'])` do not find the
+            unrecorded shot numbers, use :code:`data['valid']`
+            instead.
+
+        Behavior of :data:`samples`:
+
+        .. note::
+
+            The :code:`'signal'` field only contains the selected
+            samples.  :code:`info['sample start']` and
+            :code:`info['sample step']` record the window, and
+            :attr:`dt` is the spacing of the returned samples (i.e. it
+            includes the sample step).
+
+            With :data:`average`, each element of :code:`'signal'` is
+            the mean of :data:`average` consecutive samples of the
+            window (which must then have a unit step).
+            :code:`info['sample average']` is multiplied by
+            :data:`average` and :attr:`dt` is adjusted accordingly.
+            The :code:`'signal'` dtype is :code:`float32`, even when
+            :data:`keep_bits` is :code:`True`.
+
+        :Example:
+
+            >>> # read 2 us starting 1 ms into the record, keeping
+            >>> # every other sample
+            >>> data = HDFReadData(f, 1, 1,
+            ...                    samples=slice(1 * u.ms, 1.002 * u.ms, 2))
         """
-        # initialize timing
-        tt = []
-        if "timeit" in kwargs:  # pragma: no cover
-            timeit = kwargs["timeit"]
-            if timeit:
-                tt.append(time.time())
-            else:
-                timeit = False
-        else:
-            timeit = False
+        # ---- Resolve datasets, shot numbers, and control data     ----
+        setup = cls._setup_read(
+            hdf_file,
+            [(board, channel, adc)],
+            index=index,
+            shotnum=shotnum,
+            digitizer=digitizer,
+            config_name=config_name,
+            add_controls=add_controls,
+            add_msi=add_msi,
+            intersection_set=intersection_set,
+            samples=samples,
+            average=average,
+            masked=masked,
+            **kwargs,
+        )
+
+        # ---- Build and return `obj`                               ----
+        return cls._build_from_setup(setup, keep_bits=keep_bits, lazy=lazy, out=out)
+
+    @classmethod
+    def from_channels(
+        cls,
+        hdf_file: File,
+        channels: List[Union[Tuple[int, int], Tuple[int, int, str]]],
+        index=slice(None),
+        shotnum=slice(None),
+        digitizer=None,
+        config_name=None,
+        keep_bits=False,
+        add_controls=None,
+        add_msi=None,
+        intersection_set=True,
+        samples=None,
+        average=None,
+        lazy=False,
+        masked=False,
+        out=None,
+        **kwargs,
+    ) -> "HDFReadData":
+        """
+        Reads several digitizer channels into one array.  The shot
+        number resolution and control device read are done once for
+        all channels, and the :code:`'signal'` field gets a channel
+        axis, i.e. :code:`data['signal'][:, ii, :]` is the signal of
+        :code:`channels[ii]`.
+
+        :param channels: list of :code:`(board, channel)` or
+            :code:`(board, channel, adc)` tuples
+        :type channels: List[Union[Tuple[int, int], Tuple[int, int, str]]]
+
+        All other arguments are the same as :class:`HDFReadData`, and
+        :data:`index` refers to the dataset rows of the first channel.
+        The channel specific :attr:`info` items (:code:`'board'`,
+        :code:`'channel'`, :code:`'device dataset path'`, and
+        :code:`'voltage offset'`, plus :code:`'adc'` and :code:`'bit'`
+        if they differ between channels) are ordered like the channel
+        axis.
+
+        .. note::
+
+            All channels must belong to the same digitizer
+            configuration and share the same time axis (number of
+            samples, clock rate, and sample average).
+        """
+        # condition `channels`
+        if isinstance(channels, tuple) or not isinstance(channels, Iterable):
+            raise TypeError(
+                "Argument `channels` must be a list of (board, channel) or "
+                "(board, channel, adc) tuples."
+            )
+        channels = list(channels)
+        if len(channels) == 0:
+            raise ValueError("Argument `channels` is empty.")
+        conditioned = []
+        for chan in channels:
+            if not isinstance(chan, tuple) or len(chan) not in (2, 3):
+                raise TypeError(
+                    f"Element {chan} of `channels` is not a (board, channel) or "
+                    f"(board, channel, adc) tuple."
+                )
+            chan = chan if len(chan) == 3 else chan + (None,)
+            if chan in conditioned:
+                raise ValueError(f"Channel {chan} is specified more than once.")
+            conditioned.append(chan)
+
+        setup = cls._setup_read(
+            hdf_file,
+            conditioned,
+            index=index,
+            shotnum=shotnum,
+            digitizer=digitizer,
+            config_name=config_name,
+            add_controls=add_controls,
+            add_msi=add_msi,
+            intersection_set=intersection_set,
+            samples=samples,
+            average=average,
+            masked=masked,
+            **kwargs,
+        )
+        return cls._build_from_setup(setup, keep_bits=keep_bits, lazy=lazy, out=out)
+
+    @classmethod
+    def iter_chunks(
+        cls,
+        hdf_file: File,
+        board: int,
+        channel: int,
+        *,
+        chunk_shots=1000,
+        index=slice(None),
+        shotnum=slice(None),
+        digitizer=None,
+        config_name=None,
+        adc=None,
+        keep_bits=False,
+        add_controls=None,
+        add_msi=None,
+        intersection_set=True,
+        samples=None,
+        average=None,
+        masked=False,
+        out=None,
+        **kwargs,
+    ) -> Iterator["HDFReadData"]:
+        """
+        Generator version of :class:`HDFReadData`.  The digitizer
+        dataset, shot numbers, dataset row indices, and control device
+        data are resolved once, then the digitizer data is read and
+        yielded in blocks of at most :data:`chunk_shots` shot numbers.
+        Each yielded block is a :class:`HDFReadData` array equivalent
+        to the corresponding rows of the array returned by a single
+        :class:`HDFReadData` call with the same arguments.
+
+        :param chunk_shots: maximum number of shot numbers (rows)
+            read and yielded per block
+        :type chunk_shots: int
+        :param out: a :class:`~.bufferpool.BufferPool` providing the
+            memory of the yielded blocks
+        :type out: BufferPool
+
+        All other arguments are the same as :class:`HDFReadData`, but
+        the arguments after :data:`channel` are keyword-only.
+
+        .. note::
+
+            Since this is a generator, argument errors are not raised
+            until the first block is requested.
+        """
+        if not isinstance(chunk_shots, (int, np.integer)) or isinstance(
+            chunk_shots, bool
+        ):
+            raise TypeError(
+                f"Argument `chunk_shots` must be an int, got type {type(chunk_shots)}."
+            )
+        elif chunk_shots < 1:
+            raise ValueError(f"Argument `chunk_shots` must be >= 1, got {chunk_shots}.")
+        elif out is not None and not isinstance(out, BufferPool):
+            raise TypeError("Argument `out` must be a BufferPool.")
+
+        setup = cls._setup_read(
+            hdf_file,
+            [(board, channel, adc)],
+            index=index,
+            shotnum=shotnum,
+            digitizer=digitizer,
+            config_name=config_name,
+            add_controls=add_controls,
+            add_msi=add_msi,
+            intersection_set=intersection_set,
+            samples=samples,
+            average=average,
+            masked=masked,
+            **kwargs,
+        )
+
+        n_shots = setup["shotnum"].size
+        for start in range(0, n_shots, chunk_shots):
+            stop = min(start + chunk_shots, n_shots)
+            yield cls._build_from_setup(
+                setup, rows=slice(start, stop), keep_bits=keep_bits, out=out
+            )
+
+    @staticmethod
+    def _setup_read(
+        hdf_file: File,
+        channels: List[Tuple[int, int, Union[str, None]]],
+        index=slice(None),
+        shotnum=slice(None),
+        digitizer=None,
+        config_name=None,
+        add_controls=None,
+        add_msi=None,
+        intersection_set=True,
+        samples=None,
+        average=None,
+        masked=False,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Conditions the :class:`HDFReadData` arguments, gathers the
+        digitizer datasets, resolves the shot numbers and dataset row
+        indices, and reads the requested control device data.
+
+        :param channels: list of :code:`(board, channel, adc)` tuples
+            for the digitizer channels to be read, where :code:`adc`
+            can be :code:`None`
+        :return: dictionary of everything needed by
+            :meth:`_build_from_setup` to construct the data array
+        """
+        # initialize the stage timer (see `instrument`)
+        # - `timeit` is the deprecated way of reporting stage durations
+        timeit = bool(kwargs.get("timeit", False))
+        if timeit:
+            warn(
+                "The `timeit` keyword is deprecated, use "
+                "bapsflib._hdf.utils.instrument.instrument() instead.",
+                DeprecationWarning,
+            )
+        timer = stage_timer("HDFReadData", timeit=timeit)
 
         # ---- Condition hdf_file                                   ----
         # - `hdf_file` is a lapd.File object
@@ -178,11 +511,6 @@ class HDFReadData(np.ndarray):
                 f"`hdf_file` is NOT type `{File.__module__}.{File.__qualname__}`"
             )
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - `hdf_file` conditioning: {(tt[-1] - tt[-2]) * 1.0e3} ms")
-
         # ---- Examine file map object                              ----
         # grab instance of `HDFMap`
         _fmap = hdf_file.file_map
@@ -198,10 +526,10 @@ class HDFReadData(np.ndarray):
         else:
             controls = []
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - `add_controls` conditioning: {(tt[-1] - tt[-2]) * 1.0e3} ms")
+        # ---- Condition `add_msi`                                  ----
+        if bool(add_msi) and not bool(_fmap.msi):
+            raise ValueError("There are no MSI diagnostics in the HDF5 file.")
+        msi = condition_msi(hdf_file, add_msi) if bool(add_msi) else []
 
         # ---- Condition `digitizer` keyword                        ----
         if not bool(_fmap.digitizers):
@@ -228,6 +556,9 @@ class HDFReadData(np.ndarray):
                     f"digitizers ({list(_fmap.digitizers)})"
                 )
 
+        if timer is not None:
+            timer.mark("conditioning")
+
         # ---- Gather Digi Dataset Info                             ----
         #
         # Note: _dmap.construct_dataset_name has conditioning for
@@ -240,19 +571,80 @@ class HDFReadData(np.ndarray):
         # dheader    - dset associated header dataset
         # shotnumkey - field name for shot number column in dheader
         #
-        # Build kwargs for construct_dataset_name()
-        kwargs = {"return_info": True}
-        if config_name is not None:
-            kwargs["config_name"] = config_name
-        if adc is not None:
-            kwargs["adc"] = adc
-
-        # Get datasets
-        dname, d_info = _dmap.construct_dataset_name(board, channel, **kwargs)
-        dhname = _dmap.construct_header_dataset_name(board, channel, **kwargs)
+        # Each entry of `chan_setups` collects the info for one of the
+        # requested digitizer channels.
+        #
         dpath = f"{_dmap.info['group path']}/"
-        dset = hdf_file.get(dpath + dname)
-        dheader = hdf_file.get(dpath + dhname)
+        chan_setups = []  # type: List[Dict[str, Any]]
+        for board, channel, adc in channels:
+            # Build kwargs for construct_dataset_name()
+            kwargs = {"return_info": True}
+            if config_name is not None:
+                kwargs["config_name"] = config_name
+            if adc is not None:
+                kwargs["adc"] = adc
+
+            # Get datasets
+            dname, d_info = _dmap.construct_dataset_name(board, channel, **kwargs)
+            dhname = _dmap.construct_header_dataset_name(board, channel, **kwargs)
+            chan_setups.append(
+                {
+                    "board": board,
+                    "channel": channel,
+                    "d_info": d_info,
+                    "dset": hdf_file.get(dpath + dname),
+                    "dheader": hdf_file.get(dpath + dhname),
+                    "dataset path": dpath + dname,
+                }
+            )
+
+        # all channels must share the same time axis
+        d_info = chan_setups[0]["d_info"]
+        dset = chan_setups[0]["dset"]
+        dheader = chan_setups[0]["dheader"]
+        for cs in chan_setups[1:]:
+            if (
+                cs["dset"].shape[1:] != dset.shape[1:]
+                or cs["d_info"]["clock rate"] != d_info["clock rate"]
+                or cs["d_info"]["sample average (hardware)"]
+                != d_info["sample average (hardware)"]
+            ):
+                raise ValueError(
+                    f"Digitizer channels {channels[0][0:2]} and "
+                    f"{(cs['board'], cs['channel'])} do not share the same time "
+                    f"axis (number of samples, clock rate, and sample average) "
+                    f"and can NOT be read into the same array."
+                )
+
+        # ---- Condition `samples`                                  ----
+        # - resolved to a slice of sample indices with a positive step
+        #
+        samples = HDFReadData._condition_samples(
+            samples,
+            dset.shape[1],
+            HDFReadData._calc_dt(
+                d_info["clock rate"], d_info["sample average (hardware)"]
+            ),
+        )
+
+        # ---- Condition `average`                                  ----
+        if average is None:
+            average = 1
+        elif not isinstance(average, (int, np.integer)) or isinstance(average, bool):
+            raise TypeError(
+                f"Argument `average` must be an int, got type {type(average)}."
+            )
+        elif average < 1:
+            raise ValueError(f"Argument `average` must be >= 1, got {average}.")
+        elif average > 1 and samples.step != 1:
+            raise ValueError(
+                "Argument `average` can not be combined with a strided `samples`."
+            )
+        elif len(range(samples.start, samples.stop)) < average:
+            raise ValueError(
+                f"Argument `average` ({average}) is larger than the number of "
+                f"selected samples."
+            )
 
         # define `config_name`
         if config_name is None:
@@ -261,10 +653,8 @@ class HDFReadData(np.ndarray):
         # define `shotnumkey`
         shotnumkey = _dmap.configs[config_name]["shotnum"]["dset field"][0]
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - get dset and dheader: {(tt[-1] - tt[-2]) * 1.0e3} ms")
+        if timer is not None:
+            timer.mark("dataset lookup")
 
         # ---- Condition shots, index, and shotnum ----
         # index   -- row index of digitizer dataset
@@ -359,88 +749,68 @@ class HDFReadData(np.ndarray):
             index = np.unique(index)
 
             # define `shotnum`
-            shotnum = dheader[index.tolist(), shotnumkey]
+            shotnum = read_dset_rows(dheader, index, shotnumkey)
 
             # define sni
             sni = np.ones(shotnum.shape[0], dtype=bool)
 
-            # print execution timing
-            if timeit:  # pragma: no cover
-                tt.append(time.time())
-                print(f"tt - condition index: {(tt[-1] - tt[-2]) * 1.0e3} ms")
+            # the remaining channels are matched by shot number to the
+            # shot numbers of the first channel
+            sni_dict = {0: sni}
+            index_dict = {0: index}
+            for ii, cs in enumerate(chan_setups[1:], start=1):
+                index_dict[ii], sni_dict[ii] = build_sndr_for_simple_dset(
+                    shotnum,
+                    cs["dheader"],
+                    shotnumkey,
+                    sn_index=hdf_file.shotnum_index,
+                    resolvers=ShotNumResolvers.of_map(_dmap),
+                )
+            if intersection_set and len(chan_setups) > 1:
+                shotnum, sni_dict, index_dict = do_shotnum_intersection(
+                    shotnum, sni_dict, index_dict
+                )
+
+            if timer is not None:
+                timer.mark("index build", shotnum.size)
         else:
             # Condition `shotnum` keyword
             #
-            # convert `shotnum` to np.ndarray
-            """
-            if isinstance(shotnum, slice):
-                # determine largest possible shot number
-                last_sn = dheader[-1, shotnumkey]
-                if shotnum.stop is not None:
-                    stop_sn = max(shotnum.stop, last_sn + 1)
-                else:
-                    stop_sn = last_sn + 1
-
-                # get the start, stop, and step for the shot number
-                # array
-                start, stop, step = shotnum.indices(stop_sn)
-
-                # determine smallest possible shot number
-                # - intersection_set = True
-                #   * start = max of first_sn and shotnum.start
-                # - intersection_set = False
-                #   * start = min of first_sn and shotnum.start
-                first_sn = [dheader[0, shotnumkey]]
-                if shotnum.start is not None:
-                    # ensure shot numbers are >= 1
-                    if start <= 0:
-                        start = 1
-                else:
-                    # start wasn't specified in slice object
-                    start = min(first_sn)
-
-                # adjust start for intersection_set
-                if intersection_set:
-                    first_sn.append(start)
-                    start = max(first_sn)
-
-                # re-define shotnum as a list
-                shotnum = np.arange(start, stop, step).tolist()
-            elif isinstance(shotnum, int):
-                shotnum = [shotnum]
-            elif isinstance(shotnum, list):
-                # ensure all elements are int
-                if not all(isinstance(sn, int) for sn in shotnum):
-                    raise ValueError('Valid `shotnum` not passed')
-            else:
-                raise ValueError('Valid `shotnum` not passed')
-            """
             # perform `shotnum` conditioning
-            # - `shotnum` is returned as a numpy array
-            shotnum = condition_shotnum(shotnum, {"digi": dheader}, {"digi": shotnumkey})
+            # - `shotnum` is returned as a ShotSet, and only expanded
+            #   into a numpy array once the intersection (if any) is
+            #   done
+            shotset = condition_shotnum(
+                shotnum,
+                {ii: cs["dheader"] for ii, cs in enumerate(chan_setups)},
+                {ii: shotnumkey for ii in range(len(chan_setups))},
+                as_shotset=True,
+            )
 
             # Calc. the corresponding `index` and `sni`
-            # - `shotnum` will be converted from list to np.array
             # - `index` and `sni` will be np.array's
-            """
-            index, shotnum, sni = \
-                condition_shotnum(shotnum, dheader, shotnumkey,
-                                  intersection_set)
-            """
-            index, sni = build_sndr_for_simple_dset(shotnum, dheader, shotnumkey)
-
-            # perform intersection
-            if intersection_set:
-                shotnum, sni_dict, index_dict = do_shotnum_intersection(
-                    shotnum, {"digi": sni}, {"digi": index}
+            # - for intersection_set, the shot number ranges of the
+            #   channels are intersected before any rows are resolved
+            resolver_dict = {
+                ii: get_shotnum_resolver(
+                    cs["dheader"],
+                    shotnumkey,
+                    sn_index=hdf_file.shotnum_index,
+                    resolvers=ShotNumResolvers.of_map(_dmap),
                 )
-                sni = sni_dict["digi"]
-                index = index_dict["digi"]
+                for ii, cs in enumerate(chan_setups)
+            }
+            if intersection_set:
+                shotnum, sni_dict, index_dict = intersect_shotnum(shotset, resolver_dict)
+            else:
+                shotnum = shotset.to_array()
+                sni_dict = {}
+                index_dict = {}
+                for ii, resolver in resolver_dict.items():
+                    index_dict[ii], sni_dict[ii] = resolver.resolve(shotnum)
 
-            # print execution timing
-            if timeit:  # pragma: no cover
-                tt.append(time.time())
-                print(f"tt - condition shotnum: {(tt[-1] - tt[-2]) * 1.0e3} ms")
+            if timer is not None:
+                timer.mark("index build", shotnum.size)
 
         # ---- Retrieve Control Data                                ----
         # 1. retrieve the numpy array for control data
@@ -459,75 +829,414 @@ class HDFReadData(np.ndarray):
                 assume_controls_conditioned=True,
                 shotnum=shotnum,
                 intersection_set=intersection_set,
+                masked=masked,
             )
 
-            # print execution timing
-            if timeit:  # pragma: no cover
-                tt.append(time.time())
-                print(
-                    f"tt - read in cdata (control data): {(tt[-1] - tt[-2]) * 1.0e3} ms"
-                )
+            if timer is not None:
+                timer.mark("control read", cdata.size)
 
             # re-filter index, shotnum, and sni
             # - only need to be filtered if intersection_set=True
             # - for intersection_set=True, shotnum and index are
-            #   one-to-one
+            #   one-to-one, and the control shot numbers are a subset
+            #   of shotnum
             #
-            if intersection_set:
-                new_sn_mask = np.isin(shotnum, cdata["shotnum"])
+            if intersection_set and cdata.size != shotnum.size:
+                new_sn_mask = ShotSet(cdata["shotnum"]).contains(shotnum)
                 shotnum = shotnum[new_sn_mask]
-                index = index[new_sn_mask]
-                sni = np.ones(shotnum.shape[0], dtype=bool)
+                for ii in index_dict:
+                    index_dict[ii] = index_dict[ii][new_sn_mask]
+                    sni_dict[ii] = np.ones(shotnum.shape[0], dtype=bool)
+
+            # align cdata with shotnum
+            # - cdata is in shot number order, while an `index` read of
+            #   a dataset with unordered shot numbers is in row order
+            if not np.array_equal(cdata["shotnum"], shotnum):
+                cdata = cdata[np.searchsorted(cdata["shotnum"], shotnum)]
         else:
             cdata = None
 
+        # ---- Retrieve MSI Data                                    ----
+        # 1. resolve the MSI dataset rows of shotnum, sharing the shot
+        #    number resolution of the MSI mappings
+        # 2. re-filter shotnum if intersection_set=True s.t. only
+        #    shotnum's w/ MSI data are returned
+        # 3. read only the matching MSI rows and align them with
+        #    shotnum
+        #
+        msi_setups = []
+        for dname, reduce in msi:
+            _mmap = _fmap.msi[dname]
+            sn_config = _mmap.configs["shotnum"]
+            index, sni = build_sndr_for_simple_dset(
+                shotnum,
+                hdf_file[sn_config["dset paths"][0]],
+                sn_config["dset field"][0],
+                sn_index=hdf_file.shotnum_index,
+                resolvers=ShotNumResolvers.of_map(_mmap),
+            )
+            msi_setups.append(
+                {"name": dname, "reduce": reduce, "index": index, "sni": sni}
+            )
+
+        if intersection_set and len(msi_setups) != 0:
+            mask = np.logical_and.reduce([ms["sni"] for ms in msi_setups])
+            if not np.any(mask):
+                raise ValueError("Input `shotnum` would result in a NULL array")
+
+            # index_dict[ii] is aligned with shotnum[sni_dict[ii]]
+            for ii in index_dict:
+                index_dict[ii] = index_dict[ii][mask[sni_dict[ii]]]
+                sni_dict[ii] = sni_dict[ii][mask]
+            for ms in msi_setups:
+                ms["index"] = ms["index"][mask[ms["sni"]]]
+                ms["sni"] = ms["sni"][mask]
+            shotnum = shotnum[mask]
+            if cdata is not None:
+                cdata = cdata[mask]
+
+        msidata = {}
+        for ms in msi_setups:
+            # HDFReadMSI reads the rows in increasing order
+            # - `inverse` puts them back in the order of shotnum, e.g.
+            #   for a diagnostic with unordered shot numbers
+            rows, inverse = np.unique(ms["index"], return_inverse=True)
+            inverse = inverse.reshape(-1)
+            mdata = HDFReadMSI(hdf_file, ms["name"], index=rows, reduce=ms["reduce"])
+            if not np.array_equal(mdata["shotnum"][inverse], shotnum[ms["sni"]]):
+                raise ValueError(
+                    f"MSI diagnostic '{ms['name']}' shot numbers do not match the "
+                    f"resolved rows, do NOT know how to handle"
+                )
+
+            # align with shotnum
+            # - shot numbers not recorded by the diagnostic are given
+            #   a NULL value
+            names = [name for name in mdata.dtype.names if name != "shotnum"]
+            aligned = np.empty(
+                shotnum.shape, dtype=[(name, mdata.dtype[name]) for name in names]
+            )
+            if not np.all(ms["sni"]):
+                HDFReadData._null_fill(aligned)
+            for name in names:
+                aligned[name][ms["sni"]] = mdata[name][inverse]
+            msidata[ms["name"]] = (aligned, mdata.info, ms["reduce"])
+
+        # - MSI reads are recorded as a 'control read' stage
+        if timer is not None and len(msi_setups) != 0:
+            timer.mark("control read", shotnum.size)
+
+        for ii, cs in enumerate(chan_setups):
+            # get voltage offset
+            try:
+                cs["voltage offset"] = cs["dheader"][0, "Offset"] * u.volt
+            except ValueError:
+                warn("Digitizer header dataset is missing the voltage 'Offset' field. ")
+                cs["voltage offset"] = None
+
+            cs["index"] = index_dict[ii]
+            cs["sni"] = sni_dict[ii]
+
+            # number of `index` entries before each shot number
+            # - lets `_build_from_setup` slice `index` for a range of
+            #   rows without re-counting `sni`
+            #
+            cs["index_offsets"] = np.concatenate(
+                ([0], np.cumsum(cs["sni"], dtype=np.int64))
+            )
+
+        return {
+            "hdf_file": hdf_file,
+            "dmap": _dmap,
+            "channels": chan_setups,
+            "controls": controls,
+            "shotnum": shotnum,
+            "cdata": cdata,
+            "msidata": msidata,
+            "intersection_set": intersection_set,
+            "samples": samples,
+            "average": average,
+            "masked": masked,
+            "timeit": timeit,
+        }
+
+    @staticmethod
+    def _calc_dt(clock_rate, sample_average) -> Union[u.Quantity, None]:
+        """
+        Temporal step size (in sec) of the digitizer samples.  Returns
+        :code:`None` if :data:`clock_rate` is not a
+        :class:`~astropy.units.Quantity`.
+
+        :param clock_rate: digitizer clock rate
+        :param sample_average: number of (hardware) averaged samples,
+            can be :code:`None`
+        """
+        if not isinstance(clock_rate, u.Quantity):
+            return
+
+        # calc base dt
+        dt = 1.0 / clock_rate
+        dt = dt.to("s")
+
+        # adjust for hardware averaging
+        if sample_average is not None:
+            dt = dt * float(sample_average)
+
+        return dt
+
+    @staticmethod
+    def _null_fill(arr: np.ndarray):
+        """
+        Fill the structured array **arr** (and its nested fields) with
+        NULL values, i.e. :code:`-99999` (or the type minimum) for
+        signed integers, :code:`0` for unsigned integers,
+        :code:`numpy.nan` for floats, :code:`''` for strings, and
+        :code:`False` for booleans.
+        """
+        for name in arr.dtype.names:
+            field = arr[name]
+            dtype = field.dtype
+            if dtype.names is not None:
+                HDFReadData._null_fill(field)
+            elif np.issubdtype(dtype, np.signedinteger):
+                # small integer types can not hold -99999
+                field[...] = max(-99999, np.iinfo(dtype).min)
+            elif np.issubdtype(dtype, np.floating):
+                field[...] = np.nan
+            elif np.issubdtype(dtype, np.flexible):
+                field[...] = ""
+            else:
+                # unsigned integers and booleans
+                field[...] = 0
+
+    @staticmethod
+    def _condition_samples(samples, nt: int, dt: Union[u.Quantity, None]) -> slice:
+        """
+        Conditions the :data:`samples` argument of :class:`HDFReadData`
+        into a slice of sample indices with integer :code:`start`,
+        :code:`stop`, and :code:`step`.
+
+        :param samples: :code:`None` or a slice whose :code:`start`
+            and :code:`stop` are sample indices or times (measured from
+            the first sample)
+        :param nt: number of samples per shot
+        :param dt: temporal step size of the samples
+        """
+        if samples is None:
+            return slice(0, nt, 1)
+        elif not isinstance(samples, slice):
+            raise TypeError(
+                f"Argument `samples` must be a slice, got type {type(samples)}."
+            )
+
+        # convert times to sample indices
+        # - sample ii is at time ii * dt and is in the window if
+        #   start <= ii * dt < stop
+        #
+        bounds = []
+        for name, bound in (("start", samples.start), ("stop", samples.stop)):
+            if isinstance(bound, u.Quantity):
+                if dt is None:
+                    raise ValueError(
+                        "Unable to convert the time window of `samples` to sample "
+                        "indices since the temporal step size (dt) is unknown."
+                    )
+                elif not bound.unit.is_equivalent(u.s):
+                    raise ValueError(
+                        f"`samples.{name}` must be a sample index or a time, "
+                        f"got units of '{bound.unit}'."
+                    )
+                elif bound.size != 1 or bound.value < 0:
+                    raise ValueError(f"`samples.{name}` must be a time >= 0.")
+                bound = int(np.ceil(np.round((bound / dt).decompose().value, 6)))
+            elif bound is not None and (
+                not isinstance(bound, (int, np.integer)) or isinstance(bound, bool)
+            ):
+                raise TypeError(
+                    f"`samples.{name}` must be an int, a time, or None, "
+                    f"got type {type(bound)}."
+                )
+            bounds.append(bound)
+
+        step = samples.step
+        if step is not None and (
+            not isinstance(step, (int, np.integer)) or isinstance(step, bool)
+        ):
+            raise TypeError(f"`samples.step` must be an int, got type {type(step)}.")
+        elif step is not None and step < 1:
+            raise ValueError(f"`samples.step` must be >= 1, got {step}.")
+
+        samples = slice(*slice(bounds[0], bounds[1], step).indices(nt))
+        if len(range(samples.start, samples.stop, samples.step)) == 0:
+            raise ValueError(
+                f"Argument `samples` selects no samples of the {nt} sample time " f"axis."
+            )
+
+        return samples
+
+    @classmethod
+    def _build_from_setup(
+        cls,
+        setup: Dict[str, Any],
+        rows=slice(None),
+        keep_bits=False,
+        lazy=False,
+        out=None,
+    ):
+        """
+        Constructs the :class:`HDFReadData` array from the dictionary
+        generated by :meth:`_setup_read`.
+
+        :param setup: dictionary generated by :meth:`_setup_read`
+        :param rows: contiguous slice of the resolved shot numbers to
+            be read (step must be 1)
+        :type rows: slice
+        :param bool keep_bits: set :code:`True` to keep data in bits,
+            :code:`False` (DEFAULT) to convert data to voltage
+        :param bool lazy: set :code:`True` to leave out the
+            :code:`'signal'` field and defer its read to
+            :attr:`signal`
+        :param out: array or :class:`~.bufferpool.BufferPool` that
+            provides the memory of the returned array
+        :type out: Union[numpy.ndarray, BufferPool]
+        """
+        hdf_file = setup["hdf_file"]
+        _dmap = setup["dmap"]
+        chan_setups = setup["channels"]
+        controls = setup["controls"]
+        intersection_set = setup["intersection_set"]
+        samples = setup["samples"]
+        average = setup["average"]
+        masked = setup["masked"]
+        timer = stage_timer("HDFReadData", timeit=setup["timeit"])
+        d_info = chan_setups[0]["d_info"]
+        nchan = len(chan_setups)
+        if lazy and masked:
+            raise ValueError("Arguments `lazy` and `masked` can not both be True.")
+
+        # select the requested rows
+        # - `index` only has entries for the shot numbers flagged
+        #   by `sni`, so its rows are offset by the number of flagged
+        #   shot numbers before `rows.start` (`index_offsets`)
+        #
+        start, stop, _ = rows.indices(setup["shotnum"].size)
+        shotnum = setup["shotnum"][start:stop]
+        cdata = None if setup["cdata"] is None else setup["cdata"][start:stop]
+        msidata = {
+            dname: aligned[start:stop]
+            for dname, (aligned, _, _) in setup["msidata"].items()
+        }
+        index_list = []
+        sni_list = []
+        for cs in chan_setups:
+            offsets = cs["index_offsets"]
+            index_list.append(cs["index"][offsets[start] : offsets[stop]])
+            sni_list.append(cs["sni"][start:stop])
+
         # ---- Build `obj`                                          ----
         # Define dtype and shape
         # - 1st column of the digi data header contains the global HDF5
         #   file shot number
         # - shotkey = is the field name/key of the dheader shot number
         #   column
-        sigtype = np.float32 if not keep_bits else dset.dtype
+        # - reading multiple channels adds a channel axis to 'signal'
+        #
+        # - averaged bits are not integers
+        #
+        if keep_bits and average == 1:
+            sigtype = np.result_type(*[cs["dset"].dtype for cs in chan_setups])
+        else:
+            sigtype = np.float32
+        sigshape = len(range(samples.start, samples.stop, samples.step)) // average
+        if nchan > 1:
+            sigshape = (nchan, sigshape)
         shape = shotnum.shape
         dtype = [
-            ("shotnum", np.uint32, 1),
-            ("signal", sigtype, dset.shape[1]),
+            ("shotnum", np.uint32),
+            ("signal", sigtype, sigshape),
             ("xyz", np.float32, 3),
         ]
+        if lazy or masked:
+            # 'signal' is held outside of the array
+            del dtype[1]
         if len(controls) != 0:
             for subdtype in cdata.dtype.descr:
                 if subdtype[0] not in [d[0] for d in dtype]:
                     dtype.append(subdtype)
-
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - define dtype: {(tt[-1] - tt[-2]) * 1.0e3} ms")
+        for dname, aligned in msidata.items():
+            # each MSI diagnostic is a nested field
+            dtype.append((dname, aligned.dtype))
 
         # Initialize data array
-        data = np.empty(shape, dtype=dtype)
-
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - initialize data np.ndarray: {(tt[-1] - tt[-2]) * 1.0e3} ms")
+        # - use the buffer provided by `out`, if given
+        #
+        if out is None:
+            data = np.empty(shape, dtype=dtype)
+        elif isinstance(out, BufferPool):
+            data = out.get(shape, dtype)
+        elif isinstance(out, np.ndarray):
+            if out.shape != shape or out.dtype != np.dtype(dtype):
+                raise ValueError(
+                    f"Argument `out` must have shape {shape} and dtype "
+                    f"{np.dtype(dtype)}, got shape {out.shape} and dtype "
+                    f"{out.dtype}."
+                )
+            data = out.view(np.ndarray)
+        else:
+            raise TypeError("Argument `out` must be a numpy array or a BufferPool.")
 
         # fill 'shotnum' field of data array
         data["shotnum"] = shotnum
 
         # fill 'signal' fields of data array
-        index = index.tolist()
-        if intersection_set:
-            # fill signal
-            data["signal"] = dset[index, ...]
-        else:
-            # fill signal
-            data["signal"][sni] = dset[index, ...]
-            if np.issubdtype(data["signal"].dtype, np.integer):
-                data["signal"][np.logical_not(sni)] = 0
-            else:
-                # dtype is np.floating
-                data["signal"][np.logical_not(sni)] = np.nan
+        # - a lazy read defers this to `HDFLazySignal`
+        # - a masked read only fills the shot numbers recorded by at
+        #   least one channel (the `HDFMaskedSignal` payload)
+        #
+        if masked:
+            sig_valid = sni_list[0] if nchan == 1 else np.stack(sni_list, axis=1)
+            any_valid = np.logical_or.reduce(sni_list)
+            payload_shape = (np.count_nonzero(any_valid),) + (
+                (sigshape,) if nchan == 1 else sigshape
+            )
+            payload = np.empty(payload_shape, dtype=sigtype)
+            for ii, (cs, index, sni) in enumerate(zip(chan_setups, index_list, sni_list)):
+                signal = payload if nchan == 1 else payload[:, ii, ...]
+                prows = sni[any_valid]
+                if np.all(prows):
+                    read_dset_rows(
+                        cs["dset"], index, out=signal, samples=samples, average=average
+                    )
+                else:
+                    signal[prows] = read_dset_rows(
+                        cs["dset"], index, samples=samples, average=average
+                    )
+                    if np.issubdtype(signal.dtype, np.integer):
+                        signal[np.logical_not(prows)] = 0
+                    else:
+                        signal[np.logical_not(prows)] = np.nan
+        elif not lazy:
+            for ii, (cs, index, sni) in enumerate(zip(chan_setups, index_list, sni_list)):
+                dset = cs["dset"]
+                signal = data["signal"] if nchan == 1 else data["signal"][:, ii, ...]
+
+                if intersection_set:
+                    # fill signal
+                    # - read straight into 'signal', HDF5 handles the
+                    #   conversion to the 'signal' dtype
+                    read_dset_rows(
+                        dset, index, out=signal, samples=samples, average=average
+                    )
+                else:
+                    # fill signal
+                    signal[sni] = read_dset_rows(
+                        dset, index, samples=samples, average=average
+                    )
+                    if np.issubdtype(signal.dtype, np.integer):
+                        signal[np.logical_not(sni)] = 0
+                    else:
+                        # dtype is np.floating
+                        signal[np.logical_not(sni)] = np.nan
 
         # fill fields related to controls
         if len(controls) != 0:
@@ -552,36 +1261,66 @@ class HDFReadData(np.ndarray):
             # fill xyz
             data["xyz"] = np.nan
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - fill data array: {(tt[-1] - tt[-2]) * 1.0e3} ms")
+        # fill fields of MSI diagnostics
+        for dname, aligned in msidata.items():
+            data[dname] = aligned
+
+        if timer is not None:
+            timer.mark("array fill", shotnum.size)
 
         # Define obj to be returned
         obj = data.view(cls)
 
-        # get voltage offset
-        try:
-            voffset = dheader[0, "Offset"] * u.volt
-        except ValueError:
-            warn("Digitizer header dataset is missing the voltage 'Offset' field. ")
-            voffset = None
+        # number of averaged samples (hardware and read averaging)
+        sample_average = d_info["sample average (hardware)"]
+        if average > 1:
+            sample_average = average * (1 if sample_average is None else sample_average)
 
         # assign dataset meta-info
+        # - for a multi-channel read the channel specific items are
+        #   tuples ordered like the channel axis of 'signal'
+        #
+        if nchan == 1:
+            cs = chan_setups[0]
+            chan_info = {
+                "device dataset path": cs["dataset path"],
+                "adc": d_info["adc"],
+                "bit": d_info["bit"],
+                "board": cs["board"],
+                "channel": cs["channel"],
+                "voltage offset": cs["voltage offset"],
+            }
+        else:
+            chan_info = {
+                "device dataset path": tuple(cs["dataset path"] for cs in chan_setups),
+                "adc": tuple(cs["d_info"]["adc"] for cs in chan_setups),
+                "bit": tuple(cs["d_info"]["bit"] for cs in chan_setups),
+                "board": tuple(cs["board"] for cs in chan_setups),
+                "channel": tuple(cs["channel"] for cs in chan_setups),
+                "voltage offset": None,
+            }
+            for key in ("adc", "bit"):
+                if len(set(chan_info[key])) == 1:
+                    chan_info[key] = chan_info[key][0]
+            voffsets = [cs["voltage offset"] for cs in chan_setups]
+            if all(voffset is not None for voffset in voffsets):
+                chan_info["voltage offset"] = u.Quantity(voffsets)
         obj._info = {
             "source file": os.path.abspath(hdf_file.filename),
             "device group path": _dmap.info["group path"],
-            "device dataset path": dpath + dname,
+            "device dataset path": chan_info["device dataset path"],
             "digitizer": d_info["digitizer"],
             "configuration name": d_info["configuration name"],
-            "adc": d_info["adc"],
-            "bit": d_info["bit"],
+            "adc": chan_info["adc"],
+            "bit": chan_info["bit"],
             "clock rate": d_info["clock rate"],
-            "sample average": d_info["sample average (hardware)"],
+            "sample average": sample_average,
+            "sample start": samples.start,
+            "sample step": samples.step,
             "shot average": d_info["shot average (software)"],
-            "board": board,
-            "channel": channel,
-            "voltage offset": voffset,
+            "board": chan_info["board"],
+            "channel": chan_info["channel"],
+            "voltage offset": chan_info["voltage offset"],
             "probe name": None,
             "port": (None, None),
             "signal units": u.bit,
@@ -590,6 +1329,10 @@ class HDFReadData(np.ndarray):
             obj._info["controls"] = copy.deepcopy(cdata.info["controls"])
         else:
             obj._info["controls"] = {}
+        obj._info["msi"] = {}
+        for dname, (_, minfo, reduce) in setup["msidata"].items():
+            obj._info["msi"][dname] = copy.deepcopy(minfo)
+            obj._info["msi"][dname]["reduce"] = reduce
 
         # plasma parameter dict
         obj._plasma = {
@@ -611,23 +1354,60 @@ class HDFReadData(np.ndarray):
         #
         # obj['signal'] = obj['signal'].astype(np.float32, copy=False)
         #
+        conversions = None
         if not keep_bits:
             if obj.dv is None:
                 warn("Unable to calculated voltage step size...'signal' remains as bits")
             else:
                 # define offset
                 offset = abs(obj.info["voltage offset"].value)
+                dv = obj.dv.value
+                # - values are kept in 'signal' precision
+                # - per-channel values are broadcast along the channel
+                #   axis
+                dv = np.asarray(dv, dtype=np.float32)
+                offset = np.asarray(offset, dtype=np.float32)
+                if nchan > 1:
+                    conversions = list(zip(dv, offset))
+                    dv = dv[:, np.newaxis]
+                    offset = offset[:, np.newaxis]
+                else:
+                    conversions = [(dv[()], offset[()])]
 
                 # calc voltage
-                obj["signal"] = (obj.dv.value * obj["signal"]) - offset
+                # - done in-place to avoid full-size temporaries
+                if not lazy:
+                    signal = payload if masked else obj["signal"]
+                    np.multiply(signal, dv, out=signal)
+                    np.subtract(signal, offset, out=signal)
 
                 # update 'signal units'
                 obj._info["signal units"] = u.volt
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - execution time: {(tt[-1] - tt[-2]) * 1.0e3} ms")
+        # attach the deferred 'signal'
+        if lazy:
+            sig_rows = []
+            for cs, index, sni in zip(chan_setups, index_list, sni_list):
+                row = np.full(shotnum.shape, -1, dtype=np.int64)
+                row[sni] = index
+                sig_rows.append(row)
+            obj._lazy_signal = HDFLazySignal(
+                [cs["dset"] for cs in chan_setups],
+                shotnum,
+                sig_rows,
+                sigtype,
+                conversions=conversions,
+                channel_axis=nchan > 1,
+                samples=samples,
+                average=average,
+            )
+
+        # attach the compact 'signal'
+        if masked:
+            obj._masked_signal = HDFMaskedSignal(shotnum, sig_valid, payload)
+
+        if timer is not None:
+            timer.mark("conversion", shotnum.size)
 
         # return obj
         return obj
@@ -651,6 +1431,8 @@ class HDFReadData(np.ndarray):
                 "bit": None,
                 "clock rate": None,
                 "sample average": None,
+                "sample start": None,
+                "sample step": None,
                 "shot average": None,
                 "board": None,
                 "channel": None,
@@ -659,9 +1441,16 @@ class HDFReadData(np.ndarray):
                 "port": (None, None),
                 "signal units": None,
                 "controls": {},
+                "msi": {},
             },
         )
 
+        # deferred 'signal' of a lazy read
+        self._lazy_signal = getattr(obj, "_lazy_signal", None)
+
+        # compact 'signal' of a masked read
+        self._masked_signal = getattr(obj, "_masked_signal", None)
+
         # Define plasma attribute
         self._plasma = getattr(
             obj,
@@ -729,8 +1518,14 @@ class HDFReadData(np.ndarray):
               - tuple containing clock rate, e.g. (100.0, 'MHz')
             * - :const:`clock rate`
               - `int`
-              - (hardware sampling) number of data sample average
-                together
+              - number of data samples averaged together (hardware
+                averaging times the :data:`average` of the read)
+            * - :const:`sample start`
+              - `int`
+              - index of the first read sample in the digitizer record
+            * - :const:`sample step`
+              - `int`
+              - stride between the read samples
             * - :const:`shot average`
               - `int`
               - (software averaging) number of shot sequences averaged
@@ -772,20 +1567,15 @@ class HDFReadData(np.ndarray):
     def dt(self) -> Union[u.Quantity, None]:
         """
         Temporal step size (in sec) calculated from the
-        :code:`'clock rate'` and :code:`'sample average'` items in
-        :attr:`info`.  Returns :code:`None` if step size can not be
-        calculated.
+        :code:`'clock rate'`, :code:`'sample average'`, and
+        :code:`'sample step'` items in :attr:`info`.  Returns
+        :code:`None` if step size can not be calculated.
         """
-        if not isinstance(self.info["clock rate"], u.Quantity):
-            return
+        dt = self._calc_dt(self.info["clock rate"], self.info["sample average"])
 
-        # calc base dt
-        dt = 1.0 / self.info["clock rate"]
-        dt = dt.to("s")
-
-        # adjust for hardware averaging
-        if self.info["sample average"] is not None:
-            dt = dt * float(self.info["sample average"])
+        # adjust for a strided `samples` read
+        if dt is not None and self.info.get("sample step") is not None:
+            dt = dt * self.info["sample step"]
 
         return dt
 
@@ -801,9 +1591,72 @@ class HDFReadData(np.ndarray):
         elif self.info["bit"] is None:
             return
 
-        dv = 2.0 * abs(self.info["voltage offset"]) / (2.0 ** self.info["bit"] - 1.0)
+        dv = 2.0 * abs(self.info["voltage offset"])
+        dv = dv / (2.0 ** np.asarray(self.info["bit"]) - 1.0)
         return dv
 
+    @property
+    def signal(self) -> Union[np.ndarray, HDFLazySignal, HDFMaskedSignal]:
+        """
+        The digitizer signal.  This is the :code:`'signal'` field, or,
+        for a lazy read (:code:`lazy=True`), a
+        :class:`~.hdflazysignal.HDFLazySignal` aligned with the
+        :code:`'shotnum'` field that only reads the rows and samples it
+        is indexed with, or, for a masked read (:code:`masked=True`),
+        a :class:`~.hdfmaskedsignal.HDFMaskedSignal` aligned with the
+        :code:`'shotnum'` field.  Since the alignment is done by shot
+        number, the array can be sliced or masked (e.g. on
+        :code:`'xyz'`) before the signal is accessed.
+        """
+        if "signal" in self.dtype.names:
+            return self["signal"]
+        elif getattr(self, "_masked_signal", None) is not None:
+            return self._masked_signal.for_shotnum(self["shotnum"])
+        elif getattr(self, "_lazy_signal", None) is None:
+            raise ValueError("No 'signal' field or deferred signal available.")
+
+        return self._lazy_signal.for_shotnum(self["shotnum"])
+
+    def _trace_fields(self):
+        # the digitizer signal and the data array fields of the MSI
+        # diagnostics that are not reduced
+        names = []
+        if (
+            "signal" in self.dtype.names
+            or getattr(self, "_masked_signal", None) is not None
+            or getattr(self, "_lazy_signal", None) is not None
+        ):
+            names.append("signal")
+        for dname, minfo in self.info.get("msi", {}).items():
+            if minfo.get("reduce") is None:
+                names.extend(
+                    f"{dname}.{name}"
+                    for name in self.dtype[dname].names
+                    if name != "meta"
+                )
+        return names
+
+    def _trace_values(self, name):
+        if name == "signal":
+            return self.signal
+
+        return super()._trace_values(name)
+
+    def _trace_dims(self, name, shape):
+        if name != "signal":
+            return super()._trace_dims(name, shape)
+
+        return ("shotnum", "channel", "time") if len(shape) == 3 else ("shotnum", "time")
+
+    def _trace_time(self, name, nt):
+        if name != "signal":
+            dname = name.split(".", 1)[0]
+            return _msi_time(self.info["msi"][dname], nt)
+
+        # measured from the first read sample
+        dt = self.dt
+        return None if dt is None else np.arange(nt) * dt.to(u.s).value
+
     @property
     def plasma(self):  # pragma: no cover
         """
@@ -14,14 +14,39 @@ Module containing the main `~bapsflib._hdf.utils.hdfreadmsi.HDFReadMSI` class.
 """
 __all__ = ["HDFReadMSI"]
 
+import astropy.units as u
 import copy
+import functools
 import numpy as np
 import os
 
+from typing import Any, Callable, Union
+
+from bapsflib._hdf.utils.export import _msi_time, ExportMixin
 from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.helpers import (
+    condition_shotnum,
+    get_shotnum_resolver,
+    intersect_shotnum,
+    read_dset_rows,
+    reduce_dset_rows,
+)
+from bapsflib._hdf.utils.shotnumresolver import ShotNumResolvers
+
+
+def _integral(arr: np.ndarray, axis: int = -1, dx: float = 1.0) -> np.ndarray:
+    """
+    Trapezoidal integral of **arr** along **axis** for samples spaced
+    by **dx**.
+    """
+    arr = np.moveaxis(np.asarray(arr, dtype=np.float64), axis, -1)
+    if arr.shape[-1] < 2:
+        return np.zeros(arr.shape[:-1])
+
+    return dx * (arr.sum(axis=-1) - 0.5 * (arr[..., 0] + arr[..., -1]))
 
 
-class HDFReadMSI(np.ndarray):
+class HDFReadMSI(ExportMixin, np.ndarray):
     """
     Reads MSI diagnostic data from the HDF5 file.
 
@@ -78,6 +103,8 @@ class HDFReadMSI(np.ndarray):
          'device name': 'Discharge',
          'device group path': '/MSI/Discharge',
          'dt': [4.88e-05],
+         'reduce': None,
+         'samples': {'voltage': None, 'current': None},
          'source file': '/foo/bar/test.hdf5',
          't0': [-0.0249856],
          'voltage conversion factor': [0.0]}
@@ -87,11 +114,106 @@ class HDFReadMSI(np.ndarray):
         4.88e-05
     """
 
-    def __new__(cls, hdf_file: File, dname: str, **kwargs):
+    _aliases = [
+        ("Discharge", ["discharge"]),
+        (
+            "Gas pressure",
+            ["gas pressure", "pressure", "partial pressure", "partial pressures"],
+        ),
+        ("Heater", ["heater"]),
+        (
+            "Interferometer array",
+            ["interferometer array", "interferometer", "interarr"],
+        ),
+        ("Magnetic field", ["magnetic field", "b", "bfield"]),
+    ]
+    """Alias names of the MSI diagnostics."""
+
+    _reductions = {
+        "integral": _integral,
+        "max": np.max,
+        "mean": np.mean,
+        "median": np.median,
+        "min": np.min,
+        "ptp": np.ptp,
+        "std": np.std,
+        "sum": np.sum,
+    }
+    """Reductions that can be named by the :data:`reduce` keyword."""
+
+    def __new__(
+        cls,
+        hdf_file: File,
+        dname: str,
+        index=slice(None),
+        shotnum=slice(None),
+        reduce=None,
+        samples=None,
+        **kwargs,
+    ):
         """
         :param hdf_file: HDF5 file object
         :type hdf_file: :class:`~bapsflib.lapd.File`
         :param str dname: name of desired MSI diagnostic
+        :param index: dataset row indices to be read
+        :type index: Union[int, List[int], slice, numpy.ndarray]
+        :param shotnum: HDF5 file shot number(s) indicating the
+            entries to be read (only used if :code:`index` is not
+            given)
+        :type shotnum: Union[int, List[int], slice, numpy.ndarray, ShotSet]
+        :param reduce: reduction applied along the last (time) axis of
+            the data array fields, so each shot number has scalar
+            values.  Either the name of a reduction
+            (:code:`'integral'`, :code:`'max'`, :code:`'mean'`,
+            :code:`'median'`, :code:`'min'`, :code:`'ptp'`,
+            :code:`'std'`, or :code:`'sum'`) or a callable with the
+            signature :code:`reduce(arr, axis=-1)`.  :code:`None`
+            (DEFAULT) keeps the full data arrays.
+        :type reduce: Union[str, Callable, None]
+        :param samples: window of the time axis of the data array
+            fields to be read (or reduced), as a slice of sample
+            indices.  The slice :code:`start` and :code:`stop` may also
+            be given as times (an :class:`astropy.units.Quantity`)
+            measured from the first sample, if the diagnostic records
+            its time step (:code:`info['dt']`, in seconds).
+            :code:`None` (DEFAULT) reads all samples.
+        :type samples: slice
+
+        :code:`info['reduce']` records :data:`reduce` and
+        :code:`info['samples']` records the (conditioned) sample
+        window of each data array field.
+
+        Behavior of :data:`index` and :data:`shotnum`:
+
+        .. note::
+
+            * The keywords behave as in
+              :class:`~.hdfreaddata.HDFReadData`, with the returned
+              shot numbers being the intersection of :data:`shotnum`
+              and the shot numbers recorded by the diagnostic (so any
+              :data:`shotnum` :math:`\\le 0` is thrown out).
+            * Only the selected rows are read from each diagnostic
+              dataset.
+
+        Behavior of :data:`reduce`:
+
+        .. note::
+
+            The reduced data array fields are :code:`float64` and lose
+            their last axis, e.g. the :code:`(7, 100)` traces of a 7
+            channel interferometer become :code:`(7,)`.  The
+            :code:`'meta'` field is not reduced.
+
+            The traces are read and reduced block-by-block, so the
+            full traces are never held in memory.  :code:`'integral'`
+            is the trapezoidal integral over the (windowed) samples,
+            in units of seconds if the diagnostic records its time
+            step and of samples otherwise.
+
+            The per-shot values of a named reduction are cached in
+            :attr:`~bapsflib._hdf.utils.file.File.reduction_cache`, so
+            repeated reads (e.g. of other shot numbers) of a file
+            opened read-only only reduce the rows not reduced before.
         """
         # ---- Condition `hdf_file`                                 ----
         # - `hdf_file` is a lapd.File object
@@ -101,38 +223,37 @@ class HDFReadMSI(np.ndarray):
                 f"`hdf_file` is NOT type `{File.__module__}.{File.__qualname__}`"
             )
 
-        # ---- Condition `dname`                                    ----
-        # ensure `dname` is a string
-        if not isinstance(dname, str):
-            raise TypeError("arg `dname` needs to be a str")
-
-        # allow for alias names of MSI diagnostics
-        aliases = [
-            ("Discharge", ["discharge"]),
-            (
-                "Gas pressure",
-                ["gas pressure", "pressure", "partial pressure", "partial pressures"],
-            ),
-            ("Heater", ["heater"]),
-            (
-                "Interferometer array",
-                ["interferometer array", "interferometer", "interarr"],
-            ),
-            ("Magnetic field", ["magnetic field", "b", "bfield"]),
-        ]
-        for name, alias in aliases:
-            if dname.lower() in alias:
-                dname = name
-                break
-
+        # ---- Condition `dname` and `reduce`                       ----
         # get diagnostic map
         # - assume if a map is successful, then it is formatted to
         #   work without errors (i.e. no conditioning needed)
         #
-        try:
-            _map = hdf_file.file_map.msi[dname]
-        except KeyError:
-            raise ValueError("Specified MSI Diagnostic is not among known diagnostics")
+        _map = cls._get_map(hdf_file, dname)
+        reduce_arg = reduce
+        reduce_name = reduce if isinstance(reduce, str) else None
+        reduce = cls._condition_reduce(reduce)
+
+        # ---- Condition `samples`                                  ----
+        # - the time step (in seconds) is only known if recorded, and
+        #   all diagnostic datasets share it
+        #
+        sig_config = _map.configs["signals"]
+        dts = [None if dt is None else float(dt) for dt in _map.configs.get("dt", [])]
+        windows = {field: None for field in sig_config}
+        if samples is not None:
+            # to avoid cyclical imports
+            from bapsflib._hdf.utils.hdfreaddata import HDFReadData
+
+            dt = None
+            if len(dts) != 0 and dts[0] is not None and len(set(dts)) == 1:
+                dt = dts[0] * u.s
+            for field in sig_config:
+                if len(sig_config[field]["shape"]) == 0:
+                    # one value per shot number, no samples to select
+                    continue
+                windows[field] = HDFReadData._condition_samples(
+                    samples, sig_config[field]["shape"][-1], dt
+                )
 
         # ---- Construct shape and dtype for np.ndarray             ----
         #
@@ -157,14 +278,18 @@ class HDFReadMSI(np.ndarray):
         ]
 
         # add signal fields
-        for field in _map.configs["signals"]:
-            dtype_list.append(
-                (
-                    field,
-                    _map.configs["signals"][field]["dtype"],
-                    _map.configs["signals"][field]["shape"],
-                ),
-            )
+        # - a reduction drops the last (time) axis
+        # - a window shortens the last (time) axis
+        for field in sig_config:
+            shape = sig_config[field]["shape"]
+            if reduce is not None:
+                dtype_list.append((field, np.float64, shape[:-1]))
+            elif windows[field] is not None:
+                window = windows[field]
+                nt = len(range(window.start, window.stop, window.step))
+                dtype_list.append((field, sig_config[field]["dtype"], shape[:-1] + (nt,)))
+            else:
+                dtype_list.append((field, sig_config[field]["dtype"], shape))
 
         # add 'meta' fields
         # - all 'meta' fields needs to have the same number of rows as
@@ -191,31 +316,105 @@ class HDFReadMSI(np.ndarray):
         )
 
         # define dtype
+        # - the dtype is packed, so a slot at an offset HDF5 can not
+        #   address directly is read through the scratch buffer of
+        #   `read_dset_rows`
         dtype = np.dtype(dtype_list)
 
-        # ---- Define and Populate Numpy Array                      ----
-        # create empty array
-        data = np.empty(_map.configs["shape"], dtype=dtype)
-
-        # fill 'shotnum'
+        # ---- Condition `index` and `shotnum`                     ----
+        # - the rows are resolved against the first shot number
+        #   dataset
+        # - `index` is the (increasing) row indices to be read from
+        #   every diagnostic dataset
+        #
         sn_config = _map.configs["shotnum"]
-        for ii, path in enumerate(sn_config["dset paths"]):
-            # get dataset
-            dset = hdf_file[path]
-
-            # get field
-            field = (
+        sn_fields = [
+            (
+                path,
                 sn_config["dset field"][0]
                 if len(sn_config["dset field"]) == 1
-                else sn_config["dset field"][ii]
+                else sn_config["dset field"][ii],
             )
+            for ii, path in enumerate(sn_config["dset paths"])
+        ]
+        sn_dset = hdf_file[sn_fields[0][0]]
+        shotnumkey = sn_fields[0][1]
+        sn_size = _map.configs["shape"][0]
+
+        # Determine if indexing w.r.t. `index` or `shotnum`
+        index_with = "index"
+        if isinstance(index, slice):
+            if index == slice(None):
+                if not isinstance(shotnum, slice):
+                    index_with = "shotnum"
+                elif shotnum != slice(None):
+                    index_with = "shotnum"
+
+        if index_with == "index":
+            # convert `index` to np.ndarray
+            if isinstance(index, int):
+                index = np.array([index], dtype=np.int32)
+            elif isinstance(index, list):
+                index = np.array(index, dtype=np.int32)
+            elif isinstance(index, slice):
+                start, stop, step = index.indices(sn_size)
+                index = np.arange(start, stop, step, dtype=np.int32)
+            elif isinstance(index, type(Ellipsis)):
+                index = np.arange(0, sn_size, 1, dtype=np.int32)
+            elif isinstance(index, np.ndarray):
+                index = index.copy()
+            else:
+                raise TypeError("Valid `index` type not passed.")
+
+            # convert (VALID) negative indices to positive
+            neg_index_mask = np.where((index < 0) & (index >= -sn_size), True, False)
+            if np.any(neg_index_mask):
+                index[neg_index_mask] = index[neg_index_mask] % sn_size
+            index = np.unique(index)
+        else:
+            # resolve the requested shot numbers to dataset rows
+            # - only the shot numbers recorded in the dataset are
+            #   expanded and resolved
+            shotset = condition_shotnum(
+                shotnum, {0: sn_dset}, {0: shotnumkey}, as_shotset=True
+            )
+            resolver = get_shotnum_resolver(
+                sn_dset,
+                shotnumkey,
+                sn_index=hdf_file.shotnum_index,
+                resolvers=ShotNumResolvers.of_map(_map),
+            )
+            index = intersect_shotnum(shotset, {0: resolver})[2][0]
+
+        # ---- Define and Populate Numpy Array                      ----
+        # create empty array
+        data = np.empty(index.shape, dtype=dtype)
+
+        # every dataset must have a row for each shot number
+        meta_config = _map.configs["meta"]
+        paths = {path for path, _ in sn_fields}
+        for field, config in meta_config.items():
+            if field != "shape":
+                paths.update(config["dset paths"])
+        for path in paths:
+            if hdf_file[path].shape[0] != sn_size:
+                raise ValueError(
+                    "Datasets do NOT have the same shot number "
+                    "values, do NOT know how to handle"
+                )
 
+        # fill 'shotnum'
+        # - every dataset is read directly into its slot of `data`
+        #   (see `read_dset_rows`)
+        #
+        for ii, (path, field) in enumerate(sn_fields):
             # fill array
             if ii == 0:
-                data["shotnum"] = dset[:, field]
+                read_dset_rows(hdf_file[path], index, field, out=data["shotnum"])
             else:
                 # ensure every data set has matching shot numbers
-                if not np.array_equal(data["shotnum"], dset[field]):
+                sn_arr = read_dset_rows(hdf_file[path], index, field)
+                if not np.array_equal(data["shotnum"], sn_arr):
                     raise ValueError(
                         "Datasets do NOT have the same shot number "
                         "values, do NOT know how to handle"
@@ -224,32 +423,47 @@ class HDFReadMSI(np.ndarray):
         # fill 'signals'
         # TODO: ADD ABILITY TO READ FROM A STRUCTURED DATASET
         # - i.e. 'dset field' is not empty
-        sig_config = _map.configs["signals"]
         for field in sig_config:
-            if len(sig_config[field]["dset paths"]) == 1:
+            paths = sig_config[field]["dset paths"]
+            window = windows[field]
+            window_key = None if window is None else window.indices(window.stop)
+            for ii, path in enumerate(paths):
                 # get dataset
-                path = sig_config[field]["dset paths"][0]
                 dset = hdf_file[path]
 
-                # fill array
-                data[field] = dset
-            else:
-                # there are multiple rows in the dataset
-                # (e.g. interferometer)
-                # - indices look like
+                # get the slot of the dataset in the array
+                # - if there are multiple rows in the dataset
+                #   (e.g. interferometer), indices look like
                 #   [shot number, device number, time series]
                 #
-                for ii, path in enumerate(sig_config[field]["dset paths"]):
-                    # get dataset
-                    dset = hdf_file[path]
+                out = data[field] if len(paths) == 1 else data[field][:, ii, ...]
 
-                    # fill array
-                    data[field][:, ii, ...] = dset
+                # fill array
+                if reduce is None:
+                    read_dset_rows(dset, index, out=out, samples=window)
+                    continue
+
+                func = reduce
+                if reduce is _integral:
+                    # integrate w.r.t. time if the time step is known
+                    dt = dts[ii] if len(dts) == len(paths) else None
+                    dt = dts[0] if len(dts) == 1 else dt
+                    step = 1 if window is None else window.step
+                    func = functools.partial(_integral, dx=(dt or 1.0) * step)
+                if reduce_name is None:
+                    reduce_dset_rows(dset, index, func, samples=window, out=out)
+                else:
+                    # named reductions are cached on the file
+                    out[...] = hdf_file.reduction_cache.get(
+                        dset,
+                        index,
+                        (reduce_name, window_key),
+                        lambda rows: reduce_dset_rows(dset, rows, func, samples=window),
+                    )
 
         # fill 'meta'
         # TODO: ADD ABILITY TO READ FROM A REGULAR DATASET
         # - i.e. 'dset field' is empty
-        meta_config = _map.configs["meta"]
         for field in meta_config:
             # skip 'shape' key
             if field == "shape":
@@ -257,26 +471,26 @@ class HDFReadMSI(np.ndarray):
 
             # scan thru all datasets
             for ii, path in enumerate(meta_config[field]["dset paths"]):
-                # get dataset
-                dset = hdf_file[path]
-
                 # get dset_field
                 dset_field = (
                     meta_config[field]["dset field"][0]
                     if len(meta_config[field]["dset field"]) == 1
                     else meta_config[field]["dset field"][ii]
                 )
+                dset = hdf_file[path]
 
                 # fill array
                 if len(meta_config[field]["dset paths"]) == 1:
-                    data["meta"][field] = dset[dset_field]
+                    read_dset_rows(dset, index, dset_field, out=data["meta"][field])
                 else:
                     # there are multiple rows in the dataset
                     # (e.g. interferometer)
                     # - indices look like
                     #   [shot number, device number, time series]
                     #
-                    data["meta"][field][:, ii, ...] = dset[dset_field]
+                    read_dset_rows(
+                        dset, index, dset_field, out=data["meta"][field][:, ii, ...]
+                    )
 
         # ---- Define `obj`                                         ----
         obj = data.view(cls)
@@ -286,6 +500,8 @@ class HDFReadMSI(np.ndarray):
             "source file": os.path.abspath(hdf_file.filename),
             "device name": _map.info["group name"],
             "device group path": _map.info["group path"],
+            "reduce": reduce_arg,
+            "samples": windows,
         }
         for key, val in _map.configs.items():
             if key not in ["shape", "shotnum", "signals", "meta"]:
@@ -294,6 +510,47 @@ class HDFReadMSI(np.ndarray):
         # ---- Return `obj`                                         ----
         return obj
 
+    @classmethod
+    def _get_map(cls, hdf_file: File, dname: str):
+        """
+        Return the mapping of MSI diagnostic **dname**, which can be an
+        alias name (e.g. :code:`'bfield'` for :code:`'Magnetic field'`).
+        """
+        # ensure `dname` is a string
+        if not isinstance(dname, str):
+            raise TypeError("arg `dname` needs to be a str")
+
+        # allow for alias names of MSI diagnostics
+        for name, alias in cls._aliases:
+            if dname.lower() in alias:
+                dname = name
+                break
+
+        try:
+            return hdf_file.file_map.msi[dname]
+        except KeyError:
+            raise ValueError("Specified MSI Diagnostic is not among known diagnostics")
+
+    @classmethod
+    def _condition_reduce(cls, reduce: Union[str, Callable, None]) -> Any:
+        """
+        Condition the :data:`reduce` keyword into a callable (or
+        :code:`None`).
+        """
+        if reduce is None or callable(reduce):
+            return reduce
+        elif not isinstance(reduce, str):
+            raise TypeError(
+                f"Argument `reduce` must be a str or callable, got type {type(reduce)}."
+            )
+        elif reduce not in cls._reductions:
+            raise ValueError(
+                f"Argument `reduce` ({reduce}) must be one of "
+                f"{sorted(cls._reductions)}, or a callable."
+            )
+
+        return cls._reductions[reduce]
+
     def __array_finalize__(self, obj):
         # This should only be True during explicit construction
         # if obj is None:
@@ -309,6 +566,8 @@ class HDFReadMSI(np.ndarray):
                 "source file": None,
                 "device name": None,
                 "device group path": None,
+                "reduce": None,
+                "samples": {},
             },
         )
 
@@ -317,6 +576,17 @@ class HDFReadMSI(np.ndarray):
         """A dictionary of meta-info for the MSI diagnostic."""
         return self._info
 
+    def _trace_fields(self):
+        # the data array fields, unless reduced to per-shot values
+        if self.info.get("reduce") is not None:
+            return []
+
+        return [name for name in self.dtype.names if name not in ("shotnum", "meta")]
+
+    def _trace_time(self, name, nt):
+        window = self.info.get("samples", {}).get(name)
+        return _msi_time(self.info, nt, window)
+
 
 # add example to __new__ docstring
 HDFReadMSI.__new__.__doc__ += "\n"
@@ -17,20 +17,32 @@ __all__ = [
     "build_sndr_for_simple_dset",
     "build_sndr_for_complex_dset",
     "condition_controls",
+    "condition_msi",
     "condition_shotnum",
     "do_shotnum_intersection",
+    "get_shotnum_resolver",
+    "intersect_shotnum",
+    "read_dset_rows",
+    "reduce_dset_rows",
 ]
 
 import h5py
 import numpy as np
 
-from typing import Any, Dict, Iterable, List, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
 
 from bapsflib._hdf.maps.controls.templates import (
     HDFMapControlCLTemplate,
     HDFMapControlTemplate,
 )
 from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.shotnumindex import ShotNumIndex
+from bapsflib._hdf.utils.shotnumresolver import ShotNumResolver, ShotNumResolvers
+from bapsflib._hdf.utils.shotset import ShotSet
+
+#: byte size of the scratch buffer used by :func:`read_dset_rows` and
+#: :func:`reduce_dset_rows`
+_SCRATCH_NBYTES = 8 * 2**20
 
 # define type aliases
 ControlMap = Union[HDFMapControlTemplate, HDFMapControlCLTemplate]
@@ -43,6 +55,7 @@ def build_shotnum_dset_relation(
     shotnumkey: str,
     cmap: ControlMap,
     cconfn: Any,
+    sn_index: ShotNumIndex = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Compares the **shotnum** numpy array to the specified dataset,
@@ -65,6 +78,9 @@ def build_shotnum_dset_relation(
         contains shot numbers
     :param cmap: mapping object for control device
     :param cconfn: configuration name for the control device
+    :param sn_index: shot number index to take the dataset shot numbers
+        from, instead of reading them from **dset**
+    :type sn_index: :class:`~.shotnumindex.ShotNumIndex`
     :return: :code:`index` and :code:`sni` numpy arrays
 
     .. note::
@@ -90,19 +106,21 @@ def build_shotnum_dset_relation(
     #            shotnum[sni] = dset[index, shotnumkey]
     #
     # Calc. index, shotnum, and sni
-    if cmap.one_config_per_dset:
-        # the dataset only saves data for one configuration
-        index, sni = build_sndr_for_simple_dset(shotnum, dset, shotnumkey)
-    else:
-        # the dataset saves data for multiple configurations
-        index, sni = build_sndr_for_complex_dset(shotnum, dset, shotnumkey, cmap, cconfn)
+    resolver = get_shotnum_resolver(
+        dset, shotnumkey, cmap=cmap, cconfn=cconfn, sn_index=sn_index
+    )
+    index, sni = resolver.resolve(shotnum)
 
     # return calculated arrays
     return index.view(), sni.view()
 
 
 def build_sndr_for_simple_dset(
-    shotnum: np.ndarray, dset: h5py.Dataset, shotnumkey: str
+    shotnum: np.ndarray,
+    dset: h5py.Dataset,
+    shotnumkey: str,
+    sn_index: ShotNumIndex = None,
+    resolvers: ShotNumResolvers = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Compares the **shotnum** numpy array to the specified "simple"
@@ -125,68 +143,19 @@ def build_sndr_for_simple_dset(
     :type dset: :class:`h5py.Dataset`
     :param str shotnumkey: field name in the dataset that contains
         the shot numbers
+    :param sn_index: shot number index to take the dataset shot numbers
+        from, instead of reading them from **dset**
+    :type sn_index: :class:`~.shotnumindex.ShotNumIndex`
+    :param resolvers: cache of the shot number resolvers of the
+        device (e.g. :code:`ShotNumResolvers.of_map(cmap)`), so the
+        shot numbers of **dset** are only read once
+    :type resolvers: :class:`~.shotnumresolver.ShotNumResolvers`
     :return: :code:`index` and :code:`sni` numpy arrays
     """
     # this is for a dataset that only records data for one configuration
-    #
-    # get corresponding indices for shotnum
-    # build associated sni array
-    #
-    if dset.shape[0] == 1:
-        # only one possible shot number
-        only_sn = dset[0, shotnumkey]
-        sni = np.where(shotnum == only_sn, True, False)
-        index = np.array([0]) if True in sni else np.empty(shape=0, dtype=np.uint32)
-    else:
-        # get 1st and last shot number
-        first_sn = dset[0, shotnumkey]
-        last_sn = dset[-1, shotnumkey]
-
-        if last_sn - first_sn + 1 == dset.shape[0]:
-            # shot numbers are sequential
-            index = shotnum - first_sn
-
-            # build sni and filter index
-            sni = np.where(index < dset.shape[0], True, False)
-            index = index[sni]
-        else:
-            # shot numbers are NOT sequential
-            step_front_read = shotnum[-1] - first_sn
-            step_end_read = last_sn - shotnum[0]
-
-            if dset.shape[0] <= 1 + min(step_front_read, step_end_read):
-                # dset.shape is smaller than the theoretical reads from
-                # either end of the array
-                #
-                dset_sn = dset[shotnumkey].view()
-                sni = np.isin(shotnum, dset_sn)
-
-                # define index
-                index = np.where(np.isin(dset_sn, shotnum))[0]
-            elif step_front_read <= step_end_read:
-                # extracting from the beginning of the array is the
-                # smallest
-                some_dset_sn = dset[0 : step_front_read + 1, shotnumkey]
-                sni = np.isin(shotnum, some_dset_sn)
-
-                # define index
-                index = np.where(np.isin(some_dset_sn, shotnum))[0]
-            else:
-                # extracting from the end of the array is the smallest
-                start, stop, step = slice(
-                    -step_end_read.astype(np.int32) - 1, None, None
-                ).indices(dset.shape[0])
-                some_dset_sn = dset[start::, shotnumkey]
-                sni = np.isin(shotnum, some_dset_sn)
-
-                # define index
-                # NOTE: if index is empty (i.e. index.shape[0] == 0)
-                #       then adding an int still returns an empty array
-                index = np.where(np.isin(some_dset_sn, shotnum))[0]
-                index += start
+    resolver = _get_resolver(dset, shotnumkey, sn_index, resolvers)
 
-    # return calculated arrays
-    return index.view(), sni.view()
+    return resolver.resolve(shotnum)
 
 
 def build_sndr_for_complex_dset(
@@ -195,6 +164,7 @@ def build_sndr_for_complex_dset(
     shotnumkey: str,
     cmap: ControlMap,
     cconfn: Any,
+    sn_index: ShotNumIndex = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Compares the **shotnum** numpy array to the specified "complex"
@@ -210,18 +180,10 @@ def build_sndr_for_complex_dset(
     corresponding to the desired shot number(s).
 
     A "complex" dataset is a dataset in which the data for MULTIPLE
-    configurations is recorded.
-
-    .. admonition:: Dataset Assumption
-
-        There is an assumption that each shot number spans **n_configs**
-        number of rows in the dataset, where **n_configs** is the number
-        of control device configurations.  It is also assumed that the
-        order in which the configs are recorded is the same for each
-        shot number.  That is, if there are 3 configs (config01,
-        config02, and config03) and the first three rows of the dataset
-        are recorded in that order, then each following grouping of
-        three rows will maintain that order.
+    configurations is recorded.  The rows of each configuration are
+    found on first use and kept for the control mapping **cmap** (see
+    :meth:`~.shotnumresolver.ShotNumResolvers.of_map`), so later reads
+    only index into them.
 
     :param shotnum: desired HDF5 shot number
     :param dset: dataset containing shot numbers
@@ -230,14 +192,75 @@ def build_sndr_for_complex_dset(
         the shot numbers
     :param cmap: mapping object for control device
     :param cconfn: configuration name for the control device
+    :param sn_index: shot number index to take the dataset shot numbers
+        (and configuration rows) from, instead of reading them from
+        **dset**
+    :type sn_index: :class:`~.shotnumindex.ShotNumIndex`
     :return: :code:`index` and :code:`sni` numpy arrays
     """
     # this is for a dataset that records data for multiple
     # configurations
-    #
-    # Initialize some vals
-    n_configs = len(cmap.configs)
+    resolver = _get_complex_resolver(dset, shotnumkey, cmap, cconfn, sn_index)
+
+    return resolver.resolve(shotnum)
+
 
+def get_shotnum_resolver(
+    dset: h5py.Dataset,
+    shotnumkey: str,
+    cmap: ControlMap = None,
+    cconfn: Any = None,
+    sn_index: ShotNumIndex = None,
+    resolvers: ShotNumResolvers = None,
+) -> ShotNumResolver:
+    """
+    Get the :class:`~.shotnumresolver.ShotNumResolver` of the shot
+    numbers recorded in dataset **dset**, i.e. the resolver used by
+    :func:`build_shotnum_dset_relation` (if **cmap** is given) or
+    :func:`build_sndr_for_simple_dset`.
+
+    :param dset: dataset containing shot numbers
+    :type dset: :class:`h5py.Dataset`
+    :param str shotnumkey: field name in the dataset that contains
+        the shot numbers
+    :param cmap: mapping object for the control device, :code:`None`
+        (DEFAULT) for a "simple" dataset that is not a control device
+        dataset
+    :param cconfn: configuration name for the control device
+    :param sn_index: shot number index to take the dataset shot numbers
+        from, instead of reading them from **dset**
+    :type sn_index: :class:`~.shotnumindex.ShotNumIndex`
+    :param resolvers: cache of the shot number resolvers of the
+        device, defaults to the resolvers of **cmap** (see
+        :meth:`~.shotnumresolver.ShotNumResolvers.of_map`)
+    :type resolvers: :class:`~.shotnumresolver.ShotNumResolvers`
+    """
+    if cmap is None:
+        return _get_resolver(dset, shotnumkey, sn_index, resolvers)
+    elif not cmap.one_config_per_dset:
+        # the dataset saves data for multiple configurations
+        return _get_complex_resolver(dset, shotnumkey, cmap, cconfn, sn_index)
+
+    # the dataset only saves data for one configuration
+    return _get_resolver(
+        dset,
+        shotnumkey,
+        sn_index,
+        ShotNumResolvers.of_map(cmap) if resolvers is None else resolvers,
+    )
+
+
+def _get_complex_resolver(
+    dset: h5py.Dataset,
+    shotnumkey: str,
+    cmap: ControlMap,
+    cconfn: Any,
+    sn_index: Union[ShotNumIndex, None],
+) -> ShotNumResolver:
+    """
+    Get the shot number resolver of configuration **cconfn** of the
+    "complex" control device dataset **dset**.
+    """
     # determine configkey
     # - configkey is the dataset field name for the column that contains
     #   the associated configuration name
@@ -253,113 +276,44 @@ def build_sndr_for_complex_dset(
             f"({cmap.device_name}) dataset"
         )
 
-    # find index
-    if dset.shape[0] == n_configs:
-        # only one possible shotnum, index can be 0 to n_configs-1
-        #
-        # NOTE: The HDF5 configuration field stores a string with the
-        #       name of the configuration.  When reading that into a
-        #       numpy array the string becomes a byte string (i.e. b'').
-        #       When comparing with np.where() the comparing string
-        #       needs to be encoded (i.e. cconfn.encode()).
-        #
-        only_sn = dset[0, shotnumkey]
-        sni = np.where(shotnum == only_sn, True, False)
-
-        # construct index
-        if True not in sni:
-            # shotnum does not contain only_sn
-            index = np.empty(shape=0, dtype=np.uint32)
-        else:
-            config_name_arr = dset[0:n_configs, configkey]
-            index = np.where(config_name_arr == cconfn.encode())[0]
-
-            if index.size != 1:  # pragma: no cover
-                # something went wrong...no configurations are found
-                # and, thus, the routines assumption's do not match
-                # the format of the dataset
-                raise ValueError(
-                    "The specified dataset is NOT consistent with the"
-                    "routines assumptions of a complex dataset"
-                )
-    else:
-        # get 1st and last shot number
-        first_sn = dset[0, shotnumkey]
-        last_sn = dset[-1, shotnumkey]
-
-        # find sub-group index corresponding to the requested device
-        # configuration
-        config_name_arr = dset[0:n_configs, configkey]
-        config_where = np.where(config_name_arr == cconfn.encode())[0]
-        if config_where.size == 1:
-            config_subindex = config_where[0]
-        else:  # pragma: no cover
-            # something went wrong...either no configurations
-            # are found or the routine's assumptions do not
-            # match the format of the dataset
-            raise ValueError(
-                "The specified dataset is NOT consistent with the"
-                "routines assumptions of a complex dataset"
-            )
+    resolver = _get_resolver(
+        dset,
+        shotnumkey,
+        sn_index,
+        ShotNumResolvers.of_map(cmap),
+        configkey=configkey,
+        config_name=cconfn,
+    )
+    if len(resolver) == 0:
+        # no rows are found for the configuration and, thus, the
+        # format of the dataset does not match the configuration
+        raise ValueError(
+            "The specified dataset is NOT consistent with the"
+            "routines assumptions of a complex dataset"
+        )
 
-        # construct index for remaining scenarios
-        if n_configs * (last_sn - first_sn + 1) == dset.shape[0]:
-            # shot numbers are sequential and there are n_configs per
-            # shot number
-            index = shotnum - first_sn
+    return resolver
 
-            # adjust index to correspond to associated configuration
-            # - stretch by n_configs then shift by config_subindex
-            #
-            index = (n_configs * index) + config_subindex
 
-            # build sni and filter index
-            sni = np.where(index < dset.shape[0], True, False)
-            index = index[sni]
-        else:
-            # shot numbers are NOT sequential
-            step_front_read = shotnum[-1] - first_sn
-            step_end_read = last_sn - shotnum[0]
-
-            # construct index and sni
-            if dset.shape[0] <= n_configs * (min(step_front_read, step_end_read) + 1):
-                # dset.shape is smaller than the theoretical
-                # sequential array
-                dset_sn = dset[config_subindex::n_configs, shotnumkey]
-                sni = np.isin(shotnum, dset_sn)
-                index = np.where(np.isin(dset_sn, shotnum))[0]
-
-                # adjust index to correspond to associated configuration
-                index = (index * n_configs) + config_subindex
-            elif step_front_read <= step_end_read:
-                # extracting from the beginning of the array is the
-                # smallest
-                start = config_subindex
-                stop = n_configs * (step_front_read + 1)
-                stop += config_subindex
-                step = n_configs
-                some_dset_sn = dset[start:stop:step, shotnumkey]
-                sni = np.isin(shotnum, some_dset_sn)
-                index = np.where(np.isin(some_dset_sn, shotnum))[0]
-
-                # adjust index to correspond to associated configuration
-                index = (index * n_configs) + config_subindex
-            else:
-                # extracting from the end of the array is the
-                # smallest
-                start, stop, step = slice(
-                    -n_configs * (step_end_read + 1), None, n_configs
-                ).indices(dset.shape[0])
-                start += config_subindex
-                some_dset_sn = dset[start:stop:step, shotnumkey]
-                sni = np.isin(shotnum, some_dset_sn)
-                index = np.where(np.isin(some_dset_sn, shotnum))[0]
-
-                # adjust index to correspond to associated configuration
-                index = (index * n_configs) + start
+def _get_resolver(
+    dset: h5py.Dataset,
+    shotnumkey: str,
+    sn_index: Union[ShotNumIndex, None],
+    resolvers: Union[ShotNumResolvers, None],
+    **kwargs,
+) -> ShotNumResolver:
+    """
+    Get the shot number resolver of **dset** from the shot number
+    index **sn_index**, if given, or else from the cache
+    **resolvers**.
+    """
+    if sn_index is not None:
+        return sn_index.get_resolver(dset, shotnumkey, **kwargs)
+    elif resolvers is None:
+        # nothing to cache the resolver in
+        resolvers = ShotNumResolvers()
 
-    # return calculated arrays
-    return index.view(), sni.view()
+    return resolvers.get_resolver(dset, shotnumkey, **kwargs)
 
 
 def condition_controls(hdf_file: File, controls: Any) -> List[Tuple[str, Any]]:
@@ -478,9 +432,84 @@ def condition_controls(hdf_file: File, controls: Any) -> List[Tuple[str, Any]]:
     return controls
 
 
+def condition_msi(hdf_file: File, msi: Any) -> List[Tuple[str, Any]]:
+    """
+    Conditions the **msi** argument (the :data:`add_msi` keyword) for
+    :class:`~.hdfreaddata.HDFReadData`.
+
+    :param hdf_file: HDF5 object instance
+    :param msi: `msi` argument to be conditioned
+    :return: list containing tuple pairs of MSI diagnostic name and
+        reduction (see :class:`~.hdfreadmsi.HDFReadMSI`)
+
+    :Example:
+
+        >>> from bapsflib import lapd
+        >>> f = lapd.File('sample.hdf5')
+        >>> msi = ['Discharge', ('bfield', 'mean')]
+        >>> conditioned_msi = condition_msi(f, msi)
+        >>> conditioned_msi
+        [('Discharge', None), ('Magnetic field', 'mean')]
+
+    .. admonition:: Condition Criteria
+
+        #. Input **msi** should be
+           :code:`Union[str, Iterable[Union[str, Tuple[str, Any]]]]`
+        #. Alias diagnostic names are replaced by the mapped name.
+        #. A diagnostic can only be specified once.
+        #. The reduction must be valid for
+           :class:`~.hdfreadmsi.HDFReadMSI`.
+    """
+    # to avoid cyclical imports
+    from bapsflib._hdf.utils.hdfreadmsi import HDFReadMSI
+
+    # check if NULL
+    if not bool(msi):
+        raise ValueError("msi argument is NULL")
+
+    # make string a list
+    if isinstance(msi, str):
+        msi = [msi]
+
+    # condition Iterable
+    if not isinstance(msi, Iterable):
+        raise TypeError("`msi` argument is not Iterable")
+    elif not all(isinstance(diag, (str, tuple)) for diag in msi):
+        raise TypeError("all elements of `msi` must be of type string or tuple")
+
+    new_msi = []
+    for diag in msi:
+        if isinstance(diag, str):
+            name = diag
+            reduce = None
+        elif len(diag) in (1, 2):
+            name = diag[0]
+            reduce = None if len(diag) == 1 else diag[1]
+        else:
+            raise ValueError(
+                "a `msi` tuple element must be specified as ('diagnostic name') or, "
+                "('diagnostic name', reduce)"
+            )
+
+        # ensure the diagnostic is mapped and the reduction is valid
+        name = HDFReadMSI._get_map(hdf_file, name).device_name
+        HDFReadMSI._condition_reduce(reduce)
+        if name in [dd[0] for dd in new_msi]:
+            raise ValueError(
+                f"MSI diagnostic ({diag}) can only have one occurrence in msi"
+            )
+
+        new_msi.append((name, reduce))
+
+    return new_msi
+
+
 def condition_shotnum(
-    shotnum: Any, dset_dict: Dict[str, h5py.Dataset], shotnumkey_dict: Dict[str, str]
-) -> np.ndarray:
+    shotnum: Any,
+    dset_dict: Dict[str, h5py.Dataset],
+    shotnumkey_dict: Dict[str, str],
+    as_shotset: bool = False,
+) -> Union[np.ndarray, ShotSet]:
     """
     Conditions the **shotnum** argument for
     :class:`~bapsflib._hdf.utils.hdfreadcontrols.HDFReadControls` and
@@ -490,23 +519,32 @@ def condition_shotnum(
     :param dset_dict: dictionary of all control dataset instances
     :param shotnumkey_dict: dictionary of the shot number field name
         for each control dataset in dset_dict
-    :return: conditioned **shotnum** numpy array
+    :param bool as_shotset: return the conditioned shot numbers as a
+        :class:`~.shotset.ShotSet` instead of expanding them into an
+        array (see :func:`intersect_shotnum`)
+    :return: conditioned **shotnum** numpy array (or
+        :class:`~.shotset.ShotSet`)
 
     .. admonition:: Condition Criteria
 
         #. Input **shotnum** should be
-           :code:`Union[int, List[int,...], slice, np.ndarray]`
+           :code:`Union[int, List[int,...], slice, np.ndarray, ShotSet]`
+           (see :class:`~.shotset.ShotSet`)
         #. Any :math:`\mathbf{shotnum} \le 0` will be removed.
         #. A :code:`ValueError` will be thrown if the conditioned array
            is NULL.
+        #. The conditioned array is sorted and unique.
     """
     # Acceptable `shotnum` types
     # 1. int
     # 2. slice() object
     # 3. List[int, ...]
     # 4. np.array (dtype = np.integer and ndim = 1)
+    # 5. ShotSet
     #
-    # Catch each `shotnum` type and convert to numpy array
+    # Catch each `shotnum` type and convert to a ShotSet
+    # - a slice, or ShotSet, of consecutive shot numbers stays a
+    #   single range until the final array is built
     #
     if isinstance(shotnum, int):
         if shotnum <= 0 or isinstance(shotnum, bool):
@@ -515,28 +553,15 @@ def condition_shotnum(
             )
 
         # convert
-        shotnum = np.array([shotnum], dtype=np.uint32)
+        shotset = ShotSet.from_range(shotnum, shotnum + 1)
 
     elif isinstance(shotnum, list):
         # ensure all elements are int
         if not all(isinstance(sn, int) for sn in shotnum):
             raise ValueError("Valid `shotnum` not passed. All values NOT int.")
 
-        # remove shot numbers <= 0
-        shotnum.sort()
-        shotnum = list(set(shotnum))
-        shotnum.sort()
-        if min(shotnum) <= 0:
-            # remove values less-than or equal to 0
-            new_sn = [sn for sn in shotnum if sn > 0]
-            shotnum = new_sn
-
-        # ensure not NULL
-        if len(shotnum) == 0:
-            raise ValueError("Valid `shotnum` not passed. Resulting array would be NULL")
-
         # convert
-        shotnum = np.array(shotnum, dtype=np.uint32)
+        shotset = ShotSet(shotnum)
 
     elif isinstance(shotnum, slice):
         # determine largest possible shot number
@@ -547,19 +572,8 @@ def condition_shotnum(
             last_sn.append(shotnum.stop)
         stop_sn = max(last_sn)
 
-        # get the start, stop, and step for the shot number array
-        start, stop, step = shotnum.indices(stop_sn)
-
-        # re-define `shotnum`
-        shotnum = np.arange(start, stop, step, dtype=np.int32)
-
-        # remove shot numbers <= 0
-        shotnum = np.delete(shotnum, np.where(shotnum <= 0)[0])
-        shotnum = shotnum.astype(np.uint32)
-
-        # ensure not NULL
-        if shotnum.size == 0:
-            raise ValueError("Valid `shotnum` not passed. Resulting array would be NULL")
+        # convert
+        shotset = ShotSet.from_slice(shotnum, int(stop_sn))
 
     elif isinstance(shotnum, np.ndarray):
         if shotnum.ndim != 1:
@@ -571,19 +585,24 @@ def condition_shotnum(
         ):
             raise ValueError("Valid `shotnum` not passed")
 
-        # remove shot numbers <= 0
-        shotnum.sort()
-        shotnum = np.delete(shotnum, np.where(shotnum <= 0)[0])
-        shotnum = shotnum.astype(np.uint32)
+        # convert
+        shotset = ShotSet(shotnum)
+
+    elif isinstance(shotnum, ShotSet):
+        shotset = shotnum
 
-        # ensure not NULL
-        if shotnum.size == 0:
-            raise ValueError("Valid `shotnum` not passed. Resulting array would be NULL")
     else:
         raise ValueError("Valid `shotnum` not passed")
 
+    # remove shot numbers <= 0
+    shotset = shotset.select(start=1)
+
+    # ensure not NULL
+    if not shotset:
+        raise ValueError("Valid `shotnum` not passed. Resulting array would be NULL")
+
     # return
-    return shotnum
+    return shotset if as_shotset else shotset.to_array()
 
 
 def do_shotnum_intersection(
@@ -606,23 +625,475 @@ def do_shotnum_intersection(
             shotnum[sni] = dset[index, shotnumkey]
     """
     # intersect shot numbers
-    shotnum_intersect = shotnum
-    for sni in sni_dict.values():
-        shotnum_intersect = np.intersect1d(
-            shotnum_intersect, shotnum[sni], assume_unique=True
-        )
-    if shotnum_intersect.shape[0] == 0:
+    # - every sni array masks the same shotnum array, so the
+    #   intersection is the shot numbers masked by all of them
+    mask = np.logical_and.reduce(list(sni_dict.values()))
+    if not np.any(mask):
         raise ValueError("Input `shotnum` would result in a NULL array")
 
     # now filter
+    # - index_dict[cname] is aligned with shotnum[sni_dict[cname]]
     for cname in index_dict:
         sni = sni_dict[cname]
-        mask_for_index = np.isin(shotnum[sni], shotnum_intersect)
-        index_dict[cname] = index_dict[cname][mask_for_index]
-        sni_dict[cname] = np.ones(shotnum_intersect.shape, dtype=bool)
+        index_dict[cname] = index_dict[cname][mask[sni]]
+        sni_dict[cname] = np.ones(np.count_nonzero(mask), dtype=bool)
 
     # update shotnum
-    shotnum = shotnum_intersect
+    shotnum = shotnum[mask]
 
     # return
     return shotnum, sni_dict, index_dict
+
+
+def intersect_shotnum(
+    shotnum: ShotSet, resolver_dict: Dict[Any, ShotNumResolver]
+) -> Tuple[np.ndarray, IndexDict, IndexDict]:
+    """
+    Calculates the intersection of the shot numbers **shotnum** and
+    the shot numbers recorded in every dataset, and builds the
+    :code:`index` and :code:`sni` arrays of each dataset for it.
+
+    Unlike :func:`do_shotnum_intersection`, the intersection is done
+    on the ranges of the :class:`~.shotset.ShotSet` of the requested
+    and recorded shot numbers (see
+    :attr:`~.shotnumresolver.ShotNumResolver.shotset`), and only the
+    intersected shot numbers are expanded and resolved to dataset rows.
+
+    :param shotnum: desired HDF5 shot numbers
+    :param resolver_dict: dictionary of the shot number resolver of
+        each dataset (see :func:`get_shotnum_resolver`)
+    :return: intersected :code:`shotnum`, and the :code:`sni` and
+        :code:`index` numpy arrays of each dataset
+
+    .. admonition:: Recall Array Relationship
+
+        .. code-block:: python
+
+            shotnum[sni] = dset[index, shotnumkey]
+    """
+    # intersect shot numbers
+    shotset = shotnum.intersection(*(rs.shotset for rs in resolver_dict.values()))
+    if not shotset:
+        raise ValueError("Input `shotnum` would result in a NULL array")
+
+    # resolve the intersected shot numbers
+    # - every dataset records all of them
+    shotnum = shotset.to_array()
+    sni_dict = {}  # type: IndexDict
+    index_dict = {}  # type: IndexDict
+    for key, resolver in resolver_dict.items():
+        index_dict[key] = resolver.resolve(shotnum)[0]
+        sni_dict[key] = np.ones(shotnum.shape, dtype=bool)
+
+    return shotnum, sni_dict, index_dict
+
+
+def read_dset_rows(
+    dset: h5py.Dataset,
+    index: Union[List[int], np.ndarray],
+    field: Union[str, List[str]] = None,
+    out: np.ndarray = None,
+    samples: slice = None,
+    average: int = None,
+) -> np.ndarray:
+    """
+    Reads the rows **index** of dataset **dset**, i.e. the equivalent
+    of :code:`dset[index, ...]` or :code:`dset[index, field]`
+    (:code:`dset[index, samples, ...]` if **samples** is given).
+
+    Instead of an h5py point/fancy selection, **index** is grouped into
+    runs of contiguous rows and all runs are read with one hyperslab
+    selection (a single strided hyperslab if the runs are equally
+    sized and spaced).  For long, mostly contiguous or regularly
+    strided **index** arrays (e.g. shot number selected reads) this is
+    much faster than fancy indexing.
+
+    :param dset: dataset to be read
+    :type dset: :class:`h5py.Dataset`
+    :param index: unique row indices to be read.  Rows that are not
+        in increasing order are read in increasing order and put back
+        in the order of **index**, which costs one extra copy.
+    :param field: name of the dataset field to be read (only for
+        compound datasets), :code:`None` (DEFAULT) to read all fields.
+        A list of field names reads those fields in one pass and
+        returns a structured array with just those fields.
+    :param out: array to read the rows into, :code:`None` (DEFAULT)
+        to allocate a new array.  HDF5 converts the data to the dtype
+        of **out** while reading, so, for example, integer digitizer
+        data can be read straight into a :code:`float32` array.  If
+        **out** is not C-contiguous, but its rows are (e.g. a field of
+        a structured array), the rows are read directly into their
+        place in memory when the layout allows it (see
+        :func:`_direct_mspace`), otherwise through a small scratch
+        buffer.
+    :param samples: slice of the second dataset axis (e.g. the
+        digitizer samples) to be read, :code:`None` (DEFAULT) to read
+        the full axis.  The step must be positive.  Only the selected
+        elements are read from disk.
+    :type samples: slice
+    :param int average: number of consecutive (selected) samples to be
+        averaged together, :code:`None` (DEFAULT) for no averaging.
+        Trailing samples that do not fill a whole average are dropped.
+        The rows are read and averaged block-by-block through a small
+        scratch buffer, so the full-rate data is never held in memory.
+        A new **out** is :code:`float64`.
+    :return: numpy array of the read rows (**out** if given)
+
+    .. note::
+
+        Like h5py fancy indexing, a :code:`TypeError` is raised if
+        **index** has repeated rows and an :code:`IndexError` is
+        raised if **index** is out of range.
+    """
+    # read unordered rows in increasing order, and scatter them back
+    # - e.g. the rows resolved from a dataset whose shot numbers are
+    #   not increasing
+    #
+    index = np.asarray(index, dtype=np.int64).reshape(-1)
+    if index.size > 1 and np.any(np.diff(index) <= 0):
+        order = np.argsort(index, kind="stable")
+        if np.any(np.diff(index[order]) == 0):
+            raise TypeError("Indexing elements must be unique.")
+        data = read_dset_rows(
+            dset,
+            index[order],
+            field,
+            out=None if out is None else np.empty(out.shape, dtype=out.dtype),
+            samples=samples,
+            average=average,
+        )
+        if out is None:
+            out = np.empty_like(data)
+        out[order] = data
+        return out
+
+    # condition `field`
+    # - a list of fields is read as a compound subset of the dataset
+    #   type, and returned as a structured array
+    #
+    subset = isinstance(field, (list, tuple))
+    if field is None:
+        read_dtype = dset.dtype
+        field_shape = ()
+    elif subset:
+        for name in field:
+            if dset.dtype.names is None or name not in dset.dtype.names:
+                raise ValueError(f"Field '{name}' does not appear in the dataset type.")
+        read_dtype = np.dtype([(name, dset.dtype[name]) for name in field])
+        field_shape = ()
+    elif dset.dtype.names is None or field not in dset.dtype.names:
+        raise ValueError(f"Field '{field}' does not appear in the dataset type.")
+    else:
+        read_dtype = np.dtype([(field, dset.dtype[field])])
+        field_shape = dset.dtype[field].shape
+
+    # condition `samples`
+    if samples is None:
+        pass
+    elif not isinstance(samples, slice):
+        raise TypeError("Argument `samples` must be a slice.")
+    elif dset.ndim < 2:
+        raise ValueError("Argument `samples` requires a dataset with ndim >= 2.")
+    else:
+        samples = slice(*samples.indices(dset.shape[1]))
+        if samples.step < 1:
+            raise ValueError("Argument `samples` must have a positive step.")
+    sample_shape = dset.shape[1:]
+    if samples is not None:
+        sample_shape = (len(range(samples.start, samples.stop, samples.step)),)
+        sample_shape += dset.shape[2:]
+
+    # condition `average`
+    # - `samples` is trimmed to a whole number of averages
+    #
+    if average is None:
+        average = 1
+    elif not isinstance(average, (int, np.integer)) or isinstance(average, bool):
+        raise TypeError("Argument `average` must be an int.")
+    elif average < 1:
+        raise ValueError("Argument `average` must be >= 1.")
+    elif average > 1:
+        if field is not None:
+            raise ValueError("Argument `average` can not be combined with `field`.")
+        elif dset.ndim < 2:
+            raise ValueError("Argument `average` requires a dataset with ndim >= 2.")
+        elif samples is None:
+            samples = slice(0, dset.shape[1], 1)
+        n_avg = sample_shape[0] // average
+        samples = slice(
+            samples.start,
+            samples.start + n_avg * average * samples.step,
+            samples.step,
+        )
+        sample_shape = (n_avg,) + sample_shape[1:]
+
+    # condition `index`
+    shape = (index.size,) + sample_shape
+    if index.size != 0 and (index[0] < 0 or index[-1] >= dset.shape[0]):
+        raise IndexError(f"Index out of range for (0-{dset.shape[0] - 1}).")
+
+    # condition `out`
+    if out is not None:
+        if not isinstance(out, np.ndarray):
+            raise TypeError("Argument `out` must be a numpy array.")
+        elif out.shape != shape + field_shape:
+            raise ValueError(
+                f"Argument `out` has shape {out.shape}, expected "
+                f"{shape + field_shape}."
+            )
+    elif average > 1:
+        # averages are floating point
+        out = np.empty(shape, dtype=np.float64)
+    if out is not None and 0 in shape:
+        return out
+    # read straight into a strided `out` when its memory layout can
+    # be described to HDF5
+    # - a compound field is read as one memory element per row, so
+    #   only from a 1D dataset
+    direct = None
+    if out is not None and average == 1 and not subset:
+        if field is None and not out.flags.c_contiguous:
+            direct = _direct_mspace(out)
+        elif field is not None and dset.ndim == 1:
+            direct = _direct_mspace(out, field)
+    if (
+        out is not None
+        and direct is None
+        and (field is not None or not out.flags.c_contiguous or average > 1)
+    ):
+        # read through a bounded scratch buffer
+        # - HDF5 can only read into C-contiguous memory
+        # - numpy handles the dtype conversion when copying into
+        #   `out`
+        # - averaging is done per block, so only the scratch buffer
+        #   holds full-rate samples
+        #
+        row_shape = (shape[1] * average,) + shape[2:] if average > 1 else shape[1:]
+        row_nbytes = read_dtype.itemsize * int(np.prod(row_shape))
+        nrows = max(1, min(index.size, _SCRATCH_NBYTES // max(row_nbytes, 1)))
+        scratch = np.empty((nrows,) + row_shape, dtype=read_dtype)
+        for start in range(0, index.size, nrows):
+            sub_index = index[start : start + nrows]
+            buf = scratch[: sub_index.size]
+            read_dset_rows(dset, sub_index, out=buf, samples=samples)
+            if average > 1:
+                buf = buf.reshape((buf.shape[0], shape[1], average) + shape[2:])
+                buf = buf.mean(axis=2)
+            out[start : start + sub_index.size] = (
+                buf if field is None or subset else buf[field]
+            )
+        return out
+    if 0 in shape:
+        data = np.empty(shape, dtype=read_dtype)
+        return data if field is None or subset else data[field]
+
+    # group `index` into runs of contiguous rows
+    breaks = np.flatnonzero(np.diff(index) != 1) + 1
+    starts = index[np.concatenate(([0], breaks))]
+    counts = np.diff(np.concatenate(([0], breaks, [index.size])))
+
+    # hyperslab of the non-row axes
+    # - a strided `samples` selects `count` blocks of 1 element
+    #
+    offset = (0,) * (len(shape) - 1)
+    count = (1,) * (len(shape) - 1)
+    stride = shape[1:]
+    block = shape[1:]
+    if samples is not None:
+        offset = (samples.start,) + offset[1:]
+        if samples.step != 1:
+            count = (shape[1],) + count[1:]
+            stride = (samples.step,) + stride[1:]
+            block = (1,) + block[1:]
+
+    # build hyperslab selection
+    # - equally sized and spaced runs (e.g. from a sliced `index`)
+    #   are a single strided hyperslab
+    # - otherwise, the runs are combined into one selection
+    #
+    fspace = dset.id.get_space()
+    strides = np.diff(starts)
+    if np.all(counts == counts[0]) and np.all(strides == strides[:1]):
+        fspace.select_hyperslab(
+            (int(starts[0]),) + offset,
+            (starts.size,) + count,
+            stride=(int(strides[0]) if strides.size else int(counts[0]),) + stride,
+            block=(int(counts[0]),) + block,
+        )
+    else:
+        fspace.select_none()
+        for start, run in zip(starts.tolist(), counts.tolist()):
+            fspace.select_hyperslab(
+                (start,) + offset,
+                (1,) + count,
+                stride=(run,) + stride,
+                block=(run,) + block,
+                op=h5py.h5s.SELECT_OR,
+            )
+
+    # read
+    # - HDF5 converts to the dtype of the memory buffer
+    #
+    if direct is not None:
+        # scatter the rows directly into the memory of `out`
+        buffer, mspace, mtype = direct
+        dset.id.read(mspace, fspace, buffer, mtype=mtype)
+        return out
+
+    mspace = h5py.h5s.create_simple(shape)
+    data = np.empty(shape, dtype=read_dtype) if out is None else out
+    mtype = None if field is None else h5py.h5t.py_create(read_dtype)
+    dset.id.read(mspace, fspace, data, mtype=mtype)
+
+    return data if field is None or subset else data[field]
+
+
+def reduce_dset_rows(
+    dset: h5py.Dataset,
+    index: Union[List[int], np.ndarray],
+    reduce: Callable,
+    samples: slice = None,
+    out: np.ndarray = None,
+) -> np.ndarray:
+    """
+    Reduces the rows **index** of dataset **dset** along their last
+    axis, i.e. the equivalent of
+    :code:`reduce(dset[index, ...], axis=-1)`.
+
+    The rows are read (see :func:`read_dset_rows`) and reduced
+    block-by-block through a bounded scratch buffer, so the full rows
+    are never all held in memory.
+
+    A 1D dataset already records one value per row, so there is no axis
+    to reduce and its rows are returned unchanged (converted to the
+    dtype of **out**).
+
+    :param dset: dataset to be reduced
+    :type dset: :class:`h5py.Dataset`
+    :param index: unique row indices to be reduced
+    :param reduce: reduction with the signature
+        :code:`reduce(arr, axis=-1)`
+    :param samples: slice of the second dataset axis to be reduced,
+        :code:`None` (DEFAULT) to reduce the full axis
+    :type samples: slice
+    :param out: array to store the reduced rows in, :code:`None`
+        (DEFAULT) to allocate a new :code:`float64` array
+    :return: numpy array of the reduced rows (**out** if given)
+    """
+    index = np.asarray(index, dtype=np.int64).reshape(-1)
+    if dset.ndim < 2 and samples is not None:
+        raise ValueError(
+            f"Argument `samples` can not be used, dataset {dset.name} has no "
+            f"sample axis (shape {dset.shape})."
+        )
+    row_shape = dset.shape[1:]
+    if samples is not None:
+        row_shape = (len(range(*samples.indices(dset.shape[1]))),) + dset.shape[2:]
+    if out is None:
+        out = np.empty((index.size,) + row_shape[:-1], dtype=np.float64)
+    elif out.shape != (index.size,) + row_shape[:-1]:
+        raise ValueError(
+            f"Argument `out` has shape {out.shape}, expected "
+            f"{(index.size,) + row_shape[:-1]}."
+        )
+    if index.size == 0:
+        return out
+    elif dset.ndim < 2:
+        # one value per row, nothing to reduce
+        return read_dset_rows(dset, index, out=out)
+
+    # reduce through a bounded scratch buffer
+    row_nbytes = dset.dtype.itemsize * int(np.prod(row_shape))
+    nrows = max(1, min(index.size, _SCRATCH_NBYTES // max(row_nbytes, 1)))
+    scratch = np.empty((nrows,) + row_shape, dtype=dset.dtype)
+    for start in range(0, index.size, nrows):
+        sub_index = index[start : start + nrows]
+        buf = read_dset_rows(
+            dset, sub_index, out=scratch[: sub_index.size], samples=samples
+        )
+        out[start : start + sub_index.size] = reduce(buf, axis=-1)
+
+    return out
+
+
+def _direct_mspace(
+    out: np.ndarray, field: str = None
+) -> Union[Tuple[np.ndarray, h5py.h5s.SpaceID, Union[h5py.h5t.TypeID, None]], None]:
+    """
+    Describe the memory of a strided **out** array (e.g. the
+    :code:`[:, ii, ...]` slot of a structured array field) as an HDF5
+    memory selection, so :func:`read_dset_rows` can read the dataset
+    rows directly into **out** without a scratch buffer.
+
+    The rows of **out** (everything after the first axis) must be
+    C-contiguous and **out** must be a view of a C-contiguous array.
+    The memory selection is made on that array:
+
+    * for a regular dataset, as a strided 1D hyperslab in units of the
+      **out** elements (the row stride and the **out** offset must be
+      multiples of the element size), or
+    * for a single **field** of a compound dataset, as one compound
+      element (sized to the row stride) per row, whose only member is
+      **field**, so HDF5 leaves the rest of the memory untouched.
+
+    :param out: array the dataset rows are to be read into
+    :param field: name of the compound dataset field being read,
+        :code:`None` (DEFAULT) for a regular dataset
+    :return: the contiguous buffer, the memory dataspace, and the
+        memory type (:code:`None` to use the buffer dtype) to pass to
+        :meth:`h5py.h5d.DatasetID.read`, or :code:`None` if the
+        memory of **out** can not be described
+    """
+    # find the contiguous array `out` is a view of
+    root = out
+    while isinstance(root.base, np.ndarray):
+        root = root.base
+    if (
+        out.ndim == 0
+        or out.dtype.names is not None
+        or not root.flags.c_contiguous
+        or not root.flags.writeable
+    ):
+        return
+
+    # rows of `out` must be C-contiguous
+    elsize = out.dtype.itemsize
+    row_size = int(np.prod(out.shape[1:]))
+    row_nbytes = row_size * elsize
+    expected = elsize
+    for size, stride in zip(out.shape[:0:-1], out.strides[:0:-1]):
+        if size != 1 and stride != expected:
+            return
+        expected *= size
+    offset = out.ctypes.data - root.ctypes.data
+    row_stride = out.strides[0] if out.shape[0] > 1 else row_nbytes
+    if row_stride < row_nbytes or offset < 0:
+        return
+
+    nrows = out.shape[0]
+    if field is None:
+        # strided hyperslab of the `out` elements
+        if row_stride % elsize != 0 or offset % elsize != 0 or root.nbytes % elsize != 0:
+            return
+        buffer = root.reshape(-1).view(np.uint8).view(out.dtype)
+        mspace = h5py.h5s.create_simple((buffer.size,))
+        mspace.select_hyperslab(
+            (offset // elsize,),
+            (nrows,),
+            stride=(row_stride // elsize,),
+            block=(row_size,),
+        )
+        return buffer, mspace, None
+
+    # one compound element per row, with `field` as the only member
+    if root.nbytes % row_stride != 0 or offset % row_stride + row_nbytes > row_stride:
+        return
+    mtype = h5py.h5t.create(h5py.h5t.COMPOUND, row_stride)
+    mtype.insert(
+        field.encode(),
+        offset % row_stride,
+        h5py.h5t.py_create(np.dtype((out.dtype, out.shape[1:]))),
+    )
+    mspace = h5py.h5s.create_simple((root.nbytes // row_stride,))
+    mspace.select_hyperslab((offset // row_stride,), (nrows,))
+    return root.reshape(-1).view(np.uint8), mspace, mtype
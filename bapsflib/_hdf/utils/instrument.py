@@ -0,0 +1,218 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module for instrumenting the read stages of
+`~bapsflib._hdf.utils.hdfreaddata.HDFReadData` and
+`~bapsflib._hdf.utils.hdfreadcontrols.HDFReadControls`.
+"""
+__all__ = ["instrument", "logging_sink", "StageRecord", "StageRecorder", "STAGES"]
+
+import contextlib
+import contextvars
+import logging
+import time
+
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+STAGES = (
+    "conditioning",
+    "dataset lookup",
+    "index build",
+    "control read",
+    "array fill",
+    "conversion",
+)
+"""
+Names of the instrumented read stages.
+
+* :code:`'conditioning'`: conditioning of the read arguments (e.g.
+  :data:`add_controls`, :data:`digitizer`)
+* :code:`'dataset lookup'`: retrieval of the datasets to be read
+* :code:`'index build'`: resolution of the shot numbers and the dataset
+  row indices
+* :code:`'control read'`: read of the control device data
+* :code:`'array fill'`: allocation and filling of the returned array
+  (for :class:`~bapsflib._hdf.utils.hdfreadcontrols.HDFReadControls`
+  this includes the command list lookups)
+* :code:`'conversion'`: conversion of the data and meta-info (e.g. bits
+  to voltage), not recorded by
+  :class:`~bapsflib._hdf.utils.hdfreadcontrols.HDFReadControls`
+"""
+
+
+class StageRecord(NamedTuple):
+    """Record of one instrumented read stage."""
+
+    reader: str
+    """name of the reading class (e.g. :code:`'HDFReadData'`)"""
+
+    stage: str
+    """name of the stage (see :data:`STAGES`)"""
+
+    duration: float
+    """duration of the stage in seconds"""
+
+    size: int
+    """number of shot numbers handled by the stage"""
+
+
+Sink = Callable[[StageRecord], None]
+
+_sinks = contextvars.ContextVar("bapsflib_instrument_sinks", default=())
+
+
+class StageRecorder(object):
+    """
+    Collects the :class:`StageRecord` entries of the reads done within
+    :func:`instrument`.
+    """
+
+    def __init__(self):
+        self._records = []  # type: List[StageRecord]
+
+    def __call__(self, record: StageRecord):
+        self._records.append(record)
+
+    @property
+    def records(self) -> List[StageRecord]:
+        """List of the recorded stages (in order of execution)."""
+        return list(self._records)
+
+    def totals(self) -> Dict[Tuple[str, str], Dict[str, Union[int, float]]]:
+        """
+        Summarize the recorded stages.
+
+        :return: dictionary keyed by :code:`(reader, stage)` with the
+            number of times the stage was recorded (:code:`'count'`),
+            its total duration in seconds (:code:`'duration'`), and the
+            total number of shot numbers handled (:code:`'size'`)
+        """
+        totals = {}  # type: Dict[Tuple[str, str], Dict[str, Union[int, float]]]
+        for record in self._records:
+            entry = totals.setdefault(
+                (record.reader, record.stage), {"count": 0, "duration": 0.0, "size": 0}
+            )
+            entry["count"] += 1
+            entry["duration"] += record.duration
+            entry["size"] += record.size
+
+        return totals
+
+    def clear(self):
+        """Discard all recorded stages."""
+        self._records.clear()
+
+
+@contextlib.contextmanager
+def instrument(sink: Optional[Sink] = None):
+    """
+    Context manager recording the durations of the read stages (see
+    :data:`STAGES`) of all
+    :class:`~bapsflib._hdf.utils.hdfreaddata.HDFReadData` and
+    :class:`~bapsflib._hdf.utils.hdfreadcontrols.HDFReadControls`
+    reads done in its context.  Instrumentation is tracked with a
+    :mod:`contextvars` variable, so it is local to the current thread
+    (or :mod:`asyncio` task) and contexts can be nested.  Outside of
+    an :func:`instrument` context reads are not instrumented.
+
+    :param sink: optional callable also given each
+        :class:`StageRecord` as it is recorded (e.g.
+        :func:`logging_sink`)
+    :return: a :class:`StageRecorder` holding the records of the
+        context
+
+    :Example:
+
+        >>> with instrument() as recorder:
+        ...     data = f.read_data(0, 0, add_controls=['6K Compumotor'])
+        >>> recorder.totals()[('HDFReadData', 'array fill')]
+        {'count': 1, 'duration': 0.0021, 'size': 1000}
+        >>>
+        >>> # send records to the 'bapsflib.instrument' logger
+        >>> with instrument(sink=logging_sink()):
+        ...     data = f.read_data(0, 0)
+    """
+    recorder = StageRecorder()
+    sinks = (recorder,) if sink is None else (recorder, sink)
+    token = _sinks.set(_sinks.get() + sinks)
+    try:
+        yield recorder
+    finally:
+        _sinks.reset(token)
+
+
+def logging_sink(
+    logger: Union[str, logging.Logger] = "bapsflib.instrument",
+    level: int = logging.DEBUG,
+) -> Sink:
+    """
+    Build a :func:`instrument` sink that logs each
+    :class:`StageRecord`.
+
+    :param logger: logger, or the name of the logger, the records are
+        sent to (DEFAULT :code:`'bapsflib.instrument'`)
+    :param int level: logging level of the records (DEFAULT
+        :data:`logging.DEBUG`)
+    """
+    if not isinstance(logger, logging.Logger):
+        logger = logging.getLogger(logger)
+
+    def sink(record: StageRecord):
+        logger.log(
+            level,
+            "%s %s: %.3f ms (%d shots)",
+            record.reader,
+            record.stage,
+            record.duration * 1.0e3,
+            record.size,
+            extra={"bapsflib_stage": record},
+        )
+
+    return sink
+
+
+class _StageTimer(object):
+    """Times consecutive read stages and hands the records to sinks."""
+
+    __slots__ = ("_reader", "_sinks", "_last")
+
+    def __init__(self, reader: str, sinks: Tuple[Sink, ...]):
+        self._reader = reader
+        self._sinks = sinks
+        self._last = time.perf_counter()
+
+    def mark(self, stage: str, size: int = 0):
+        """Record the end of **stage**, which began at the last mark."""
+        now = time.perf_counter()
+        record = StageRecord(self._reader, stage, now - self._last, int(size))
+        for sink in self._sinks:
+            sink(record)
+        self._last = time.perf_counter()
+
+
+def stage_timer(reader: str, timeit=False) -> Optional[_StageTimer]:
+    """
+    Get the stage timer of a read.
+
+    :param reader: name of the reading class
+    :param bool timeit: set :code:`True` to also log the stage
+        durations at the :data:`logging.INFO` level (for the
+        deprecated :data:`timeit` keyword, see :func:`logging_sink`)
+    :return: :code:`None` if the read is not instrumented (see
+        :func:`instrument`)
+    """
+    sinks = _sinks.get()
+    if timeit:
+        sinks += (logging_sink(level=logging.INFO),)
+    if not sinks:
+        return
+
+    return _StageTimer(reader, sinks)
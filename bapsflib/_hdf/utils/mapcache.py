@@ -0,0 +1,163 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module containing the `~bapsflib._hdf.utils.mapcache.HDFMapCache`
+class.
+"""
+__all__ = ["HDFMapCache"]
+
+import h5py
+import os
+import pickle
+import stat
+
+from typing import Any, Dict, Union
+from warnings import warn
+
+from bapsflib._hdf.maps import HDFMap
+from bapsflib._hdf.utils.sidecar import SidecarFile
+
+
+class HDFMapCache(SidecarFile):
+    """
+    On-disk (sidecar) cache of the :class:`~bapsflib._hdf.maps.core.HDFMap`
+    of an HDF5 file.
+
+    Mapping an HDF5 file reads the attributes of every control device,
+    digitizer, and MSI diagnostic group, which can take seconds for
+    large files.  This cache pickles the constructed map so a later
+    opening of the unchanged HDF5 file loads it back without touching
+    the HDF5 metadata.
+
+    The cached map is discarded when the HDF5 file changes (see
+    :class:`~bapsflib._hdf.utils.sidecar.SidecarFile`), when it was
+    built by another version of :mod:`bapsflib`, or when it was built
+    for a different file class or device paths.
+
+    .. warning::
+
+        The cache is a pickle file and loading a pickle can execute
+        arbitrary code, so anyone able to write the cache file can run
+        code as the user opening the HDF5 file.  By default, a cache
+        file is ignored (and rebuilt) unless it is owned by the current
+        user and not writable by the group or others (this check is
+        skipped on platforms without :func:`os.getuid`, e.g. Windows).
+        Only use :data:`trust_foreign=True` for cache directories
+        whose writers are trusted.
+
+    :Example:
+
+        >>> # normally used through the `File` keyword
+        >>> f = File('run.hdf5', map_cache=True)
+        >>> HDFMapCache(f.filename).path
+        '/data/run.hdf5.bfmap.pkl'
+    """
+
+    _suffix = ".bfmap.pkl"
+    _version = 3
+
+    def __init__(
+        self,
+        filename: str,
+        cache_dir: str = None,
+        validate="stat",
+        trust_foreign: bool = False,
+    ):
+        """
+        :param bool trust_foreign: set :code:`True` to load cache files
+            not owned by the current user, or writable by others
+            (:code:`False` DEFAULT)
+
+        All other arguments are the same as
+        :class:`~bapsflib._hdf.utils.sidecar.SidecarFile`.
+        """
+        super().__init__(filename, cache_dir=cache_dir, validate=validate)
+        self._trust_foreign = trust_foreign
+
+    def _trusted(self) -> bool:
+        """
+        :code:`True` if the cache file may be unpickled, i.e. it is
+        owned by the current user and only writable by them (or
+        :data:`trust_foreign` is set).
+        """
+        if self._trust_foreign or not hasattr(os, "getuid"):
+            return True
+
+        st = os.stat(self._path)
+        return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+    @staticmethod
+    def _bapsflib_version() -> str:
+        """Version of :mod:`bapsflib` the cached map is built with."""
+        # import here to avoid cyclical imports
+        import bapsflib
+
+        return getattr(bapsflib, "__version__", "unknown")
+
+    def load(self, hdf_obj: h5py.File, key: Dict[str, Any]) -> Union[HDFMap, None]:
+        """
+        Load the cached map and attach it to **hdf_obj**.
+
+        :param hdf_obj: the opened HDF5 file
+        :type hdf_obj: :class:`h5py.File`
+        :param dict key: description of how the map was built (e.g.
+            the file class and device paths), must match the
+            :data:`key` the map was saved with
+        :return: the cached map, :code:`None` if there is no valid
+            cached map
+        """
+        if not os.path.exists(self._path):
+            return None
+        elif not self._trusted():
+            warn(
+                f"Ignoring HDF5 map cache '{self._path}', it is not owned by the "
+                f"current user or is writable by others."
+            )
+            return None
+
+        try:
+            with open(self._path, "rb") as fh:
+                payload = pickle.load(fh)
+            if (
+                payload["version"] != self._version
+                or payload["bapsflib version"] != self._bapsflib_version()
+                or payload["signature"] != self._signature
+                or payload["key"] != key
+            ):
+                # HDF5 file (or bapsflib) has changed
+                return None
+
+            fmap = payload["map"]
+            fmap._bind(hdf_obj)
+        except Exception as err:
+            warn(f"Ignoring unreadable HDF5 map cache '{self._path}' ({err}).")
+            return None
+
+        return fmap
+
+    def save(self, fmap: HDFMap, key: Dict[str, Any]):
+        """
+        Write the map **fmap** to :attr:`path`.  The file is replaced
+        atomically, and a failed write (e.g. a read-only directory)
+        only issues a warning.
+
+        :param fmap: the HDF5 file map to be cached
+        :param dict key: description of how the map was built (see
+            :meth:`load`)
+        """
+        payload = {
+            "version": self._version,
+            "bapsflib version": self._bapsflib_version(),
+            "signature": self._signature,
+            "key": key,
+            "map": fmap,
+        }
+        self._write(lambda fh: pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL))
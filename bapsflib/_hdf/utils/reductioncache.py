@@ -0,0 +1,116 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module containing the `~bapsflib._hdf.utils.reductioncache.ReductionCache`
+class.
+"""
+__all__ = ["ReductionCache"]
+
+import h5py
+import numpy as np
+
+from typing import Callable, Dict, Hashable, Tuple
+
+
+class ReductionCache(object):
+    """
+    In-memory cache of per-row reductions (e.g. the per-shot maximum
+    of a trace) of HDF5 datasets, so each row of a dataset is only
+    read and reduced once per reduction.
+
+    Entries are filled row by row as they are requested, so a reduction
+    of a few shot numbers only computes those rows, and a later request
+    only computes the rows that are still missing.  An entry is rebuilt
+    if the shape of its dataset has changed.
+
+    Only datasets of files opened read-only (mode :code:`'r'`) are
+    cached.  A writable file can have a dataset rewritten in place, or
+    replaced by one of the same shape, without anything the cache
+    could check, so its reductions are always computed.
+
+    :Example:
+
+        >>> cache = ReductionCache()
+        >>> values = cache.get(dset, np.array([0, 1, 2]), 'max', compute)
+        >>>
+        >>> # only row 3 is computed
+        >>> values = cache.get(dset, np.array([2, 3]), 'max', compute)
+    """
+
+    def __init__(self):
+        # key -> (dataset shape, reduced values, computed rows mask)
+        self._entries = {}  # type: Dict[tuple, Tuple[tuple, np.ndarray, np.ndarray]]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Discard all cached reductions."""
+        self._entries.clear()
+
+    @staticmethod
+    def _cacheable(dset: h5py.Dataset) -> bool:
+        """:code:`True` if the reductions of **dset** can be cached."""
+        return dset.file.mode == "r"
+
+    def get(
+        self,
+        dset: h5py.Dataset,
+        index: np.ndarray,
+        name: Hashable,
+        compute: Callable[[np.ndarray], np.ndarray],
+    ) -> np.ndarray:
+        """
+        Return the reduction **name** of the rows **index** of dataset
+        **dset**, computing the rows that are not cached yet.
+
+        :param dset: dataset being reduced
+        :type dset: :class:`h5py.Dataset`
+        :param index: row indices of **dset**
+        :param name: hashable name of the reduction (including any
+            option that changes the result, e.g. a sample window)
+        :param compute: function returning the reduction of the rows
+            it is given (an increasing array of row indices), with the
+            rows along the first axis
+        :return: reduced values of the rows **index**
+        """
+        index = np.asarray(index, dtype=np.int64).reshape(-1)
+        if not self._cacheable(dset):
+            # the data of a writable file can change under the cache
+            rows, inverse = np.unique(index, return_inverse=True)
+            return np.asarray(compute(rows))[inverse.reshape(-1)]
+
+        key = (dset.name, name)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] != dset.shape:
+            entry = None
+
+        # compute the missing rows
+        if entry is None:
+            missing = np.unique(index)
+        else:
+            missing = np.unique(index[~entry[2][index]])
+        if missing.size != 0:
+            values = np.asarray(compute(missing))
+            if entry is None:
+                entry = (
+                    dset.shape,
+                    np.empty((dset.shape[0],) + values.shape[1:], dtype=values.dtype),
+                    np.zeros(dset.shape[0], dtype=bool),
+                )
+                self._entries[key] = entry
+            entry[1][missing] = values
+            entry[2][missing] = True
+        elif entry is None:
+            # nothing requested and nothing cached
+            return np.asarray(compute(missing))
+
+        return entry[1][index]
@@ -0,0 +1,218 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module containing the `~bapsflib._hdf.utils.shotnumindex.ShotNumIndex`
+class.
+"""
+__all__ = ["ShotNumIndex"]
+
+import h5py
+import json
+import numpy as np
+import os
+
+from typing import Any, Dict, Tuple, Union
+from warnings import warn
+
+from bapsflib._hdf.utils.shotnumresolver import ShotNumResolver
+from bapsflib._hdf.utils.sidecar import SidecarFile
+
+
+class ShotNumIndex(SidecarFile):
+    """
+    Persistent (sidecar) index of the shot number columns of an HDF5
+    file's datasets.
+
+    Resolving shot numbers (see
+    :func:`~bapsflib._hdf.utils.helpers.build_shotnum_dset_relation`)
+    requires the shot number column of every involved header and
+    control dataset.  This index keeps, for each dataset (and each
+    configuration of a multi-configuration control dataset), the shot
+    number array, the dataset rows it came from, and whether the shot
+    numbers are monotonic and gap-free.  The index is saved to a
+    :code:`.npz` file so later sessions on the same HDF5 file skip
+    reading those columns entirely.
+
+    The saved index is discarded when the HDF5 file changes (see
+    :class:`~bapsflib._hdf.utils.sidecar.SidecarFile`).
+
+    :Example:
+
+        >>> # normally created through the `File` keyword
+        >>> f = File('run.hdf5', shotnum_index=True)
+        >>> f.shotnum_index.path
+        '/data/run.hdf5.bfidx.npz'
+    """
+
+    _suffix = ".bfidx.npz"
+    _version = 1
+
+    def __init__(self, filename: str, cache_dir: str = None, validate="stat"):
+        """
+        :param str filename: path of the HDF5 file being indexed
+        :param str cache_dir: directory to store the index in,
+            :code:`None` (DEFAULT) to store it next to the HDF5 file
+        :param str validate: how a saved index is validated against the
+            HDF5 file, :code:`'stat'` (DEFAULT) or :code:`'hash'`
+        """
+        super().__init__(filename, cache_dir=cache_dir, validate=validate)
+        self._entries = {}  # type: Dict[str, Dict[str, Any]]
+        self._resolvers = {}  # type: Dict[str, ShotNumResolver]
+        self._dirty = False
+        self._load()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _load(self):
+        """Load the saved index, if it exists and is still valid."""
+        if not os.path.exists(self._path):
+            return
+
+        try:
+            with np.load(self._path, allow_pickle=False) as npz:
+                manifest = json.loads(str(npz["manifest"]))
+                if (
+                    manifest["version"] != self._version
+                    or manifest["signature"] != self._signature
+                ):
+                    # HDF5 file has changed
+                    return
+
+                entries = {}
+                for key, meta in manifest["entries"].items():
+                    entry = dict(meta)
+                    entry["shotnum"] = npz[f"shotnum_{meta['id']}"]
+                    entry["rows"] = (
+                        npz[f"rows_{meta['id']}"] if meta["has_rows"] else None
+                    )
+                    entries[key] = entry
+        except (OSError, ValueError, KeyError) as err:
+            warn(f"Ignoring unreadable shot number index '{self._path}' ({err}).")
+            return
+
+        self._entries = entries
+
+    def save(self):
+        """
+        Write the index to :attr:`path` if it has changed.  The file is
+        replaced atomically, and a failed write (e.g. a read-only
+        directory) only issues a warning.
+        """
+        if not self._dirty:
+            return
+
+        arrays = {}
+        manifest = {
+            "version": self._version,
+            "signature": self._signature,
+            "entries": {},
+        }
+        for ii, (key, entry) in enumerate(self._entries.items()):
+            manifest["entries"][key] = {
+                "id": ii,
+                "has_rows": entry["rows"] is not None,
+                "monotonic": entry["monotonic"],
+                "n_gaps": entry["n_gaps"],
+            }
+            arrays[f"shotnum_{ii}"] = entry["shotnum"]
+            if entry["rows"] is not None:
+                arrays[f"rows_{ii}"] = entry["rows"]
+        arrays["manifest"] = np.array(json.dumps(manifest))
+
+        if self._write(lambda fh: np.savez(fh, **arrays)):
+            self._dirty = False
+
+    def clear(self):
+        """Discard the index and remove its file."""
+        self._entries.clear()
+        self._resolvers.clear()
+        self._dirty = False
+        super().clear()
+
+    def get_shotnums(
+        self,
+        dset: h5py.Dataset,
+        shotnumkey: str,
+        configkey: str = None,
+        config_name: Any = None,
+    ) -> Tuple[np.ndarray, Union[np.ndarray, None], bool]:
+        """
+        Return the shot numbers recorded in dataset **dset**, reading
+        and indexing the shot number column if it is not indexed yet.
+
+        :param dset: dataset containing shot numbers
+        :type dset: :class:`h5py.Dataset`
+        :param str shotnumkey: field name of the shot number column
+        :param str configkey: field name of the configuration column
+            of a multi-configuration dataset, :code:`None` (DEFAULT)
+            for a single-configuration dataset
+        :param config_name: configuration to select when
+            **configkey** is given
+        :return: the shot numbers, the dataset rows of those shot
+            numbers (:code:`None` if they are all rows of **dset**),
+            and whether the shot numbers are strictly increasing
+        """
+        key = self._key(dset, shotnumkey, configkey, config_name)
+        if key not in self._entries:
+            shotnum = dset[shotnumkey]
+            rows = None
+            if configkey is not None:
+                rows = np.flatnonzero(dset[configkey] == str(config_name).encode())
+                shotnum = shotnum[rows]
+
+            diff = np.diff(shotnum.astype(np.int64))
+            self._entries[key] = {
+                "shotnum": shotnum,
+                "rows": rows,
+                "monotonic": bool(np.all(diff > 0)),
+                "n_gaps": int(np.count_nonzero(diff != 1)),
+            }
+            self._dirty = True
+
+        entry = self._entries[key]
+        return entry["shotnum"], entry["rows"], entry["monotonic"]
+
+    def get_resolver(
+        self,
+        dset: h5py.Dataset,
+        shotnumkey: str,
+        configkey: str = None,
+        config_name: Any = None,
+    ) -> ShotNumResolver:
+        """
+        Return the :class:`~.shotnumresolver.ShotNumResolver` of the
+        shot numbers recorded in dataset **dset** (see
+        :meth:`get_shotnums` for the arguments).  The resolver is kept
+        for the life of the index.
+        """
+        key = self._key(dset, shotnumkey, configkey, config_name)
+        if key not in self._resolvers:
+            shotnum, rows, _ = self.get_shotnums(
+                dset, shotnumkey, configkey=configkey, config_name=config_name
+            )
+            self._resolvers[key] = ShotNumResolver(shotnum, rows=rows)
+
+        return self._resolvers[key]
+
+    @staticmethod
+    def _key(
+        dset: h5py.Dataset, shotnumkey: str, configkey: str, config_name: Any
+    ) -> str:
+        """Key of the index entry of a dataset (and configuration)."""
+        key = f"{dset.name}:{shotnumkey}"
+        if configkey is not None:
+            key += f":{configkey}={config_name}"
+
+        return key
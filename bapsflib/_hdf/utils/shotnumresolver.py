@@ -0,0 +1,278 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module for resolving requested shot numbers to the rows of an HDF5
+dataset.
+"""
+__all__ = ["ShotNumResolver", "ShotNumResolvers"]
+
+import h5py
+import numpy as np
+import weakref
+
+from typing import Any, Dict, Tuple, Union
+
+from bapsflib._hdf.utils.shotset import ShotSet
+
+
+class ShotNumResolver(object):
+    """
+    Resolves requested shot numbers to the rows of a dataset recording
+    the shot numbers **shotnum**.
+
+    Whether **shotnum** is strictly increasing, and gap-free, is
+    checked once when the resolver is created.  Requested shot numbers
+    are then resolved by
+
+    * offset arithmetic, if **shotnum** is strictly increasing and
+      gap-free,
+    * a binary search (:func:`numpy.searchsorted`), if **shotnum** is
+      strictly increasing, or
+    * a binary search through an argsort of **shotnum** that is
+      computed on first use and kept,
+
+    so resolving :math:`k` shot numbers costs :math:`O(k \\log n)`,
+    or :math:`O(k)`, instead of a scan of the :math:`n` recorded shot
+    numbers.
+
+    :Example:
+
+        >>> resolver = ShotNumResolver(np.array([1, 2, 3, 5, 8]))
+        >>> resolver.monotonic, resolver.contiguous
+        (True, False)
+        >>> index, sni = resolver.resolve(np.array([2, 4, 5]))
+        >>> index, sni
+        (array([1, 3]), array([ True, False,  True]))
+    """
+
+    def __init__(self, shotnum: np.ndarray, rows: np.ndarray = None):
+        """
+        :param shotnum: shot numbers recorded in the dataset
+        :param rows: dataset rows of **shotnum**, :code:`None`
+            (DEFAULT) if **shotnum** is the full shot number column
+        """
+        self._shotnum = np.asarray(shotnum).reshape(-1)
+        self._rows = rows
+        self._sorter = None  # type: Union[np.ndarray, None]
+        self._sorted_sn = None  # type: Union[np.ndarray, None]
+        self._shotset = None  # type: Union[ShotSet, None]
+
+        diff = np.diff(self._shotnum.astype(np.int64))
+        self._monotonic = bool(np.all(diff > 0))
+        self._contiguous = self._monotonic and bool(np.all(diff == 1))
+
+    def __len__(self):
+        return self._shotnum.size
+
+    @property
+    def contiguous(self) -> bool:
+        """:code:`True` if the shot numbers increase in steps of 1"""
+        return self._contiguous
+
+    @property
+    def monotonic(self) -> bool:
+        """:code:`True` if the shot numbers are strictly increasing"""
+        return self._monotonic
+
+    @property
+    def rows(self) -> Union[np.ndarray, None]:
+        """
+        Dataset rows of :attr:`shotnum`, :code:`None` if
+        :attr:`shotnum` is the full shot number column.
+        """
+        return self._rows
+
+    @property
+    def shotnum(self) -> np.ndarray:
+        """Shot numbers recorded in the dataset."""
+        return self._shotnum
+
+    @property
+    def shotset(self) -> ShotSet:
+        """
+        Shot numbers recorded in the dataset as a
+        :class:`~.shotset.ShotSet`.  Gap-free shot numbers are a single
+        range, built without scanning :attr:`shotnum`.
+        """
+        if self._shotset is None:
+            if self._contiguous and self._shotnum.size != 0:
+                first = int(self._shotnum[0])
+                self._shotset = ShotSet.from_range(first, first + self._shotnum.size)
+            else:
+                self._shotset = ShotSet(self._shotnum)
+        return self._shotset
+
+    def resolve(self, shotnum: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Resolve the requested shot numbers **shotnum** to the dataset
+        rows.  The two returned arrays satisfy the rule::
+
+            shotnum[sni] = dset[index, shotnumkey]
+
+        where **sni** is a boolean mask of the shot numbers recorded in
+        the dataset and **index** are the dataset rows of those shot
+        numbers.
+
+        :param shotnum: requested shot numbers
+        :return: :code:`index` and :code:`sni` numpy arrays
+        """
+        shotnum = np.asarray(shotnum).reshape(-1)
+        size = self._shotnum.size
+        if size == 0:
+            return np.empty(0, dtype=np.intp), np.zeros(shotnum.shape, dtype=bool)
+
+        if self._contiguous:
+            # offset arithmetic
+            index = shotnum.astype(np.int64) - int(self._shotnum[0])
+            sni = (index >= 0) & (index < size)
+            index = index[sni]
+        else:
+            # binary search
+            if self._monotonic:
+                sorter = None
+                sorted_sn = self._shotnum
+            else:
+                if self._sorter is None:
+                    self._sorter = np.argsort(self._shotnum, kind="stable")
+                    self._sorted_sn = self._shotnum[self._sorter]
+                sorter = self._sorter
+                sorted_sn = self._sorted_sn
+            pos = np.searchsorted(sorted_sn, shotnum)
+            sni = pos < size
+            sni[sni] = sorted_sn[pos[sni]] == shotnum[sni]
+            index = pos[sni]
+            if sorter is not None:
+                index = sorter[index]
+
+        if self._rows is not None:
+            index = self._rows[index]
+
+        return index, sni
+
+
+class ShotNumResolvers(object):
+    """
+    In-memory cache of the :class:`ShotNumResolver` of datasets, so the
+    shot number column of a dataset is only read (and checked) once.
+
+    A resolver is rebuilt if the number of rows, or the first or last
+    shot number, of its dataset has changed.
+
+    The resolvers of the datasets of a mapping object (e.g. a control
+    device mapping) are shared through :meth:`of_map`.
+    """
+
+    #: resolver caches of the mapping objects, dropped with the mapping
+    _map_caches = weakref.WeakKeyDictionary()
+
+    def __init__(self):
+        self._entries = {}  # type: Dict[str, Tuple[tuple, Any]]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Discard all cached resolvers."""
+        self._entries.clear()
+
+    @classmethod
+    def of_map(cls, _map) -> "ShotNumResolvers":
+        """
+        Return the cache of the resolvers of the datasets of mapping
+        object **_map**, creating it on first use.
+
+        The cache is kept here rather than on **_map**, so it is never
+        pickled with the mapping and is discarded with it.
+
+        :param _map: mapping object of the datasets (e.g. an instance
+            of :class:`~bapsflib._hdf.maps.controls.templates.HDFMapControlTemplate`)
+        """
+        try:
+            return cls._map_caches[_map]
+        except KeyError:
+            resolvers = cls._map_caches[_map] = cls()
+            return resolvers
+
+    def get_resolver(
+        self,
+        dset: h5py.Dataset,
+        shotnumkey: str,
+        configkey: str = None,
+        config_name: Any = None,
+    ) -> ShotNumResolver:
+        """
+        Return the resolver of the shot numbers recorded in dataset
+        **dset**.
+
+        For a multi-configuration dataset the rows of all configurations
+        are found with one scan of the configuration column.
+
+        :param dset: dataset containing shot numbers
+        :type dset: :class:`h5py.Dataset`
+        :param str shotnumkey: field name of the shot number column
+        :param str configkey: field name of the configuration column
+            of a multi-configuration dataset, :code:`None` (DEFAULT)
+            for a single-configuration dataset
+        :param config_name: configuration to select when
+            **configkey** is given (if not recorded in **dset** the
+            resolver has no shot numbers)
+        """
+        key = f"{dset.name}:{shotnumkey}"
+        if configkey is not None:
+            key += f":{configkey}"
+
+        # rows and first/last shot numbers the resolver was built from
+        nrows = dset.shape[0]
+        signature = (
+            (nrows, dset[0, shotnumkey], dset[nrows - 1, shotnumkey])
+            if nrows
+            else (nrows,)
+        )
+        if key not in self._entries or self._entries[key][0] != signature:
+            if configkey is None:
+                entry = ShotNumResolver(dset[shotnumkey])
+            else:
+                entry = self._split_configs(dset, shotnumkey, configkey)
+            self._entries[key] = (signature, entry)
+
+        entry = self._entries[key][1]
+        if configkey is None:
+            return entry
+
+        try:
+            return entry[str(config_name).encode()]
+        except KeyError:
+            return ShotNumResolver(
+                np.empty(0, dtype=dset.dtype[shotnumkey]),
+                rows=np.empty(0, dtype=np.intp),
+            )
+
+    @staticmethod
+    def _split_configs(
+        dset: h5py.Dataset, shotnumkey: str, configkey: str
+    ) -> Dict[bytes, ShotNumResolver]:
+        """Build a resolver for each configuration recorded in **dset**."""
+        shotnum = dset[shotnumkey]
+        config_names, config_ii = np.unique(dset[configkey], return_inverse=True)
+        config_ii = config_ii.reshape(-1)
+
+        # group the rows by configuration
+        # - a stable sort keeps the rows of a configuration in dataset
+        #   order
+        rows = np.argsort(config_ii, kind="stable")
+        splits = np.cumsum(np.bincount(config_ii, minlength=config_names.size))
+        resolvers = {}
+        for name, crows in zip(config_names.tolist(), np.split(rows, splits[:-1])):
+            if not isinstance(name, bytes):
+                name = str(name).encode()
+            resolvers[name] = ShotNumResolver(shotnum[crows], rows=crows)
+
+        return resolvers
@@ -0,0 +1,324 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module containing the `~bapsflib._hdf.utils.shotset.ShotSet` class.
+"""
+__all__ = ["ShotSet"]
+
+import numpy as np
+
+from typing import Iterable, Tuple, Union
+
+
+class ShotSet(object):
+    """
+    Sorted set of shot numbers stored as run-length encoded ranges.
+
+    Runs of consecutive shot numbers are kept as half-open
+    :code:`[start, stop)` ranges, so the set operations
+    (:meth:`intersection`, :meth:`union`, :meth:`contains`) cost
+    :math:`O(r \\log r)` in the number of ranges :math:`r` instead of
+    the number of shot numbers.  Sets made of mostly isolated shot
+    numbers (on average, runs shorter than :attr:`_min_run`) are kept
+    as a dense sorted array instead.
+
+    The shot numbers are only expanded into an array by
+    :meth:`to_array`.
+
+    :Example:
+
+        >>> shots = ShotSet.from_range(1, 1000001)
+        >>> shots.n_ranges, len(shots)
+        (1, 1000000)
+        >>> shots & ShotSet([5, 6, 7, 2000000])
+        ShotSet([(5, 8)])
+        >>> (shots | ShotSet.from_range(2000000, 2000010)).n_ranges
+        2
+        >>> shots.contains(np.array([0, 10, 1000001]))
+        array([False,  True, False])
+    """
+
+    _min_run = 2
+    """
+    Minimum average run length of a set to be stored as ranges, shorter
+    runs are stored as a dense array.
+    """
+
+    def __init__(self, shotnum: Union[Iterable[int], np.ndarray, "ShotSet"] = ()):
+        """
+        :param shotnum: shot numbers of the set (need not be sorted or
+            unique)
+        """
+        if isinstance(shotnum, ShotSet):
+            self._set(shotnum._starts, shotnum._stops, shotnum._array)
+            return
+
+        shotnum = np.asarray(
+            shotnum if isinstance(shotnum, np.ndarray) else list(shotnum),
+            dtype=np.int64,
+        ).reshape(-1)
+        if shotnum.size > 1 and not np.all(shotnum[1:] > shotnum[:-1]):
+            shotnum = np.unique(shotnum)
+        self._set_array(shotnum)
+
+    # -- construction                                              ----
+    @classmethod
+    def from_range(cls, start: int, stop: int) -> "ShotSet":
+        """Set of the shot numbers in the half-open range [**start**, **stop**)."""
+        return cls.from_ranges([start], [stop])
+
+    @classmethod
+    def from_ranges(cls, starts: Iterable[int], stops: Iterable[int]) -> "ShotSet":
+        """
+        Set of the shot numbers in the half-open ranges
+        :code:`[starts[i], stops[i])`.  The ranges may be unordered,
+        overlapping, or empty.
+        """
+        starts = np.asarray(starts, dtype=np.int64).reshape(-1)
+        stops = np.asarray(stops, dtype=np.int64).reshape(-1)
+        if starts.shape != stops.shape:
+            raise ValueError("Arguments `starts` and `stops` must be the same size.")
+
+        obj = cls.__new__(cls)
+        obj._set_ranges(*_sweep([(starts, stops)], 1))
+        return obj
+
+    @classmethod
+    def from_slice(cls, shotnum: slice, stop: int) -> "ShotSet":
+        """
+        Set of the shot numbers selected by slice **shotnum** from the
+        shot numbers :code:`range(stop)` (see :meth:`slice.indices`).
+        """
+        start, stop, step = shotnum.indices(stop)
+        if step == 1:
+            return cls.from_range(start, max(start, stop))
+
+        return cls(np.arange(start, stop, step, dtype=np.int64))
+
+    def _set(self, starts, stops, array):
+        self._starts = starts  # type: Union[np.ndarray, None]
+        self._stops = stops  # type: Union[np.ndarray, None]
+        self._array = array  # type: Union[np.ndarray, None]
+        if array is not None:
+            self._size = array.size
+        else:
+            self._size = int(np.sum(stops - starts))
+
+    def _set_array(self, shotnum: np.ndarray):
+        """Set from a sorted array of unique shot numbers."""
+        starts, stops = _runs(shotnum)
+        if starts.size * self._min_run > shotnum.size:
+            # mostly isolated shot numbers
+            self._set(None, None, shotnum)
+        else:
+            self._set(starts, stops, None)
+
+    def _set_ranges(self, starts: np.ndarray, stops: np.ndarray):
+        """Set from sorted, disjoint, non-adjacent, non-empty ranges."""
+        size = int(np.sum(stops - starts))
+        if starts.size * self._min_run > size:
+            # mostly isolated shot numbers
+            self._set(None, None, _expand(starts, stops))
+        else:
+            self._set(starts, stops, None)
+
+    # -- inspection                                                ----
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size != 0
+
+    def __contains__(self, item):
+        return bool(self.contains(np.array([item]))[0])
+
+    def __iter__(self):
+        return iter(self.to_array(dtype=np.int64).tolist())
+
+    def __eq__(self, other):
+        if not isinstance(other, ShotSet):
+            return NotImplemented
+
+        starts, stops = self.ranges
+        other_starts, other_stops = other.ranges
+        return np.array_equal(starts, other_starts) and np.array_equal(stops, other_stops)
+
+    def __repr__(self):
+        if self.n_ranges > 6:
+            starts, stops = self.ranges
+            return (
+                f"ShotSet(<{self.n_ranges} ranges, {len(self)} shots, "
+                f"{starts[0]}-{stops[-1] - 1}>)"
+            )
+
+        return f"ShotSet({list(zip(*(arr.tolist() for arr in self.ranges)))})"
+
+    @property
+    def dense(self) -> bool:
+        """:code:`True` if the set is stored as a dense array"""
+        return self._array is not None
+
+    @property
+    def n_ranges(self) -> int:
+        """Number of runs of consecutive shot numbers."""
+        return self.ranges[0].size
+
+    @property
+    def ranges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Starts and stops of the half-open ranges of consecutive shot
+        numbers.
+        """
+        if self._array is not None:
+            return _runs(self._array)
+
+        return self._starts, self._stops
+
+    @property
+    def first(self) -> Union[int, None]:
+        """Smallest shot number, :code:`None` if the set is empty."""
+        if not self:
+            return
+
+        return int(self._array[0] if self.dense else self._starts[0])
+
+    @property
+    def last(self) -> Union[int, None]:
+        """Largest shot number, :code:`None` if the set is empty."""
+        if not self:
+            return
+
+        return int(self._array[-1] if self.dense else self._stops[-1] - 1)
+
+    def contains(self, shotnum: np.ndarray) -> np.ndarray:
+        """
+        Boolean mask of the shot numbers **shotnum** that are in the set.
+        """
+        shotnum = np.asarray(shotnum)
+        if not self:
+            return np.zeros(shotnum.shape, dtype=bool)
+
+        if self.dense:
+            pos = np.searchsorted(self._array, shotnum)
+            mask = pos < self._array.size
+            mask[mask] = self._array[pos[mask]] == shotnum[mask]
+            return mask
+
+        # the range starting at, or before, each shot number
+        pos = np.searchsorted(self._starts, shotnum, side="right") - 1
+        mask = pos >= 0
+        mask[mask] = shotnum[mask] < self._stops[pos[mask]]
+        return mask
+
+    def to_array(self, dtype=np.uint32) -> np.ndarray:
+        """The sorted shot numbers as a numpy array."""
+        if self.dense:
+            return self._array.astype(dtype)
+
+        return _expand(self._starts, self._stops).astype(dtype, copy=False)
+
+    # -- set operations                                            ----
+    def intersection(self, *others: "ShotSet") -> "ShotSet":
+        """Set of the shot numbers in this set and all of **others**."""
+        result = self
+        for other in others:
+            result = result._intersection(ShotSet._as_shotset(other))
+
+        return result
+
+    def _intersection(self, other: "ShotSet") -> "ShotSet":
+        obj = ShotSet.__new__(ShotSet)
+        if self.dense or other.dense:
+            # filter the dense set, O(k log r)
+            dense, other = (self, other) if self.dense else (other, self)
+            obj._set_array(dense._array[other.contains(dense._array)])
+        else:
+            obj._set_ranges(*_sweep([self.ranges, other.ranges], 2))
+        return obj
+
+    def union(self, *others: "ShotSet") -> "ShotSet":
+        """Set of the shot numbers in this set or any of **others**."""
+        others = [ShotSet._as_shotset(other) for other in others]
+        obj = ShotSet.__new__(ShotSet)
+        obj._set_ranges(*_sweep([s.ranges for s in [self] + others], 1))
+        return obj
+
+    def select(self, start: int = None, stop: int = None) -> "ShotSet":
+        """
+        Subset of the shot numbers in the half-open range
+        [**start**, **stop**), :code:`None` for no bound.
+        """
+        if not self:
+            return self
+
+        start = self.first if start is None else start
+        stop = self.last + 1 if stop is None else stop
+        return self._intersection(ShotSet.from_range(start, max(start, stop)))
+
+    __and__ = intersection
+    __or__ = union
+
+    @staticmethod
+    def _as_shotset(obj) -> "ShotSet":
+        return obj if isinstance(obj, ShotSet) else ShotSet(obj)
+
+
+def _runs(shotnum: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Half-open ranges of the runs in a sorted array of unique shot numbers."""
+    if shotnum.size == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    shotnum = shotnum.astype(np.int64, copy=False)
+    breaks = np.flatnonzero(np.diff(shotnum) != 1) + 1
+    starts = shotnum[np.concatenate(([0], breaks))]
+    stops = shotnum[np.concatenate((breaks - 1, [shotnum.size - 1]))] + 1
+    return starts, stops
+
+
+def _expand(starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """Expand half-open ranges into an array of their shot numbers."""
+    lengths = stops - starts
+    offsets = np.cumsum(lengths) - lengths
+    return np.arange(int(np.sum(lengths)), dtype=np.int64) + np.repeat(
+        starts - offsets, lengths
+    )
+
+
+def _sweep(
+    ranges: Iterable[Tuple[np.ndarray, np.ndarray]], n_cover: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sweep over the boundaries of the half-open ranges of several sets,
+    returning the sorted, merged ranges covered by at least **n_cover**
+    of the sets (1 for a union, the number of sets for an
+    intersection).
+    """
+    starts, stops = (np.concatenate(arrs) for arrs in zip(*ranges))
+    keep = starts < stops
+    starts = starts[keep]
+    stops = stops[keep]
+
+    # sweep the boundaries in order
+    # - at the same position a range starts before another stops, so
+    #   adjacent ranges are merged
+    pos = np.concatenate((starts, stops))
+    delta = np.concatenate(
+        (np.ones(starts.size, dtype=np.int64), -np.ones(stops.size, dtype=np.int64))
+    )
+    order = np.lexsort((-delta, pos))
+    pos = pos[order]
+    covered = np.cumsum(delta[order]) >= n_cover
+    was_covered = np.concatenate(([False], covered[:-1]))
+
+    new_starts = pos[covered & ~was_covered]
+    new_stops = pos[~covered & was_covered]
+    keep = new_starts < new_stops
+    return new_starts[keep], new_stops[keep]
@@ -0,0 +1,129 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module containing the `~bapsflib._hdf.utils.sidecar.SidecarFile`
+template class.
+"""
+__all__ = ["SidecarFile"]
+
+import hashlib
+import os
+import tempfile
+
+from typing import Any, Callable, Dict
+from warnings import warn
+
+#: number of bytes read from each end of the HDF5 file for the
+#: :code:`'hash'` validation of :class:`SidecarFile`
+_HASH_NBYTES = 4 * 2**20
+
+
+class SidecarFile(object):
+    """
+    Template class for a cache file that accompanies (is a sidecar to)
+    an HDF5 file and holds information derived from it.
+
+    The cache file is stored next to the HDF5 file, or in a cache
+    directory under a name unique to the HDF5 file's absolute path.
+    Its contents are only valid for an unchanged HDF5 file, which is
+    judged by the file :meth:`signature`: the file size and
+    modification time (:code:`validate='stat'`), or the file size and a
+    hash of its first and last 4 MiB (:code:`validate='hash'`, which
+    survives copies that do not preserve the modification time).
+    """
+
+    #: file name suffix of the sidecar file
+    _suffix = NotImplemented  # type: str
+
+    def __init__(self, filename: str, cache_dir: str = None, validate="stat"):
+        """
+        :param str filename: path of the HDF5 file
+        :param str cache_dir: directory to store the sidecar file in,
+            :code:`None` (DEFAULT) to store it next to the HDF5 file
+        :param str validate: how the sidecar file is validated against
+            the HDF5 file, :code:`'stat'` (DEFAULT) or :code:`'hash'`
+        """
+        if validate not in ("stat", "hash"):
+            raise ValueError(
+                f"Argument `validate` must be 'stat' or 'hash', got '{validate}'."
+            )
+
+        self._filename = os.path.abspath(filename)
+        self._validate = validate
+        if cache_dir is None:
+            self._path = f"{self._filename}{self._suffix}"
+        else:
+            # unique name for the absolute path of the HDF5 file
+            digest = hashlib.sha1(self._filename.encode()).hexdigest()[:16]
+            self._path = os.path.join(
+                os.path.abspath(cache_dir),
+                f"{os.path.basename(self._filename)}-{digest}{self._suffix}",
+            )
+
+        self._signature = self.signature()
+
+    @property
+    def path(self) -> str:
+        """Path of the sidecar file."""
+        return self._path
+
+    @property
+    def validate(self) -> str:
+        """How the sidecar file is validated (:code:`'stat'` or :code:`'hash'`)"""
+        return self._validate
+
+    def signature(self) -> Dict[str, Any]:
+        """Signature of the HDF5 file used to validate the sidecar file."""
+        stat = os.stat(self._filename)
+        signature = {"size": stat.st_size}
+        if self._validate == "stat":
+            signature["mtime_ns"] = stat.st_mtime_ns
+        else:
+            blake = hashlib.blake2b(digest_size=16)
+            with open(self._filename, "rb") as fh:
+                blake.update(fh.read(_HASH_NBYTES))
+                if stat.st_size > _HASH_NBYTES:
+                    fh.seek(max(_HASH_NBYTES, stat.st_size - _HASH_NBYTES))
+                    blake.update(fh.read())
+            signature["hash"] = blake.hexdigest()
+
+        return signature
+
+    def _write(self, write_func: Callable) -> bool:
+        """
+        Atomically replace the sidecar file with the contents written
+        by :code:`write_func(fh)`, where :code:`fh` is a binary file
+        object.  A failed write (e.g. a read-only directory) only
+        issues a warning.
+
+        :return: :code:`True` if the file was written
+        """
+        try:
+            dirname = os.path.dirname(self._path)
+            os.makedirs(dirname, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix=self._suffix, dir=dirname)
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    write_func(fh)
+                os.replace(tmp_path, self._path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except OSError as err:
+            warn(f"Unable to save '{self._path}' ({err}).")
+            return False
+
+        return True
+
+    def clear(self):
+        """Remove the sidecar file."""
+        if os.path.exists(self._path):
+            os.remove(self._path)
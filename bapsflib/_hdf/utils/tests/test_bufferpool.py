@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import numpy as np
+import unittest as ut
+
+from bapsflib._hdf.utils.bufferpool import BufferPool
+
+
+class TestBufferPool(ut.TestCase):
+    """Test case for :class:`~bapsflib._hdf.utils.bufferpool.BufferPool`."""
+
+    def test_get(self):
+        pool = BufferPool(size=2)
+        self.assertEqual(pool.size, 2)
+        self.assertEqual(len(pool), 0)
+        self.assertEqual(pool.nbytes, 0)
+
+        # arrays are allocated until `size` is reached
+        dtype = [("shotnum", np.uint32), ("signal", np.float32, (10,))]
+        buf1 = pool.get((5,), dtype)
+        buf2 = pool.get((5,), dtype)
+        self.assertIsInstance(buf1, np.ndarray)
+        self.assertEqual(buf1.shape, (5,))
+        self.assertEqual(buf1.dtype, np.dtype(dtype))
+        self.assertFalse(np.shares_memory(buf1, buf2))
+        self.assertEqual(len(pool), 2)
+        self.assertEqual(pool.nbytes, 2 * buf1.nbytes)
+
+        # then reused round-robin
+        self.assertIs(pool.get((5,), dtype), buf1)
+        self.assertIs(pool.get(5, np.dtype(dtype)), buf2)
+        self.assertIs(pool.get([5], dtype), buf1)
+
+        # different shapes/dtypes get their own arrays
+        buf3 = pool.get((4,), dtype)
+        buf4 = pool.get((5,), np.float32)
+        self.assertEqual(buf3.shape, (4,))
+        self.assertEqual(buf4.dtype, np.float32)
+        self.assertEqual(len(pool), 4)
+        self.assertIs(pool.get((5,), dtype), buf2)
+
+        # clear
+        pool.clear()
+        self.assertEqual(len(pool), 0)
+        self.assertIsNot(pool.get((5,), dtype), buf1)
+
+    def test_raises(self):
+        for size, err in ((0, ValueError), (1.5, TypeError), (True, TypeError)):
+            with self.subTest(size=size), self.assertRaises(err):
+                BufferPool(size=size)
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import astropy.units as u
+import importlib.util
+import numpy as np
+import unittest as ut
+import warnings
+
+from bapsflib._hdf.utils.export import _import_backend, CopyWarning, export_columns
+from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.hdfreaddata import HDFReadData
+from bapsflib._hdf.utils.tests import TestBase
+from bapsflib.utils.decorators import with_bf
+
+
+def _has(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+class TestExportColumns(ut.TestCase):
+    """Test case for :func:`~bapsflib._hdf.utils.export.export_columns`."""
+
+    def setUp(self):
+        self.arr = np.zeros(
+            5,
+            dtype=[
+                ("shotnum", np.uint32),
+                ("signal", np.float32, (10,)),
+                ("xyz", np.float32, (3,)),
+                ("valid", bool, (2, 2)),
+                ("meta", [("a", np.float64), ("b", np.int8)], (2,)),
+            ],
+        )
+        self.arr["shotnum"] = np.arange(1, 6)
+        self.arr["xyz"] = np.arange(15).reshape(5, 3)
+        self.arr["meta"]["a"] = np.arange(10).reshape(5, 2)
+
+    def test_columns(self):
+        columns = export_columns(self.arr)
+        self.assertEqual(
+            list(columns),
+            ["shotnum"]
+            + [f"signal[{ii}]" for ii in range(10)]
+            + ["x", "y", "z"]
+            + ["valid[0,0]", "valid[0,1]", "valid[1,0]", "valid[1,1]"]
+            + ["meta[0].a", "meta[0].b", "meta[1].a", "meta[1].b"],
+        )
+
+        # every column is a 1D view
+        for name, col in columns.items():
+            with self.subTest(name=name):
+                self.assertEqual(col.shape, (5,))
+                self.assertTrue(np.shares_memory(col, self.arr))
+        self.assertTrue(np.array_equal(columns["y"], self.arr["xyz"][:, 1]))
+        self.assertTrue(np.array_equal(columns["meta[1].a"], self.arr["meta"]["a"][:, 1]))
+
+        # excluded fields
+        columns = export_columns(self.arr, exclude=["signal", "meta.b"])
+        self.assertEqual(
+            list(columns),
+            ["shotnum", "x", "y", "z"]
+            + ["valid[0,0]", "valid[0,1]", "valid[1,0]", "valid[1,1]"]
+            + ["meta[0].a", "meta[1].a"],
+        )
+
+        # not a structured array
+        with self.assertRaises(TypeError):
+            export_columns(np.arange(5))
+
+    def test_import_backend(self):
+        self.assertIs(_import_backend("numpy"), np)
+        with self.assertRaises(ImportError):
+            _import_backend("not_a_backend_module")
+
+
+class TestExportMixin(TestBase):
+    """
+    Test case for :class:`~bapsflib._hdf.utils.export.ExportMixin`
+    on the read classes.
+    """
+
+    def setUp(self):
+        super().setUp()
+        sn_size = 50
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": sn_size, "nt": 100})
+        self.f.add_module(
+            "6K Compumotor", {"n_configs": 1, "sn_size": sn_size, "n_motionlists": 1}
+        )
+        self.f.add_module("Discharge")
+        _mod = self.f.modules["SIS 3301"]
+        bc_arr = np.zeros((13, 8), dtype=bool)
+        bc_arr[0, 0] = True
+        _mod.knobs.active_brdch = bc_arr
+        self.extras = {
+            "config_name": _mod.knobs.active_config[0],
+            "adc": "SIS 3301",
+            "digitizer": "SIS 3301",
+        }
+        self.controls = [
+            ("6K Compumotor", self.f.modules["6K Compumotor"].config_names[0])
+        ]
+
+    def tearDown(self):
+        super().tearDown()
+
+    @with_bf
+    def test_read_data(self, _bf: File):
+        data = _bf.read_data(0, 0, add_controls=self.controls, **self.extras)
+
+        # per-shot columns are views
+        self.assertEqual(data._trace_fields(), ["signal"])
+        columns = data.export_columns()
+        self.assertNotIn("signal", columns)
+        self.assertIn("x", columns)
+        for name, col in columns.items():
+            with self.subTest(name=name):
+                self.assertTrue(np.shares_memory(col, data))
+
+        # the signal is a 2D view
+        sig, copied = data._trace_array("signal")
+        self.assertFalse(copied)
+        self.assertEqual(sig.shape, data["signal"].shape)
+        self.assertTrue(np.shares_memory(sig, data))
+        self.assertEqual(data._trace_dims("signal", sig.shape), ("shotnum", "time"))
+
+        # coordinates are generated from `dt` and 'xyz'
+        time = data._trace_time("signal", sig.shape[-1])
+        self.assertTrue(np.allclose(time, np.arange(100) * data.dt.to(u.s).value))
+        coords = data._position_coords()
+        self.assertEqual(list(coords), ["shotnum", "x", "y", "z"])
+        self.assertTrue(np.array_equal(coords["z"], data["xyz"][:, 2]))
+        self.assertTrue(np.shares_memory(coords["z"], data))
+
+        # a masked signal has to be filled
+        data = _bf.read_data(
+            0,
+            0,
+            shotnum=np.arange(40, 61),
+            intersection_set=False,
+            masked=True,
+            **self.extras,
+        )
+        self.assertEqual(data._trace_fields(), ["signal"])
+        sig, copied = data._trace_array("signal")
+        self.assertTrue(copied)
+        self.assertTrue(np.array_equal(sig, data.signal.filled(), equal_nan=True))
+
+        # MSI data arrays are traces unless reduced
+        # - the faux diagnostic records other shot numbers, so the
+        #   union read NULL fills them
+        data = _bf.read_data(
+            0, 0, add_msi=["Discharge"], intersection_set=False, **self.extras
+        )
+        mdata = _bf.read_msi("Discharge")
+        fields = [name for name in mdata.dtype.names if name not in ("shotnum", "meta")]
+        self.assertEqual(
+            data._trace_fields(), ["signal"] + [f"Discharge.{name}" for name in fields]
+        )
+        sig, copied = data._trace_array(f"Discharge.{fields[0]}")
+        self.assertFalse(copied)
+        self.assertTrue(np.shares_memory(sig, data))
+        self.assertEqual(
+            data._trace_dims(f"Discharge.{fields[0]}", sig.shape)[0], "shotnum"
+        )
+        self.assertTrue(
+            np.allclose(
+                data._trace_time(f"Discharge.{fields[0]}", sig.shape[-1]),
+                mdata._trace_time(fields[0], sig.shape[-1]),
+            )
+        )
+        data = _bf.read_data(
+            0, 0, add_msi=[("Discharge", "max")], intersection_set=False, **self.extras
+        )
+        self.assertEqual(data._trace_fields(), ["signal"])
+        self.assertIn(f"Discharge.{fields[0]}", data.export_columns())
+
+    @with_bf
+    def test_read_msi(self, _bf: File):
+        mdata = _bf.read_msi("Discharge")
+        fields = [name for name in mdata.dtype.names if name not in ("shotnum", "meta")]
+        self.assertEqual(mdata._trace_fields(), fields)
+        self.assertEqual(
+            list(mdata.export_columns()),
+            ["shotnum"] + [f"meta.{name}" for name in mdata.dtype["meta"].names],
+        )
+
+        # times from the recorded 'dt' and 't0', following a window
+        nt = mdata.dtype[fields[0]].shape[-1]
+        dt = mdata.info["dt"][0]
+        t0 = mdata.info["t0"][0]
+        self.assertTrue(
+            np.allclose(mdata._trace_time(fields[0], nt), t0 + np.arange(nt) * dt)
+        )
+        wdata = _bf.read_msi("Discharge", samples=slice(10, 50, 4))
+        self.assertTrue(
+            np.allclose(wdata._trace_time(fields[0], 10), t0 + np.arange(10, 50, 4) * dt)
+        )
+
+        # unknown time step
+        mdata.info["dt"] = [None]
+        self.assertIsNone(mdata._trace_time(fields[0], nt))
+
+        # reduced data arrays are per-shot columns
+        rdata = _bf.read_msi("Discharge", reduce="max")
+        self.assertEqual(rdata._trace_fields(), [])
+        self.assertIn(fields[0], rdata.export_columns())
+
+    @with_bf
+    def test_read_controls(self, _bf: File):
+        cdata = _bf.read_controls(self.controls)
+        self.assertEqual(cdata._trace_fields(), [])
+        columns = cdata.export_columns()
+        self.assertEqual(list(columns)[:4], ["shotnum", "x", "y", "z"])
+        for name, col in columns.items():
+            with self.subTest(name=name):
+                self.assertTrue(np.shares_memory(col, cdata))
+
+    @ut.skipUnless(_has("pandas"), "pandas is not installed")
+    @with_bf
+    def test_to_pandas(self, _bf: File):
+        data = _bf.read_data(0, 0, add_controls=self.controls, **self.extras)
+        df = data.to_pandas()
+        self.assertEqual(list(df.columns), list(data.export_columns()))
+        self.assertTrue(np.array_equal(df["x"].to_numpy(), data["xyz"][:, 0]))
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", CopyWarning)
+            df = data.to_pandas(trace="signal")
+        self.assertEqual(df.shape, data["signal"].shape)
+        self.assertTrue(np.array_equal(df.index.to_numpy(), data["shotnum"]))
+        self.assertTrue(np.shares_memory(df.to_numpy(), data))
+
+        with self.assertRaises(ValueError):
+            data.to_pandas(trace="xyz")
+
+    @ut.skipUnless(_has("xarray"), "xarray is not installed")
+    @with_bf
+    def test_to_xarray(self, _bf: File):
+        data = _bf.read_data(0, 0, add_controls=self.controls, **self.extras)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", CopyWarning)
+            ds = data.to_xarray()
+        self.assertEqual(ds["signal"].dims, ("shotnum", "time"))
+        self.assertTrue(np.shares_memory(ds["signal"].values, data))
+        self.assertTrue(np.array_equal(ds["x"].values, data["xyz"][:, 0]))
+        self.assertTrue(
+            np.allclose(ds["time"].values, np.arange(100) * data.dt.to(u.s).value)
+        )
+
+        # a masked signal is filled, and reported
+        data = _bf.read_data(
+            0,
+            0,
+            shotnum=np.arange(40, 61),
+            intersection_set=False,
+            masked=True,
+            **self.extras,
+        )
+        with self.assertWarns(CopyWarning):
+            data.to_xarray()
+
+    @ut.skipUnless(_has("pyarrow"), "pyarrow is not installed")
+    @with_bf
+    def test_to_arrow(self, _bf: File):
+        data = _bf.read_data(0, 0, add_controls=self.controls, **self.extras)
+
+        # structured columns are not contiguous
+        with self.assertWarns(CopyWarning):
+            table = data.to_arrow()
+        self.assertEqual(table.column_names, list(data.export_columns()) + ["signal"])
+        self.assertEqual(table.num_rows, data.size)
+        self.assertTrue(
+            np.array_equal(np.asarray(table["signal"].to_pylist()), data["signal"])
+        )
+        table = data.to_arrow(traces=False)
+        self.assertNotIn("signal", table.column_names)
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -20,6 +20,7 @@ from unittest import mock
 from bapsflib._hdf import HDFMap
 from bapsflib._hdf.utils.file import File
 from bapsflib._hdf.utils.hdfoverview import HDFOverview
+from bapsflib._hdf.utils.hdfpositionstats import HDFPositionStats
 from bapsflib._hdf.utils.hdfreadcontrols import HDFReadControls
 from bapsflib._hdf.utils.hdfreaddata import HDFReadData
 from bapsflib._hdf.utils.hdfreadmsi import HDFReadMSI
@@ -93,6 +94,11 @@ class TestFile(TestBase):
         self.assertIsInstance(type(_bf).overview, property)
         self.assertIsInstance(_bf.overview, HDFOverview)
 
+        # `shotnum_index` attribute                                 ----
+        self.assertTrue(hasattr(_bf, "shotnum_index"))
+        self.assertIsInstance(type(_bf).shotnum_index, property)
+        self.assertIsNone(_bf.shotnum_index)
+
         # read attributes                                           ----
         self.assertTrue(hasattr(_bf, "read_controls"))
         self.assertTrue(hasattr(_bf, "read_data"))
@@ -106,6 +112,8 @@ class TestFile(TestBase):
             extras = {
                 "shotnum": 2,
                 "intersection_set": True,
+                "categorical": False,
+                "masked": True,
             }
             cdata = _bf.read_controls(["control"], **extras, silent=False)
             self.assertTrue(mock_rc.called)
@@ -125,21 +133,101 @@ class TestFile(TestBase):
                 "config_name": "config01",
                 "keep_bits": True,
                 "add_controls": ["control"],
+                "add_msi": ["Discharge"],
                 "intersection_set": True,
+                "samples": slice(2, 10),
+                "average": 4,
+                "lazy": True,
+                "masked": False,
+                "out": "buffer",
             }
             data = _bf.read_data(1, 2, **extras, silent=False)
             self.assertTrue(mock_rd.called)
             self.assertEqual(data, "read data")
             mock_rd.assert_called_once_with(_bf, 1, 2, **extras)
 
+        # calling `read_channels`
+        self.assertTrue(hasattr(_bf, "read_channels"))
+        with mock.patch.object(
+            HDFReadData, "from_channels", return_value="read channels"
+        ) as mock_fc:
+            extras = {
+                "index": 1,
+                "shotnum": 2,
+                "digitizer": "digi",
+                "config_name": "config01",
+                "keep_bits": True,
+                "add_controls": ["control"],
+                "add_msi": ["Discharge"],
+                "intersection_set": True,
+                "samples": slice(2, 10),
+                "average": 4,
+                "lazy": True,
+                "masked": False,
+                "out": "buffer",
+            }
+            data = _bf.read_channels([(1, 2), (1, 3)], **extras, silent=False)
+            self.assertEqual(data, "read channels")
+            mock_fc.assert_called_once_with(_bf, [(1, 2), (1, 3)], **extras)
+
+        # calling `iter_data`
+        self.assertTrue(hasattr(_bf, "iter_data"))
+        with mock.patch.object(
+            HDFReadData, "iter_chunks", return_value=iter(["chunk 1", "chunk 2"])
+        ) as mock_ic:
+            extras = {
+                "chunk_shots": 20,
+                "index": 1,
+                "shotnum": 2,
+                "digitizer": "digi",
+                "adc": "SIS",
+                "config_name": "config01",
+                "keep_bits": True,
+                "add_controls": ["control"],
+                "add_msi": ["Discharge"],
+                "intersection_set": True,
+                "samples": slice(2, 10),
+                "average": 4,
+                "masked": True,
+                "out": "pool",
+            }
+            chunks = _bf.iter_data(1, 2, **extras, silent=False)
+            self.assertFalse(mock_ic.called)
+            self.assertEqual(list(chunks), ["chunk 1", "chunk 2"])
+            mock_ic.assert_called_once_with(_bf, 1, 2, **extras)
+
+            # `chunk_shots` is keyword-only (unlike `read_data`, the
+            # third positional argument is not `index`)
+            with self.assertRaises(TypeError):
+                _bf.iter_data(1, 2, slice(None))
+
+        # calling `read_position_stats`
+        self.assertTrue(hasattr(_bf, "read_position_stats"))
+        with mock.patch(
+            f"{HDFPositionStats.__module__}.{HDFPositionStats.__qualname__}",
+            return_value="position stats",
+        ) as mock_ps:
+            extras = {
+                "add_controls": ["control"],
+                "chunk_shots": 20,
+                "ddof": 1,
+                "shotnum": 2,
+                "config_name": "config01",
+                "average": 4,
+            }
+            data = _bf.read_position_stats(1, 2, **extras, silent=False)
+            self.assertEqual(data, "position stats")
+            mock_ps.assert_called_once_with(_bf, 1, 2, **extras)
+
         # calling `read_msi`
         with mock.patch(
             f"{HDFReadMSI.__module__}.{HDFReadMSI.__qualname__}", return_value="read msi"
         ) as mock_rm:
-            mdata = _bf.read_msi("Discharge", silent=False)
+            extras = {"index": 1, "shotnum": 2, "reduce": "max", "samples": slice(2, 10)}
+            mdata = _bf.read_msi("Discharge", **extras, silent=False)
             self.assertTrue(mock_rm.called)
             self.assertEqual(mdata, "read msi")
-            mock_rm.assert_called_once_with(_bf, "Discharge")
+            mock_rm.assert_called_once_with(_bf, "Discharge", **extras)
 
         # __init__ calling                                          ----
         # methods `_build_info` and `_map_file` should be called in
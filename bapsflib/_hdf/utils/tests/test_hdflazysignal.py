@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import h5py
+import numpy as np
+import unittest as ut
+
+from unittest import mock
+
+from bapsflib._hdf.utils.hdflazysignal import HDFLazySignal
+from bapsflib._hdf.utils.helpers import read_dset_rows
+
+
+class TestHDFLazySignal(ut.TestCase):
+    """Test case for :class:`~bapsflib._hdf.utils.hdflazysignal.HDFLazySignal`."""
+
+    def setUp(self):
+        # in-memory HDF5 file with two 'digitizer' datasets
+        self.f = h5py.File("lazy.hdf5", "w", driver="core", backing_store=False)
+        self.arrs = [
+            np.arange(20 * 10, dtype=np.int16).reshape(20, 10),
+            -np.arange(20 * 10, dtype=np.int16).reshape(20, 10),
+        ]
+        self.dsets = [
+            self.f.create_dataset(f"dset{ii}", data=arr)
+            for ii, arr in enumerate(self.arrs)
+        ]
+
+        # shot numbers 1-8, recorded in rows 2-9 of dataset 0 and rows
+        # 0-5 of dataset 1 (shots 7 and 8 not recorded)
+        self.shotnum = np.arange(1, 9, dtype=np.uint32)
+        self.rows = [np.arange(2, 10), np.array([0, 1, 2, 3, 4, 5, -1, -1])]
+
+    def tearDown(self):
+        self.f.close()
+
+    def assertReadRows(self, mock_read, rows, samples, average=None):
+        """Assert only dataset `rows` and `samples` were read."""
+        mock_read.assert_called_once()
+        args, kwargs = mock_read.call_args
+        self.assertIs(args[0], self.dsets[0])
+        self.assertTrue(np.array_equal(args[1], rows))
+        self.assertEqual(kwargs["samples"], samples)
+        self.assertEqual(kwargs.get("average"), average)
+
+    def test_single_channel(self):
+        sig = HDFLazySignal([self.dsets[0]], self.shotnum, self.rows[:1], np.int16)
+        expected = self.arrs[0][2:10]
+
+        # array-like attributes
+        self.assertEqual(sig.shape, (8, 10))
+        self.assertEqual(sig.ndim, 2)
+        self.assertEqual(len(sig), 8)
+        self.assertEqual(sig.dtype, np.dtype(np.int16))
+        self.assertTrue(np.array_equal(sig.shotnum, self.shotnum))
+        self.assertTrue(np.array_equal(sig.read(), expected))
+        self.assertTrue(np.array_equal(np.asarray(sig), expected))
+
+        # indexing matches numpy
+        for item in (
+            3,
+            -1,
+            slice(None),
+            slice(2, 6),
+            slice(None, None, -2),
+            [5, 1, 1],
+            np.array([True, False] * 4),
+            (slice(1, 4), slice(2, 8)),
+            (slice(1, 4), 5),
+            (2, slice(None, None, 3)),
+            (Ellipsis, 4),
+            (slice(None), [1, 7]),
+        ):
+            with self.subTest(item=item):
+                self.assertTrue(np.array_equal(sig[item], expected[item]))
+
+        # only the requested rows are read
+        with mock.patch(
+            f"{HDFLazySignal.__module__}.read_dset_rows", wraps=read_dset_rows
+        ) as mock_read:
+            sig[[1, 3], 2:4]
+            self.assertReadRows(mock_read, [3, 5], slice(2, 4, 1))
+
+        # bad indices
+        with self.assertRaises(IndexError):
+            sig[1, 2, 3]
+        with self.assertRaises(IndexError):
+            sig[..., 1, ...]
+        with self.assertRaises(IndexError):
+            sig[8]
+
+    def test_multi_channel(self):
+        sig = HDFLazySignal(
+            self.dsets, self.shotnum, self.rows, np.float32, channel_axis=True
+        )
+        expected = np.empty((8, 2, 10), dtype=np.float32)
+        expected[:, 0, :] = self.arrs[0][2:10]
+        expected[:6, 1, :] = self.arrs[1][:6]
+        expected[6:, 1, :] = np.nan
+        self.assertEqual(sig.shape, (8, 2, 10))
+
+        for item in (
+            Ellipsis,
+            slice(5, None),
+            (slice(None), 1),
+            (7, 1),
+            ([0, 7], slice(None), slice(3, 5)),
+            (Ellipsis, [0, 9]),
+        ):
+            with self.subTest(item=item):
+                self.assertTrue(np.array_equal(sig[item], expected[item], equal_nan=True))
+
+        # integer dtype fills unrecorded shots with 0
+        sig = HDFLazySignal(
+            self.dsets, self.shotnum, self.rows, np.int16, channel_axis=True
+        )
+        self.assertTrue(np.all(sig[6:, 1] == 0))
+
+        # multiple datasets need a channel axis
+        with self.assertRaises(ValueError):
+            HDFLazySignal(self.dsets, self.shotnum, self.rows, np.int16)
+
+    def test_conversions(self):
+        dv = np.float32(0.5)
+        offset = np.float32(2.0)
+        sig = HDFLazySignal(
+            [self.dsets[0]],
+            self.shotnum,
+            self.rows[:1],
+            np.float32,
+            conversions=[(dv, offset)],
+        )
+        expected = (dv * self.arrs[0][2:10].astype(np.float32)) - offset
+        self.assertEqual(sig[...].dtype, np.float32)
+        self.assertTrue(np.array_equal(sig[...], expected))
+        self.assertTrue(np.array_equal(sig[3:5, 1], expected[3:5, 1]))
+
+    def test_samples(self):
+        sig = HDFLazySignal(
+            self.dsets,
+            self.shotnum,
+            self.rows,
+            np.float32,
+            channel_axis=True,
+            samples=slice(1, 9, 2),
+        )
+        full = HDFLazySignal(
+            self.dsets, self.shotnum, self.rows, np.float32, channel_axis=True
+        )
+        expected = full[..., 1:9:2]
+        self.assertEqual(sig.shape, (8, 2, 4))
+        for item in (
+            Ellipsis,
+            (slice(None), 0, 2),
+            (Ellipsis, -1),
+            (Ellipsis, slice(1, 3)),
+            (Ellipsis, slice(None, None, -1)),
+            (Ellipsis, [3, 0]),
+        ):
+            with self.subTest(item=item):
+                self.assertTrue(np.array_equal(sig[item], expected[item], equal_nan=True))
+
+        # only the window is read
+        with mock.patch(
+            f"{HDFLazySignal.__module__}.read_dset_rows", wraps=read_dset_rows
+        ) as mock_read:
+            sig[[1, 3], 0, 1:]
+            self.assertReadRows(mock_read, [3, 5], slice(3, 9, 2))
+
+        # kept by `for_shotnum`
+        self.assertEqual(sig.for_shotnum([2, 7]).shape, (2, 2, 4))
+
+        # bad indices and samples
+        with self.assertRaises(IndexError):
+            sig[0, 0, 4]
+        with self.assertRaises(ValueError):
+            HDFLazySignal(
+                self.dsets[:1],
+                self.shotnum,
+                self.rows[:1],
+                np.int16,
+                samples=slice(None, None, -1),
+            )
+
+    def test_average(self):
+        sig = HDFLazySignal(
+            self.dsets,
+            self.shotnum,
+            self.rows,
+            np.float32,
+            channel_axis=True,
+            samples=slice(1, None),
+            average=2,
+        )
+        full = HDFLazySignal(
+            self.dsets, self.shotnum, self.rows, np.float32, channel_axis=True
+        )
+        expected = full[..., 1:9].reshape(8, 2, 4, 2).mean(axis=-1)
+        self.assertEqual(sig.shape, (8, 2, 4))
+        for item in (
+            Ellipsis,
+            (slice(None), 0, 2),
+            (Ellipsis, -1),
+            (Ellipsis, slice(1, 3)),
+            (Ellipsis, slice(None, None, -1)),
+            (Ellipsis, [3, 0]),
+            (Ellipsis, slice(2, 2)),
+        ):
+            with self.subTest(item=item):
+                self.assertTrue(np.allclose(sig[item], expected[item], equal_nan=True))
+
+        # only the averages covering the selection are read
+        with mock.patch(
+            f"{HDFLazySignal.__module__}.read_dset_rows", wraps=read_dset_rows
+        ) as mock_read:
+            sig[[1, 3], 0, 1:3]
+            self.assertReadRows(mock_read, [3, 5], slice(3, 7), average=2)
+
+        # averages are accumulated in float64, then cast
+        # - float32 accumulation gives 2**24 for every average
+        #
+        dset = self.f.create_dataset(
+            "big", data=np.full((2, 4), 2**24, dtype=np.int32) + [1, 2, 1, 2]
+        )
+        sig = HDFLazySignal([dset], [1, 2], [[0, 1]], np.float32, average=2)
+        self.assertTrue(np.array_equal(sig[...], np.full((2, 2), 2**24 + 2)))
+
+        # averaging needs unit steps and floats
+        for kwargs in (
+            {"samples": slice(None, None, 2), "dtype": np.float32},
+            {"samples": None, "dtype": np.int16},
+        ):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                HDFLazySignal(
+                    self.dsets[:1], self.shotnum, self.rows[:1], average=2, **kwargs
+                )
+
+    def test_for_shotnum(self):
+        sig = HDFLazySignal(
+            self.dsets, self.shotnum, self.rows, np.float32, channel_axis=True
+        )
+        sub = sig.for_shotnum([2, 7])
+        self.assertIsInstance(sub, HDFLazySignal)
+        self.assertEqual(sub.shape, (2, 2, 10))
+        self.assertTrue(np.array_equal(sub.shotnum, [2, 7]))
+        self.assertTrue(np.array_equal(sub[...], sig[[1, 6]], equal_nan=True))
+
+        # shot numbers in dataset row order (not sorted)
+        order = [5, 2, 7, 0, 1, 6, 4, 3]
+        sig = HDFLazySignal(
+            self.dsets,
+            self.shotnum[order],
+            [row[order] for row in self.rows],
+            np.float32,
+            channel_axis=True,
+        )
+        sub = sig.for_shotnum([2, 7, 4])
+        self.assertTrue(np.array_equal(sub.shotnum, [2, 7, 4]))
+        self.assertTrue(np.array_equal(sub[...], sig[[4, 5, 7]], equal_nan=True))
+
+        # shot numbers must be a subset
+        for shotnum in ([0, 2], [9], [2, 20]):
+            with self.subTest(shotnum=shotnum), self.assertRaises(ValueError):
+                sig.for_shotnum(shotnum)
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import numpy as np
+import unittest as ut
+
+from bapsflib._hdf.utils.hdfmaskedsignal import HDFMaskedSignal
+
+
+class TestHDFMaskedSignal(ut.TestCase):
+    """
+    Test case for :class:`~bapsflib._hdf.utils.hdfmaskedsignal.HDFMaskedSignal`.
+    """
+
+    def setUp(self):
+        # shot numbers 1-8, channel 0 records shots 1-4, channel 1
+        # records shots 3-6 (shots 7 and 8 not recorded)
+        self.shotnum = np.arange(1, 9, dtype=np.uint32)
+        self.valid = np.zeros((8, 2), dtype=bool)
+        self.valid[0:4, 0] = True
+        self.valid[2:6, 1] = True
+        self.full = np.full((8, 2, 5), np.nan, dtype=np.float32)
+        self.full[0:4, 0] = np.arange(4 * 5).reshape(4, 5)
+        self.full[2:6, 1] = -np.arange(4 * 5).reshape(4, 5)
+        self.payload = self.full[0:6].copy()
+
+    def test_attributes(self):
+        sig = HDFMaskedSignal(self.shotnum, self.valid, self.payload)
+        self.assertEqual(sig.shape, (8, 2, 5))
+        self.assertEqual(sig.ndim, 3)
+        self.assertEqual(len(sig), 8)
+        self.assertEqual(sig.dtype, np.float32)
+        self.assertIs(sig.data, self.payload)
+        self.assertIs(sig.valid, self.valid)
+        self.assertTrue(np.array_equal(sig.shotnum, self.shotnum))
+        self.assertTrue(np.isnan(sig.fill_value))
+        self.assertEqual(sig.nbytes, self.payload.nbytes + self.valid.nbytes)
+        self.assertIn("stored=6", repr(sig))
+
+        # integer data is filled with 0
+        sig = HDFMaskedSignal(self.shotnum[:2], [True, False], np.arange(3)[None, :])
+        self.assertEqual(sig.fill_value, 0)
+        self.assertTrue(np.array_equal(np.asarray(sig), [[0, 1, 2], [0, 0, 0]]))
+
+        # mismatched sizes
+        with self.assertRaises(ValueError):
+            HDFMaskedSignal(self.shotnum, self.valid[:-1], self.payload)
+        with self.assertRaises(ValueError):
+            HDFMaskedSignal(self.shotnum, self.valid, self.payload[:-1])
+
+    def test_indexing(self):
+        sig = HDFMaskedSignal(self.shotnum, self.valid, self.payload)
+        mask = np.broadcast_to(~self.valid[..., None], self.full.shape)
+
+        # full expansion
+        arr = sig.read()
+        self.assertIsInstance(arr, np.ma.MaskedArray)
+        self.assertTrue(np.array_equal(arr.mask, mask))
+        self.assertTrue(np.array_equal(arr.data, self.full, equal_nan=True))
+        self.assertTrue(np.array_equal(sig[...].mask, mask))
+        self.assertTrue(np.array_equal(sig.filled(), self.full, equal_nan=True))
+        self.assertTrue(np.array_equal(sig.filled(-1.0), np.where(mask, -1.0, self.full)))
+        self.assertTrue(np.array_equal(np.asarray(sig), self.full, equal_nan=True))
+
+        # partial expansion
+        for item in (
+            3,
+            slice(2, 7),
+            (slice(None, None, -2), 1),
+            (np.array([7, 0, 3]), slice(None), 2),
+            (self.shotnum % 2 == 0, 0, slice(1, 3)),
+            (5, ..., 1),
+            (..., 0),
+        ):
+            with self.subTest(item=item):
+                arr = sig[item]
+                self.assertTrue(np.array_equal(arr.mask, mask[item]))
+                self.assertTrue(np.array_equal(arr.data, self.full[item], equal_nan=True))
+
+    def test_for_shotnum(self):
+        sig = HDFMaskedSignal(self.shotnum, self.valid, self.payload)
+        self.assertIs(sig.for_shotnum(self.shotnum), sig)
+
+        # subset of shot numbers
+        sub = sig.for_shotnum([8, 5, 1, 2])
+        self.assertTrue(np.array_equal(sub.shotnum, [8, 5, 1, 2]))
+        self.assertEqual(sub.data.shape, (3, 2, 5))
+        self.assertTrue(np.array_equal(sub.valid, self.valid[[7, 4, 0, 1]]))
+        self.assertTrue(
+            np.array_equal(sub.filled(), self.full[[7, 4, 0, 1]], equal_nan=True)
+        )
+
+        # unknown shot numbers
+        with self.assertRaises(ValueError):
+            sig.for_shotnum([1, 20])
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import numpy as np
+import unittest as ut
+
+from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.hdfpositionstats import HDFPositionStats
+from bapsflib._hdf.utils.hdfreaddata import HDFReadData
+from bapsflib._hdf.utils.tests import TestBase
+from bapsflib.utils.decorators import with_bf
+
+
+class TestHDFPositionStats(TestBase):
+    """
+    Test Case for
+    :class:`~bapsflib._hdf.utils.hdfpositionstats.HDFPositionStats`
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        # 60 shots taken at 4 interleaved positions
+        self.sn_size = 60
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": self.sn_size, "nt": 50})
+        self.f.add_module(
+            "6K Compumotor",
+            {"n_configs": 1, "sn_size": self.sn_size, "n_motionlists": 1},
+        )
+        _mod = self.f.modules["SIS 3301"]
+        self.config_name = _mod.knobs.active_config[0]
+        brd, ch = np.where(_mod.knobs.active_brdch)
+        self.brdch = (int(brd[0]), int(ch[0]))
+        self.sixk_cspec = self.f.modules["6K Compumotor"].config_names[0]
+        self.positions = np.array(
+            [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [-1.0, 2.5, 0.0], [1.0, 0.0, -3.0]]
+        )
+        dset = self.f[f"Raw data + config/6K Compumotor/XY[{self.sixk_cspec}]: probe01"]
+        data = dset[...]
+        for ii, field in enumerate(("x", "y", "z")):
+            data[field] = self.positions[np.arange(self.sn_size) % 4, ii]
+        dset[...] = data
+
+    def tearDown(self):
+        super().tearDown()
+
+    @with_bf
+    def test_stats(self, _bf: File):
+        """Statistics match a grouped full read."""
+        controls = [("6K Compumotor", self.sixk_cspec)]
+        kwargs = {"config_name": self.config_name, "add_controls": controls}
+        full = HDFReadData(_bf, *self.brdch, **kwargs)
+        sig = full["signal"].astype(np.float64)
+
+        for chunk_shots, ddof in ((1000, 0), (7, 1), (1, 0)):
+            with self.subTest(chunk_shots=chunk_shots, ddof=ddof):
+                stats = HDFPositionStats(
+                    _bf, *self.brdch, chunk_shots=chunk_shots, ddof=ddof, **kwargs
+                )
+                self.assertIsInstance(stats, HDFPositionStats)
+                self.assertEqual(stats.dtype.names, ("xyz", "count", "mean", "var"))
+                self.assertEqual(stats.shape, (4,))
+                self.assertEqual(stats["mean"].shape, (4, 50))
+                self.assertEqual(stats["mean"].dtype, np.float64)
+                self.assertEqual(stats.info["ddof"], ddof)
+                self.assertEqual(stats.info["board"], self.brdch[0])
+
+                # sorted by position
+                expected_xyz = np.unique(self.positions, axis=0)
+                self.assertTrue(np.array_equal(stats["xyz"], expected_xyz))
+
+                for entry in stats:
+                    mask = np.all(full["xyz"] == entry["xyz"], axis=1)
+                    self.assertEqual(entry["count"], np.count_nonzero(mask))
+                    self.assertTrue(np.allclose(entry["mean"], sig[mask].mean(axis=0)))
+                    self.assertTrue(
+                        np.allclose(entry["var"], sig[mask].var(axis=0, ddof=ddof))
+                    )
+
+        # read keywords are passed on
+        stats = HDFPositionStats(
+            _bf, *self.brdch, shotnum=slice(1, 7), samples=slice(0, 10), **kwargs
+        )
+        self.assertEqual(stats["count"].tolist(), [1, 2, 1, 2])
+        self.assertEqual(stats["mean"].shape, (4, 10))
+
+        # variance is NaN without enough shots
+        stats = HDFPositionStats(_bf, *self.brdch, shotnum=[1, 2, 3, 5], ddof=1, **kwargs)
+        self.assertTrue(np.all(np.isnan(stats["var"][stats["count"] == 1])))
+
+        # no positional control, all shots are one group
+        stats = HDFPositionStats(_bf, *self.brdch, config_name=self.config_name)
+        self.assertEqual(stats.shape, (1,))
+        self.assertEqual(stats["count"][0], self.sn_size)
+        self.assertTrue(np.all(np.isnan(stats["xyz"])))
+        self.assertTrue(np.allclose(stats["mean"][0], sig.mean(axis=0)))
+
+        # numerically stable for a large offset
+        signal = 1.0e8 + np.arange(40, dtype=np.float64).reshape(20, 2)
+        xyz = np.zeros((20, 3), dtype=np.float32)
+        _, count, mean, m2 = HDFPositionStats._block_stats(xyz, signal)
+        self.assertTrue(np.allclose(m2[0] / count[0], signal.var(axis=0)))
+
+        # -0.0 and NaN payloads do not split a position
+        xyz = np.zeros((4, 3), dtype=np.float32)
+        xyz[1, 0] = -0.0
+        xyz[2:, 1] = np.array([0x7FC00000, 0x7FC00001], dtype=np.uint32).view(np.float32)
+        bxyz, count, _, _ = HDFPositionStats._block_stats(xyz, np.ones((4, 2)))
+        self.assertTrue(np.array_equal(count, [2, 2]))
+        self.assertEqual(np.signbit(bxyz).sum(), 0)
+
+    @with_bf
+    def test_raises(self, _bf: File):
+        for kwargs, err in (
+            ({"ddof": -1}, ValueError),
+            ({"ddof": 1.0}, TypeError),
+            ({"intersection_set": False}, TypeError),
+            ({"lazy": True}, TypeError),
+            ({"masked": True}, TypeError),
+        ):
+            with self.subTest(**kwargs), self.assertRaises(err):
+                HDFPositionStats(_bf, *self.brdch, config_name=self.config_name, **kwargs)
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -292,6 +292,24 @@ class TestHDFReadControl(TestBase):
                 _bf, controls, shotnum=sn, assume_controls_conditioned=True
             )
 
+        # -- no dataset fields are mapped                             --
+        # - every numpy field is zero filled, so nothing is read
+        #
+        smap = mock_controls.return_value["Sample"]
+        smap._configs["config01"]["state values"] = {
+            "xyz": {
+                "dset paths": smap.configs["config01"]["dset paths"],
+                "dset field": ("", "", ""),
+                "shape": (3,),
+                "dtype": np.float64,
+            },
+        }
+        cdata = HDFReadControls(
+            _bf, controls, shotnum=sn, assume_controls_conditioned=True
+        )
+        self.assertTrue(np.array_equal(cdata["shotnum"], sn_v))
+        self.assertTrue(np.array_equal(cdata["xyz"], np.zeros((3, 3), dtype=np.float64)))
+
     @with_bf
     @mock.patch.object(HDFMap, "controls", new_callable=mock.PropertyMock)
     def test_nan_fill(self, _bf: File, mock_controls):
@@ -795,6 +813,123 @@ class TestHDFReadControl(TestBase):
         cdata = HDFReadControls(_bf, control, intersection_set=False)
         self.assertCDataObj(cdata, _bf, control_plus, intersection_set=False)
 
+    @with_bf
+    def test_command_list(self, _bf: File):
+        """Test the fill of command list controls."""
+        self.f.add_module("N5700_PS", {"n_configs": 1, "sn_size": 10})
+        dset = self.f["Raw data + config/N5700_PS/Run time list"]
+        cindex = np.array([0, 1, 2, 3, 0, 1, 2, 3, 9, 3])
+        data = dset[...]
+        data["Command index"] = cindex
+        dset[...] = data
+        _bf._map_file()  # re-map file
+        cl = _bf.file_map.controls["N5700_PS"].configs["config01"]["state values"][
+            "VOLT"
+        ]["command list"]
+        cl = np.array(cl)
+
+        # command values are gathered from the command list
+        cdata = HDFReadControls(_bf, ["N5700_PS"], shotnum=[2, 3, 4, 5])
+        self.assertEqual(cdata["VOLT"].dtype, np.float64)
+        self.assertTrue(np.array_equal(cdata["VOLT"], cl[cindex[1:5]]))
+        self.assertNotIn("command tables", cdata.info["controls"]["N5700_PS"])
+
+        # categorical
+        cdata = HDFReadControls(
+            _bf, ["N5700_PS"], shotnum=[7, 8, 9, 10, 11], categorical=True
+        )
+        table = cdata.info["controls"]["N5700_PS"]["command tables"]["VOLT"]
+        self.assertEqual(cdata["VOLT"].dtype, np.uint8)
+        self.assertTrue(np.array_equal(table, cl))
+        self.assertEqual(table.dtype, np.float64)
+        self.assertEqual(cdata["shotnum"].tolist(), [7, 8, 9, 10])
+        self.assertEqual(cdata["VOLT"].tolist(), [2, 3, len(cl), 3])
+
+        # missing shot numbers
+        cdata = _bf.read_controls(
+            ["N5700_PS"], shotnum=[9, 10, 11], intersection_set=False, categorical=True
+        )
+        self.assertEqual(cdata["VOLT"].tolist(), [len(cl), 3, len(cl)])
+
+    @with_bf
+    def test_masked(self, _bf: File):
+        """Test the validity mask of keyword `masked`."""
+        self.f.remove_all_modules()
+        self.f.add_module(
+            "6K Compumotor", {"n_configs": 1, "sn_size": 50, "n_motionlists": 1}
+        )
+        self.f.add_module("Waveform", {"n_configs": 1, "sn_size": 30})
+        _bf._map_file()  # re-map file
+        sixk_cspec = self.f.modules["6K Compumotor"].config_names[0]
+        control = [("Waveform", "config01"), ("6K Compumotor", sixk_cspec)]
+        shotnum = np.arange(20, 61)
+
+        cdata = HDFReadControls(_bf, control, shotnum=shotnum, intersection_set=False)
+        mdata = _bf.read_controls(
+            control, shotnum=shotnum, intersection_set=False, masked=True
+        )
+        self.assertEqual(list(mdata.dtype.names), list(cdata.dtype.names) + ["valid"])
+        self.assertEqual(mdata.dtype["valid"].shape, (2,))
+        self.assertEqual(list(mdata.info["controls"]), ["Waveform", "6K Compumotor"])
+        self.assertTrue(np.array_equal(mdata["shotnum"], shotnum))
+
+        # columns of 'valid' follow the order of info['controls']
+        valid = np.stack((shotnum <= 30, shotnum <= 50), axis=1)
+        self.assertTrue(np.array_equal(mdata["valid"], valid))
+
+        # recorded entries match, the others are zeroed
+        sixk_fields = _bf.file_map.controls["6K Compumotor"].configs[sixk_cspec][
+            "state values"
+        ]
+        for field in cdata.dtype.names[1:]:
+            recorded = valid[:, int(field in sixk_fields)]
+            self.assertTrue(
+                np.array_equal(mdata[field][recorded], cdata[field][recorded])
+            )
+            self.assertTrue(
+                np.all(mdata[field][~recorded] == np.zeros(1, mdata.dtype[field]))
+            )
+
+        # all shot numbers are valid for an intersection
+        mdata = HDFReadControls(_bf, control, shotnum=shotnum, masked=True)
+        self.assertTrue(np.all(mdata["valid"]))
+        self.assertEqual(mdata.shape, (11,))
+
+    @with_bf
+    def test_unordered_shotnum(self, _bf: File):
+        """Test reading a control dataset whose shot numbers are shuffled."""
+        self.f.remove_all_modules()
+        self.f.add_module("Waveform", {"n_configs": 1, "sn_size": 100})
+        self.f.add_module(
+            "6K Compumotor", {"n_configs": 1, "sn_size": 100, "n_motionlists": 1}
+        )
+        _bf._map_file()  # re-map file
+        sixk_cspec = self.f.modules["6K Compumotor"].config_names[0]
+        controls = [("Waveform", "config01"), ("6K Compumotor", sixk_cspec)]
+        cases = [
+            {"shotnum": slice(3, 80), "intersection_set": False},
+            {"shotnum": [90, 5, 6, 7, 40]},
+            {"shotnum": slice(50, 120), "intersection_set": False, "masked": True},
+        ]
+        expected = [_bf.read_controls(controls, **case) for case in cases]
+
+        # shuffle the rows of the datasets
+        rng = np.random.default_rng(7)
+        for name, cspec in controls:
+            path = _bf.file_map.controls[name].configs[cspec]["dset paths"][0]
+            dset = self.f[path]
+            dset[...] = dset[...][rng.permutation(dset.shape[0])]
+        _bf._map_file()  # re-map file
+
+        for case, cdata in zip(cases, expected):
+            with self.subTest(case=case):
+                data = _bf.read_controls(controls, **case)
+                self.assertEqual(data.dtype, cdata.dtype)
+                for field in cdata.dtype.names:
+                    self.assertTrue(
+                        np.array_equal(data[field], cdata[field], equal_nan=True)
+                    )
+
     def assertCDataObj(
         self,
         cdata: HDFReadControls,
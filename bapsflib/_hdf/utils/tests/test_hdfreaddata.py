@@ -15,19 +15,24 @@ import astropy.units as u
 import h5py
 import numpy as np
 import os
+import tracemalloc
 import unittest as ut
 
 from unittest import mock
 
 from bapsflib._hdf.maps import HDFMap
 from bapsflib._hdf.maps.digitizers.sis3301 import HDFMapDigiSIS3301
+from bapsflib._hdf.utils.bufferpool import BufferPool
 from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.hdflazysignal import HDFLazySignal
+from bapsflib._hdf.utils.hdfmaskedsignal import HDFMaskedSignal
 from bapsflib._hdf.utils.hdfreadcontrols import HDFReadControls
 from bapsflib._hdf.utils.hdfreaddata import (
-    build_sndr_for_simple_dset,
     condition_shotnum,
-    do_shotnum_intersection,
+    get_shotnum_resolver,
     HDFReadData,
+    intersect_shotnum,
+    read_dset_rows,
 )
 from bapsflib._hdf.utils.tests import TestBase
 from bapsflib.utils.decorators import with_bf
@@ -256,6 +261,343 @@ class TestHDFReadData(TestBase):
         mock_cdata.reset_mock()
         mock_cc.reset_mock()
 
+    @with_bf
+    def test_adding_msi(self, _bf: File):
+        """Test joining MSI diagnostic data with keyword `add_msi`."""
+        # setup
+        sn_size = 50
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": sn_size, "nt": 100})
+        _mod = self.f.modules["SIS 3301"]
+        digi = "SIS 3301"
+        config_name = _mod.knobs.active_config[0]
+        bc_arr = np.zeros((13, 8), dtype=bool)
+        bc_arr[0, 0:2] = True
+        _mod.knobs.active_brdch = bc_arr
+        brdchs = [(0, 0), (0, 1)]
+
+        # - rebuild the 'Discharge' datasets to record a subset (with a
+        #   gap) of the digitizer shot numbers
+        self.f.add_module("Discharge")
+        msi_sn = np.concatenate((np.arange(10, 20), np.arange(25, 60)))
+        gpath = "/MSI/Discharge"
+        for name in ("Cathode-anode voltage", "Discharge current", "Discharge summary"):
+            dset = self.f[f"{gpath}/{name}"]
+            arr = np.resize(dset[...], (msi_sn.size,) + dset.shape[1:2])
+            if name == "Discharge summary":
+                arr["Shot number"] = msi_sn
+                arr["Peak current"] = msi_sn + 0.5
+            else:
+                arr = np.arange(arr.size, dtype=arr.dtype).reshape(arr.shape)
+            del self.f[f"{gpath}/{name}"]
+            self.f.create_dataset(f"{gpath}/{name}", data=arr)
+        _bf._map_file()  # re-map file
+        extras = {"config_name": config_name, "adc": digi, "digitizer": digi}
+        msi_data = _bf.read_msi("Discharge")
+        msi_fields = [name for name in msi_data.dtype.names if name != "shotnum"]
+
+        # MSI data is joined by shot number
+        cases = [
+            {},
+            {"shotnum": [5, 12, 13, 21, 30]},
+            {"shotnum": slice(15, 30)},
+            {"index": slice(0, 40, 3)},
+            {"add_msi": "discharge"},
+            {"add_msi": [("Discharge", "max")]},
+            {"add_msi": [("Discharge", np.mean)], "shotnum": [5, 12, 13, 21, 30]},
+            {"intersection_set": False},
+            {"intersection_set": False, "shotnum": [5, 12, 13, 21, 30]},
+            {"intersection_set": False, "add_msi": [("Discharge", "min")]},
+            {"intersection_set": False, "masked": True},
+        ]
+        for case in cases:
+            case = {"add_msi": "Discharge", **case}
+            with self.subTest(**case):
+                data = HDFReadData(_bf, *brdchs[0], **case, **extras)
+                plain = {k: v for k, v in case.items() if k != "add_msi"}
+                pdata = HDFReadData(_bf, *brdchs[0], **plain, **extras)
+                if case.get("intersection_set", True):
+                    recorded = np.isin(pdata["shotnum"], msi_sn)
+                    self.assertTrue(np.all(np.isin(data["shotnum"], msi_sn)))
+                    pdata = pdata[recorded]
+                self.assertTrue(np.array_equal(data["shotnum"], pdata["shotnum"]))
+                if case.get("masked", False):
+                    self.assertTrue(
+                        np.array_equal(
+                            data.signal.filled(), pdata.signal.filled(), equal_nan=True
+                        )
+                    )
+                else:
+                    self.assertTrue(np.array_equal(data["signal"], pdata["signal"]))
+
+                # nested MSI field
+                self.assertIn("Discharge", data.dtype.names)
+                self.assertEqual(list(data.dtype["Discharge"].names), msi_fields)
+                add_msi = case["add_msi"]
+                reduce = None if isinstance(add_msi, str) else add_msi[0][1]
+                self.assertIn("Discharge", data.info["msi"])
+                self.assertIs(data.info["msi"]["Discharge"]["reduce"], reduce)
+
+                recorded = np.isin(data["shotnum"], msi_sn)
+                rows = np.searchsorted(msi_sn, data["shotnum"][recorded])
+                mdata = data["Discharge"]
+                for name in msi_fields:
+                    expected = msi_data[name][rows]
+                    if reduce is not None and name != "meta":
+                        func = reduce if callable(reduce) else getattr(np, reduce)
+                        expected = func(expected, axis=-1)
+                        self.assertEqual(mdata.dtype[name], np.float64)
+                    self.assertTrue(np.array_equal(mdata[name][recorded], expected))
+
+                # NULL fill of shot numbers not recorded by the diagnostic
+                if not np.all(recorded):
+                    self.assertTrue(
+                        np.all(np.isnan(mdata["meta"]["peak current"][~recorded]))
+                    )
+                    self.assertTrue(np.all(np.isnan(mdata["current"][~recorded])))
+
+        # chunked reads match a full read
+        data = HDFReadData(_bf, *brdchs[0], add_msi="Discharge", **extras)
+        chunks = list(
+            HDFReadData.iter_chunks(
+                _bf, *brdchs[0], chunk_shots=7, add_msi="Discharge", **extras
+            )
+        )
+        self.assertTrue(
+            np.array_equal(
+                np.concatenate([chunk["Discharge"] for chunk in chunks]),
+                data["Discharge"],
+            )
+        )
+
+        # joined with several channels
+        data = HDFReadData.from_channels(
+            _bf, brdchs, add_msi=[("Discharge", "max")], **extras
+        )
+        self.assertTrue(np.array_equal(data["shotnum"], msi_sn[msi_sn <= sn_size]))
+        self.assertEqual(data["Discharge"]["current"].shape, data["shotnum"].shape)
+
+        # no matching shot numbers
+        with self.assertRaises(ValueError):
+            HDFReadData(_bf, *brdchs[0], add_msi="Discharge", shotnum=[1, 2], **extras)
+
+        # invalid `add_msi`
+        with self.assertRaises(ValueError):
+            HDFReadData(_bf, *brdchs[0], add_msi="Not a diagnostic", **extras)
+
+    @with_bf
+    def test_from_channels(self, _bf: File):
+        """Test reading several channels with `HDFReadData.from_channels`."""
+        # setup
+        sn_size = 50
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": sn_size, "nt": 1000})
+        self.f.add_module(
+            "6K Compumotor", {"n_configs": 1, "sn_size": sn_size, "n_motionlists": 1}
+        )
+        _mod = self.f.modules["SIS 3301"]
+        digi = "SIS 3301"
+        adc = "SIS 3301"
+        config_name = _mod.knobs.active_config[0]
+        bc_arr = np.zeros((13, 8), dtype=bool)
+        bc_arr[0, 0:2] = True
+        bc_arr[2, 5] = True
+        _mod.knobs.active_brdch = bc_arr
+        bc_indices = np.where(bc_arr)
+        brdchs = list(zip(bc_indices[0][:3].tolist(), bc_indices[1][:3].tolist()))
+        _bf._map_file()  # re-map file
+        sixk_cspec = self.f.modules["6K Compumotor"].config_names[0]
+        extras = {"config_name": config_name, "digitizer": digi}
+
+        # stacked channels match individual reads
+        cases = [
+            {},
+            {"index": slice(3, 30, 2)},
+            {"shotnum": [5, 10, 11, 12, 40, sn_size + 5]},
+            {"shotnum": [5, 10, 11, 12, 40, sn_size + 5], "intersection_set": False},
+            {"keep_bits": True, "shotnum": slice(10, 30)},
+            {"add_controls": [("6K Compumotor", sixk_cspec)], "shotnum": slice(40, 60)},
+            {
+                "add_controls": [("6K Compumotor", sixk_cspec)],
+                "shotnum": slice(40, 60),
+                "intersection_set": False,
+            },
+        ]
+        for case in cases:
+            with self.subTest(**case):
+                data = HDFReadData.from_channels(_bf, brdchs, **case, **extras)
+                singles = [
+                    HDFReadData(_bf, brd, ch, adc=adc, **case, **extras)
+                    for brd, ch in brdchs
+                ]
+                self.assertIsInstance(data, HDFReadData)
+                self.assertEqual(data.dtype["signal"].shape, (len(brdchs), 1000))
+                self.assertEqual(data.shape, singles[0].shape)
+                for ii, single in enumerate(singles):
+                    self.assertTrue(
+                        np.array_equal(
+                            data["signal"][:, ii, :], single["signal"], equal_nan=True
+                        )
+                    )
+                for field in singles[0].dtype.names:
+                    if field == "signal":
+                        continue
+                    self.assertTrue(
+                        np.array_equal(data[field], singles[0][field], equal_nan=True)
+                    )
+                self.assertEqual(data.info["board"], tuple(bc[0] for bc in brdchs))
+                self.assertEqual(data.info["channel"], tuple(bc[1] for bc in brdchs))
+                self.assertEqual(data.info["adc"], adc)
+                self.assertEqual(
+                    data.info["device dataset path"],
+                    tuple(s.info["device dataset path"] for s in singles),
+                )
+                self.assertEqual(data.info["clock rate"], singles[0].info["clock rate"])
+
+        # channels recording different shot numbers
+        brd, ch = brdchs[-1]
+        dheader = self.f[f"Raw data + config/SIS 3301/{config_name} [{brd}:{ch}] headers"]
+        shots = dheader["Shot"]
+        dheader["Shot"] = shots + 5
+        for kwargs, sn_expected in (
+            ({"intersection_set": True}, np.arange(6, sn_size + 1)),
+            ({"intersection_set": False}, np.arange(1, sn_size + 1)),
+            (
+                {"shotnum": slice(1, None), "intersection_set": True},
+                np.arange(6, sn_size + 1),
+            ),
+            (
+                {"shotnum": slice(1, None), "intersection_set": False},
+                np.arange(1, sn_size + 6),
+            ),
+        ):
+            with self.subTest(**kwargs):
+                data = HDFReadData.from_channels(_bf, brdchs, **kwargs, **extras)
+                self.assertTrue(np.array_equal(data["shotnum"], sn_expected))
+                for ii, (brd, ch) in enumerate(brdchs):
+                    single = HDFReadData(
+                        _bf,
+                        brd,
+                        ch,
+                        shotnum=sn_expected,
+                        intersection_set=False,
+                        adc=adc,
+                        **extras,
+                    )
+                    self.assertTrue(
+                        np.array_equal(
+                            data["signal"][:, ii, :], single["signal"], equal_nan=True
+                        )
+                    )
+        dheader["Shot"] = shots
+
+        # `adc` may be given per channel
+        data = HDFReadData.from_channels(
+            _bf, [brdch + (adc,) for brdch in brdchs], **extras
+        )
+        self.assertEqual(data.info["channel"], tuple(bc[1] for bc in brdchs))
+
+        # invalid `channels`
+        for channels, err in (
+            (brdchs[0], TypeError),
+            (5, TypeError),
+            ([brdchs[0], 5], TypeError),
+            ([brdchs[0], (1,)], TypeError),
+            ([], ValueError),
+            ([brdchs[0], brdchs[0]], ValueError),
+        ):
+            with self.subTest(channels=channels), self.assertRaises(err):
+                HDFReadData.from_channels(_bf, channels, **extras)
+
+    @with_bf
+    def test_iter_chunks(self, _bf: File):
+        """Test reading data in blocks with `HDFReadData.iter_chunks`."""
+        # setup
+        sn_size = 50
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": sn_size, "nt": 1000})
+        self.f.add_module(
+            "6K Compumotor", {"n_configs": 1, "sn_size": sn_size, "n_motionlists": 1}
+        )
+        _mod = self.f.modules["SIS 3301"]
+        digi = "SIS 3301"
+        adc = "SIS 3301"
+        config_name = _mod.knobs.active_config[0]
+        bc_arr = _mod.knobs.active_brdch
+        bc_indices = np.where(bc_arr)
+        brd = bc_indices[0][0]
+        ch = bc_indices[1][0]
+        _bf._map_file()  # re-map file
+        sixk_cspec = self.f.modules["6K Compumotor"].config_names[0]
+        extras = {"config_name": config_name, "adc": adc, "digitizer": digi}
+
+        # blocks match a single read
+        cases = [
+            {"chunk_shots": 7},
+            {"chunk_shots": 50},
+            {"chunk_shots": 100},
+            {"chunk_shots": 4, "index": slice(3, 30, 2)},
+            {"chunk_shots": 3, "shotnum": [5, 10, 11, 12, 40, sn_size + 5]},
+            {
+                "chunk_shots": 3,
+                "shotnum": [5, 10, 11, 12, 40, sn_size + 5],
+                "intersection_set": False,
+            },
+            {"chunk_shots": 3, "keep_bits": True, "shotnum": slice(10, 30)},
+            {
+                "chunk_shots": 6,
+                "add_controls": [("6K Compumotor", sixk_cspec)],
+                "shotnum": slice(5, 45),
+            },
+            {
+                "chunk_shots": 6,
+                "add_controls": [("6K Compumotor", sixk_cspec)],
+                "shotnum": slice(40, 60),
+                "intersection_set": False,
+            },
+        ]
+        for case in cases:
+            with self.subTest(**case):
+                kwargs = case.copy()
+                chunk_shots = kwargs.pop("chunk_shots")
+                data = HDFReadData(_bf, brd, ch, **kwargs, **extras)
+                chunks = list(
+                    HDFReadData.iter_chunks(
+                        _bf, brd, ch, chunk_shots=chunk_shots, **kwargs, **extras
+                    )
+                )
+                motion_added = "add_controls" in kwargs
+                keep_bits = kwargs.get("keep_bits", False)
+
+                self.assertEqual(len(chunks), int(np.ceil(data.shape[0] / chunk_shots)))
+                for chunk in chunks:
+                    self.assertDataObj(
+                        chunk, _bf, motion_added=motion_added, keep_bits=keep_bits
+                    )
+                    self.assertLessEqual(chunk.shape[0], chunk_shots)
+                    for key, val in data.info.items():
+                        if key == "controls":
+                            self.assertEqual(list(chunk.info[key]), list(val))
+                        else:
+                            self.assertEqual(chunk.info[key], val)
+                    self.assertEqual(chunk.dtype, data.dtype)
+
+                combined = np.concatenate(chunks)
+                for field in data.dtype.names:
+                    self.assertTrue(
+                        np.array_equal(combined[field], data[field], equal_nan=True)
+                    )
+
+        # invalid `chunk_shots`
+        for chunk_shots, err in ((0, ValueError), (2.5, TypeError), (True, TypeError)):
+            with self.assertRaises(err):
+                next(
+                    HDFReadData.iter_chunks(
+                        _bf, brd, ch, chunk_shots=chunk_shots, **extras
+                    )
+                )
+
+        # `chunk_shots` and the read keywords are keyword-only
+        with self.assertRaises(TypeError):
+            next(HDFReadData.iter_chunks(_bf, brd, ch, 10, **extras))
+
     @with_bf
     def test_kwarg_adc(self, _bf: File):
         """Test handling of keyword `adc`."""
@@ -556,8 +898,8 @@ class TestHDFReadData(TestBase):
 
     @with_bf
     @mock.patch(
-        "bapsflib._hdf.utils.hdfreaddata.do_shotnum_intersection",
-        side_effect=do_shotnum_intersection,
+        "bapsflib._hdf.utils.hdfreaddata.intersect_shotnum",
+        side_effect=intersect_shotnum,
     )
     def test_kwarg_intersection_set(self, _bf: File, mock_inter):
         """Test behavior of keyword `intersection_set`."""
@@ -693,6 +1035,626 @@ class TestHDFReadData(TestBase):
         self.assertFalse(mock_inter.called)
         mock_inter.reset_mock()
 
+    @with_bf
+    def test_kwarg_samples(self, _bf: File):
+        """Test behavior of keyword `samples`."""
+        # setup
+        sn_size = 30
+        nt = 100
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": sn_size, "nt": nt})
+        _mod = self.f.modules["SIS 3301"]
+        digi = "SIS 3301"
+        adc = "SIS 3301"
+        config_name = _mod.knobs.active_config[0]
+        bc_arr = np.zeros((13, 8), dtype=bool)
+        bc_arr[0, 0:2] = True
+        _mod.knobs.active_brdch = bc_arr
+        brdchs = [(0, 0), (0, 1)]
+        _bf._map_file()  # re-map file
+        extras = {"config_name": config_name, "adc": adc, "digitizer": digi}
+        full = HDFReadData(_bf, *brdchs[0], **extras)
+        dt = full.dt
+
+        # window given as sample indices or times
+        cases = [
+            (slice(None), slice(None)),
+            (slice(10, 40), slice(10, 40)),
+            (slice(5, None, 3), slice(5, None, 3)),
+            (slice(-20, None), slice(80, 100)),
+            (slice(10 * dt, 40 * dt), slice(10, 40)),
+            (slice(9.5 * dt, (40 * dt).to(u.us), 2), slice(10, 40, 2)),
+            (slice(None, 0.25 * nt * dt), slice(0, 25)),
+        ]
+        for samples, expected in cases:
+            with self.subTest(samples=samples):
+                data = HDFReadData(_bf, *brdchs[0], samples=samples, **extras)
+                self.assertDataObj(data, _bf)
+                self.assertTrue(
+                    np.array_equal(data["signal"], full["signal"][:, expected])
+                )
+                start, _, step = expected.indices(nt)
+                self.assertEqual(data.info["sample start"], start)
+                self.assertEqual(data.info["sample step"], step)
+                self.assertTrue(u.isclose(data.dt, step * dt))
+
+                # with other keywords
+                for kwargs in (
+                    {"shotnum": [2, 5, 6, 7, sn_size + 2], "intersection_set": False},
+                    {"index": slice(3, 20, 4), "keep_bits": True},
+                ):
+                    ref = HDFReadData(_bf, *brdchs[0], **kwargs, **extras)
+                    data = HDFReadData(
+                        _bf, *brdchs[0], samples=samples, **kwargs, **extras
+                    )
+                    self.assertTrue(
+                        np.array_equal(
+                            data["signal"], ref["signal"][:, expected], equal_nan=True
+                        )
+                    )
+
+                # lazy, multi-channel, and chunked reads
+                ldata = HDFReadData(_bf, *brdchs[0], samples=samples, lazy=True, **extras)
+                self.assertTrue(
+                    np.array_equal(ldata.signal[...], full["signal"][:, expected])
+                )
+                mdata = HDFReadData.from_channels(
+                    _bf, brdchs, samples=samples, config_name=config_name, digitizer=digi
+                )
+                mfull = HDFReadData.from_channels(
+                    _bf, brdchs, config_name=config_name, digitizer=digi
+                )
+                self.assertTrue(
+                    np.array_equal(mdata["signal"], mfull["signal"][..., expected])
+                )
+                chunks = list(
+                    HDFReadData.iter_chunks(
+                        _bf, *brdchs[0], chunk_shots=7, samples=samples, **extras
+                    )
+                )
+                self.assertTrue(
+                    np.array_equal(
+                        np.concatenate([chunk["signal"] for chunk in chunks]),
+                        full["signal"][:, expected],
+                    )
+                )
+
+        # only the window is read from disk
+        with mock.patch(
+            f"{HDFReadData.__module__}.read_dset_rows", wraps=read_dset_rows
+        ) as mock_read:
+            HDFReadData(_bf, *brdchs[0], samples=slice(10, 40, 2), **extras)
+            self.assertEqual(mock_read.call_args_list[-1][1]["samples"], slice(10, 40, 2))
+
+        # invalid `samples`
+        for samples, err in (
+            (5, TypeError),
+            ((10, 40), TypeError),
+            (slice(1.5, 10), TypeError),
+            (slice(None, None, 2.0), TypeError),
+            (slice(None, None, 0), ValueError),
+            (slice(None, None, -1), ValueError),
+            (slice(40, 10), ValueError),
+            (slice(nt, None), ValueError),
+            (slice(1 * u.V, None), ValueError),
+            (slice(-1 * u.s, None), ValueError),
+        ):
+            with self.subTest(samples=samples), self.assertRaises(err):
+                HDFReadData(_bf, *brdchs[0], samples=samples, **extras)
+
+    @with_bf
+    def test_kwarg_average(self, _bf: File):
+        """Test behavior of keyword `average`."""
+        # setup
+        sn_size = 30
+        nt = 100
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": sn_size, "nt": nt})
+        _mod = self.f.modules["SIS 3301"]
+        digi = "SIS 3301"
+        adc = "SIS 3301"
+        config_name = _mod.knobs.active_config[0]
+        bc_arr = np.zeros((13, 8), dtype=bool)
+        bc_arr[0, 0:2] = True
+        _mod.knobs.active_brdch = bc_arr
+        brdchs = [(0, 0), (0, 1)]
+        _bf._map_file()  # re-map file
+        extras = {"config_name": config_name, "adc": adc, "digitizer": digi}
+        full = HDFReadData(_bf, *brdchs[0], **extras)
+        bits = HDFReadData(_bf, *brdchs[0], keep_bits=True, **extras)
+
+        def allclose(actual, expected, **kwargs):
+            # float32 averages vs float64 reference
+            return np.allclose(actual, expected, atol=1e-5, **kwargs)
+
+        def boxcar(arr, average, samples=slice(None)):
+            arr = arr[..., samples].astype(np.float64)
+            n_avg = arr.shape[-1] // average
+            arr = arr[..., : n_avg * average]
+            return arr.reshape(arr.shape[:-1] + (n_avg, average)).mean(axis=-1)
+
+        for average, samples, window in (
+            (1, slice(None), slice(None)),
+            (4, slice(None), slice(None)),
+            (7, slice(None), slice(None)),
+            (5, slice(10, 43), slice(10, 43)),
+            (3, slice(10 * full.dt, 40 * full.dt), slice(10, 40)),
+        ):
+            with self.subTest(average=average, samples=samples):
+                data = HDFReadData(
+                    _bf, *brdchs[0], samples=samples, average=average, **extras
+                )
+                self.assertDataObj(data, _bf)
+                self.assertTrue(
+                    allclose(data["signal"], boxcar(full["signal"], average, window))
+                )
+                self.assertEqual(
+                    data.info["sample average"],
+                    average * (full.info["sample average"] or 1)
+                    if average > 1
+                    else full.info["sample average"],
+                )
+                self.assertTrue(u.isclose(data.dt, average * full.dt))
+
+                # averaged bits are float32
+                data = HDFReadData(
+                    _bf,
+                    *brdchs[0],
+                    samples=samples,
+                    average=average,
+                    keep_bits=True,
+                    **extras,
+                )
+                self.assertTrue(
+                    allclose(data["signal"], boxcar(bits["signal"], average, window))
+                )
+                if average > 1:
+                    self.assertEqual(data["signal"].dtype, np.float32)
+
+                # union shot numbers, lazy, multi-channel, and chunked
+                kwargs = {"samples": samples, "average": average}
+                sn = [2, 5, 6, 7, sn_size + 2]
+                data = HDFReadData(
+                    _bf,
+                    *brdchs[0],
+                    shotnum=sn,
+                    intersection_set=False,
+                    **kwargs,
+                    **extras,
+                )
+                ref = HDFReadData(
+                    _bf, *brdchs[0], shotnum=sn, intersection_set=False, **extras
+                )
+                self.assertTrue(
+                    allclose(
+                        data["signal"],
+                        boxcar(ref["signal"], average, window),
+                        equal_nan=True,
+                    )
+                )
+                ldata = HDFReadData(_bf, *brdchs[0], lazy=True, **kwargs, **extras)
+                self.assertTrue(
+                    allclose(ldata.signal[...], boxcar(full["signal"], average, window))
+                )
+                mdata = HDFReadData.from_channels(
+                    _bf, brdchs, config_name=config_name, digitizer=digi, **kwargs
+                )
+                mfull = HDFReadData.from_channels(
+                    _bf, brdchs, config_name=config_name, digitizer=digi
+                )
+                self.assertTrue(
+                    allclose(mdata["signal"], boxcar(mfull["signal"], average, window))
+                )
+                chunks = HDFReadData.iter_chunks(
+                    _bf, *brdchs[0], chunk_shots=7, **kwargs, **extras
+                )
+                self.assertTrue(
+                    allclose(
+                        np.concatenate([chunk["signal"] for chunk in chunks]),
+                        boxcar(full["signal"], average, window),
+                    )
+                )
+
+        # invalid `average`
+        for kwargs, err in (
+            ({"average": 2.0}, TypeError),
+            ({"average": True}, TypeError),
+            ({"average": 0}, ValueError),
+            ({"average": nt + 1}, ValueError),
+            ({"average": 2, "samples": slice(None, None, 2)}, ValueError),
+        ):
+            with self.subTest(**kwargs), self.assertRaises(err):
+                HDFReadData(_bf, *brdchs[0], **kwargs, **extras)
+
+    @with_bf
+    def test_kwarg_lazy(self, _bf: File):
+        """Test behavior of keyword `lazy`."""
+        # setup
+        sn_size = 50
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": sn_size, "nt": 1000})
+        self.f.add_module(
+            "6K Compumotor", {"n_configs": 1, "sn_size": sn_size, "n_motionlists": 1}
+        )
+        _mod = self.f.modules["SIS 3301"]
+        digi = "SIS 3301"
+        adc = "SIS 3301"
+        config_name = _mod.knobs.active_config[0]
+        bc_arr = np.zeros((13, 8), dtype=bool)
+        bc_arr[0, 0:2] = True
+        _mod.knobs.active_brdch = bc_arr
+        brdchs = [(0, 0), (0, 1)]
+        _bf._map_file()  # re-map file
+        sixk_cspec = self.f.modules["6K Compumotor"].config_names[0]
+        extras = {"config_name": config_name, "adc": adc, "digitizer": digi}
+
+        # lazy read matches an eager read
+        cases = [
+            {},
+            {"index": slice(3, 30, 2)},
+            {"shotnum": [5, 10, 11, 12, 40, sn_size + 5], "intersection_set": False},
+            {"keep_bits": True, "shotnum": slice(10, 30)},
+            {
+                "add_controls": [("6K Compumotor", sixk_cspec)],
+                "shotnum": slice(40, 60),
+                "intersection_set": False,
+            },
+        ]
+        for case in cases:
+            with self.subTest(**case):
+                data = HDFReadData(_bf, *brdchs[0], **case, **extras)
+                ldata = HDFReadData(_bf, *brdchs[0], lazy=True, **case, **extras)
+                self.assertIsInstance(ldata, HDFReadData)
+                self.assertNotIn("signal", ldata.dtype.names)
+                self.assertEqual(
+                    [name for name in data.dtype.names if name != "signal"],
+                    list(ldata.dtype.names),
+                )
+                for field in ldata.dtype.names:
+                    self.assertTrue(
+                        np.array_equal(ldata[field], data[field], equal_nan=True)
+                    )
+                self.assertEqual(ldata.info["signal units"], data.info["signal units"])
+
+                sig = ldata.signal
+                self.assertIsInstance(sig, HDFLazySignal)
+                self.assertEqual(sig.shape, data["signal"].shape)
+                self.assertEqual(sig.dtype, data["signal"].dtype)
+                self.assertTrue(np.array_equal(sig[...], data["signal"], equal_nan=True))
+                self.assertTrue(
+                    np.array_equal(sig[1:4, 10:20], data["signal"][1:4, 10:20])
+                )
+
+                # signal follows slicing/masking of the array
+                mask = data["shotnum"] % 2 == 0
+                self.assertTrue(
+                    np.array_equal(
+                        ldata[mask].signal[...], data["signal"][mask], equal_nan=True
+                    )
+                )
+                self.assertTrue(
+                    np.array_equal(
+                        ldata[::-3].signal[...], data["signal"][::-3], equal_nan=True
+                    )
+                )
+
+        # multi-channel lazy read
+        extras.pop("adc")
+        data = HDFReadData.from_channels(_bf, brdchs, **extras)
+        ldata = HDFReadData.from_channels(_bf, brdchs, lazy=True, **extras)
+        sig = ldata.signal
+        self.assertEqual(sig.shape, data["signal"].shape)
+        self.assertTrue(np.array_equal(sig[...], data["signal"]))
+        self.assertTrue(np.array_equal(sig[5:9, 1, :50], data["signal"][5:9, 1, :50]))
+
+        # eager reads return the 'signal' field
+        self.assertTrue(np.shares_memory(data.signal, data))
+
+    @with_bf
+    def test_kwarg_masked(self, _bf: File):
+        """Test behavior of keyword `masked`."""
+        # setup
+        sn_size = 50
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": sn_size, "nt": 100})
+        self.f.add_module(
+            "6K Compumotor", {"n_configs": 1, "sn_size": sn_size, "n_motionlists": 1}
+        )
+        _mod = self.f.modules["SIS 3301"]
+        digi = "SIS 3301"
+        config_name = _mod.knobs.active_config[0]
+        bc_arr = np.zeros((13, 8), dtype=bool)
+        bc_arr[0, 0:2] = True
+        _mod.knobs.active_brdch = bc_arr
+        brdchs = [(0, 0), (0, 1)]
+        _bf._map_file()  # re-map file
+        sixk_cspec = self.f.modules["6K Compumotor"].config_names[0]
+        controls = [("6K Compumotor", sixk_cspec)]
+        extras = {"config_name": config_name, "adc": digi, "digitizer": digi}
+
+        # masked union read matches a NULL filled union read
+        shotnum = np.arange(30, 91)
+        cases = [
+            {"shotnum": shotnum},
+            {"shotnum": shotnum, "keep_bits": True},
+            {"shotnum": shotnum, "add_controls": controls},
+            {"shotnum": slice(5, 20), "add_controls": controls},
+        ]
+        for case in cases:
+            with self.subTest(**case):
+                data = HDFReadData(
+                    _bf, *brdchs[0], intersection_set=False, **case, **extras
+                )
+                mdata = HDFReadData(
+                    _bf, *brdchs[0], intersection_set=False, masked=True, **case, **extras
+                )
+                recorded = data["shotnum"] <= sn_size
+                self.assertIsInstance(mdata, HDFReadData)
+                self.assertNotIn("signal", mdata.dtype.names)
+                self.assertTrue(np.array_equal(mdata["shotnum"], data["shotnum"]))
+                self.assertEqual(mdata.info["signal units"], data.info["signal units"])
+
+                # only the recorded shot numbers are stored
+                sig = mdata.signal
+                self.assertIsInstance(sig, HDFMaskedSignal)
+                self.assertEqual(sig.shape, data["signal"].shape)
+                self.assertEqual(sig.data.shape[0], np.count_nonzero(recorded))
+                self.assertTrue(np.array_equal(sig.valid, recorded))
+                self.assertTrue(np.array_equal(sig.data, data["signal"][recorded]))
+                arr = sig[...]
+                self.assertIsInstance(arr, np.ma.MaskedArray)
+                self.assertTrue(np.array_equal(arr.mask.any(axis=-1), ~recorded))
+                self.assertTrue(
+                    np.array_equal(sig.filled(), data["signal"], equal_nan=True)
+                )
+
+                # signal follows slicing/masking of the array
+                mask = data["shotnum"] % 2 == 0
+                self.assertTrue(
+                    np.array_equal(
+                        mdata[mask].signal.filled(), data["signal"][mask], equal_nan=True
+                    )
+                )
+
+                # control fields are zeroed for unrecorded shot numbers
+                if "add_controls" in case:
+                    self.assertTrue(np.array_equal(mdata["valid"][:, 0], recorded))
+                    self.assertTrue(
+                        np.array_equal(mdata["xyz"][recorded], data["xyz"][recorded])
+                    )
+                    self.assertTrue(np.all(mdata["xyz"][~recorded] == 0.0))
+
+        # multi-channel masked read
+        extras.pop("adc")
+        data = HDFReadData.from_channels(
+            _bf, brdchs, shotnum=shotnum, intersection_set=False, **extras
+        )
+        mdata = HDFReadData.from_channels(
+            _bf, brdchs, shotnum=shotnum, intersection_set=False, masked=True, **extras
+        )
+        sig = mdata.signal
+        self.assertEqual(sig.shape, data["signal"].shape)
+        self.assertEqual(sig.valid.shape, (shotnum.size, 2))
+        self.assertTrue(np.array_equal(sig.filled(), data["signal"], equal_nan=True))
+        self.assertTrue(
+            np.array_equal(
+                sig[5:9, 1, :50].filled(np.nan),
+                data["signal"][5:9, 1, :50],
+                equal_nan=True,
+            )
+        )
+
+        # chunked masked read
+        chunks = list(
+            HDFReadData.iter_chunks(
+                _bf,
+                *brdchs[0],
+                chunk_shots=25,
+                shotnum=shotnum,
+                intersection_set=False,
+                masked=True,
+                **extras,
+            )
+        )
+        self.assertTrue(
+            np.array_equal(
+                np.concatenate([chunk.signal.filled() for chunk in chunks]),
+                data["signal"][:, 0],
+                equal_nan=True,
+            )
+        )
+
+        # can not be combined with `lazy`
+        with self.assertRaises(ValueError):
+            HDFReadData(_bf, *brdchs[0], lazy=True, masked=True, **extras)
+
+    @with_bf
+    def test_unordered_shotnum(self, _bf: File):
+        """
+        Test reading a digitizer dataset whose shot numbers are not
+        increasing.
+        """
+        # setup
+        # - the header shot numbers are rolled, i.e. 48, 49, 50, 1, ...
+        sn_size = 50
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": sn_size, "nt": 100})
+        self.f.add_module(
+            "6K Compumotor", {"n_configs": 1, "sn_size": sn_size, "n_motionlists": 1}
+        )
+        _mod = self.f.modules["SIS 3301"]
+        config_name = _mod.knobs.active_config[0]
+        bc_arr = np.zeros((13, 8), dtype=bool)
+        bc_arr[0, 0:2] = True
+        _mod.knobs.active_brdch = bc_arr
+        dsets = []
+        for ch in range(2):
+            dset_path = f"Raw data + config/SIS 3301/{config_name} [0:{ch}]"
+            dheader = self.f[f"{dset_path} headers"]
+            arr = dheader[...]
+            arr["Shot"] = np.roll(arr["Shot"], 3)
+            dheader[...] = arr
+            dsets.append(self.f[dset_path][...])
+        _bf._map_file()  # re-map file
+        dset_sn = np.roll(np.arange(1, sn_size + 1), 3)
+        sixk_cspec = self.f.modules["6K Compumotor"].config_names[0]
+        controls = [("6K Compumotor", sixk_cspec)]
+        extras = {
+            "config_name": config_name,
+            "adc": "SIS 3301",
+            "digitizer": "SIS 3301",
+            "keep_bits": True,
+        }
+
+        def assertSignal(data, channels=(0,)):
+            sn = data["shotnum"]
+            rows = np.array([np.flatnonzero(dset_sn == s)[0] for s in sn])
+            for ii, ch in enumerate(channels):
+                signal = data.signal if len(channels) == 1 else data.signal[:, ii, :]
+                self.assertTrue(np.array_equal(signal, dsets[ch][rows]))
+
+        shotnum = [1, 2, 3, 10, 49, 50]
+        cdata = _bf.read_controls(controls, shotnum=shotnum)
+        cases = [
+            {"shotnum": shotnum},
+            {"shotnum": shotnum, "lazy": True},
+            {"shotnum": shotnum, "add_controls": controls},
+        ]
+        for case in cases:
+            with self.subTest(case=case):
+                data = _bf.read_data(0, 0, **case, **extras)
+                self.assertTrue(np.array_equal(data["shotnum"], shotnum))
+                assertSignal(data)
+                if "add_controls" in case:
+                    self.assertTrue(np.array_equal(data["xyz"], cdata["xyz"]))
+
+        # multi-channel and masked union reads
+        data = _bf.read_channels([(0, 0), (0, 1)], shotnum=shotnum, **extras)
+        assertSignal(data, channels=(0, 1))
+        data = _bf.read_data(
+            0, 0, shotnum=shotnum + [60], intersection_set=False, masked=True, **extras
+        )
+        self.assertTrue(np.array_equal(data.signal.valid, [True] * 6 + [False]))
+        rows = [np.flatnonzero(dset_sn == s)[0] for s in shotnum]
+        self.assertTrue(np.array_equal(data.signal.data, dsets[0][rows]))
+
+        # an `index` read keeps the row order and aligns the controls
+        # by shot number
+        cdata = _bf.read_controls(controls)
+        for case in ({}, {"index": [0, 1, 2, 3, 40]}):
+            with self.subTest(case=case):
+                data = _bf.read_data(0, 0, add_controls=controls, **case, **extras)
+                index = case.get("index", slice(None))
+                self.assertTrue(np.array_equal(data["shotnum"], dset_sn[index]))
+                assertSignal(data)
+                self.assertTrue(
+                    np.array_equal(data["xyz"], cdata["xyz"][data["shotnum"] - 1])
+                )
+
+    @with_bf
+    def test_kwarg_out(self, _bf: File):
+        """Test behavior of keyword `out`."""
+        # setup
+        sn_size = 50
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": sn_size, "nt": 1000})
+        self.f.add_module(
+            "6K Compumotor", {"n_configs": 1, "sn_size": sn_size, "n_motionlists": 1}
+        )
+        _mod = self.f.modules["SIS 3301"]
+        config_name = _mod.knobs.active_config[0]
+        bc_arr = _mod.knobs.active_brdch
+        bc_indices = np.where(bc_arr)
+        brd = bc_indices[0][0]
+        ch = bc_indices[1][0]
+        _bf._map_file()  # re-map file
+        sixk_cspec = self.f.modules["6K Compumotor"].config_names[0]
+        extras = {
+            "config_name": config_name,
+            "adc": "SIS 3301",
+            "digitizer": "SIS 3301",
+            "add_controls": [("6K Compumotor", sixk_cspec)],
+        }
+
+        # -- `out` is an array                                      ----
+        data = HDFReadData(_bf, brd, ch, shotnum=slice(5, 25), **extras)
+        out = np.zeros(data.shape, dtype=data.dtype)
+        odata = HDFReadData(_bf, brd, ch, shotnum=slice(5, 25), out=out, **extras)
+        self.assertIsInstance(odata, HDFReadData)
+        self.assertTrue(np.shares_memory(odata, out))
+        for field in data.dtype.names:
+            self.assertTrue(np.array_equal(odata[field], data[field], equal_nan=True))
+        self.assertEqual(odata.info["signal units"], data.info["signal units"])
+
+        # a previously returned array can be re-used
+        odata2 = HDFReadData(_bf, brd, ch, shotnum=slice(25, 45), out=odata, **extras)
+        self.assertTrue(np.shares_memory(odata2, out))
+        self.assertTrue(np.array_equal(out["shotnum"], np.arange(25, 45)))
+
+        # wrong shape, dtype, or type
+        for bad_out, err in (
+            (np.zeros(19, dtype=data.dtype), ValueError),
+            (np.zeros(20, dtype=np.float32), ValueError),
+            ("not an array", TypeError),
+        ):
+            with self.subTest(out=bad_out), self.assertRaises(err):
+                HDFReadData(_bf, brd, ch, shotnum=slice(5, 25), out=bad_out, **extras)
+
+        # -- `out` is a BufferPool                                  ----
+        pool = BufferPool(size=2)
+        reads = [
+            HDFReadData(
+                _bf, brd, ch, shotnum=slice(start, start + 10), out=pool, **extras
+            )
+            for start in (1, 11, 21)
+        ]
+        self.assertEqual(len(pool), 2)
+        self.assertTrue(np.shares_memory(reads[0], reads[2]))
+        self.assertFalse(np.shares_memory(reads[1], reads[2]))
+        self.assertTrue(np.array_equal(reads[2]["shotnum"], np.arange(21, 31)))
+
+        # blocks of iter_chunks
+        pool = BufferPool(size=1)
+        chunks = []
+        for chunk in HDFReadData.iter_chunks(
+            _bf, brd, ch, chunk_shots=10, shotnum=slice(1, 46), out=pool, **extras
+        ):
+            self.assertEqual(chunk["shotnum"][0], 1 + 10 * len(chunks))
+            chunks.append(chunk)
+        self.assertEqual(len(pool), 2)  # one 10-shot and one 5-shot buffer
+        self.assertTrue(all(np.shares_memory(chunks[0], chunk) for chunk in chunks[1:-1]))
+        with self.assertRaises(TypeError):
+            next(HDFReadData.iter_chunks(_bf, brd, ch, out=out, **extras))
+
+    @with_bf
+    def test_memory_peak(self, _bf: File):
+        """The volt conversion does not create full-size temporaries."""
+        sn_size = 200
+        nt = 10000
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": sn_size, "nt": nt})
+        _mod = self.f.modules["SIS 3301"]
+        config_name = _mod.knobs.active_config[0]
+        bc_indices = np.where(_mod.knobs.active_brdch)
+        brd = bc_indices[0][0]
+        ch = bc_indices[1][0]
+        _bf._map_file()  # re-map file
+
+        signal_nbytes = sn_size * nt * np.dtype(np.float32).itemsize
+        tracemalloc.start()
+        try:
+            data = HDFReadData(_bf, brd, ch, config_name=config_name)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(data["signal"].nbytes, signal_nbytes)
+        self.assertLess(peak, 2 * signal_nbytes)
+
+        # an averaged read never holds the full-rate signal
+        # - scratch buffer limited to 20 rows
+        with mock.patch("bapsflib._hdf.utils.helpers._SCRATCH_NBYTES", 20 * nt * 2):
+            tracemalloc.start()
+            try:
+                data = HDFReadData(_bf, brd, ch, config_name=config_name, average=10)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        self.assertEqual(data["signal"].nbytes, signal_nbytes // 10)
+        self.assertLess(peak, signal_nbytes // 4)
+
     @with_bf
     def test_misc_behavior(self, _bf: File):
         """Test miscellaneous behavior"""
@@ -1008,14 +1970,14 @@ class TestHDFReadData(TestBase):
         "bapsflib._hdf.utils.hdfreaddata.condition_shotnum", side_effect=condition_shotnum
     )
     @mock.patch(
-        "bapsflib._hdf.utils.hdfreaddata.build_sndr_for_simple_dset",
-        side_effect=build_sndr_for_simple_dset,
+        "bapsflib._hdf.utils.hdfreaddata.get_shotnum_resolver",
+        side_effect=get_shotnum_resolver,
     )
     @mock.patch(
-        "bapsflib._hdf.utils.hdfreaddata.do_shotnum_intersection",
-        side_effect=do_shotnum_intersection,
+        "bapsflib._hdf.utils.hdfreaddata.intersect_shotnum",
+        side_effect=intersect_shotnum,
     )
-    def test_read_w_shotnum(self, _bf: File, mock_inter, mock_build_sndr, mock_cs):
+    def test_read_w_shotnum(self, _bf: File, mock_inter, mock_get_resolver, mock_cs):
         """Test reading data using `index` keyword."""
         # setup
         sn_size = 50
@@ -1038,8 +2000,8 @@ class TestHDFReadData(TestBase):
 
         # -- examine the various `shotnum` types                    ----
         # Note: relying on test for `condition_shotnum`,
-        #       `build_sndr_for_simple_dset`, and
-        #       `do_shotnum_intersection` for detailed behavior and
+        #       `get_shotnum_resolver`, and
+        #       `intersect_shotnum` for detailed behavior and
         #       testing
         #
         # `shotnum` is an int
@@ -1057,10 +2019,10 @@ class TestHDFReadData(TestBase):
         self.assertDataObj(data, _bf)
         self.assertTrue(np.array_equiv(data["shotnum"], np.array([5], dtype=np.uint32)))
         self.assertDataArrayValues(data, dset, indices)
-        self.assertTrue(mock_build_sndr.called)
+        self.assertTrue(mock_get_resolver.called)
         self.assertTrue(mock_cs.called)
         self.assertTrue(mock_inter.called)
-        mock_build_sndr.reset_mock()
+        mock_get_resolver.reset_mock()
         mock_cs.reset_mock()
         mock_inter.reset_mock()
 
@@ -1079,10 +2041,10 @@ class TestHDFReadData(TestBase):
         self.assertDataObj(data, _bf)
         self.assertTrue(np.array_equal(data["shotnum"], np.array([50], dtype=np.uint32)))
         self.assertDataArrayValues(data, dset, indices)
-        self.assertTrue(mock_build_sndr.called)
+        self.assertTrue(mock_get_resolver.called)
         self.assertTrue(mock_cs.called)
         self.assertTrue(mock_inter.called)
-        mock_build_sndr.reset_mock()
+        mock_get_resolver.reset_mock()
         mock_cs.reset_mock()
         mock_inter.reset_mock()
 
@@ -1103,10 +2065,10 @@ class TestHDFReadData(TestBase):
             np.array_equal(data["shotnum"], np.array([5, 7, 9], dtype=np.uint32))
         )
         self.assertDataArrayValues(data, dset, indices)
-        self.assertTrue(mock_build_sndr.called)
+        self.assertTrue(mock_get_resolver.called)
         self.assertTrue(mock_cs.called)
         self.assertTrue(mock_inter.called)
-        mock_build_sndr.reset_mock()
+        mock_get_resolver.reset_mock()
         mock_cs.reset_mock()
         mock_inter.reset_mock()
 
@@ -1127,10 +2089,10 @@ class TestHDFReadData(TestBase):
             np.array_equal(data["shotnum"], np.arange(1, 10, 3, dtype=np.uint32))
         )
         self.assertDataArrayValues(data, dset, indices)
-        self.assertTrue(mock_build_sndr.called)
+        self.assertTrue(mock_get_resolver.called)
         self.assertTrue(mock_cs.called)
         self.assertTrue(mock_inter.called)
-        mock_build_sndr.reset_mock()
+        mock_get_resolver.reset_mock()
         mock_cs.reset_mock()
         mock_inter.reset_mock()
 
@@ -1210,6 +2172,8 @@ class TestHDFReadData(TestBase):
             "port",
             "probe name",
             "sample average",
+            "sample start",
+            "sample step",
             "shot average",
             "signal units",
             "source file",
@@ -1220,9 +2184,9 @@ class TestHDFReadData(TestBase):
 
             if key == "source file":
                 self.assertEqual(data.info[key], os.path.abspath(_bf.filename))
-            elif key in ("bit", "sample average", "shot average"):
+            elif key in ("bit", "sample average", "shot average", "sample step"):
                 self.assertIsInstance(data.info[key], (type(None), int, np.integer))
-            elif key in ("board", "channel"):
+            elif key in ("board", "channel", "sample start"):
                 self.assertIsInstance(data.info[key], (int, np.integer))
             elif key in (
                 "adc",
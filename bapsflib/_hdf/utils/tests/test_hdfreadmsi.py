@@ -11,12 +11,17 @@
 # License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
 #   license terms and contributor agreement.
 #
+import astropy.units as u
 import numpy as np
 import os
 import unittest as ut
 
+from unittest import mock
+
 from bapsflib._hdf.utils.file import File
 from bapsflib._hdf.utils.hdfreadmsi import HDFReadMSI
+from bapsflib._hdf.utils.helpers import _direct_mspace, reduce_dset_rows
+from bapsflib._hdf.utils.reductioncache import ReductionCache
 from bapsflib._hdf.utils.tests import TestBase
 from bapsflib.utils.decorators import with_bf
 
@@ -111,7 +116,191 @@ class TestHDFReadMSI(TestBase):
         )
         _bf._map_file()  # re-map file
         _map = _bf.file_map.msi["Interferometer array"]
-        self.assertDataObj(self.read(_bf, "Interferometer array"), _bf, _map)
+        data = self.read(_bf, "Interferometer array")
+        self.assertDataObj(data, _bf, _map)
+
+        # the dtype is packed
+        # - signal slots at offsets HDF5 can not address are read
+        #   through the scratch buffer, the compound 'meta' fields are
+        #   read directly into their slots
+        self.assertFalse(data.dtype.isalignedstruct)
+        self.assertEqual(
+            data.dtype.itemsize,
+            sum(data.dtype[name].itemsize for name in data.dtype.names),
+        )
+        for field in _map.configs["signals"]:
+            for ii, path in enumerate(_map.configs["signals"][field]["dset paths"]):
+                self.assertIsNone(_direct_mspace(data[field][:, ii, ...]))
+                self.assertTrue(np.array_equal(data[field][:, ii, ...], _bf[path][...]))
+        for field, config in _map.configs["meta"].items():
+            if field == "shape":
+                continue
+            dset_field = config["dset field"][0]
+            for ii, path in enumerate(config["dset paths"]):
+                self.assertIsNotNone(
+                    _direct_mspace(data["meta"][field][:, ii], dset_field)
+                )
+                self.assertTrue(
+                    np.array_equal(data["meta"][field][:, ii], _bf[path][dset_field])
+                )
+
+    @with_bf
+    def test_read_selection(self, _bf: File):
+        """Test keywords `index` and `shotnum`."""
+        # Using 'Interferometer array' as a test case
+        # - rebuild the datasets with 30 shot numbers (with a gap)
+        self.f.add_module("Interferometer array")
+        sn_arr = np.concatenate((np.arange(1, 10), np.arange(15, 36)))
+        n_inter = self.f["MSI/Interferometer array"].attrs["Interferometer count"]
+        for ii in range(n_inter):
+            gpath = f"/MSI/Interferometer array/Interferometer [{ii}]"
+            for name in ("Interferometer summary list", "Interferometer trace"):
+                dset = self.f[f"{gpath}/{name}"]
+                arr = np.resize(dset[...], (sn_arr.size,) + dset.shape[1:])
+                if name == "Interferometer trace":
+                    arr = np.arange(arr.size, dtype=arr.dtype).reshape(arr.shape) + ii
+                else:
+                    arr["Shot number"] = sn_arr
+                    arr["Peak density"] = np.arange(sn_arr.size) + 10 * ii
+                del self.f[f"{gpath}/{name}"]
+                self.f.create_dataset(f"{gpath}/{name}", data=arr)
+        _bf._map_file()  # re-map file
+        data = _bf.read_msi("Interferometer array")
+        self.assertTrue(np.array_equal(data["shotnum"], sn_arr))
+
+        # rows selected with `index`
+        for index, rows in (
+            (3, [3]),
+            ([-1, 0, 5, 5], [0, 5, sn_arr.size - 1]),
+            (slice(2, 20, 3), list(range(2, 20, 3))),
+            (np.array([1, 2]), [1, 2]),
+        ):
+            with self.subTest(index=index):
+                sdata = _bf.read_msi("Interferometer array", index=index)
+                self.assertIsInstance(sdata, HDFReadMSI)
+                self.assertTrue(np.array_equal(sdata, data[rows]))
+                self.assertEqual(sdata.info, data.info)
+
+        # rows selected with `shotnum`
+        for shotnum in (
+            5,
+            [8, 9, 10, 30, 100],
+            slice(12, 20),
+            np.array([1, 35]),
+        ):
+            with self.subTest(shotnum=shotnum):
+                sdata = _bf.read_msi("Interferometer array", shotnum=shotnum)
+                rows = np.isin(sn_arr, np.arange(101)[shotnum])
+                self.assertTrue(np.array_equal(sdata, data[rows]))
+
+        # `index` takes precedence
+        sdata = _bf.read_msi("Interferometer array", index=2, shotnum=[1, 2])
+        self.assertTrue(np.array_equal(sdata, data[[2]]))
+
+        # no recorded shot numbers
+        with self.assertRaises(ValueError):
+            _bf.read_msi("Interferometer array", shotnum=[10, 11])
+        with self.assertRaises(ValueError):
+            _bf.read_msi("Interferometer array", shotnum=0)
+
+        # invalid `index`
+        with self.assertRaises(TypeError):
+            _bf.read_msi("Interferometer array", index="1")
+
+    @with_bf
+    def test_read_reduce(self, _bf: File):
+        """Test keyword `reduce`."""
+        # Using 'Discharge' as a test case
+        self.f.add_module("Discharge")
+        _bf._map_file()  # re-map file
+        data = _bf.read_msi("Discharge")
+        sig_fields = [
+            name for name in data.dtype.names if name not in ("shotnum", "meta")
+        ]
+
+        for reduce, func in (("max", np.max), ("mean", np.mean), (np.ptp, np.ptp)):
+            with self.subTest(reduce=reduce):
+                rdata = _bf.read_msi("Discharge", reduce=reduce)
+                self.assertTrue(np.array_equal(rdata["shotnum"], data["shotnum"]))
+                self.assertTrue(np.array_equal(rdata["meta"], data["meta"]))
+                for name in sig_fields:
+                    self.assertEqual(rdata.dtype[name], np.float64)
+                    self.assertTrue(np.allclose(rdata[name], func(data[name], axis=-1)))
+
+        # reduction combined with a shot number selection
+        shotnum = int(data["shotnum"][-1])
+        rdata = _bf.read_msi("Discharge", shotnum=shotnum, reduce="min")
+        self.assertTrue(np.array_equal(rdata["shotnum"], [shotnum]))
+        for name in sig_fields:
+            self.assertTrue(np.allclose(rdata[name], np.min(data[name][-1:], axis=-1)))
+
+        # 'integral' is w.r.t. time (in seconds)
+        dt = data.info["dt"][0]
+        trapz = getattr(np, "trapezoid", None) or np.trapz
+        rdata = _bf.read_msi("Discharge", reduce="integral")
+        for name in sig_fields:
+            self.assertTrue(np.allclose(rdata[name], trapz(data[name], dx=dt, axis=-1)))
+
+        # named reductions are cached on the file
+        # - the faux file is held open writable by the builder, so
+        #   caching is only enabled by patching
+        _bf.reduction_cache.clear()
+        _bf.read_msi("Discharge", reduce="max")
+        self.assertEqual(len(_bf.reduction_cache), 0)
+        with mock.patch(
+            "bapsflib._hdf.utils.hdfreadmsi.reduce_dset_rows", wraps=reduce_dset_rows
+        ) as mock_reduce, mock.patch.object(
+            ReductionCache, "_cacheable", return_value=True
+        ):
+            rdata = _bf.read_msi("Discharge", reduce="max")
+            self.assertEqual(mock_reduce.call_count, len(sig_fields))
+            self.assertEqual(len(_bf.reduction_cache), len(sig_fields))
+
+            mock_reduce.reset_mock()
+            rdata2 = _bf.read_msi("Discharge", reduce="max")
+            self.assertFalse(mock_reduce.called)
+            self.assertTrue(np.array_equal(rdata, rdata2))
+
+            # a callable is not cached
+            _bf.read_msi("Discharge", reduce=np.max)
+            self.assertEqual(mock_reduce.call_count, len(sig_fields))
+
+        # reduction of a time window
+        for samples, window in (
+            (slice(10, 50), slice(10, 50)),
+            (slice(10, 50, 4), slice(10, 50, 4)),
+            (slice(10 * dt * u.s, 50 * dt * u.s), slice(10, 50)),
+        ):
+            with self.subTest(samples=samples):
+                rdata = _bf.read_msi("Discharge", reduce="max", samples=samples)
+                for name in sig_fields:
+                    self.assertTrue(
+                        np.allclose(rdata[name], np.max(data[name][:, window], axis=-1))
+                    )
+
+                # `samples` without a reduction only reads the window
+                wdata = _bf.read_msi("Discharge", samples=samples)
+                for name in sig_fields:
+                    self.assertTrue(np.array_equal(wdata[name], data[name][:, window]))
+                self.assertTrue(np.array_equal(wdata["meta"], data["meta"]))
+
+        rdata = _bf.read_msi("Discharge", reduce="integral", samples=slice(0, 50, 2))
+        for name in sig_fields:
+            self.assertTrue(
+                np.allclose(rdata[name], trapz(data[name][:, 0:50:2], dx=2 * dt, axis=-1))
+            )
+
+        # invalid `samples`
+        with self.assertRaises(TypeError):
+            _bf.read_msi("Discharge", samples=5)
+        with self.assertRaises(ValueError):
+            _bf.read_msi("Discharge", samples=slice(10, 10))
+
+        # invalid reductions
+        with self.assertRaises(TypeError):
+            _bf.read_msi("Discharge", reduce=5)
+        with self.assertRaises(ValueError):
+            _bf.read_msi("Discharge", reduce="average")
 
     def assertDataObj(self, _data: HDFReadMSI, _bf, _map):
         # data is a structured numpy array
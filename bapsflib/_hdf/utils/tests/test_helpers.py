@@ -11,19 +11,32 @@
 # License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
 #   license terms and contributor agreement.
 #
+import h5py
+import itertools
 import numpy as np
+import pickle
 import unittest as ut
 
 from numpy.lib import recfunctions as rfn
+from unittest import mock
 
 from bapsflib._hdf.maps.controls.waveform import HDFMapControlWaveform
 from bapsflib._hdf.utils.file import File
 from bapsflib._hdf.utils.helpers import (
+    _direct_mspace,
     build_shotnum_dset_relation,
     condition_controls,
+    condition_msi,
     condition_shotnum,
     do_shotnum_intersection,
+    get_shotnum_resolver,
+    intersect_shotnum,
+    read_dset_rows,
+    reduce_dset_rows,
 )
+from bapsflib._hdf.utils.shotnumindex import ShotNumIndex
+from bapsflib._hdf.utils.shotnumresolver import ShotNumResolver, ShotNumResolvers
+from bapsflib._hdf.utils.shotset import ShotSet
 from bapsflib._hdf.utils.tests import TestBase
 from bapsflib.utils import _bytes_to_str
 from bapsflib.utils.decorators import with_bf
@@ -125,6 +138,56 @@ class TestBuildShotnumDsetRelation(TestBase):
                 np.empty(5, dtype=np.uint32), cdset, "Shot number", self.map, "config01"
             )
 
+    def test_config_resolvers(self):
+        """
+        Test the configuration rows of a complex dataset found by the
+        control mapping.
+        """
+        self.mod.knobs.n_configs = 3
+        self.mod.knobs.sn_size = 10
+        _map = self.map
+        cdset = self.cgroup["Run time list"]
+        keys = ("Shot number", "Configuration name")
+        resolvers = ShotNumResolvers.of_map(_map)
+        self.assertIs(ShotNumResolvers.of_map(_map), resolvers)
+
+        resolver = resolvers.get_resolver(cdset, *keys, config_name="config02")
+        self.assertTrue(np.array_equal(resolver.shotnum, np.arange(1, 11)))
+        self.assertTrue(np.array_equal(resolver.rows, np.arange(1, 30, 3)))
+        self.assertTrue(resolver.contiguous)
+
+        # all configurations are found with one scan
+        self.assertEqual(len(resolvers), 1)
+        self.assertIs(
+            resolvers.get_resolver(cdset, *keys, config_name="config02"), resolver
+        )
+        resolver = resolvers.get_resolver(cdset, *keys, config_name="config03")
+        self.assertTrue(np.array_equal(resolver.rows, np.arange(2, 30, 3)))
+        self.assertEqual(len(resolvers), 1)
+
+        # unknown configuration
+        resolver = resolvers.get_resolver(cdset, *keys, config_name="config09")
+        self.assertEqual(len(resolver), 0)
+        with self.assertRaises(ValueError):
+            build_shotnum_dset_relation(
+                np.array([1, 2], dtype=np.uint32), cdset, keys[0], _map, "config09"
+            )
+
+        # the resolvers are shared with get_shotnum_resolver
+        resolver = get_shotnum_resolver(cdset, keys[0], cmap=_map, cconfn="config03")
+        self.assertIs(
+            resolver, resolvers.get_resolver(cdset, *keys, config_name="config03")
+        )
+        self.assertEqual(resolver.shotset, ShotSet.from_range(1, 11))
+        with self.assertRaises(ValueError):
+            get_shotnum_resolver(cdset, keys[0], cmap=_map, cconfn="config09")
+
+        # found rows are not kept by (or pickled with) the mapping
+        self.assertNotIn(resolvers, vars(_map).values())
+        self.assertEqual(
+            len(ShotNumResolvers.of_map(pickle.loads(pickle.dumps(_map)))), 0
+        )
+
     def assertInRangeSN(self):
         """
         Assert shot numbers cases with in-range of dataset shot numbers.
@@ -156,6 +219,7 @@ class TestBuildShotnumDsetRelation(TestBase):
                 self.assertSNSuite(
                     sn_arr, index, sni, cdset, shotnumkey, configkey, cconfn
                 )
+                self.assertSNIndex(sn_arr, index, sni, cdset, shotnumkey, cconfn)
 
     def assertOutRangeSN(self):
         """
@@ -194,6 +258,22 @@ class TestBuildShotnumDsetRelation(TestBase):
                 self.assertSNSuite(
                     sn_arr, index, sni, cdset, shotnumkey, configkey, cconfn
                 )
+                self.assertSNIndex(sn_arr, index, sni, cdset, shotnumkey, cconfn)
+
+    def assertSNIndex(self, shotnum, index, sni, cdset, shotnumkey, cconfn):
+        """
+        Assert a :class:`ShotNumIndex` gives the same relation as reading
+        the dataset.
+        """
+        sn_index = ShotNumIndex(self.filename)
+        for _ in range(2):
+            # 1st builds the index entry, 2nd uses it
+            _index, _sni = build_shotnum_dset_relation(
+                shotnum, cdset, shotnumkey, self.map, cconfn, sn_index=sn_index
+            )
+            self.assertTrue(np.array_equal(_index, index))
+            self.assertTrue(np.array_equal(_sni, sni))
+        self.assertEqual(len(sn_index), 1)
 
     def assertSNSuite(self, shotnum, index, sni, cdset, shotnumkey, configkey, cconfn):
         """Suite of assertions for shot number conditioning"""
@@ -524,6 +604,65 @@ class TestConditionControls(TestBase):
         )
 
 
+class TestConditionMSI(TestBase):
+    """Test Case for condition_msi"""
+
+    def setUp(self):
+        # setup HDF5 file
+        super().setUp()
+        self.f.add_module("Discharge")
+        self.f.add_module("Magnetic field")
+
+    def tearDown(self):
+        super().tearDown()
+
+    @with_bf
+    def test_input_failures(self, _bf: File):
+        """Test input failures of `msi`"""
+        # `msi` is Null
+        self.assertRaises(ValueError, condition_msi, _bf, [])
+
+        # `msi` is not a string or Iterable
+        self.assertRaises(TypeError, condition_msi, _bf, True)
+
+        # `msi` element is not a str or tuple
+        self.assertRaises(TypeError, condition_msi, _bf, ["Discharge", 8])
+
+        # `msi` tuple element has length > 2
+        self.assertRaises(ValueError, condition_msi, _bf, [("Discharge", "max", "min")])
+
+        # unknown diagnostic
+        self.assertRaises(ValueError, condition_msi, _bf, ["Not a diagnostic"])
+
+        # invalid reduction
+        self.assertRaises(ValueError, condition_msi, _bf, [("Discharge", "average")])
+        self.assertRaises(TypeError, condition_msi, _bf, [("Discharge", 5)])
+
+        # diagnostic specified twice (also through an alias)
+        self.assertRaises(ValueError, condition_msi, _bf, ["Discharge", "Discharge"])
+        self.assertRaises(
+            ValueError, condition_msi, _bf, ["Discharge", ("discharge", "max")]
+        )
+
+    @with_bf
+    def test_conditioning(self, _bf: File):
+        """Test `msi` conditioning."""
+        for msi, expected in (
+            ("Discharge", [("Discharge", None)]),
+            ("discharge", [("Discharge", None)]),
+            (["Discharge"], [("Discharge", None)]),
+            ([("Discharge",)], [("Discharge", None)]),
+            ([("Discharge", "max")], [("Discharge", "max")]),
+            (
+                ["Discharge", ("bfield", "mean")],
+                [("Discharge", None), ("Magnetic field", "mean")],
+            ),
+            ([("Discharge", np.ptp)], [("Discharge", np.ptp)]),
+        ):
+            with self.subTest(msi=msi):
+                self.assertEqual(condition_msi(_bf, msi), expected)
+
+
 class TestConditionShotnum(TestBase):
     """Test Case for condition_shotnum"""
 
@@ -646,6 +785,36 @@ class TestConditionShotnum(TestBase):
             self.assertIsInstance(_sn, np.ndarray)
             self.assertTrue(np.array_equal(_sn, ex_sn))
 
+    def test_shotnum_shotset(self):
+        # shotnum would result in NULL
+        for shotnum in (ShotSet(), ShotSet([-5, 0])):
+            with self.assertRaises(ValueError):
+                _sn = condition_shotnum(shotnum, {}, {})
+
+        # shotnum valid
+        sn = [
+            (ShotSet.from_range(1, 5), np.array([1, 2, 3, 4], np.uint32)),
+            (ShotSet.from_ranges([-2, 8], [3, 10]), np.array([1, 2, 8, 9], np.uint32)),
+            (ShotSet([30, 20]), np.array([20, 30], np.uint32)),
+        ]
+        for shotnum, ex_sn in sn:
+            _sn = condition_shotnum(shotnum, {}, {})
+
+            self.assertIsInstance(_sn, np.ndarray)
+            self.assertEqual(_sn.dtype, np.uint32)
+            self.assertTrue(np.array_equal(_sn, ex_sn))
+
+        # inputs are not modified
+        shotnum = np.array([5, 2, 3], np.int32)
+        condition_shotnum(shotnum, {}, {})
+        self.assertTrue(np.array_equal(shotnum, [5, 2, 3]))
+
+        # the conditioned ShotSet is not expanded
+        _sn = condition_shotnum(slice(0, 1000001), {}, {}, as_shotset=True)
+        self.assertIsInstance(_sn, ShotSet)
+        self.assertEqual(_sn, ShotSet.from_range(1, 1000001))
+        self.assertFalse(_sn.dense)
+
     def test_shotnum_invalid(self):
         # shotnum not int, List[int], slice, or ndarray
         sn = [1.5, None, True, {}]
@@ -712,5 +881,364 @@ class TestDoShotnumIntersection(ut.TestCase):
             self.assertTrue(np.array_equal(index_dict[key], [5, 6]))
 
 
+class TestIntersectShotnum(ut.TestCase):
+    """Test Case for intersect_shotnum"""
+
+    def test_intersection(self):
+        resolver_dict = {
+            "Waveform": ShotNumResolver(np.arange(1, 101, dtype=np.uint32)),
+            "6K Compumotor": ShotNumResolver(
+                np.array([50, 40, 60, 52, 51, 53, 70], dtype=np.uint32)
+            ),
+        }
+
+        # null result
+        with self.assertRaises(ValueError):
+            intersect_shotnum(ShotSet.from_range(101, 200), resolver_dict)
+
+        # working case
+        shotnum, sni_dict, index_dict = intersect_shotnum(
+            ShotSet.from_range(45, 1000001), resolver_dict
+        )
+        self.assertEqual(shotnum.dtype, np.uint32)
+        self.assertTrue(np.array_equal(shotnum, [50, 51, 52, 53, 60, 70]))
+        for key, resolver in resolver_dict.items():
+            with self.subTest(key=key):
+                self.assertTrue(np.array_equal(sni_dict[key], [True] * 6))
+                self.assertTrue(
+                    np.array_equal(resolver.shotnum[index_dict[key]], shotnum)
+                )
+
+        # only the intersected shot numbers are resolved
+        with mock.patch.object(
+            ShotNumResolver, "resolve", autospec=True, side_effect=ShotNumResolver.resolve
+        ) as mock_resolve:
+            shotnum, sni_dict, index_dict = intersect_shotnum(
+                ShotSet.from_range(1, 1000001), resolver_dict
+            )
+            for call in mock_resolve.call_args_list:
+                self.assertEqual(call.args[1].size, 7)
+
+
+class TestReadDsetRows(ut.TestCase):
+    """Test Case for read_dset_rows"""
+
+    def setUp(self):
+        # in-memory HDF5 file with a 2D dataset and a compound dataset
+        self.f = h5py.File("rows.hdf5", "w", driver="core", backing_store=False)
+        self.dset = self.f.create_dataset(
+            "signal", data=np.arange(100 * 8, dtype=np.int16).reshape(100, 8)
+        )
+        cdata = np.zeros(
+            100, dtype=[("Shot", np.uint32), ("x", np.float64), ("v", np.int32, (2,))]
+        )
+        cdata["Shot"] = np.arange(1, 101)
+        cdata["x"] = np.linspace(-5.0, 5.0, 100)
+        cdata["v"][:, 0] = np.arange(100)
+        cdata["v"][:, 1] = -np.arange(100)
+        self.cdset = self.f.create_dataset("control", data=cdata)
+
+    def tearDown(self):
+        self.f.close()
+
+    def test_read(self):
+        """Results match h5py fancy indexing"""
+        indices = [
+            [5],
+            [0, 1, 2, 3],
+            [0, 99],
+            [3, 4, 5, 20, 21, 60, 98, 99],
+            list(range(0, 100, 2)),
+            np.arange(10, 90, dtype=np.uint32),
+            np.unique(np.random.default_rng(0).integers(0, 100, 60)),
+        ]
+        for index in indices:
+            with self.subTest(index=index):
+                ilist = list(np.asarray(index).tolist())
+                data = read_dset_rows(self.dset, index)
+                self.assertEqual(data.dtype, self.dset.dtype)
+                self.assertTrue(np.array_equal(data, self.dset[ilist, ...]))
+                for field in self.cdset.dtype.names:
+                    data = read_dset_rows(self.cdset, index, field)
+                    self.assertEqual(data.dtype, self.cdset.dtype[field].base)
+                    self.assertTrue(np.array_equal(data, self.cdset[ilist, field]))
+
+                # all fields of a compound dataset
+                data = read_dset_rows(self.cdset, index)
+                self.assertTrue(np.array_equal(data, self.cdset[ilist]))
+
+                # several fields in one pass
+                data = read_dset_rows(self.cdset, index, ["v", "x"])
+                self.assertEqual(data.dtype.names, ("v", "x"))
+                for field in ("v", "x"):
+                    self.assertTrue(np.array_equal(data[field], self.cdset[ilist, field]))
+
+        # empty index
+        data = read_dset_rows(self.dset, [])
+        self.assertEqual(data.shape, (0, 8))
+        data = read_dset_rows(self.cdset, np.array([], dtype=int), "v")
+        self.assertEqual(data.shape, (0, 2))
+        data = read_dset_rows(self.cdset, [], ["Shot", "x"])
+        self.assertEqual(data.shape, (0,))
+        self.assertEqual(data.dtype.names, ("Shot", "x"))
+
+        # missing fields
+        with self.assertRaises(ValueError):
+            read_dset_rows(self.cdset, [0, 1], ["x", "y"])
+        with self.assertRaises(ValueError):
+            read_dset_rows(self.dset, [0, 1], ["x"])
+
+    @mock.patch("bapsflib._hdf.utils.helpers._SCRATCH_NBYTES", 40)
+    def test_out(self):
+        """Test reading into a given array"""
+        index = [3, 4, 5, 20, 21, 60, 98, 99]
+
+        # contiguous `out` is converted to its dtype while reading
+        out = np.empty((8, 8), dtype=np.float32)
+        data = read_dset_rows(self.dset, index, out=out)
+        self.assertIs(data, out)
+        self.assertTrue(np.array_equal(out, self.dset[index, ...]))
+
+        # non-contiguous `out` with contiguous, element aligned rows
+        # (read directly into `out`)
+        sarr = np.zeros(8, dtype=[("shotnum", np.uint32), ("signal", np.float32, (8,))])
+        self.assertIsNotNone(_direct_mspace(sarr["signal"]))
+        data = read_dset_rows(self.dset, index, out=sarr["signal"])
+        self.assertTrue(np.shares_memory(data, sarr))
+        self.assertTrue(np.array_equal(sarr["signal"], self.dset[index, ...]))
+        self.assertTrue(np.all(sarr["shotnum"] == 0))
+
+        # - a channel slot of a multi-channel field
+        sarr = np.zeros(8, dtype=[("shotnum", np.uint32), ("signal", np.float32, (3, 8))])
+        read_dset_rows(self.dset, index, out=sarr["signal"][:, 1, :])
+        self.assertTrue(np.array_equal(sarr["signal"][:, 1, :], self.dset[index, ...]))
+        self.assertTrue(np.all(sarr["signal"][:, [0, 2], :] == 0))
+        self.assertTrue(np.all(sarr["shotnum"] == 0))
+
+        # - a compound field into a nested structured field, the other
+        #   fields are untouched
+        sarr = np.zeros(
+            8,
+            dtype=[
+                ("shotnum", np.uint32),
+                ("meta", [("x", np.float64), ("f", "i1")], (2,)),
+            ],
+        )
+        sarr["meta"]["f"] = 7
+        read_dset_rows(self.cdset, index, "x", out=sarr["meta"]["x"][:, 1])
+        self.assertTrue(np.array_equal(sarr["meta"]["x"][:, 1], self.cdset[index, "x"]))
+        self.assertTrue(np.all(sarr["meta"]["x"][:, 0] == 0))
+        self.assertTrue(np.all(sarr["meta"]["f"] == 7))
+        self.assertTrue(np.all(sarr["shotnum"] == 0))
+
+        # non-contiguous `out` with misaligned rows (read in blocks
+        # through the scratch buffer...patched to 40 bytes, i.e. 2 rows)
+        sarr = np.zeros(8, dtype=[("flag", np.int8), ("signal", np.float32, (8,))])
+        self.assertIsNone(_direct_mspace(sarr["signal"]))
+        data = read_dset_rows(self.dset, index, out=sarr["signal"])
+        self.assertTrue(np.shares_memory(data, sarr))
+        self.assertTrue(np.array_equal(sarr["signal"], self.dset[index, ...]))
+        self.assertTrue(np.all(sarr["flag"] == 0))
+
+        # non-contiguous rows
+        out = np.zeros((8, 16), dtype=np.float32)
+        self.assertIsNone(_direct_mspace(out[:, ::2]))
+        read_dset_rows(self.dset, index, out=out[:, ::2])
+        self.assertTrue(np.array_equal(out[:, ::2], self.dset[index, ...]))
+        self.assertTrue(np.all(out[:, 1::2] == 0))
+
+        # `field` reads
+        for field in self.cdset.dtype.names:
+            with self.subTest(field=field):
+                out = np.zeros((8,) + self.cdset.dtype[field].shape, dtype=np.float64)
+                read_dset_rows(self.cdset, index, field, out=out)
+                self.assertTrue(np.array_equal(out, self.cdset[index, field]))
+
+        # several fields
+        out = np.zeros(8, dtype=[("x", np.float32), ("Shot", np.int64)])
+        read_dset_rows(self.cdset, index, ["x", "Shot"], out=out)
+        self.assertTrue(np.allclose(out["x"], self.cdset[index, "x"]))
+        self.assertTrue(np.array_equal(out["Shot"], self.cdset[index, "Shot"]))
+
+        # empty index
+        out = np.empty((0, 8), dtype=np.float32)
+        self.assertIs(read_dset_rows(self.dset, [], out=out), out)
+
+        # invalid `out`
+        with self.assertRaises(ValueError):
+            read_dset_rows(self.dset, index, out=np.empty((7, 8)))
+        with self.assertRaises(ValueError):
+            read_dset_rows(self.cdset, index, "v", out=np.empty((8,)))
+        with self.assertRaises(TypeError):
+            read_dset_rows(self.dset, index, out=[0] * 8)
+
+    @mock.patch("bapsflib._hdf.utils.helpers._SCRATCH_NBYTES", 40)
+    def test_samples(self):
+        """Test reading a slice of the sample axis"""
+        indices = [
+            [5],
+            [0, 1, 2, 3],
+            [3, 4, 5, 20, 21, 60, 98, 99],
+            list(range(0, 100, 2)),
+        ]
+        samples = [
+            slice(None),
+            slice(2, 6),
+            slice(1, None, 3),
+            slice(-3, None),
+            slice(0, 100, 2),
+            slice(5, 5),
+        ]
+        for index, sl in itertools.product(indices, samples):
+            with self.subTest(index=index, samples=sl):
+                expected = self.dset[index, ...][:, sl]
+                data = read_dset_rows(self.dset, index, samples=sl)
+                self.assertTrue(np.array_equal(data, expected))
+
+                # into contiguous and non-contiguous `out`
+                out = np.empty(expected.shape, dtype=np.float32)
+                read_dset_rows(self.dset, index, out=out, samples=sl)
+                self.assertTrue(np.array_equal(out, expected))
+                sarr = np.zeros(
+                    len(index),
+                    dtype=[
+                        ("shotnum", np.uint32),
+                        ("signal", np.float32, expected.shape[1:]),
+                    ],
+                )
+                read_dset_rows(self.dset, index, out=sarr["signal"], samples=sl)
+                self.assertTrue(np.array_equal(sarr["signal"], expected))
+
+        # invalid `samples`
+        self.assertRaises(TypeError, read_dset_rows, self.dset, [1], samples=2)
+        self.assertRaises(
+            ValueError, read_dset_rows, self.dset, [1], samples=slice(None, None, -1)
+        )
+        self.assertRaises(ValueError, read_dset_rows, self.cdset, [1], samples=slice(2))
+
+    @mock.patch("bapsflib._hdf.utils.helpers._SCRATCH_NBYTES", 40)
+    def test_average(self):
+        """Test averaging consecutive samples"""
+        index = [3, 4, 5, 20, 21, 60, 98, 99]
+        full = self.dset[index, ...].astype(np.float64)
+        for average, sl in (
+            (1, slice(None)),
+            (2, slice(None)),
+            (3, slice(None)),
+            (2, slice(1, 7)),
+            (2, slice(0, None, 2)),
+            (8, slice(None)),
+            (9, slice(None)),
+        ):
+            with self.subTest(average=average, samples=sl):
+                window = full[:, sl]
+                n_avg = window.shape[1] // average
+                expected = (
+                    window[:, : n_avg * average]
+                    .reshape(len(index), n_avg, average)
+                    .mean(axis=2)
+                )
+                data = read_dset_rows(self.dset, index, samples=sl, average=average)
+                self.assertTrue(np.allclose(data, expected))
+
+                # into a non-contiguous `out`
+                sarr = np.zeros(
+                    len(index),
+                    dtype=[("shotnum", np.uint32), ("signal", np.float32, (n_avg,))],
+                )
+                read_dset_rows(
+                    self.dset, index, out=sarr["signal"], samples=sl, average=average
+                )
+                self.assertTrue(np.allclose(sarr["signal"], expected))
+
+        # new `out` is float64
+        self.assertEqual(read_dset_rows(self.dset, index, average=2).dtype, np.float64)
+
+        # invalid `average`
+        for average, err in ((0, ValueError), (2.0, TypeError), (True, TypeError)):
+            with self.subTest(average=average), self.assertRaises(err):
+                read_dset_rows(self.dset, index, average=average)
+        self.assertRaises(ValueError, read_dset_rows, self.cdset, [1], "v", average=2)
+        self.assertRaises(ValueError, read_dset_rows, self.cdset, [1], average=2)
+
+    @mock.patch("bapsflib._hdf.utils.helpers._SCRATCH_NBYTES", 40)
+    def test_reduce(self):
+        """Test reducing rows block-by-block"""
+        index = [3, 4, 5, 20, 21, 60, 98, 99]
+        rows = self.dset[index, ...]
+
+        # rows are reduced in blocks of the scratch buffer
+        # (patched to 40 bytes, i.e. 2 rows)
+        reduce = mock.Mock(side_effect=np.max)
+        data = reduce_dset_rows(self.dset, index, reduce)
+        self.assertEqual(data.dtype, np.float64)
+        self.assertTrue(np.array_equal(data, rows.max(axis=-1)))
+        self.assertEqual(reduce.call_count, 4)
+        self.assertTrue(all(c.kwargs == {"axis": -1} for c in reduce.call_args_list))
+
+        # windowed reduction and given `out`
+        out = np.zeros(8, dtype=np.float32)
+        data = reduce_dset_rows(
+            self.dset, index, np.mean, samples=slice(1, 7, 2), out=out
+        )
+        self.assertIs(data, out)
+        self.assertTrue(np.allclose(out, rows[:, 1:7:2].mean(axis=-1)))
+
+        # empty index
+        self.assertEqual(reduce_dset_rows(self.dset, [], np.max).shape, (0,))
+
+        # invalid `out`
+        with self.assertRaises(ValueError):
+            reduce_dset_rows(self.dset, index, np.max, out=np.empty(7))
+
+        # 1D dataset rows are one value each and are not reduced
+        dset = self.f.create_dataset("peak", data=np.arange(100, dtype=np.int16) * 3)
+        reduce = mock.Mock(side_effect=np.max)
+        data = reduce_dset_rows(dset, index, reduce)
+        self.assertEqual(data.dtype, np.float64)
+        self.assertTrue(np.array_equal(data, dset[index]))
+        reduce.assert_not_called()
+        with self.assertRaises(ValueError):
+            reduce_dset_rows(dset, index, np.max, samples=slice(0, 1))
+
+    def test_unordered(self):
+        """Test reading rows that are not in increasing order"""
+        index = [60, 3, 98, 4, 21, 5]
+        data = read_dset_rows(self.dset, index)
+        self.assertTrue(np.array_equal(data, self.dset[...][index]))
+
+        # into `out`, with `samples` and `average`
+        out = np.zeros((6, 2), dtype=np.float32)
+        self.assertIs(
+            read_dset_rows(self.dset, index, out=out, samples=slice(1, 6), average=2),
+            out,
+        )
+        self.assertTrue(
+            np.allclose(out, self.dset[...][index, 1:5].reshape(6, 2, 2).mean(axis=-1))
+        )
+
+        # a compound field into a structured array field
+        sarr = np.zeros(6, dtype=[("shotnum", np.uint32), ("x", np.float64)])
+        read_dset_rows(self.cdset, index, "x", out=sarr["x"])
+        self.assertTrue(np.array_equal(sarr["x"], self.cdset[...]["x"][index]))
+        self.assertTrue(np.all(sarr["shotnum"] == 0))
+
+    def test_raises(self):
+        """Test errors"""
+        # index with repeated rows
+        for index in ([1, 1, 2], [3, 1, 3]):
+            with self.subTest(index=index):
+                self.assertRaises(TypeError, read_dset_rows, self.dset, index)
+
+        # index out of range
+        for index in ([-1, 2], [5, 100]):
+            with self.subTest(index=index):
+                self.assertRaises(IndexError, read_dset_rows, self.dset, index)
+
+        # invalid field
+        self.assertRaises(ValueError, read_dset_rows, self.cdset, [1], "y")
+        self.assertRaises(ValueError, read_dset_rows, self.dset, [1], "Shot")
+
+
 if __name__ == "__main__":
     ut.main()
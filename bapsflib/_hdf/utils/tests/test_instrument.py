@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import numpy as np
+import unittest as ut
+
+from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.hdfreadcontrols import HDFReadControls
+from bapsflib._hdf.utils.hdfreaddata import HDFReadData
+from bapsflib._hdf.utils.instrument import (
+    instrument,
+    logging_sink,
+    stage_timer,
+    StageRecord,
+    STAGES,
+)
+from bapsflib._hdf.utils.tests import TestBase
+from bapsflib.utils.decorators import with_bf
+
+
+class TestInstrument(TestBase):
+    """Test case for :func:`~bapsflib._hdf.utils.instrument.instrument`."""
+
+    def setUp(self):
+        super().setUp()
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": 30, "nt": 50})
+        self.f.add_module("6K Compumotor", {"n_configs": 1, "sn_size": 30})
+        _mod = self.f.modules["SIS 3301"]
+        brd, ch = np.where(_mod.knobs.active_brdch)
+        self.brdch = (int(brd[0]), int(ch[0]))
+        self.controls = [
+            ("6K Compumotor", self.f.modules["6K Compumotor"].config_names[0])
+        ]
+
+    def tearDown(self):
+        super().tearDown()
+
+    @with_bf
+    def test_stages(self, _bf: File):
+        # not instrumented
+        self.assertIsNone(stage_timer("HDFReadData"))
+
+        # records of HDFReadData & HDFReadControls
+        with instrument() as recorder:
+            HDFReadData(_bf, *self.brdch, shotnum=[2, 3, 4], add_controls=self.controls)
+        records = recorder.records
+        self.assertTrue(all(isinstance(rec, StageRecord) for rec in records))
+        self.assertTrue(all(rec.duration >= 0.0 for rec in records))
+        data_stages = [rec.stage for rec in records if rec.reader == "HDFReadData"]
+        self.assertEqual(data_stages, list(STAGES))
+        control_stages = [rec.stage for rec in records if rec.reader == "HDFReadControls"]
+        # - HDFReadControls reads all control datasets before filling
+        #   the array, and has no conversion
+        self.assertEqual(control_stages, list(STAGES[:-1]))
+        self.assertEqual(
+            [rec.size for rec in records if rec.stage == "array fill"], [3, 3]
+        )
+
+        # totals
+        totals = recorder.totals()
+        self.assertEqual(totals[("HDFReadData", "index build")]["count"], 1)
+        self.assertEqual(totals[("HDFReadData", "index build")]["size"], 3)
+        self.assertEqual(
+            totals[("HDFReadControls", "conditioning")]["duration"],
+            records[[rec.reader for rec in records].index("HDFReadControls")].duration,
+        )
+        recorder.clear()
+        self.assertEqual(recorder.records, [])
+
+        # no control read without controls
+        with instrument() as recorder:
+            HDFReadData(_bf, *self.brdch)
+        self.assertNotIn("control read", [rec.stage for rec in recorder.records])
+
+        # nothing is recorded once the context exits
+        records = recorder.records
+        HDFReadControls(_bf, self.controls)
+        self.assertEqual(recorder.records, records)
+
+    @with_bf
+    def test_sinks(self, _bf: File):
+        received = []
+        with instrument(sink=received.append) as outer:
+            HDFReadControls(_bf, self.controls)
+            with instrument() as inner:
+                HDFReadControls(_bf, self.controls)
+        self.assertEqual(received, outer.records)
+        self.assertEqual(len(outer.records), 2 * len(inner.records))
+
+        # logging
+        with self.assertLogs("bapsflib.instrument", level="DEBUG") as logs:
+            with instrument(sink=logging_sink()) as recorder:
+                HDFReadControls(_bf, self.controls)
+        self.assertEqual(len(logs.records), len(recorder.records))
+        self.assertIs(logs.records[0].bapsflib_stage, recorder.records[0])
+        self.assertIn("HDFReadControls conditioning", logs.output[0])
+
+    @with_bf
+    def test_timeit(self, _bf: File):
+        # the deprecated `timeit` keyword logs the stage durations
+        for reader, args in (
+            (HDFReadControls, (self.controls,)),
+            (HDFReadData, (*self.brdch,)),
+        ):
+            with self.subTest(reader=reader.__name__):
+                with self.assertWarns(DeprecationWarning), self.assertLogs(
+                    "bapsflib.instrument", level="INFO"
+                ) as logs:
+                    reader(_bf, *args, timeit=True)
+                self.assertNotEqual(len(logs.records), 0)
+                for record in logs.records:
+                    self.assertEqual(record.levelname, "INFO")
+                    self.assertEqual(record.bapsflib_stage.reader, reader.__name__)
+                    self.assertIn(record.bapsflib_stage.stage, STAGES)
+
+
+if __name__ == "__main__":
+    ut.main()
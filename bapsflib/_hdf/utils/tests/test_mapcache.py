@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import os
+import tempfile
+import unittest as ut
+
+from unittest import mock
+
+from bapsflib._hdf import HDFMap
+from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.mapcache import HDFMapCache
+from bapsflib._hdf.utils.tests import TestBase
+
+
+class TestHDFMapCache(TestBase):
+    """Test case for :class:`~bapsflib._hdf.utils.mapcache.HDFMapCache`."""
+
+    def setUp(self):
+        super().setUp()
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": 20, "nt": 100})
+        self.f.add_module("Waveform", {"n_configs": 3, "sn_size": 20})
+        self.f.add_module("Discharge")
+        self.f.flush()
+        self.cache = tempfile.TemporaryDirectory(prefix="bfmap-test_")
+        self.paths = {
+            "control_path": self.control_path,
+            "digitizer_path": self.digitizer_path,
+            "msi_path": self.msi_path,
+        }
+
+    def tearDown(self):
+        self.cache.cleanup()
+        super().tearDown()
+
+    def test_cache(self):
+        key = {"file class": "File", "paths": ["a", "b", "c"]}
+        with File(self.filename, **self.paths) as bf:
+            cache = HDFMapCache(self.filename, cache_dir=self.cache.name)
+            self.assertTrue(cache.path.endswith(".bfmap.pkl"))
+            self.assertIsNone(cache.load(bf, key))
+
+            # save & load
+            cache.save(bf.file_map, key)
+            self.assertTrue(os.path.exists(cache.path))
+            fmap = cache.load(bf, key)
+            self.assertIsInstance(fmap, HDFMap)
+            self.assertIs(fmap._hdf_obj, bf)
+            self.assertEqual(list(fmap.controls), list(bf.controls))
+            self.assertEqual(list(fmap.digitizers), list(bf.digitizers))
+            self.assertEqual(list(fmap.msi), list(bf.msi))
+
+            # a cache file owned by another user, or writable by
+            # others, is not unpickled (POSIX only)
+            if hasattr(os, "getuid"):
+                with mock.patch("pickle.load", side_effect=AssertionError):
+                    with mock.patch("os.getuid", return_value=os.getuid() + 1):
+                        with self.assertWarns(UserWarning):
+                            self.assertIsNone(cache.load(bf, key))
+                    os.chmod(cache.path, 0o622)
+                    with self.assertWarns(UserWarning):
+                        self.assertIsNone(cache.load(bf, key))
+                trusting = HDFMapCache(self.filename, self.cache.name, trust_foreign=True)
+                self.assertIsInstance(trusting.load(bf, key), HDFMap)
+                os.chmod(cache.path, 0o600)
+                self.assertIsInstance(cache.load(bf, key), HDFMap)
+
+            # a different key or bapsflib version is a miss
+            self.assertIsNone(cache.load(bf, {**key, "paths": ["/", "/", "/"]}))
+            with mock.patch.object(
+                HDFMapCache, "_bapsflib_version", return_value="0.0.0.dev"
+            ):
+                self.assertIsNone(cache.load(bf, key))
+
+            # the HDF5 file changed
+            stat = os.stat(self.filename)
+            os.utime(self.filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            self.assertIsNone(HDFMapCache(self.filename, self.cache.name).load(bf, key))
+
+            # unreadable cache
+            with open(cache.path, "wb") as fh:
+                fh.write(b"not a pickle")
+            with self.assertWarns(UserWarning):
+                self.assertIsNone(cache.load(bf, key))
+
+            # clear
+            cache.clear()
+            self.assertFalse(os.path.exists(cache.path))
+
+    def test_file_integration(self):
+        # 1st open maps the file and saves the cache
+        with File(self.filename, map_cache=self.cache.name, **self.paths) as bf:
+            cache_path = bf._map_cache.path
+            controls = list(bf.controls)
+            digitizers = list(bf.digitizers)
+            msi = list(bf.msi)
+        self.assertTrue(os.path.exists(cache_path))
+
+        # 2nd open loads the cached map
+        with mock.patch(
+            f"{File.__module__}.{HDFMap.__qualname__}", side_effect=AssertionError
+        ):
+            with File(self.filename, map_cache=self.cache.name, **self.paths) as bf:
+                self.assertEqual(list(bf.controls), controls)
+                self.assertEqual(list(bf.digitizers), digitizers)
+                self.assertEqual(list(bf.msi), msi)
+
+                # a cached map can read data
+                data = bf.read_data(0, 0, shotnum=[1, 2])
+                self.assertEqual(data["shotnum"].tolist(), [1, 2])
+
+        # different device paths are mapped
+        with File(self.filename, map_cache=self.cache.name) as bf:
+            self.assertEqual(len(bf.controls), 0)
+
+        # `remap` forces mapping the file
+        with mock.patch(
+            f"{File.__module__}.{HDFMap.__qualname__}", wraps=HDFMap
+        ) as mock_map:
+            with File(
+                self.filename, map_cache=self.cache.name, remap=True, **self.paths
+            ) as bf:
+                self.assertTrue(mock_map.called)
+                self.assertEqual(list(bf.controls), controls)
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import h5py
+import numpy as np
+import os
+import tempfile
+import unittest as ut
+
+from unittest import mock
+
+from bapsflib._hdf.utils.reductioncache import ReductionCache
+
+
+class TestReductionCache(ut.TestCase):
+    """
+    Test case for
+    :class:`~bapsflib._hdf.utils.reductioncache.ReductionCache`.
+    """
+
+    def setUp(self):
+        # read-only HDF5 file with a 2D dataset
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tempdir.name, "reduce.hdf5")
+        with h5py.File(self.filename, "w") as f:
+            f.create_dataset(
+                "signal", data=np.arange(20 * 5, dtype=np.float32).reshape(20, 5)
+            )
+        self.open("r")
+
+    def tearDown(self):
+        self.f.close()
+        self.tempdir.cleanup()
+
+    def open(self, mode):
+        """(Re-)open the HDF5 file in mode **mode**."""
+        if getattr(self, "f", None) is not None:
+            self.f.close()
+        self.f = h5py.File(self.filename, mode)
+        self.dset = self.f["signal"]
+
+    def compute(self, rows):
+        return self.dset[rows, ...].max(axis=-1)
+
+    def test_get(self):
+        cache = ReductionCache()
+        compute = mock.Mock(side_effect=self.compute)
+        expected = self.dset[...].max(axis=-1)
+
+        # first request computes all requested rows
+        index = np.array([1, 2, 3, 10])
+        values = cache.get(self.dset, index, "max", compute)
+        self.assertTrue(np.array_equal(values, expected[index]))
+        self.assertEqual(len(cache), 1)
+        compute.assert_called_once()
+        self.assertTrue(np.array_equal(compute.call_args[0][0], index))
+
+        # only the missing rows are computed
+        compute.reset_mock()
+        index = np.array([2, 3, 4, 5, 10])
+        values = cache.get(self.dset, index, "max", compute)
+        self.assertTrue(np.array_equal(values, expected[index]))
+        compute.assert_called_once()
+        self.assertTrue(np.array_equal(compute.call_args[0][0], [4, 5]))
+
+        # cached rows are not recomputed
+        compute.reset_mock()
+        values = cache.get(self.dset, [10, 1], "max", compute)
+        self.assertTrue(np.array_equal(values, expected[[10, 1]]))
+        compute.assert_not_called()
+
+        # another reduction name is a separate entry
+        values = cache.get(self.dset, [1], ("max", (0, 2, 1)), compute)
+        self.assertEqual(len(cache), 2)
+        compute.assert_called_once()
+
+        # empty request
+        values = cache.get(self.dset, [], "other", self.compute)
+        self.assertEqual(values.shape, (0,))
+
+        # clear
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_rebuild(self):
+        """Entries are rebuilt when the dataset shape changes."""
+        cache = ReductionCache()
+        cache.get(self.dset, [0, 1], "max", self.compute)
+
+        # re-create the dataset with more rows
+        self.open("r+")
+        del self.f["signal"]
+        self.f.create_dataset(
+            "signal", data=-np.arange(30 * 5, dtype=np.float32).reshape(30, 5)
+        )
+        self.open("r")
+        values = cache.get(self.dset, [0, 1, 25], "max", self.compute)
+        self.assertTrue(np.array_equal(values, self.dset[[0, 1, 25], ...].max(axis=-1)))
+
+    def test_writable(self):
+        """Datasets of writable files are not cached."""
+        cache = ReductionCache()
+        self.open("r+")
+        compute = mock.Mock(side_effect=self.compute)
+        values = cache.get(self.dset, [3, 1, 3], "max", compute)
+        self.assertTrue(np.array_equal(values, self.dset[...].max(axis=-1)[[3, 1, 3]]))
+        self.assertTrue(np.array_equal(compute.call_args[0][0], [1, 3]))
+        self.assertFalse(cache._cacheable(self.dset))
+        self.assertEqual(len(cache), 0)
+
+        # rewriting the data (same shape) is seen by the next request
+        self.dset[...] = -self.dset[...]
+        values = cache.get(self.dset, [1, 3], "max", compute)
+        self.assertTrue(np.array_equal(values, self.dset[[1, 3], ...].max(axis=-1)))
+        self.assertEqual(compute.call_count, 2)
+
+
+if __name__ == "__main__":
+    ut.main()
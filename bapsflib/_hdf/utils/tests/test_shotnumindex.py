@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import numpy as np
+import os
+import tempfile
+import unittest as ut
+
+from unittest import mock
+
+from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.hdfreadcontrols import HDFReadControls
+from bapsflib._hdf.utils.hdfreaddata import HDFReadData
+from bapsflib._hdf.utils.shotnumindex import ShotNumIndex
+from bapsflib._hdf.utils.tests import TestBase
+
+
+class TestShotNumIndex(TestBase):
+    """Test case for :class:`~bapsflib._hdf.utils.shotnumindex.ShotNumIndex`."""
+
+    def setUp(self):
+        super().setUp()
+        self.f.add_module("Waveform", {"n_configs": 3, "sn_size": 20})
+        self.f.flush()
+        self.cdset = self.f["Raw data + config/Waveform/Run time list"]
+        self.cache = tempfile.TemporaryDirectory(prefix="bfidx-test_")
+
+    def tearDown(self):
+        self.cache.cleanup()
+        super().tearDown()
+
+    def assertEntry(self, sn_index: ShotNumIndex):
+        """Assert the indexed entries of the Waveform dataset."""
+        # simple dataset (all rows)
+        shotnum, rows, monotonic = sn_index.get_shotnums(self.cdset, "Shot number")
+        self.assertTrue(np.array_equal(shotnum, np.repeat(np.arange(1, 21), 3)))
+        self.assertIsNone(rows)
+        self.assertFalse(monotonic)
+
+        # one configuration of a multi-configuration dataset
+        shotnum, rows, monotonic = sn_index.get_shotnums(
+            self.cdset, "Shot number", "Configuration name", "config02"
+        )
+        self.assertTrue(np.array_equal(rows, np.arange(1, 60, 3)))
+        self.assertTrue(np.array_equal(shotnum, np.arange(1, 21)))
+        self.assertTrue(monotonic)
+
+    def test_index(self):
+        sn_index = ShotNumIndex(self.filename, cache_dir=self.cache.name)
+        self.assertEqual(sn_index.validate, "stat")
+        self.assertEqual(len(sn_index), 0)
+
+        # `path`
+        self.assertEqual(os.path.dirname(sn_index.path), self.cache.name)
+        self.assertTrue(
+            os.path.basename(sn_index.path).startswith(os.path.basename(self.filename))
+        )
+        self.assertTrue(sn_index.path.endswith(".bfidx.npz"))
+        self.assertEqual(
+            ShotNumIndex(self.filename).path,
+            f"{os.path.abspath(self.filename)}.bfidx.npz",
+        )
+
+        # index entries
+        self.assertEntry(sn_index)
+        self.assertEqual(len(sn_index), 2)
+        self.assertIn(f"{self.cdset.name}:Shot number", sn_index)
+
+        # resolvers are built from, and kept with, the index entries
+        resolver = sn_index.get_resolver(
+            self.cdset, "Shot number", "Configuration name", "config02"
+        )
+        self.assertTrue(np.array_equal(resolver.rows, np.arange(1, 60, 3)))
+        self.assertTrue(resolver.contiguous)
+        self.assertIs(
+            sn_index.get_resolver(
+                self.cdset, "Shot number", "Configuration name", "config02"
+            ),
+            resolver,
+        )
+        self.assertEqual(len(sn_index), 2)
+
+        # nothing is saved until `save()`
+        self.assertFalse(os.path.exists(sn_index.path))
+        sn_index.save()
+        self.assertTrue(os.path.exists(sn_index.path))
+
+        # a new index loads the saved entries without reading the dataset
+        sn_index2 = ShotNumIndex(self.filename, cache_dir=self.cache.name)
+        self.assertEqual(len(sn_index2), 2)
+        with mock.patch.object(
+            type(self.cdset), "__getitem__", side_effect=AssertionError("read")
+        ):
+            self.assertEntry(sn_index2)
+
+        # `clear()`
+        sn_index2.clear()
+        self.assertEqual(len(sn_index2), 0)
+        self.assertFalse(os.path.exists(sn_index2.path))
+
+        # invalid `validate`
+        with self.assertRaises(ValueError):
+            ShotNumIndex(self.filename, validate="mtime")
+
+    def test_validate(self):
+        for validate in ("stat", "hash"):
+            with self.subTest(validate=validate):
+                sn_index = ShotNumIndex(
+                    self.filename, cache_dir=self.cache.name, validate=validate
+                )
+                sn_index.get_shotnums(self.cdset, "Shot number")
+                sn_index.save()
+                self.assertEqual(
+                    len(ShotNumIndex(self.filename, self.cache.name, validate)), 1
+                )
+
+                # touching the file only invalidates a 'stat' index
+                stat = os.stat(self.filename)
+                os.utime(self.filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+                self.assertEqual(
+                    len(ShotNumIndex(self.filename, self.cache.name, validate)),
+                    0 if validate == "stat" else 1,
+                )
+
+                # modifying the file invalidates both
+                sn_index = ShotNumIndex(self.filename, self.cache.name, validate)
+                sn_index.get_shotnums(self.cdset, "Shot number")
+                sn_index.save()
+                self.f.create_dataset("extra", data=np.arange(100))
+                self.f.flush()
+                self.assertEqual(
+                    len(ShotNumIndex(self.filename, self.cache.name, validate)), 0
+                )
+                del self.f["extra"]
+                self.f.flush()
+
+    def test_unreadable(self):
+        sn_index = ShotNumIndex(self.filename, cache_dir=self.cache.name)
+        with open(sn_index.path, "w") as fh:
+            fh.write("not an npz file")
+        with self.assertWarns(UserWarning):
+            sn_index = ShotNumIndex(self.filename, cache_dir=self.cache.name)
+        self.assertEqual(len(sn_index), 0)
+
+        # a failed save only warns
+        sn_index.get_shotnums(self.cdset, "Shot number")
+        with mock.patch("os.replace", side_effect=PermissionError("denied")):
+            with self.assertWarns(UserWarning):
+                sn_index.save()
+
+    def test_file_integration(self):
+        self.f.remove_all_modules()
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": 20, "nt": 100})
+        self.f.add_module("Waveform", {"n_configs": 3, "sn_size": 20})
+        self.f.flush()
+        shotnum = [2, 5, 8, 30]
+        controls = [("Waveform", "config02")]
+        paths = {
+            "control_path": self.control_path,
+            "digitizer_path": self.digitizer_path,
+            "msi_path": self.msi_path,
+        }
+
+        with File(self.filename, **paths) as bf:
+            data = HDFReadData(bf, 0, 0, shotnum=shotnum, add_controls=controls)
+            cdata = HDFReadControls(bf, controls, shotnum=shotnum)
+
+        for _ in range(2):
+            with File(self.filename, shotnum_index=self.cache.name, **paths) as bf:
+                self.assertIsInstance(bf.shotnum_index, ShotNumIndex)
+                idata = HDFReadData(bf, 0, 0, shotnum=shotnum, add_controls=controls)
+                icdata = HDFReadControls(bf, controls, shotnum=shotnum)
+                self.assertGreater(len(bf.shotnum_index), 0)
+            # (compare bytes since out-of-range shots are NaN filled)
+            self.assertEqual(idata.tobytes(), data.tobytes())
+            self.assertEqual(icdata.tobytes(), cdata.tobytes())
+
+            # index is saved on close
+            self.assertTrue(os.path.exists(bf.shotnum_index.path))
+
+        # only readonly files
+        with self.assertRaises(ValueError):
+            File(self.filename, mode="r+", shotnum_index=True)
+
+
+if __name__ == "__main__":
+    ut.main()
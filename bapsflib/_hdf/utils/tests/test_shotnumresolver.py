@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import gc
+import numpy as np
+import unittest as ut
+
+from unittest import mock
+
+from bapsflib._hdf.utils.shotnumresolver import ShotNumResolver, ShotNumResolvers
+from bapsflib._hdf.utils.shotset import ShotSet
+from bapsflib._hdf.utils.tests import TestBase
+
+
+class TestShotNumResolver(ut.TestCase):
+    """
+    Test case for
+    :class:`~bapsflib._hdf.utils.shotnumresolver.ShotNumResolver`.
+    """
+
+    def assertResolved(self, resolver: ShotNumResolver, dset_sn, shotnum):
+        """Assert **shotnum** is resolved like a scan of **dset_sn**."""
+        dset_sn = np.asarray(dset_sn)
+        shotnum = np.asarray(shotnum, dtype=np.uint32)
+        index, sni = resolver.resolve(shotnum)
+        self.assertEqual(sni.dtype, bool)
+        self.assertEqual(sni.shape, shotnum.shape)
+        self.assertTrue(np.array_equal(sni, np.isin(shotnum, dset_sn)))
+        self.assertTrue(np.array_equal(dset_sn[index], shotnum[sni]))
+
+    def test_resolve(self):
+        shotnum = [1, 2, 5, 6, 9, 10, 11, 20, 40]
+        cases = (
+            # (dset_sn, monotonic, contiguous)
+            (np.arange(3, 33, dtype=np.uint32), True, True),
+            (np.array([2, 3, 5, 6, 10, 12], dtype=np.uint32), True, False),
+            (np.array([6, 2, 11, 3, 10, 5], dtype=np.uint32), False, False),
+            (np.array([5], dtype=np.uint32), True, True),
+        )
+        for dset_sn, monotonic, contiguous in cases:
+            with self.subTest(dset_sn=dset_sn):
+                resolver = ShotNumResolver(dset_sn)
+                self.assertEqual(resolver.monotonic, monotonic)
+                self.assertEqual(resolver.contiguous, contiguous)
+                self.assertEqual(len(resolver), dset_sn.size)
+                self.assertTrue(np.shares_memory(resolver.shotnum, dset_sn))
+                self.assertIsNone(resolver.rows)
+                self.assertResolved(resolver, dset_sn, shotnum)
+                self.assertResolved(resolver, dset_sn, [])
+                self.assertResolved(resolver, dset_sn, [100, 200])
+
+        # the argsort of unordered shot numbers is computed once
+        resolver = ShotNumResolver(np.array([6, 2, 11, 3], dtype=np.uint32))
+        with mock.patch("numpy.argsort", wraps=np.argsort) as mock_argsort:
+            resolver.resolve(np.array([2, 3]))
+            resolver.resolve(np.array([6, 11]))
+            self.assertEqual(mock_argsort.call_count, 1)
+
+        # rows
+        rows = np.array([1, 4, 7, 10])
+        resolver = ShotNumResolver(np.array([1, 2, 3, 4], dtype=np.uint32), rows=rows)
+        index, sni = resolver.resolve(np.array([2, 4, 8], dtype=np.uint32))
+        self.assertTrue(np.array_equal(index, [4, 10]))
+        self.assertTrue(np.array_equal(sni, [True, True, False]))
+
+        # no shot numbers
+        index, sni = ShotNumResolver(np.empty(0, dtype=np.uint32)).resolve(
+            np.array([1, 2])
+        )
+        self.assertEqual(index.size, 0)
+        self.assertTrue(np.array_equal(sni, [False, False]))
+
+    def test_shotset(self):
+        # gap-free shot numbers are one range, built without a scan
+        resolver = ShotNumResolver(np.arange(3, 1003, dtype=np.uint32))
+        with mock.patch.object(ShotSet, "_set_array") as mock_set:
+            shotset = resolver.shotset
+            self.assertFalse(mock_set.called)
+        self.assertEqual(shotset, ShotSet.from_range(3, 1003))
+        self.assertIs(resolver.shotset, shotset)
+
+        # other shot numbers
+        for dset_sn in ([2, 3, 5, 6, 10, 12], [6, 2, 11, 3, 10, 5], []):
+            with self.subTest(dset_sn=dset_sn):
+                resolver = ShotNumResolver(np.array(dset_sn, dtype=np.uint32))
+                self.assertEqual(resolver.shotset, ShotSet(dset_sn))
+
+
+class TestShotNumResolvers(TestBase):
+    """
+    Test case for
+    :class:`~bapsflib._hdf.utils.shotnumresolver.ShotNumResolvers`.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.f.add_module("Waveform", {"n_configs": 3, "sn_size": 20})
+        self.f.flush()
+
+    def tearDown(self):
+        super().tearDown()
+
+    @property
+    def cdset(self):
+        return self.f["Raw data + config/Waveform/Run time list"]
+
+    def test_get_resolver(self):
+        resolvers = ShotNumResolvers()
+        keys = ("Shot number", "Configuration name")
+
+        # full column
+        resolver = resolvers.get_resolver(self.cdset, keys[0])
+        self.assertTrue(np.array_equal(resolver.shotnum, np.repeat(np.arange(1, 21), 3)))
+        self.assertFalse(resolver.monotonic)
+        self.assertIs(resolvers.get_resolver(self.cdset, keys[0]), resolver)
+
+        # configurations
+        for ii, config_name in enumerate(("config01", "config02", "config03")):
+            resolver = resolvers.get_resolver(self.cdset, *keys, config_name=config_name)
+            self.assertTrue(np.array_equal(resolver.rows, np.arange(ii, 60, 3)))
+            self.assertTrue(resolver.contiguous)
+        self.assertEqual(len(resolvers), 2)
+        resolver = resolvers.get_resolver(self.cdset, *keys, config_name="config09")
+        self.assertEqual(len(resolver), 0)
+
+        # a changed dataset is read again
+        resolver = resolvers.get_resolver(self.cdset, keys[0])
+        self.cdset["Shot number"] = self.cdset["Shot number"] + 5
+        self.assertIsNot(resolvers.get_resolver(self.cdset, keys[0]), resolver)
+        self.assertEqual(resolvers.get_resolver(self.cdset, keys[0]).shotnum[0], 6)
+
+        # clear
+        resolvers.clear()
+        self.assertEqual(len(resolvers), 0)
+
+    def test_of_map(self):
+        class FakeMap(object):
+            pass
+
+        map1, map2 = FakeMap(), FakeMap()
+        resolvers = ShotNumResolvers.of_map(map1)
+        self.assertIsInstance(resolvers, ShotNumResolvers)
+        self.assertIs(ShotNumResolvers.of_map(map1), resolvers)
+        self.assertIsNot(ShotNumResolvers.of_map(map2), resolvers)
+
+        # the cache is dropped with the mapping
+        gc.collect()
+        n_caches = len(ShotNumResolvers._map_caches)
+        del map1
+        gc.collect()
+        self.assertEqual(len(ShotNumResolvers._map_caches), n_caches - 1)
+
+
+if __name__ == "__main__":
+    ut.main()
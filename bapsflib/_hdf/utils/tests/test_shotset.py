@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import numpy as np
+import unittest as ut
+
+from bapsflib._hdf.utils.shotset import ShotSet
+
+
+class TestShotSet(ut.TestCase):
+    """Test case for :class:`~bapsflib._hdf.utils.shotset.ShotSet`."""
+
+    def assertShots(self, shotset: ShotSet, shotnum):
+        """Assert **shotset** holds exactly the shot numbers **shotnum**."""
+        shotnum = np.unique(np.asarray(shotnum, dtype=np.int64))
+        self.assertEqual(len(shotset), shotnum.size)
+        self.assertEqual(bool(shotset), shotnum.size != 0)
+        self.assertTrue(np.array_equal(shotset.to_array(dtype=np.int64), shotnum))
+        self.assertEqual(list(shotset), shotnum.tolist())
+
+    def test_construction(self):
+        # from shot numbers
+        self.assertShots(ShotSet(), [])
+        self.assertShots(ShotSet([5, 1, 2, 3, 3, 9]), [1, 2, 3, 5, 9])
+        self.assertShots(ShotSet(np.arange(10, 0, -1)), np.arange(1, 11))
+        self.assertShots(ShotSet(range(4)), [0, 1, 2, 3])
+
+        # from ranges
+        shots = ShotSet.from_range(1, 1000001)
+        self.assertEqual(shots.n_ranges, 1)
+        self.assertFalse(shots.dense)
+        self.assertEqual((shots.first, shots.last), (1, 1000000))
+        self.assertShots(ShotSet.from_range(5, 5), [])
+        self.assertShots(
+            ShotSet.from_ranges([10, 1, 3, 20], [12, 4, 6, 20]), [1, 2, 3, 4, 5, 10, 11]
+        )
+        with self.assertRaises(ValueError):
+            ShotSet.from_ranges([1, 2], [3])
+
+        # from slices
+        self.assertShots(ShotSet.from_slice(slice(None), 5), [0, 1, 2, 3, 4])
+        self.assertShots(ShotSet.from_slice(slice(1, 9, 3), 20), [1, 4, 7])
+        self.assertShots(ShotSet.from_slice(slice(-3, None), 10), [7, 8, 9])
+        self.assertShots(ShotSet.from_slice(slice(5, 2), 10), [])
+
+        # copies
+        self.assertEqual(ShotSet(shots), shots)
+
+        # isolated shot numbers are stored densely
+        sparse = ShotSet(np.arange(1, 100, 2))
+        self.assertTrue(sparse.dense)
+        self.assertEqual(sparse.n_ranges, 50)
+        self.assertShots(sparse, np.arange(1, 100, 2))
+        self.assertFalse(ShotSet([1, 2, 3, 7]).dense)
+
+    def test_contains(self):
+        for shots in (ShotSet.from_ranges([2, 10], [5, 13]), ShotSet([2, 4, 10, 12])):
+            with self.subTest(dense=shots.dense):
+                values = np.array([0, 1, 2, 4, 5, 9, 10, 12, 13, 100])
+                expected = np.isin(values, shots.to_array())
+                self.assertTrue(np.array_equal(shots.contains(values), expected))
+                self.assertIn(10, shots)
+                self.assertNotIn(13, shots)
+
+        self.assertFalse(np.any(ShotSet().contains(np.array([1, 2]))))
+
+    def test_set_operations(self):
+        rng = np.random.default_rng(5)
+        cases = (
+            (ShotSet.from_range(1, 100), ShotSet.from_ranges([0, 50], [10, 150])),
+            (ShotSet.from_range(1, 100), ShotSet(rng.choice(200, 40, replace=False))),
+            (ShotSet(rng.choice(200, 60)), ShotSet(rng.choice(200, 60))),
+            (ShotSet.from_range(1, 10), ShotSet.from_range(10, 20)),
+            (ShotSet.from_range(1, 10), ShotSet()),
+        )
+        for a, b in cases:
+            with self.subTest(a=a, b=b):
+                arr_a = a.to_array(dtype=np.int64)
+                arr_b = b.to_array(dtype=np.int64)
+                self.assertShots(a & b, np.intersect1d(arr_a, arr_b))
+                self.assertShots(a.intersection(b), np.intersect1d(arr_a, arr_b))
+                self.assertShots(a | b, np.union1d(arr_a, arr_b))
+                self.assertShots(b.union(a), np.union1d(arr_a, arr_b))
+
+        # adjacent ranges merge
+        union = ShotSet.from_range(1, 10) | ShotSet.from_range(10, 20)
+        self.assertEqual(union.n_ranges, 1)
+        self.assertEqual(union, ShotSet.from_range(1, 20))
+
+        # several sets, and arrays
+        a = ShotSet.from_range(1, 100)
+        self.assertShots(a.intersection([5, 6, 200], ShotSet.from_range(6, 7)), [6])
+        self.assertShots(
+            a.union(ShotSet.from_range(200, 202), [300]),
+            np.concatenate((np.arange(1, 100), [200, 201, 300])),
+        )
+
+        # long runs cost the number of ranges
+        big = ShotSet.from_ranges([1, 2000000], [1000001, 3000001])
+        both = big & ShotSet.from_range(500000, 2500000)
+        self.assertEqual(both, ShotSet.from_ranges([500000, 2000000], [1000001, 2500000]))
+        self.assertEqual(len(both), 1000001)
+
+    def test_select(self):
+        shots = ShotSet.from_ranges([-5, 10], [3, 20])
+        self.assertShots(shots.select(start=1), [1, 2] + list(range(10, 20)))
+        self.assertShots(shots.select(stop=0), [-5, -4, -3, -2, -1])
+        self.assertShots(shots.select(2, 12), [2, 10, 11])
+        self.assertShots(ShotSet().select(start=1), [])
+
+    def test_repr(self):
+        self.assertEqual(repr(ShotSet([1, 2, 3, 7, 8])), "ShotSet([(1, 4), (7, 9)])")
+        self.assertIn("50 ranges", repr(ShotSet(np.arange(1, 100, 2))))
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -20,6 +20,14 @@ contains functions and classes relevant for calculating LaPD parameters
 """
 __all__ = ["ConType", "File"]
 
-from bapsflib._hdf.maps.controls.types import ConType
-from bapsflib.lapd import _hdf, constants, tools
-from bapsflib.lapd._hdf.file import File
+from bapsflib.utils.lazyimport import lazy_import
+
+# sub-packages and classes are imported on first access
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    submodules=["_hdf", "constants", "tools"],
+    attributes={
+        "ConType": "bapsflib._hdf.maps.controls.types",
+        "File": "bapsflib.lapd._hdf.file",
+    },
+)
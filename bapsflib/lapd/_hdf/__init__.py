@@ -14,4 +14,9 @@ in the HDF5 files generated by the Large Plasma Device (LaPD).
 """
 __all__ = []
 
-from bapsflib.lapd._hdf import file, lapdmap, lapdoverview
+from bapsflib.utils.lazyimport import lazy_import
+
+# modules are imported on first access
+__getattr__, __dir__ = lazy_import(
+    __name__, submodules=["file", "lapdmap", "lapdoverview"]
+)
@@ -67,6 +67,7 @@ class File(BaseFile):
 
     def _map_file(self):
         """Map/re-map the LaPD HDF5 file. (Builds :attr:`file_map`)"""
+        self._reduction_cache.clear()
         self._file_map = LaPDMap(
             self,
             control_path=self.CONTROL_PATH,
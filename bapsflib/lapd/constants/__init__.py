@@ -13,4 +13,14 @@ A package of LaPD parameters and constants.
 """
 __all__ = ["port_spacing", "ref_port"]
 
-from bapsflib.lapd.constants.constants import port_spacing, ref_port
+from bapsflib.utils.lazyimport import lazy_import
+
+# constants are imported (with astropy) on first access
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    submodules=["constants"],
+    attributes={
+        "port_spacing": "bapsflib.lapd.constants.constants",
+        "ref_port": "bapsflib.lapd.constants.constants",
+    },
+)
@@ -14,4 +14,14 @@ relevant to the LaPD and its configuration.
 """
 __all__ = ["portnum_to_z", "z_to_portnum"]
 
-from bapsflib.lapd.tools.tools import portnum_to_z, z_to_portnum
+from bapsflib.utils.lazyimport import lazy_import
+
+# tools are imported (with astropy) on first access
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    submodules=["tools"],
+    attributes={
+        "portnum_to_z": "bapsflib.lapd.tools.tools",
+        "z_to_portnum": "bapsflib.lapd.tools.tools",
+    },
+)
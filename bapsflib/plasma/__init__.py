@@ -14,4 +14,7 @@ especially its physical parameters.
 """
 __all__ = []
 
-from bapsflib.plasma import core
+from bapsflib.utils.lazyimport import lazy_import
+
+# modules are imported on first access
+__getattr__, __dir__ = lazy_import(__name__, submodules=["core"])
@@ -46,11 +46,12 @@ __all__ = [
     "vTi",
 ]
 
+import functools
 import math
 
-from scipy import constants
-
-pconst = constants.physical_constants
+#: module attributes derived from :mod:`scipy.constants`, which are
+#: defined by :func:`_load_constants` on first use
+_SCIPY_CONSTANTS = ("AMU", "C", "ME", "MP", "constants", "pconst")
 
 
 class FloatUnit(float):
@@ -99,23 +100,63 @@ class IntUnit(int):
         return self._unit
 
 
-#: atomic mass unit (g)
-AMU = FloatUnit(1000.0 * constants.m_u, "g")
-
-#: speed of light (cm/s)
-C = FloatUnit(100.0 * constants.c, "cm s^-1")
-
 #: fundamental charge (statcoul)
 E = FloatUnit(4.8032e-10, "statcoul")
 
 #: Boltzmann constant (erg/K)
 KB = FloatUnit(1.3807e-16, "erg k^-1")
 
-#: electron mass (g)
-ME = FloatUnit(1000.0 * constants.m_e, "g")
 
-#: proton mass (g)
-MP = FloatUnit(1000.0 * constants.m_p, "g")
+def _load_constants():
+    """
+    Import :mod:`scipy.constants` and define the constants derived
+    from it.  This is deferred until a constant is first used, since
+    importing :mod:`scipy` is slow.
+    """
+    global AMU, C, ME, MP, constants, pconst
+    if "constants" in globals():
+        return
+
+    from scipy import constants
+
+    pconst = constants.physical_constants
+
+    # atomic mass unit (g)
+    AMU = FloatUnit(1000.0 * constants.m_u, "g")
+
+    # speed of light (cm/s)
+    C = FloatUnit(100.0 * constants.c, "cm s^-1")
+
+    # electron mass (g)
+    ME = FloatUnit(1000.0 * constants.m_e, "g")
+
+    # proton mass (g)
+    MP = FloatUnit(1000.0 * constants.m_p, "g")
+
+
+def __getattr__(name):
+    # define the scipy derived constants on first access
+    # (atomic mass unit AMU (g), speed of light C (cm/s), electron
+    # mass ME (g), and proton mass MP (g))
+    if name in _SCIPY_CONSTANTS:
+        _load_constants()
+        return globals()[name]
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def _uses_constants(func):
+    """
+    Decorator for functions that use the constants defined by
+    :func:`_load_constants`.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        _load_constants()
+        return func(*args, **kwargs)
+
+    return wrapper
 
 
 # ---- frequency constants ----
@@ -136,6 +177,7 @@ def fce(Bo, **kwargs):
     return FloatUnit(_fce, "Hz")
 
 
+@_uses_constants
 def fci(Bo, m_i, Z, **kwargs):
     """
     ion-cyclotron frequency (Hz)
@@ -226,6 +268,7 @@ def fUH(Bo, n_e, **kwargs):
     return FloatUnit(_fUH, "Hz")
 
 
+@_uses_constants
 def oce(Bo, **kwargs):
     """
     electron-cyclotron frequency (rad/s)
@@ -240,6 +283,7 @@ def oce(Bo, **kwargs):
     return FloatUnit(_oce, "rad s^-1")
 
 
+@_uses_constants
 def oci(Bo, m_i, Z, **kwargs):
     """
     ion-cyclotron frequency (rads / s)
@@ -288,6 +332,7 @@ def oLH(Bo, m_i, n_i, Z, **kwargs):
     return FloatUnit(_olh, "rad s^-1")
 
 
+@_uses_constants
 def ope(n_e, **kwargs):
     """
     electron-plasma frequency (in rad/s)
@@ -336,6 +381,7 @@ def oUH(Bo, n_e, **kwargs):
 
 
 # ---- length constants ----
+@_uses_constants
 def lD(kT, n, **kwargs):
     """
     Debye Length (in cm)
@@ -352,6 +398,7 @@ def lD(kT, n, **kwargs):
     return FloatUnit(_lD, "cm")
 
 
+@_uses_constants
 def lpe(n_e, **kwargs):
     """
     electron-inertial length (cm)
@@ -368,6 +415,7 @@ def lpe(n_e, **kwargs):
     return FloatUnit(_lpe, "cm")
 
 
+@_uses_constants
 def lpi(m_i, n_i, Z, **kwargs):
     """
     ion-inertial length (cm)
@@ -423,6 +471,7 @@ def rci(Bo, kTi, m_i, Z, **kwargs):
 
 
 # ---- velocity constants ----
+@_uses_constants
 def cs(kTe, m_i, Z, gamma=1.0, **kwargs):
     """
     ion sound speed (cm/s)
@@ -463,6 +512,7 @@ def VA(Bo, m_i, n_i, **kwargs):
     return FloatUnit(_VA, "cm s^-1")
 
 
+@_uses_constants
 def vTe(kTe, **kwargs):
     """
     electron thermal velocity (in cm/s)
@@ -478,6 +528,7 @@ def vTe(kTe, **kwargs):
     return FloatUnit(_vTe, "cm s^-1")
 
 
+@_uses_constants
 def vTi(kTi, m_i, **kwargs):
     """
     ion thermal velocity (in cm/s)
@@ -15,7 +15,7 @@ __all__ = []
 
 from typing import Union
 
-from bapsflib.utils import decorators, exceptions, warnings
+from bapsflib.utils import decorators, exceptions, lazyimport, warnings
 
 
 def _bytes_to_str(string: Union[bytes, str]) -> str:
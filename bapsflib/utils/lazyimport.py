@@ -0,0 +1,64 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Helper for lazily importing the sub-modules and attributes of a
+package.
+"""
+__all__ = ["lazy_import"]
+
+import importlib
+import sys
+
+from typing import Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_import(
+    name: str, submodules: Iterable[str] = (), attributes: Dict[str, str] = None
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build the module level :code:`__getattr__` and :code:`__dir__`
+    functions (see :pep:`562`) that import the sub-modules and
+    attributes of module **name** the first time they are accessed.
+    Imported objects are set on the module, so later accesses do not
+    go through :code:`__getattr__`.
+
+    :param str name: name of the module (i.e. :code:`__name__`)
+    :param submodules: names of the sub-modules to be lazily imported
+    :param attributes: dictionary mapping the attribute names to the
+        (absolute) name of the module defining them
+
+    :Example:
+
+        >>> # in the __init__.py of package 'pkg'
+        >>> __getattr__, __dir__ = lazy_import(
+        ...     __name__,
+        ...     submodules=["core"],
+        ...     attributes={"Thing": "pkg.core.things"},
+        ... )
+    """
+    submodules = set(submodules)
+    attributes = {} if attributes is None else dict(attributes)
+
+    def __getattr__(attr: str):
+        if attr in submodules:
+            value = importlib.import_module(f"{name}.{attr}")
+        elif attr in attributes:
+            value = getattr(importlib.import_module(attributes[attr]), attr)
+        else:
+            raise AttributeError(f"module '{name}' has no attribute '{attr}'")
+
+        setattr(sys.modules[name], attr, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[name])) | submodules | set(attributes))
+
+    return __getattr__, __dir__
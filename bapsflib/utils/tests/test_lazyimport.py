@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import importlib
+import math
+import subprocess
+import sys
+import types
+import unittest as ut
+
+from unittest import mock
+
+from bapsflib.utils.lazyimport import lazy_import
+
+
+class TestLazyImport(ut.TestCase):
+    """Test case for :func:`~bapsflib.utils.lazyimport.lazy_import`."""
+
+    def setUp(self):
+        self.module = types.ModuleType("faux_pkg")
+        patcher = mock.patch.dict(sys.modules, {"faux_pkg": self.module})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_lazy_import(self):
+        getattr_, dir_ = lazy_import(
+            "faux_pkg",
+            submodules=["json"],
+            attributes={"sqrt": "math", "OrderedDict": "collections"},
+        )
+        self.module.__getattr__ = getattr_
+        self.module.__dir__ = dir_
+
+        # attributes are imported and set on first access
+        with mock.patch(
+            "importlib.import_module", wraps=importlib.import_module
+        ) as mock_im:
+            self.assertIs(self.module.sqrt, math.sqrt)
+            self.assertIs(vars(self.module)["sqrt"], math.sqrt)
+            self.assertIs(self.module.sqrt, math.sqrt)
+            self.assertEqual(mock_im.call_count, 1)
+
+        # sub-modules
+        with mock.patch("importlib.import_module", return_value="json module"):
+            self.assertEqual(self.module.json, "json module")
+
+        # __dir__
+        self.assertTrue({"json", "sqrt", "OrderedDict"}.issubset(dir(self.module)))
+
+        # unknown attribute
+        with self.assertRaises(AttributeError):
+            self.module.not_an_attr
+
+    def test_package_import(self):
+        """Importing bapsflib does not import its heavy dependencies."""
+        code = (
+            "import sys; import bapsflib; import bapsflib.lapd; "
+            "import bapsflib.plasma.core; "
+            "print(sorted(m for m in ('astropy', 'h5py', 'scipy', 'pkg_resources') "
+            "if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-W", "ignore", "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "[]")
+
+        # and everything is still reachable
+        import bapsflib
+
+        self.assertTrue(hasattr(bapsflib, "__version__"))
+        self.assertIs(bapsflib.lapd.File, bapsflib.lapd._hdf.file.File)
+        self.assertIs(bapsflib._hdf.HDFMap, bapsflib._hdf.maps.core.HDFMap)
+        self.assertAlmostEqual(bapsflib.plasma.core.ME / 9.109e-28, 1.0, places=3)
+        self.assertEqual(bapsflib.lapd.constants.ref_port.value, 53)
+        for name in bapsflib._hdf.maps.__all__:
+            self.assertTrue(hasattr(bapsflib._hdf.maps, name))
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,19 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+`airspeed velocity <https://asv.readthedocs.io/>`_ benchmarks for
+bapsflib.  Run :code:`asv run` from the repository root.
+
+Results are stored as JSON in :file:`.asv/results`, so releases can be
+compared for regressions (e.g. :code:`asv continuous <release> main` or
+:code:`asv compare <release> main`).  The size of the synthetic runs
+used by the benchmarks is set in :mod:`benchmarks.faux_runs`.
+"""
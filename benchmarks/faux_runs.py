@@ -0,0 +1,112 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Synthetic LaPD runs for the benchmarks, built with
+`~bapsflib._hdf.maps.tests.fauxhdfbuilder.FauxHDFBuilder`.
+
+The size of the runs can be set with the environment variables
+
+* :code:`BAPSFLIB_BENCH_SN_SIZES`: comma separated number of shots of
+  the benchmarked runs (default :code:`1000,10000`)
+* :code:`BAPSFLIB_BENCH_NT`: number of samples per digitizer
+  shot (default :code:`1024`)
+"""
+import h5py
+import numpy as np
+import os
+
+from bapsflib._hdf.maps.tests.fauxhdfbuilder import FauxHDFBuilder
+from bapsflib._hdf.utils.file import File
+
+SN_SIZES = [
+    int(size)
+    for size in os.environ.get("BAPSFLIB_BENCH_SN_SIZES", "1000,10000").split(",")
+]
+NT = int(os.environ.get("BAPSFLIB_BENCH_NT", "1024"))
+
+#: `File` keywords locating the devices in a faux run
+FILE_KWARGS = {
+    "control_path": "Raw data + config",
+    "digitizer_path": "Raw data + config",
+    "msi_path": "MSI",
+    "silent": True,
+}
+
+
+def build_faux_run(path: str, sn_size: int, nt: int = NT) -> str:
+    """
+    Build a faux LaPD run at **path** containing the SIS 3301 and SIS
+    crate digitizers, the 6K Compumotor, NI_XZ, and Waveform control
+    devices, and the Discharge, Magnetic field, and Interferometer
+    array MSI diagnostics, all recording **sn_size** shots.
+
+    :param path: path of the HDF5 file to be built
+    :param sn_size: number of shots in the run
+    :param nt: number of samples per digitizer shot
+    :return: absolute path of the built file
+    """
+    path = os.path.abspath(path)
+    faux = FauxHDFBuilder(
+        name=path,
+        add_modules={
+            "SIS 3301": {"n_configs": 1, "sn_size": sn_size, "nt": nt},
+            "SIS crate": {"n_configs": 1, "sn_size": sn_size, "nt": nt},
+            "6K Compumotor": {"n_configs": 2, "sn_size": sn_size},
+            "NI_XZ": {"sn_size": sn_size},
+            "Waveform": {"n_configs": 1, "sn_size": sn_size},
+            "Discharge": {},
+            "Magnetic field": {},
+            "Interferometer array": {},
+        },
+    )
+
+    # the faux MSI diagnostics only record 2 shots
+    _size_msi(faux["MSI"], sn_size)
+    faux.close()
+
+    return path
+
+
+def _size_msi(group: h5py.Group, sn_size: int):
+    """
+    Resize every MSI diagnostic dataset in **group** to **sn_size**
+    rows (one per shot, with shot numbers :code:`1` to
+    :code:`sn_size`), repeating the recorded rows.
+    """
+    dsets = []
+    group.visititems(
+        lambda name, obj: dsets.append(name) if isinstance(obj, h5py.Dataset) else None
+    )
+    for name in dsets:
+        arr = np.resize(group[name][...], (sn_size,) + group[name].shape[1:])
+        if arr.dtype.names is not None and "Shot number" in arr.dtype.names:
+            arr["Shot number"] = np.arange(1, sn_size + 1)
+        attrs = dict(group[name].attrs)
+        del group[name]
+        group.create_dataset(name, data=arr).attrs.update(attrs)
+
+
+def build_faux_runs() -> dict:
+    """
+    Build a faux run for each of the :data:`SN_SIZES` in the current
+    working directory (e.g. in an asv :code:`setup_cache`).
+
+    :return: dictionary mapping the number of shots to the file path
+    """
+    return {
+        sn_size: build_faux_run(f"faux_run_{sn_size}.hdf5", sn_size)
+        for sn_size in SN_SIZES
+    }
+
+
+def open_faux_run(path: str) -> File:
+    """Open a faux run built by :func:`build_faux_run`."""
+    return File(path, **FILE_KWARGS)
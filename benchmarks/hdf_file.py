@@ -0,0 +1,141 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Benchmarks of opening, mapping, and reading synthetic LaPD runs (see
+:mod:`benchmarks.faux_runs`).
+"""
+import contextlib
+import io
+import numpy as np
+
+from bapsflib._hdf.utils.hdfoverview import HDFOverview
+
+from .faux_runs import build_faux_runs, open_faux_run, SN_SIZES
+
+
+class _FauxRunBenchmark:
+    """Base class for the benchmarks of an opened faux run."""
+
+    params = [SN_SIZES]
+    param_names = ["sn_size"]
+    timeout = 300
+
+    def setup_cache(self):
+        return build_faux_runs()
+
+    def setup(self, paths, sn_size):
+        self.f = open_faux_run(paths[sn_size])
+
+    def teardown(self, paths, sn_size):
+        self.f.close()
+
+
+class TimeFile(_FauxRunBenchmark):
+    """Open and map a faux run."""
+
+    def setup(self, paths, sn_size):
+        pass
+
+    def teardown(self, paths, sn_size):
+        pass
+
+    def time_open(self, paths, sn_size):
+        open_faux_run(paths[sn_size]).close()
+
+    def time_open_map_all(self, paths, sn_size):
+        with open_faux_run(paths[sn_size]) as f:
+            # devices may be mapped on first access
+            f.file_map.controls.items()
+            f.file_map.digitizers.items()
+            f.file_map.msi.items()
+
+
+class TimeReadData(_FauxRunBenchmark):
+    """`File.read_data` of a faux run."""
+
+    def setup(self, paths, sn_size):
+        super().setup(paths, sn_size)
+        self.index = slice(sn_size // 4, 3 * sn_size // 4)
+        self.shotnum = np.arange(1, sn_size + 1, 3)
+
+    def time_read_data_index(self, paths, sn_size):
+        self.f.read_data(0, 0, index=self.index, digitizer="SIS 3301", silent=True)
+
+    def time_read_data_shotnum(self, paths, sn_size):
+        self.f.read_data(0, 0, shotnum=self.shotnum, digitizer="SIS 3301", silent=True)
+
+    def time_read_data_sis_crate(self, paths, sn_size):
+        self.f.read_data(
+            1,
+            1,
+            shotnum=self.shotnum,
+            digitizer="SIS crate",
+            adc="SIS 3302",
+            silent=True,
+        )
+
+    def time_read_data_add_controls(self, paths, sn_size):
+        self.f.read_data(
+            0,
+            0,
+            shotnum=self.shotnum,
+            digitizer="SIS 3301",
+            add_controls=[("6K Compumotor", 1), ("Waveform", "config01")],
+            silent=True,
+        )
+
+
+class TimeReadControls(_FauxRunBenchmark):
+    """`File.read_controls` of a faux run."""
+
+    def setup(self, paths, sn_size):
+        super().setup(paths, sn_size)
+        self.shotnum = np.arange(1, sn_size + 1, 3)
+
+    def time_read_controls_one(self, paths, sn_size):
+        self.f.read_controls([("6K Compumotor", 1)], silent=True)
+
+    def time_read_controls_one_shotnum(self, paths, sn_size):
+        self.f.read_controls([("6K Compumotor", 1)], shotnum=self.shotnum, silent=True)
+
+    def time_read_controls_several(self, paths, sn_size):
+        self.f.read_controls(
+            [("6K Compumotor", 1), ("Waveform", "config01")],
+            shotnum=self.shotnum,
+            silent=True,
+        )
+
+    def time_read_controls_nixz(self, paths, sn_size):
+        self.f.read_controls(["NI_XZ"], shotnum=self.shotnum, silent=True)
+
+
+class TimeReadMSI(_FauxRunBenchmark):
+    """`File.read_msi` of a faux run."""
+
+    params = [SN_SIZES, ["Discharge", "Magnetic field", "Interferometer array"]]
+    param_names = ["sn_size", "msi"]
+
+    def setup(self, paths, sn_size, msi):
+        super().setup(paths, sn_size)
+
+    def teardown(self, paths, sn_size, msi):
+        super().teardown(paths, sn_size)
+
+    def time_read_msi(self, paths, sn_size, msi):
+        self.f.read_msi(msi, silent=True)
+
+
+class TimeHDFOverview(_FauxRunBenchmark):
+    """`HDFOverview` report of a faux run."""
+
+    def time_report_details(self, paths, sn_size):
+        with contextlib.redirect_stdout(io.StringIO()):
+            HDFOverview(self.f).print()
@@ -0,0 +1,30 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Import time benchmarks.  Each benchmark runs in a fresh interpreter, so
+they measure the full cost of importing bapsflib and its dependencies.
+"""
+
+
+def timeraw_import_bapsflib():
+    return "import bapsflib"
+
+
+def timeraw_import_lapd():
+    return "from bapsflib import lapd"
+
+
+def timeraw_import_lapd_file():
+    return "from bapsflib.lapd import File"
+
+
+def timeraw_import_plasma_constants():
+    return "from bapsflib.plasma.core import ME"
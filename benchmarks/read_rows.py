@@ -0,0 +1,129 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Benchmarks comparing h5py fancy indexing to the coalesced hyperslab
+reads of `~bapsflib._hdf.utils.helpers.read_dset_rows`.
+"""
+import h5py
+import numpy as np
+import os
+import tempfile
+
+from bapsflib._hdf.maps.tests.fauxhdfbuilder import FauxHDFBuilder
+from bapsflib._hdf.utils.file import File
+
+try:
+    from bapsflib._hdf.utils.helpers import read_dset_rows
+except ImportError:
+    # bapsflib versions before the coalesced reads
+    read_dset_rows = None
+
+
+def _row_index(pattern: str, n_rows: int) -> np.ndarray:
+    """Dataset row indices for the named selection pattern."""
+    rng = np.random.default_rng(0)
+    if pattern == "contiguous":
+        index = np.arange(n_rows // 20, n_rows - n_rows // 20)
+    elif pattern == "runs":
+        # ~70% of the rows in runs of 100
+        keep = np.repeat(rng.random(n_rows // 100) < 0.7, 100)
+        index = np.flatnonzero(keep)
+    elif pattern == "strided":
+        index = np.arange(0, n_rows, 3)
+    elif pattern == "random":
+        index = np.unique(rng.integers(0, n_rows, n_rows // 4))
+    else:  # pragma: no cover
+        raise ValueError(f"Unknown pattern '{pattern}'.")
+
+    return index
+
+
+class TimeReadDsetRows:
+    """Read the rows of a digitizer-like dataset."""
+
+    params = ["contiguous", "runs", "strided", "random"]
+    param_names = ["pattern"]
+    n_rows = 20000
+    nt = 1024
+
+    def setup(self, pattern):
+        if read_dset_rows is None:
+            # asv skips benchmarks raising NotImplementedError in setup
+            raise NotImplementedError
+
+        self._tempdir = tempfile.TemporaryDirectory(prefix="bapsflib-bench_")
+        path = os.path.join(self._tempdir.name, "rows.hdf5")
+        with h5py.File(path, "w") as f:
+            f.create_dataset(
+                "signal",
+                data=np.random.default_rng(0)
+                .integers(-2000, 2000, (self.n_rows, self.nt))
+                .astype(np.int16),
+            )
+        self.f = h5py.File(path, "r")
+        self.dset = self.f["signal"]
+        self.index = _row_index(pattern, self.n_rows)
+        self.index_list = self.index.tolist()
+
+    def teardown(self, pattern):
+        self.f.close()
+        self._tempdir.cleanup()
+
+    def time_fancy_index(self, pattern):
+        self.dset[self.index_list, ...]
+
+    def time_read_dset_rows(self, pattern):
+        read_dset_rows(self.dset, self.index)
+
+
+class TimeReadDataShotnum:
+    """Shot number selected `File.read_data` of a large run."""
+
+    params = ["contiguous", "runs", "strided"]
+    param_names = ["pattern"]
+    sn_size = 10000
+
+    def setup(self, pattern):
+        self._tempdir = tempfile.TemporaryDirectory(prefix="bapsflib-bench_")
+        path = os.path.join(self._tempdir.name, "run.hdf5")
+        faux = FauxHDFBuilder(
+            name=path,
+            add_modules={
+                "SIS 3301": {"n_configs": 1, "sn_size": self.sn_size, "nt": 1024}
+            },
+        )
+        mod = faux.modules["SIS 3301"]
+        self.config_name = mod.knobs.active_config[0]
+        brd, ch = np.where(mod.knobs.active_brdch)
+        self.brd, self.ch = int(brd[0]), int(ch[0])
+        faux.close()
+
+        self.f = File(
+            path,
+            control_path="Raw data + config",
+            digitizer_path="Raw data + config",
+            msi_path="MSI",
+            silent=True,
+        )
+        self.shotnum = _row_index(pattern, self.sn_size) + 1
+
+    def teardown(self, pattern):
+        self.f.close()
+        self._tempdir.cleanup()
+
+    def time_read_data(self, pattern):
+        self.f.read_data(
+            self.brd,
+            self.ch,
+            shotnum=self.shotnum,
+            config_name=self.config_name,
+            silent=True,
+        )